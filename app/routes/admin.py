@@ -660,6 +660,34 @@ def revoke_admin_access(user_id: int, admin_user = Depends(get_admin_user), db:
             detail=f"Failed to revoke admin access: {str(e)}"
         )
 
+# NLP model registry endpoints
+@admin_router.get("/admin/nlp-models")
+def get_nlp_models(admin_user = Depends(get_admin_user)):
+    """Load status, load times and memory footprint of the shared NLP models - ADMIN ONLY"""
+    try:
+        from nlp_models import get_model_registry
+        return {"status": "success", **get_model_registry().stats()}
+    except Exception as e:
+        logger.error(f"Error fetching NLP model stats: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch NLP model stats: {str(e)}"
+        )
+
+@admin_router.post("/admin/nlp-models/warmup")
+def warmup_nlp_models(models: Optional[str] = None, admin_user = Depends(get_admin_user)):
+    """Load NLP models now (comma-separated names, default NLP_WARMUP_MODELS) - ADMIN ONLY"""
+    try:
+        from nlp_models import get_model_registry
+        names = [m.strip() for m in models.split(",") if m.strip()] if models else None
+        return {"status": "success", **get_model_registry().warmup(names)}
+    except Exception as e:
+        logger.error(f"Error warming up NLP models: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to warm up NLP models: {str(e)}"
+        )
+
 # Code Health Scanner endpoints
 @admin_router.get("/admin/code-health")
 def get_code_health(admin_user = Depends(get_admin_user)):
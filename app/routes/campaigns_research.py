@@ -175,7 +175,7 @@ def get_campaign_research(campaign_id: str, limit: int = 20, current_user = Depe
     - wordCloud: top 10 terms by frequency (cached in DB)
     - topics: naive primary topics (top terms) (cached in DB)
     - entities: NLTK-based extraction using named entity recognition (cached in DB)
-    - hashtags: generated from topics/keywords (cached in DB)
+    - hashtags: generated from topics/keywords, topped up from the most frequent terms (cached in DB)
     
     Caches wordCloud, topics, hashtags, and entities in database to avoid re-computation.
     REQUIRES AUTHENTICATION AND OWNERSHIP VERIFICATION
@@ -243,7 +243,6 @@ def get_campaign_research(campaign_id: str, limit: int = 20, current_user = Depe
         # Import NLTK-based text processing (lazy import with fallback)
         try:
             from text_processing import (
-                extract_entities as nltk_extract_entities,
                 remove_stopwords,
                 extract_keywords,
                 extract_topics
@@ -251,8 +250,6 @@ def get_campaign_research(campaign_id: str, limit: int = 20, current_user = Depe
         except ImportError as import_err:
             logger.warning(f"⚠️ text_processing module not available: {import_err}")
             # Define fallback functions
-            def nltk_extract_entities(text, **kwargs):
-                return {}
             def remove_stopwords(text):
                 return text
             def extract_keywords(text):
@@ -260,10 +257,13 @@ def get_campaign_research(campaign_id: str, limit: int = 20, current_user = Depe
             def extract_topics(texts, topic_tool, num_topics, iterations, query="", keywords=[], urls=[]):
                 return []
 
+        from term_counts import is_campaign_corpus_page
         rows = db.query(CampaignRawData).filter(CampaignRawData.campaign_id == campaign_id).all()
         logger.info(f"🔍 Research endpoint: Found {len(rows)} rows for campaign {campaign_id}")
         urls = []
         texts = []
+        text_row_ids = []  # CampaignRawData id of each text (per-document entity cache)
+        text_simhashes = []  # Stored SimHash of each text (near-duplicate check in extract_topics)
         errors = []  # Collect error diagnostics
         error_meta = []  # Collect error metadata
         truncation_info = []  # Track which texts were truncated
@@ -292,10 +292,12 @@ def get_campaign_research(campaign_id: str, limit: int = 20, current_user = Depe
                 # Valid scraped data
                 if r.source_url and not r.source_url.startswith(("error:", "placeholder:")):
                     urls.append(r.source_url)
-                # More lenient text check - include text if it exists and has some content (even if short)
-                # This helps with campaigns that previously had data but might have shorter snippets
-                if r.extracted_text and len(r.extracted_text.strip()) > 0:
+                # Any non-blank text, even short snippets - the corpus every caller of
+                # term_counts.campaign_term_totals() uses (campaign_corpus_texts)
+                if is_campaign_corpus_page(r.source_url, r.extracted_text):
                     texts.append(r.extracted_text)  # Keep as string for backward compatibility
+                    text_row_ids.append(r.id)
+                    text_simhashes.append(r.simhash)
                     
                     # Check if this text was truncated (from metadata)
                     if r.meta_json:
@@ -372,7 +374,9 @@ def get_campaign_research(campaign_id: str, limit: int = 20, current_user = Depe
                     iterations=iterations,
                     query=campaign_query,
                     keywords=campaign_keywords,
-                    urls=campaign_urls
+                    urls=campaign_urls,
+                    campaign_id=campaign_id,
+                    simhashes=text_simhashes
                 )
                 
                 logger.info(f"🔍 extract_topics returned {len(topic_phrases) if topic_phrases else 0} topics: {topic_phrases[:5] if topic_phrases else 'NONE'}")
@@ -398,66 +402,29 @@ def get_campaign_research(campaign_id: str, limit: int = 20, current_user = Depe
             # Fallback: Extract meaningful bigrams/trigrams if extract_topics failed or returned empty
             if not topic_phrases or len(topic_phrases) == 0:
                 logger.info(f"🔄 Using fallback phrase extraction (extract_topics returned empty or failed)")
-                # Fallback: Extract meaningful bigrams/trigrams instead of single words
-                from collections import Counter
-                from nltk.corpus import stopwords
-                from nltk.tokenize import word_tokenize
-                from nltk import pos_tag
-                
-                nltk_stopwords = set(stopwords.words('english'))
-                additional_stopwords = {
-                    'who', 'which', 'what', 'when', 'where', 'why', 'how', 'but', 'than', 'that', 'this',
-                    'these', 'those', 'united', 'world', 'one', 'two', 'also', 'more', 'most', 'very'
-                }
-                comprehensive_stopwords = nltk_stopwords | additional_stopwords
-                
-                # Extract meaningful bigrams and trigrams
-                phrases = []
-                for t in texts[:50]:  # Limit for performance
-                    try:
-                        tokens = word_tokenize(t.lower())
-                        tagged = pos_tag(tokens)
-                        # Filter out stopwords and function words
-                        meaningful_tokens = [word for word, tag in tagged 
-                                           if word not in comprehensive_stopwords 
-                                           and tag not in {'PRP', 'PRP$', 'DT', 'IN', 'CC', 'TO'}
-                                           and len(word) >= 3 and word.isalpha()]
-                        
-                        # Extract bigrams
-                        for i in range(len(meaningful_tokens) - 1):
-                            bigram = f"{meaningful_tokens[i]} {meaningful_tokens[i+1]}"
-                            phrases.append(bigram)
-                        # Extract trigrams
-                        for i in range(len(meaningful_tokens) - 2):
-                            trigram = f"{meaningful_tokens[i]} {meaningful_tokens[i+1]} {meaningful_tokens[i+2]}"
-                            phrases.append(trigram)
-                    except Exception as e:
-                        logger.debug(f"Phrase extraction failed for text: {e}")
-                        continue
-                
-                # Count phrase frequencies
-                phrase_counts = Counter(phrases)
-                top_phrases = phrase_counts.most_common(10)
+                # Fallback: bigrams/trigrams of content words scored by TF-IDF over the whole
+                # corpus (phrase_fallback.py), from the stored tokenize-once artifacts
+                from doc_artifacts import get_document_artifacts
+                from phrase_fallback import score_phrases
+
+                top_phrases, text_artifacts = [], None
+                try:
+                    text_artifacts = get_document_artifacts(texts)
+                    top_phrases = score_phrases(texts, text_artifacts, ngram_range=(2, 3), top_n=10)
+                except Exception as e:
+                    logger.warning(f"⚠️ Fallback phrase extraction failed: {e}")
                 
                 if top_phrases:
-                    topics = [{"label": phrase, "score": count} for phrase, count in top_phrases]
+                    topics = [{"label": phrase, "score": score} for phrase, score in top_phrases]
                     logger.info(f"✅ Generated {len(topics)} fallback topic phrases: {[t['label'] for t in topics]}")
                 else:
                     # Last resort: single meaningful words
-                    word_counts = Counter()
-                    for t in texts:
-                        try:
-                            tokens = word_tokenize(t.lower())
-                            tagged = pos_tag(tokens)
-                            for word, tag in tagged:
-                                if (word not in comprehensive_stopwords and 
-                                    tag not in {'PRP', 'PRP$', 'DT', 'IN', 'CC', 'TO'}
-                                    and len(word) >= 4 and word.isalpha()):
-                                    word_counts[word] += 1
-                        except:
-                            continue
-                    top_words = word_counts.most_common(10)
-                    topics = [{"label": word, "score": count} for word, count in top_words]
+                    top_words = []
+                    try:
+                        top_words = score_phrases(texts, text_artifacts, ngram_range=(1, 1), min_word_len=4, top_n=10)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Single-word fallback failed: {e}")
+                    topics = [{"label": word, "score": score} for word, score in top_words]
                     logger.warning(f"⚠️ Using single-word fallback: {[t['label'] for t in topics]}")
         else:
             topics = []
@@ -465,52 +432,18 @@ def get_campaign_research(campaign_id: str, limit: int = 20, current_user = Depe
             if len(rows) > 0:
                 logger.warning(f"⚠️ Campaign has {len(rows)} rows but {len(texts)} valid texts. Error rows: {len(errors)}")
         
-        # Build word cloud with comprehensive stopword filtering and POS tagging
-        # Use NLTK's comprehensive stopword list + additional filtering
-        from nltk.corpus import stopwords
-        from nltk.tokenize import word_tokenize
-        from nltk import pos_tag
-        
-        # Comprehensive stopword set (NLTK + common function words)
-        nltk_stopwords = set(stopwords.words('english'))
-        additional_stopwords = {
-            'who', 'which', 'what', 'when', 'where', 'why', 'how', 'but', 'than', 'that', 'this',
-            'these', 'those', 'united', 'world', 'one', 'two', 'also', 'more', 'most', 'very',
-            'much', 'many', 'some', 'any', 'all', 'each', 'every', 'both', 'few', 'other',
-            'such', 'only', 'just', 'even', 'still', 'yet', 'already', 'never', 'always',
-            'often', 'sometimes', 'usually', 'generally', 'particularly', 'especially',
-            'however', 'therefore', 'thus', 'hence', 'moreover', 'furthermore', 'nevertheless'
-        }
-        comprehensive_stopwords = nltk_stopwords | additional_stopwords
-        
-        # Function word POS tags to exclude (pronouns, determiners, prepositions, conjunctions, etc.)
-        function_word_tags = {'PRP', 'PRP$', 'DT', 'IN', 'CC', 'TO', 'WDT', 'WP', 'WP$', 'WRB', 'PDT', 'RP', 'EX'}
-        
-        counts = {}
-        for t in texts:
-            try:
-                # Tokenize and POS tag
-                tokens = word_tokenize(t.lower())
-                tagged = pos_tag(tokens)
-                
-                for word, tag in tagged:
-                    # Skip if stopword, function word, or too short
-                    if (word.lower() in comprehensive_stopwords or 
-                        tag in function_word_tags or 
-                        len(word) < 3 or 
-                        not word.isalpha()):
-                        continue
-                    counts[word.lower()] = counts.get(word.lower(), 0) + 1
-            except Exception as e:
-                # Fallback to simple tokenization if NLTK fails
-                logger.debug(f"POS tagging failed for text, using simple tokenization: {e}")
-                tokenizer = re.compile(r"[A-Za-z]{3,}")
-                for w in tokenizer.findall(t.lower()):
-                    if w not in comprehensive_stopwords:
-                        counts[w] = counts.get(w, 0) + 1
-        
-        top_terms = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[:10]
-        word_cloud = [{"term": k, "count": v} for k, v in top_terms]
+        # Build word cloud from the campaign's summed per-document term counts (term_counts.py):
+        # stopwords and function words (by POS tag) were filtered out when each page was
+        # counted, and only pages added or removed since the last request are re-summed
+        from term_counts import campaign_term_totals, cloud_stop_words
+        comprehensive_stopwords = cloud_stop_words()
+        term_totals = {}
+        try:
+            term_totals = campaign_term_totals(campaign_id, texts) if texts else {}
+        except Exception as e:
+            logger.warning(f"⚠️ Term counts unavailable for campaign {campaign_id}: {e}")
+        cloud_counts = term_totals.get("cloud")
+        word_cloud = [{"term": k, "count": v} for k, v in cloud_counts.top(10)] if cloud_counts is not None else []
         
         if not word_cloud or len(word_cloud) == 0:
             logger.warning(f"⚠️ Word cloud generation failed - no terms found. Texts: {len(texts)}, Total chars: {sum(len(t) for t in texts)}")
@@ -527,91 +460,47 @@ def get_campaign_research(campaign_id: str, limit: int = 20, current_user = Depe
         else:
             logger.info(f"📊 Word cloud generated: {len(word_cloud)} terms - {[t['term'] for t in word_cloud[:5]]}")
 
-        # Use NLTK-based entity extraction for accurate named entity recognition
-        persons = []
-        organizations = []
-        locations = []
-        dates = []
-        money = []
-        percent = []
-        time = []
-        facility = []
-        
-        # Process texts with NLTK entity extraction
-        texts_processed = 0
-        texts_skipped = 0
-        extraction_errors = 0
+        # Use NLTK-based entity extraction for accurate named entity recognition.
+        # Per-document results are cached on the CampaignRawData rows (keyed by content
+        # hash), so only pages never extracted before - in this or any other campaign -
+        # go through NER, in a worker process pool; campaign entities are their merge.
+        from entity_cache import extract_corpus_entities, merge_entities
+
         logger.info(f"🔍 Starting entity extraction for {len(texts)} texts (processing up to 100)")
         
         # Log first few texts for debugging
         if len(texts) > 0:
             logger.info(f"📄 Sample text (first 200 chars): {texts[0][:200] if texts[0] else 'EMPTY'}")
         
-        for idx, t in enumerate(texts[:100]):
-            if not t or len(t.strip()) < 10:
-                texts_skipped += 1
-                if texts_skipped <= 3:
-                    logger.debug(f"⏭️ Skipping text {idx}: length={len(t) if t else 0}")
-                continue
-            try:
-                entity_result = nltk_extract_entities(
-                    t,
-                    extract_persons=True,
-                    extract_organizations=True,
-                    extract_locations=True,
-                    extract_dates=True,
-                    extract_money=True,
-                    extract_percent=True,
-                    extract_time=True,
-                    extract_facility=True
-                )
-                texts_processed += 1
-                
-                # Log entities found in this text (first few texts only)
-                if texts_processed <= 3:
-                    found_entities = {k: len(v) for k, v in entity_result.items() if v}
-                    if found_entities:
-                        logger.info(f"📝 Text {texts_processed}: Found {found_entities}")
-                        # Log sample entities
-                        for entity_type, entity_list in entity_result.items():
-                            if entity_list:
-                                logger.info(f"   {entity_type}: {entity_list[:3]}")
-                    else:
-                        logger.warning(f"⚠️ Text {texts_processed}: No entities found (length: {len(t)})")
-                
-                persons.extend(entity_result.get('persons', []))
-                organizations.extend(entity_result.get('organizations', []))
-                locations.extend(entity_result.get('locations', []))
-                dates.extend(entity_result.get('dates', []))
-                money.extend(entity_result.get('money', []))
-                percent.extend(entity_result.get('percent', []))
-                time.extend(entity_result.get('time', []))
-                facility.extend(entity_result.get('facility', []))
-            except Exception as e:
+        entity_docs = [idx for idx, t in enumerate(texts[:100]) if t and len(t.strip()) >= 10]
+        texts_skipped = min(len(texts), 100) - len(entity_docs)
+        per_document = extract_corpus_entities([texts[idx] for idx in entity_docs], [text_row_ids[idx] for idx in entity_docs])
+        
+        extraction_errors = 0
+        for position, (idx, entity_result) in enumerate(zip(entity_docs, per_document)):
+            # Log entities found in the first few texts
+            if position < 3 and entity_result is not None:
+                found_entities = {k: len(v) for k, v in entity_result.items() if v}
+                if found_entities:
+                    logger.info(f"📝 Text {position + 1}: Found {found_entities}")
+                    for entity_type, entity_list in entity_result.items():
+                        if entity_list:
+                            logger.info(f"   {entity_type}: {entity_list[:3]}")
+                else:
+                    logger.warning(f"⚠️ Text {position + 1}: No entities found (length: {len(texts[idx])})")
+            if entity_result is None:
                 extraction_errors += 1
-                logger.error(f"❌ Error extracting entities from text {idx} (length {len(t) if t else 0}): {e}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
                 # Fallback to regex for dates if NLTK fails
                 try:
                     date_regex = re.compile(r"\b(\d{4}|\d{1,2}/\d{1,2}/\d{2,4}|Jan(uary)?|Feb(ruary)?|Mar(ch)?|Apr(il)?|May|Jun(e)?|Jul(y)?|Aug(ust)?|Sep(tember)?|Oct(ober)?|Nov(ember)?|Dec(ember)?)\s+\d{4}\b", re.I)
-                    date_matches = date_regex.findall(t)
-                    dates.extend([d[0] if isinstance(d, tuple) else d for d in date_matches])
+                    date_matches = date_regex.findall(texts[idx])
+                    per_document[position] = {"dates": [d[0] if isinstance(d, tuple) else d for d in date_matches]}
                 except Exception as regex_err:
                     logger.debug(f"Regex fallback also failed: {regex_err}")
         
-        logger.info(f"✅ Entity extraction complete: {texts_processed} processed, {texts_skipped} skipped, {extraction_errors} errors")
-        
-        entities = {
-            "persons": list(dict.fromkeys(persons))[:20],
-            "organizations": list(dict.fromkeys(organizations))[:20],
-            "locations": list(dict.fromkeys(locations))[:20],
-            "dates": list(dict.fromkeys(dates))[:20],
-            "money": list(dict.fromkeys(money))[:20],
-            "percent": list(dict.fromkeys(percent))[:20],
-            "time": list(dict.fromkeys(time))[:20],
-            "facility": list(dict.fromkeys(facility))[:20],
-        }
+        logger.info(f"✅ Entity extraction complete: {len(entity_docs) - extraction_errors} processed, {texts_skipped} skipped, {extraction_errors} errors")
+        
+        entities = merge_entities(per_document, limit=20)
         
         # Log summary of extracted entities
         total_entities = sum(len(v) for v in entities.values())
@@ -643,6 +532,22 @@ def get_campaign_research(campaign_id: str, limit: int = 20, current_user = Depe
                         "name": hashtag_name,
                         "category": "Industry"
                     })
+        # Seed the rest from the campaign's most frequent keywords (summed term counts)
+        keyword_counts = term_totals.get("keywords")
+        if len(hashtags) < 8 and keyword_counts is not None:
+            taken = {h["name"].lower() for h in hashtags}
+            for i, (term, _) in enumerate(keyword_counts.top(16)):
+                hashtag_name = f"#{term}"
+                if not term.isalpha() or len(term) < 3 or hashtag_name.lower() in taken:
+                    continue
+                taken.add(hashtag_name.lower())
+                hashtags.append({
+                    "id": f"term-{i}",
+                    "name": hashtag_name,
+                    "category": "Trending"
+                })
+                if len(hashtags) >= 8:
+                    break
         
         # Save to database cache (as "raw data" associated with campaign)
         # Only save if we have valid non-empty data
@@ -765,11 +670,13 @@ def compare_topics(campaign_id: str, method: str = "system", current_user = Depe
         # Get raw data
         rows = db.query(CampaignRawData).filter(CampaignRawData.campaign_id == campaign_id).all()
         texts = []
+        simhashes = []
         
         for r in rows:
             if r.extracted_text and len(r.extracted_text.strip()) > 0:
                 if not r.source_url or not r.source_url.startswith(("error:", "placeholder:")):
                     texts.append(r.extracted_text)
+                    simhashes.append(r.simhash)
         
         if not texts:
             return {
@@ -808,7 +715,9 @@ def compare_topics(campaign_id: str, method: str = "system", current_user = Depe
             iterations=iterations,
             query=campaign_query,
             keywords=campaign_keywords,
-            urls=campaign_urls
+            urls=campaign_urls,
+            campaign_id=campaign_id,
+            simhashes=simhashes
         )
         
         # Format topics same as research endpoint
@@ -1104,71 +1013,89 @@ def get_topicwizard_visualization(
             texts = texts[:max_texts]
             logger.info(f"Limited to {max_texts} texts for TopicWizard performance")
         
-        # Create pipeline compatible with TopicWizard
-        vectorizer = TfidfVectorizer(
-            min_df=tfidf_min_df,
-            max_df=tfidf_max_df,
-            stop_words='english',
-            strip_accents='unicode'
-        )
+        # Reuse an identical earlier fit (same texts, same settings) from the topic model cache
+        from topic_cache import get_topic_result, store_topic_result, topic_cache_key
+        n_components = min(num_topics, len(texts) - 1)
+        cache_key = topic_cache_key(texts, "topicwizard_nmf", {
+            "tfidf_min_df": tfidf_min_df,
+            "tfidf_max_df": tfidf_max_df,
+            "n_components": n_components,
+            "stop_words": "english",
+            "random_state": 42,
+            "max_iter": 500,
+        })
+        cached = get_topic_result(cache_key)
+        if cached is not None:
+            doc_topic_matrix = cached["W"]
+            topic_word_matrix = cached["H"]
+            feature_names = cached["vocabulary"]
+        else:
+            # Create pipeline compatible with TopicWizard
+            vectorizer = TfidfVectorizer(
+                min_df=tfidf_min_df,
+                max_df=tfidf_max_df,
+                stop_words='english',
+                strip_accents='unicode'
+            )
         
-        topic_model = NMF(
-            n_components=min(num_topics, len(texts) - 1),
-            random_state=42,
-            max_iter=500
-        )
+            topic_model = NMF(
+                n_components=n_components,
+                random_state=42,
+                max_iter=500
+            )
         
-        topic_pipeline = Pipeline([
-            ("vectorizer", vectorizer),
-            ("topic_model", topic_model),
-        ])
+            topic_pipeline = Pipeline([
+                ("vectorizer", vectorizer),
+                ("topic_model", topic_model),
+            ])
         
-        # Fit the pipeline
-        logger.info(f"Fitting topic model pipeline with {len(texts)} documents, {min(num_topics, len(texts) - 1)} topics")
-        try:
-            topic_pipeline.fit(texts)
-        except ValueError as e:
-            if "no terms remain" in str(e).lower() or "after pruning" in str(e).lower():
-                logger.warning(f"⚠️ TopicWizard: No terms remain after pruning. Adjusting min_df/max_df parameters.")
-                # Try with more lenient parameters
-                vectorizer = TfidfVectorizer(
-                    min_df=1,  # Allow terms that appear in at least 1 document
-                    max_df=0.95,  # Allow terms that appear in up to 95% of documents
-                    stop_words='english',
-                    strip_accents='unicode'
-                )
-                topic_model = NMF(
-                    n_components=min(num_topics, len(texts) - 1),
-                    random_state=42,
-                    max_iter=500
-                )
-                topic_pipeline = Pipeline([
-                    ("vectorizer", vectorizer),
-                    ("topic_model", topic_model),
-                ])
-                try:
-                    topic_pipeline.fit(texts)
-                    logger.info("✅ TopicWizard: Successfully fitted with adjusted parameters")
-                except Exception as e2:
-                    logger.error(f"❌ TopicWizard: Still failed after parameter adjustment: {e2}")
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"TopicWizard failed: {str(e2)}. Try reducing min_df or increasing max_df, or ensure you have sufficient text data."
+            # Fit the pipeline
+            logger.info(f"Fitting topic model pipeline with {len(texts)} documents, {n_components} topics")
+            try:
+                topic_pipeline.fit(texts)
+            except ValueError as e:
+                if "no terms remain" in str(e).lower() or "after pruning" in str(e).lower():
+                    logger.warning(f"⚠️ TopicWizard: No terms remain after pruning. Adjusting min_df/max_df parameters.")
+                    # Try with more lenient parameters
+                    vectorizer = TfidfVectorizer(
+                        min_df=1,  # Allow terms that appear in at least 1 document
+                        max_df=0.95,  # Allow terms that appear in up to 95% of documents
+                        stop_words='english',
+                        strip_accents='unicode'
                     )
-            else:
-                raise
+                    topic_model = NMF(
+                        n_components=n_components,
+                        random_state=42,
+                        max_iter=500
+                    )
+                    topic_pipeline = Pipeline([
+                        ("vectorizer", vectorizer),
+                        ("topic_model", topic_model),
+                    ])
+                    try:
+                        topic_pipeline.fit(texts)
+                        logger.info("✅ TopicWizard: Successfully fitted with adjusted parameters")
+                    except Exception as e2:
+                        logger.error(f"❌ TopicWizard: Still failed after parameter adjustment: {e2}")
+                        raise HTTPException(
+                            status_code=500,
+                            detail=f"TopicWizard failed: {str(e2)}. Try reducing min_df or increasing max_df, or ensure you have sufficient text data."
+                        )
+                else:
+                    raise
         
-        # Extract topic information for visualization
-        vectorizer = topic_pipeline.named_steps['vectorizer']
-        nmf_model = topic_pipeline.named_steps['topic_model']
+            # Extract topic information for visualization
+            vectorizer = topic_pipeline.named_steps['vectorizer']
+            nmf_model = topic_pipeline.named_steps['topic_model']
         
-        # Get document-topic matrix
-        X = vectorizer.transform(texts)
-        doc_topic_matrix = nmf_model.transform(X)
+            # Get document-topic matrix
+            X = vectorizer.transform(texts)
+            doc_topic_matrix = nmf_model.transform(X)
         
-        # Get topic-word matrix and top words per topic
-        topic_word_matrix = nmf_model.components_
-        feature_names = vectorizer.get_feature_names_out()
+            # Get topic-word matrix and top words per topic
+            topic_word_matrix = nmf_model.components_
+            feature_names = vectorizer.get_feature_names_out()
+            store_topic_result(cache_key, "topicwizard_nmf", feature_names, doc_topic_matrix, topic_word_matrix)
         
         topics_data = []
         for topic_idx in range(min(num_topics, len(texts) - 1)):
@@ -2161,11 +2088,10 @@ def get_research_agent_recommendations(
             CampaignRawData.campaign_id == campaign_id
         ).all()
         
-        texts = [
-            r.extracted_text for r in rows 
-            if r.extracted_text and len(r.extracted_text.strip()) > 10 
-            and (not r.source_url or not r.source_url.startswith(("error:", "placeholder:")))
-        ]
+        # Same corpus as the research view and ingestion, so they share the campaign's term totals
+        from term_counts import campaign_corpus_texts, is_campaign_corpus_page
+        texts = campaign_corpus_texts((r.source_url, r.extracted_text) for r in rows)
+        simhashes = [r.simhash for r in rows if is_campaign_corpus_page(r.source_url, r.extracted_text)]
         
         if not texts:
             raise HTTPException(
@@ -2175,7 +2101,7 @@ def get_research_agent_recommendations(
         
         # Get research data for context
         from text_processing import extract_keywords, extract_topics
-        keywords_data = extract_keywords(texts, num_keywords=20)
+        keywords_data = extract_keywords(texts, num_keywords=20, campaign_id=campaign_id)
         topics_data = extract_topics(
             texts, 
             topic_tool="system", 
@@ -2183,7 +2109,9 @@ def get_research_agent_recommendations(
             iterations=25, 
             query=campaign.query or "", 
             keywords=campaign.keywords.split(",") if campaign.keywords else [], 
-            urls=[]
+            urls=[],
+            campaign_id=campaign_id,
+            simhashes=simhashes
         )
         
         # Get prompt from system settings
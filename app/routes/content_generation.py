@@ -1100,27 +1100,37 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                     task["progress_message"] = msg
                     logger.info(f"📊 Task {tid}: {prog}% - {step} - {msg}")
 
-                # CRITICAL: Check if raw_data already exists for this campaign
-                # If it does, skip scraping to prevent re-scraping and data growth
-                # Raw data should only be written during initial scrape
-                existing_raw_data = session.query(CampaignRawData).filter(
-                    CampaignRawData.campaign_id == cid,
-                    ~CampaignRawData.source_url.startswith("error:"),
-                    ~CampaignRawData.source_url.startswith("placeholder:")
-                ).first()
-                
-                if existing_raw_data:
-                    logger.info(f"📋 Raw data already exists for campaign {cid} - skipping scrape phase to prevent data growth")
-                    logger.info(f"📋 Raw data was created at: {existing_raw_data.fetched_at}")
-                    set_task("raw_data_exists", 50, "Raw data already exists - using existing data")
-                    set_task("complete", 100, "Analysis complete - using existing raw data")
-                    camp = session.query(Campaign).filter(Campaign.campaign_id == cid).first()
-                    if camp:
-                        camp.status = "READY_TO_ACTIVATE"
-                        camp.updated_at = datetime.utcnow()
-                        session.commit()
-                    logger.info(f"✅ Skipped scraping for campaign {cid} - raw data already exists")
-                    return  # Exit early - don't write any new raw_data
+                # URLs already stored for this campaign are pushed down into the scraper as a
+                # frontier filter: a re-run only fetches pages that aren't in the database yet,
+                # so existing raw data never grows with duplicates and unchanged campaigns
+                # finish right after the search call (NO_CHANGES)
+                # Their SimHash fingerprints seed the near-duplicate index, so a new page that
+                # copies an already stored one (syndication, AMP/print variant) is caught too
+                from near_duplicates import NearDuplicateIndex, NEAR_DUP_ACTION, fingerprint_from_hex
+                from scrape_cache import normalize_url
+                from sitemap_state import SITEMAP_INCREMENTAL_ENABLED, load_sitemap_state, plan_incremental_crawl, save_sitemap_state
+                known_urls = set()
+                sitemap_entries = []  # Site Builder: (url, lastmod) of the sitemap URLs being crawled
+                sitemap_plan = None  # Site Builder: incremental crawl plan (new / changed / unchanged URLs)
+                sitemap_unchanged_count = 0
+                scraped_content_hashes = {}  # Normalized URL -> content hash of pages scraped successfully
+                near_dups = NearDuplicateIndex()
+                try:
+                    from sqlalchemy import func
+                    known_rows = session.query(CampaignRawData.source_url, CampaignRawData.simhash).filter(
+                        CampaignRawData.campaign_id == cid,
+                        ~CampaignRawData.source_url.startswith("error:"),
+                        ~CampaignRawData.source_url.startswith("placeholder:"),
+                        func.length(CampaignRawData.extracted_text) > 10
+                    ).all()
+                    known_urls = {row.source_url for row in known_rows if row.source_url}
+                    for row in known_rows:
+                        near_dups.add(row.source_url, fingerprint_from_hex(row.simhash))
+                    if known_urls:
+                        logger.info(f"📋 {len(known_urls)} URLs already stored for campaign {cid} - they will be skipped before scraping")
+                except Exception as known_err:
+                    logger.warning(f"⚠️ Error loading stored URLs for campaign {cid}: {known_err}, scraping without frontier filter")
+                    known_urls = set()
 
                 # CRITICAL: Set campaign status to PROCESSING at the start of analysis
                 try:
@@ -1330,7 +1340,7 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                 
                 # Handle Site Builder campaign type
                 if data.type == "site_builder":
-                    from sitemap_parser import parse_sitemap_from_site
+                    from sitemap_parser import parse_sitemap_entries_from_site
                     from gap_analysis import identify_content_gaps, rank_gaps_by_priority
                     from text_processing import extract_topics
                     import json
@@ -1413,7 +1423,8 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                     # Parse sitemap (we already validated accessibility at initialization, so this should work)
                     # But handle network failures gracefully with better error messages
                     try:
-                        sitemap_urls = parse_sitemap_from_site(site_url, max_urls=max_sitemap_urls, most_recent=most_recent_urls)
+                        sitemap_entries = parse_sitemap_entries_from_site(site_url, max_urls=max_sitemap_urls, most_recent=most_recent_urls)
+                        sitemap_urls = [entry_url for entry_url, _ in sitemap_entries]
                         logger.info(f"✅ Sitemap parsing complete: Found {len(sitemap_urls)} URLs from sitemap")
                         if len(sitemap_urls) > 0:
                             logger.info(f"✅ First 5 sitemap URLs: {sitemap_urls[:5]}")
@@ -1557,6 +1568,19 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                     
                     logger.info(f"✅ Validated {len(valid_urls)} valid URLs out of {len(sitemap_urls)} total")
                     
+                    # Incremental re-crawl: pages already stored for this campaign are reused unless
+                    # their sitemap lastmod moved forward since they were scraped. Changed pages are
+                    # taken out of the frontier skip list (and their old rows replaced after scraping);
+                    # unchanged ones are filtered out before scraping like any other stored URL
+                    sitemap_lastmods = dict(sitemap_entries)
+                    sitemap_entries = [(u, sitemap_lastmods.get(u)) for u in valid_urls]
+                    if SITEMAP_INCREMENTAL_ENABLED:
+                        sitemap_plan = plan_incremental_crawl(sitemap_entries, load_sitemap_state(cid), known_urls)
+                        known_urls = sitemap_plan["skip_urls"]
+                        sitemap_unchanged_count = sitemap_plan["unchanged"]
+                        logger.info(f"🗺️ Site Builder incremental crawl: {len(sitemap_plan['new'])} new, {len(sitemap_plan['changed'])} changed (lastmod moved forward), {sitemap_unchanged_count} unchanged URLs")
+                        set_task("parsing_sitemap", 35, f"Sitemap: {len(sitemap_plan['new'])} new, {len(sitemap_plan['changed'])} changed, {sitemap_unchanged_count} unchanged pages")
+                    
                     # Use validated sitemap URLs for scraping
                     urls = valid_urls
                     keywords = []  # Don't use keywords for Site Builder
@@ -1588,18 +1612,22 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                     logger.info(f"ℹ️ No URLs provided, will search DuckDuckGo for keywords: {keywords}")
                 
                 # Import web scraping module
-                scrape_campaign_data = None
+                iter_campaign_data = None
                 try:
-                    from web_scraping import scrape_campaign_data
+                    from web_scraping import iter_campaign_data
                 except ImportError as e:
                     logger.error(f"❌ Failed to import web_scraping module: {e}")
-                    scrape_campaign_data = None  # Mark as unavailable
+                    iter_campaign_data = None  # Mark as unavailable
                 
                 # Perform actual web scraping
                 created = 0
+                valid_count = 0
+                prefiltered_count = 0
+                skipped_count = 0
+                total_urls_scraped = 0
                 now = datetime.utcnow()
                 
-                if scrape_campaign_data is None:
+                if iter_campaign_data is None:
                     # Module import failed - create error row
                     logger.error(f"❌ Cannot proceed with scraping - module import failed")
                     row = CampaignRawData(
@@ -1633,32 +1661,126 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                     logger.info(f"📋 Parameters: keywords={keywords}, urls={urls}, depth={depth}, max_pages={max_pages}, include_images={include_images}, include_links={include_links}")
                     
                     try:
-                        logger.info(f"🚀 Calling scrape_campaign_data with: keywords={keywords}, urls={urls}, query={data.query or ''}, depth={depth}, max_pages={max_pages}")
+                        logger.info(f"🚀 Calling iter_campaign_data with: keywords={keywords}, urls={urls}, query={data.query or ''}, depth={depth}, max_pages={max_pages}")
                         # Update progress to show scraping is starting
                         set_task("scraping", 50, f"Scraping 0/{len(urls)} URLs... (this may take several minutes)")
                         
+                        from app.services.raw_data_writer import RawDataWriter, build_raw_data_row, flag_near_duplicate
+                        writer = RawDataWriter(session)
+                        
                         # Progress callback to update as each URL is scraped
                         def update_scraping_progress(scraped: int, total: int, progress_pct: int):
-                            set_task("scraping", progress_pct, f"Scraping {scraped}/{total} URLs... ({progress_pct}%)")
+                            set_task("scraping", progress_pct, f"Scraping {scraped}/{total} URLs, {writer.written} saved... ({progress_pct}%)")
                         
-                        scraped_results = scrape_campaign_data(
-                            keywords=keywords,
-                            urls=urls,
-                            query=data.query or "",
-                            depth=depth,
-                            max_pages=max_pages,
-                            include_images=include_images,
-                            include_links=include_links,
-                            progress_callback=update_scraping_progress
-                        )
+                        # Stream pages straight into the database: rows are written in batches while
+                        # the crawl continues, so only a few pages are ever held in memory and the
+                        # research view fills in as scraping progresses
+                        frontier_stats = {}
+                        scraped_total = 0
+                        success_count = 0
+                        error_count = 0
+                        total_text_length = 0
+                        near_duplicate_count = 0
+                        try:
+                            for result in iter_campaign_data(
+                                keywords=keywords,
+                                urls=urls,
+                                query=data.query or "",
+                                depth=depth,
+                                max_pages=max_pages,
+                                include_images=include_images,
+                                include_links=include_links,
+                                progress_callback=update_scraping_progress,
+                                skip_urls=known_urls,
+                                stats=frontier_stats
+                            ):
+                                scraped_total += 1
+                                url = result.get("url", "unknown")
+                                error = result.get("error")
+                                text_len = len(result.get("text") or "")
+                                if error:
+                                    error_count += 1
+                                else:
+                                    success_count += 1
+                                    total_text_length += text_len
+                                
+                                # Safety net: the frontier filter normally drops stored URLs before fetching
+                                if url in known_urls and not error:
+                                    skipped_count += 1
+                                    logger.debug(f"♻️ Skipping {url} - already exists in database")
+                                    continue
+                                
+                                try:
+                                    row_values = build_raw_data_row(result, cid, now, include_links)
+                                    duplicate = None if error else near_dups.check_and_add(url, fingerprint_from_hex(row_values.get("simhash")))
+                                    if duplicate and normalize_url(duplicate[0]) == normalize_url(url):
+                                        duplicate = None  # Re-scraped page matching its own stored copy
+                                    if not error:
+                                        scraped_content_hashes[normalize_url(url)] = row_values.get("content_hash")
+                                    if duplicate:
+                                        near_duplicate_count += 1
+                                        if NEAR_DUP_ACTION == "skip":
+                                            logger.info(f"🪞 Skipping {url} - near-duplicate of {duplicate[0]} ({duplicate[1]} bits apart)")
+                                            continue
+                                        flag_near_duplicate(row_values, duplicate[0], duplicate[1])
+                                        logger.info(f"🪞 {url} is a near-duplicate of {duplicate[0]} ({duplicate[1]} bits apart) - stored but excluded from topic extraction")
+                                    writer.add(row_values)
+                                except Exception as save_error:
+                                    logger.error(f"❌ Error preparing scraped data for {url}: {save_error}")
+                                    continue
+                                
+                                if error:
+                                    logger.warning(f"⚠️ Scraped {url}: ERROR - {error}")
+                                else:
+                                    logger.info(f"✅ Scraped {url}: {text_len} chars, {len(result.get('links', []))} links, {len(result.get('images', []))} images")
+                        finally:
+                            # Persist whatever was scraped, even if the crawl failed part-way
+                            try:
+                                writer.flush()
+                            except Exception as save_error:
+                                logger.error(f"❌ CRITICAL: Error saving scraped data to database for campaign {cid}: {save_error}")
+                            created = writer.written
                         
-                        logger.info(f"✅ Web scraping completed: {len(scraped_results)} pages scraped")
+                        if sitemap_plan is not None:
+                            # Replace stored copies of pages whose lastmod moved forward, keep the rest,
+                            # and remember what this sitemap looked like for the next re-run
+                            superseded_urls = [
+                                stored_url
+                                for key, stored_urls in sitemap_plan["superseded"].items() if key in scraped_content_hashes
+                                for stored_url in stored_urls
+                            ]
+                            if superseded_urls:
+                                try:
+                                    replaced = session.query(CampaignRawData).filter(
+                                        CampaignRawData.campaign_id == cid,
+                                        CampaignRawData.source_url.in_(superseded_urls),
+                                        CampaignRawData.fetched_at < now
+                                    ).delete(synchronize_session=False)
+                                    session.commit()
+                                    logger.info(f"🔁 Replaced {replaced} stored rows of {len(superseded_urls)} changed sitemap pages")
+                                except Exception as replace_err:
+                                    session.rollback()
+                                    logger.warning(f"⚠️ Could not remove superseded rows for campaign {cid}: {replace_err}")
+                            due_urls = {normalize_url(u) for u in sitemap_plan["new"] + sitemap_plan["changed"]}
+                            save_sitemap_state(cid, site_url, sitemap_entries, scraped_content_hashes, due_urls - set(scraped_content_hashes))
+                        
+                        prefiltered_count = frontier_stats.get("skipped_known", 0)
+                        # URLs filtered out before scraping count as skipped duplicates
+                        skipped_count += prefiltered_count
+                        total_urls_scraped = scraped_total + prefiltered_count
+                        
+                        logger.info(f"✅ Web scraping completed: {scraped_total} pages scraped ({prefiltered_count} already-stored URLs skipped before scraping)")
+                        logger.info(f"💾 Saved {created} scraped results in {writer.batches} batches ({writer.failed} failed, skipped={skipped_count} duplicates - reused existing data)")
+                        if near_duplicate_count:
+                            logger.info(f"🪞 {near_duplicate_count} near-duplicate pages {'skipped' if NEAR_DUP_ACTION == 'skip' else 'flagged'} (SimHash)")
                         # Update progress after scraping completes
-                        set_task("scraping_complete", 70, f"Scraped {len(scraped_results)} pages, saving to database...")
+                        set_task("scraping_complete", 70, f"Scraped {scraped_total} pages, {created} saved to database")
                         logger.info(f"📊 Progress updated: 70% - scraping_complete")
                         
                         # Log detailed results for diagnostics
-                        if len(scraped_results) == 0:
+                        if scraped_total == 0 and prefiltered_count > 0:
+                            logger.info(f"♻️ All {prefiltered_count} candidate URLs for campaign {cid} are already stored - nothing new to scrape")
+                        elif scraped_total == 0:
                             logger.error(f"❌ CRITICAL: Scraping returned 0 results for campaign {cid}")
                             logger.error(f"❌ Campaign type: {data.type}")
                             logger.error(f"❌ Keywords used: {keywords}")
@@ -1698,207 +1820,12 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                                 session.rollback()
                                 # Continue anyway - we'll check for created == 0 later
                         else:
-                            logger.info(f"📊 Scraping results breakdown:")
-                            success_count = 0
-                            error_count = 0
-                            total_text_length = 0
-                            for i, result in enumerate(scraped_results):
-                                url = result.get("url", "unknown")
-                                text = result.get("text", "")
-                                text_len = len(text)
-                                has_error = result.get("error") is not None
-                                if has_error:
-                                    error_count += 1
-                                    logger.warning(f"  [{i+1}] ❌ {url}: ERROR - {result.get('error')}")
-                                else:
-                                    success_count += 1
-                                    total_text_length += text_len
-                                    if i < 5:  # Log first 5 successful results
-                                        logger.info(f"  [{i+1}] ✅ {url}: {text_len} chars")
                             logger.info(f"📊 Summary: {success_count} successful, {error_count} errors, {total_text_length} total chars")
-                            
                             if success_count == 0:
-                                logger.error(f"❌ CRITICAL: All {len(scraped_results)} scraping attempts failed!")
-                        
-                        # Store scraped data in database
-                        # Initialize tracking variables before try block so they're accessible later
-                        skipped_count = 0
-                        created = 0
-                        total_urls_scraped = len(scraped_results) if 'scraped_results' in locals() else 0
-                        
-                        try:
-                            # Ensure json is available (it's imported globally, but ensure it's in scope)
-                            import json as json_module
-                            json = json_module  # Use global json module
-                            
-                            logger.info(f"💾 Starting to save {len(scraped_results)} scraped results to database...")
-                            
-                            # Update total_urls_scraped now that we're in the try block
-                            total_urls_scraped = len(scraped_results)
-                            
-                            # CRITICAL: Check for existing scraped data to avoid duplicates
-                            # Query all existing URLs for this campaign to reuse instead of re-scraping
-                            existing_urls = {}
-                            try:
-                                existing_rows = session.query(CampaignRawData).filter(
-                                    CampaignRawData.campaign_id == cid,
-                                    ~CampaignRawData.source_url.startswith("error:"),
-                                    ~CampaignRawData.source_url.startswith("placeholder:")
-                                ).all()
-                                for row in existing_rows:
-                                    if row.source_url and row.extracted_text and len(row.extracted_text.strip()) > 10:
-                                        existing_urls[row.source_url] = row
-                                logger.info(f"📋 Found {len(existing_urls)} existing scraped URLs for campaign {cid} - will reuse instead of re-scraping")
-                            except Exception as query_err:
-                                logger.warning(f"⚠️ Error querying existing URLs: {query_err}, will proceed with saving all results")
-                                existing_urls = {}
-                            
-                            skipped_count = 0
-                            for i, result in enumerate(scraped_results, 1):
-                                # Update progress periodically during database save (every 10 items)
-                                if i % 10 == 0 or i == len(scraped_results):
-                                    set_task("scraping_complete", 70, f"Saving to database... ({i}/{len(scraped_results)})")
-                                    logger.debug(f"💾 Saving progress: {i}/{len(scraped_results)}")
-                                url = result.get("url", "unknown")
-                                text = result.get("text", "")
-                                html = result.get("html")
-                                images = result.get("images", [])
-                                links = result.get("links", [])
-                                error = result.get("error")
-                                depth_level = result.get("depth", 0)
-                                
-                                # CRITICAL: Skip if URL already exists in database (reuse existing data)
-                                if url in existing_urls and not error:
-                                    skipped_count += 1
-                                    existing_row = existing_urls[url]
-                                    logger.debug(f"♻️ Skipping {url} - already exists in database (DB ID: {existing_row.id}, {len(existing_row.extracted_text or '')} chars)")
-                                    continue  # Skip creating duplicate row
-                                
-                                # Build metadata JSON
-                                meta = {
-                                    "type": "scraped",
-                                    "depth": depth_level,
-                                    "scraped_at": result.get("scraped_at"),
-                                    "has_images": len(images) > 0,
-                                    "image_count": len(images),
-                                    "link_count": len(links)
-                                }
-                                if error:
-                                    meta["error"] = error
-                                if images:
-                                    meta["sample_images"] = images[:5]  # Store first 5 images
-                                
-                                # Safety guard: Truncate text to MEDIUMTEXT limit (16MB) to prevent DB errors
-                                # MEDIUMTEXT max: 16,777,215 bytes (≈16 MB)
-                                # Note: Truncation at 16MB is extremely rare - most web pages are <100KB
-                                # If truncation occurs, it's likely mostly noise (ads, scripts, duplicate content)
-                                MAX_TEXT_SIZE = 16_777_000  # Leave small buffer (≈16 MB)
-                                
-                                # Language detection and filtering
-                                detected_language = None
-                                safe_text = None
-                                if text:
-                                    # Detect language before processing
-                                    try:
-                                        from langdetect import detect, LangDetectException
-                                        # Use first 1000 chars for faster detection
-                                        sample_text = text[:1000] if len(text) > 1000 else text
-                                        if len(sample_text.strip()) > 10:  # Need minimum text for detection
-                                            detected_language = detect(sample_text)
-                                            meta["detected_language"] = detected_language
-                                            
-                                            # Filter out non-English content
-                                            if detected_language != 'en':
-                                                logger.warning(f"🌐 Non-English content detected ({detected_language}) for {url}, filtering out")
-                                                logger.warning(f"🌐 Sample text: {sample_text[:200]}...")
-                                                meta["language_filtered"] = True
-                                                meta["filter_reason"] = f"non_english_{detected_language}"
-                                                safe_text = ""  # Skip non-English content
-                                            else:
-                                                logger.debug(f"✅ English content confirmed for {url}")
-                                        else:
-                                            logger.debug(f"⚠️ Text too short for language detection for {url}")
-                                            meta["detected_language"] = "unknown"
-                                    except LangDetectException as lang_err:
-                                        logger.warning(f"⚠️ Language detection failed for {url}: {lang_err}")
-                                        meta["detected_language"] = "unknown"
-                                        meta["language_detection_error"] = str(lang_err)
-                                    except ImportError:
-                                        logger.warning("⚠️ langdetect not available - skipping language filtering")
-                                        meta["detected_language"] = "not_checked"
-                                    except Exception as lang_err:
-                                        logger.warning(f"⚠️ Unexpected error in language detection for {url}: {lang_err}")
-                                        meta["detected_language"] = "error"
-                                    
-                                    # Only process text if it's English (or if language detection failed/not available)
-                                    if safe_text is None:  # Only process if not already filtered
-                                        try:
-                                            # Remove emojis and 4-byte UTF-8 characters (they cause DataError 1366)
-                                            # Keep only 1-3 byte UTF-8 characters (basic unicode)
-                                            safe_text = text.encode('utf-8', errors='ignore').decode('utf-8', errors='ignore')
-                                            # Remove any remaining problematic characters (emojis are >0xFFFF)
-                                            safe_text = ''.join(char for char in safe_text if ord(char) < 0x10000)
-                                        except Exception as encode_err:
-                                            logger.warning(f"⚠️ Error encoding extracted_text for {url}: {encode_err}, using empty string")
-                                            safe_text = ""
-                                        
-                                        # Smart truncation: Keep first portion if too large
-                                        if len(safe_text) > MAX_TEXT_SIZE:
-                                            safe_text = safe_text[:MAX_TEXT_SIZE]
-                                            logger.warning(f"⚠️ Truncated extracted_text for {url}: {len(text):,} chars → {len(safe_text):,} chars (exceeded MEDIUMTEXT 16MB limit)")
-                                            logger.warning(f"⚠️ This is extremely rare - text >16MB likely contains mostly noise. First {MAX_TEXT_SIZE:,} chars preserved.")
-                                            meta["text_truncated"] = True
-                                            meta["original_length"] = len(text)
-                                            meta["truncation_reason"] = "exceeded_mediumtext_limit"
-                                else:
-                                    safe_text = ""
-                                
-                                # Sanitize HTML to remove emojis/unicode that can't be stored in utf8mb3
-                                # Keep only ASCII + basic UTF-8, remove 4-byte UTF-8 (emojis)
-                                safe_html = None
-                                if html and include_links:
-                                    try:
-                                        # Remove emojis and 4-byte UTF-8 characters (they cause DataError 1366)
-                                        # Keep only 1-3 byte UTF-8 characters (basic unicode)
-                                        safe_html = html[:MAX_TEXT_SIZE].encode('utf-8', errors='ignore').decode('utf-8', errors='ignore')
-                                        # Remove any remaining problematic characters
-                                        safe_html = ''.join(char for char in safe_html if ord(char) < 0x10000)
-                                    except Exception as encode_err:
-                                        logger.warning(f"⚠️ Error encoding HTML for {url}: {encode_err}, storing as None")
-                                        safe_html = None
-                                
-                                row = CampaignRawData(
-                                    campaign_id=cid,
-                                    source_url=url,
-                                    fetched_at=now,
-                                    raw_html=safe_html,  # Sanitized HTML (no emojis)
-                                    extracted_text=safe_text if safe_text else (f"Error scraping {url}: {error}" if error else ""),
-                                    meta_json=json.dumps(meta)
-                                )
-                                session.add(row)
-                                # Flush to get DB ID immediately for logging
-                                session.flush()
-                                created += 1
-                                
-                                # Enhanced per-URL logging with DB ID
-                                text_len = len(safe_text) if safe_text else 0
-                                original_len = len(text) if text else 0
-                                truncation_note = f" (truncated from {original_len})" if original_len > MAX_TEXT_SIZE else ""
-                                
-                                if error:
-                                    logger.warning(f"⚠️ Scraped {url} (DB ID: {row.id}): ERROR - {error}")
-                                else:
-                                    logger.info(f"✅ Scraped {url} (DB ID: {row.id}): {text_len} chars{truncation_note}, {len(links)} links, {len(images)} images")
-                            
-                            logger.info(f"💾 Finished saving {len(scraped_results)} results to database (created={created} new, skipped={skipped_count} duplicates - reused existing data)")
-                        except Exception as save_error:
-                            logger.error(f"❌ CRITICAL: Error saving scraped data to database for campaign {cid}: {save_error}")
-                            import traceback
-                            logger.error(f"❌ Traceback: {traceback.format_exc()}")
-                            # Continue anyway - we'll create an error row below
+                                logger.error(f"❌ CRITICAL: All {scraped_total} scraping attempts failed!")
                         
                         # Only create error row if we haven't already created one (e.g., for Site Builder with 0 results)
-                        if created == 0 and len(scraped_results) == 0:
+                        if created == 0 and scraped_total == 0 and prefiltered_count == 0:
                             logger.warning(f"⚠️ Web scraping returned no results for campaign {cid}")
                             # Create error row
                             row = CampaignRawData(
@@ -1939,7 +1866,7 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                             })
                         )
                         session.add(row)
-                        created = 1
+                        created += 1  # Pages saved before the failure are already committed
                 
                 if created > 0:
                     logger.info(f"💾 Committing {created} rows to database for campaign {cid}...")
@@ -2020,11 +1947,26 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                 logger.info(f"📊 Moving to processing_content step (80%) for campaign {cid}")
                 set_task("processing_content", 80, f"Processing {created} scraped pages")
                 logger.info(f"📊 Progress updated: 80% - processing_content")
-                # Content is already processed during scraping, minimal delay
-                time.sleep(2)
+                # Tokenize, tag and lemmatize each new page once (doc_artifacts.py); the research
+                # view, keyword extraction and entity extraction reuse the stored artifacts.
+                # The new pages' term counts are then added to the campaign's totals (term_counts.py)
+                if created > 0:
+                    try:
+                        from doc_artifacts import ensure_document_artifacts
+                        from term_counts import campaign_corpus_texts, campaign_term_totals
+                        artifact_rows = session.query(CampaignRawData.source_url, CampaignRawData.extracted_text).filter(
+                            CampaignRawData.campaign_id == cid
+                        ).all()
+                        campaign_texts = campaign_corpus_texts(artifact_rows)
+                        ensure_document_artifacts(campaign_texts)
+                        campaign_term_totals(cid, campaign_texts)
+                    except Exception as artifact_err:
+                        logger.warning(f"⚠️ Could not preprocess scraped pages for campaign {cid}: {artifact_err}")
 
                 # Step 3.5: Gap Analysis for Site Builder campaigns
-                if data.type == "site_builder" and valid_count > 0:
+                # Runs over the merged corpus (reused unchanged pages + newly scraped ones), so it
+                # also runs when an incremental re-crawl found nothing new to scrape
+                if data.type == "site_builder" and (valid_count > 0 or sitemap_unchanged_count > 0):
                     try:
                         from gap_analysis import identify_content_gaps, rank_gaps_by_priority
                         from text_processing import extract_topics
@@ -2038,7 +1980,8 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                             ~CampaignRawData.source_url.startswith(("error:", "placeholder:"))
                         ).all()
                         
-                        texts = [row.extracted_text for row in all_rows if row.extracted_text and len(row.extracted_text.strip()) > 50]
+                        text_rows = [row for row in all_rows if row.extracted_text and len(row.extracted_text.strip()) > 50]
+                        texts = [row.extracted_text for row in text_rows]
                         
                         if texts:
                             # Extract topics from existing content
@@ -2050,7 +1993,9 @@ def analyze_campaign(analyze_data: AnalyzeRequest, current_user = Depends(get_cu
                                 iterations=25,
                                 query=data.query or "",
                                 keywords=[],
-                                urls=[]
+                                urls=[],
+                                campaign_id=cid,
+                                simhashes=[row.simhash for row in text_rows]
                             )
                             logger.info(f"✅ Extracted {len(existing_topics)} topics from site content")
                             
@@ -0,0 +1,244 @@
+"""
+Raw data writer for the analyze pipeline
+Turns scrape results into CampaignRawData rows and persists them in batches
+(one executemany INSERT per batch) while scraping is still running
+"""
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+try:
+    from langdetect import detect, LangDetectException
+    LANGDETECT_AVAILABLE = True
+except ImportError:
+    detect = None
+    LangDetectException = Exception
+    LANGDETECT_AVAILABLE = False
+    logger.warning("⚠️ langdetect not available - scraped text will not be language-filtered")
+
+RAW_DATA_WRITE_BATCH_SIZE = int(os.getenv("RAW_DATA_WRITE_BATCH_SIZE", "10"))  # Rows per INSERT
+RAW_DATA_WRITE_BATCH_MAX_CHARS = int(os.getenv("RAW_DATA_WRITE_BATCH_MAX_CHARS", str(8_000_000)))  # Flush early on big pages
+
+# Safety guard: Truncate text to MEDIUMTEXT limit (16MB) to prevent DB errors
+# MEDIUMTEXT max: 16,777,215 bytes (≈16 MB)
+# Note: Truncation at 16MB is extremely rare - most web pages are <100KB
+# If truncation occurs, it's likely mostly noise (ads, scripts, duplicate content)
+MAX_TEXT_SIZE = 16_777_000  # Leave small buffer (≈16 MB)
+
+# Fetch method / browser escalation / cache info kept for hit-rate reporting
+FETCH_META_KEYS = (
+    "fetch_method", "escalation_reason", "static_fetch_ms", "browser_fetch_ms",
+    "cache_age_seconds", "time_saved_ms", "ready_signal", "blocked_requests",
+)
+
+
+def _strip_4byte_chars(value: str) -> str:
+    """Remove emojis and 4-byte UTF-8 characters (they cause DataError 1366 on utf8mb3 columns)"""
+    # Keep only 1-3 byte UTF-8 characters (basic unicode)
+    value = value.encode('utf-8', errors='ignore').decode('utf-8', errors='ignore')
+    return ''.join(char for char in value if ord(char) < 0x10000)
+
+
+def build_raw_data_row(
+    result: Dict[str, Any],
+    campaign_id: str,
+    fetched_at: datetime,
+    include_links: bool = False
+) -> Dict[str, Any]:
+    """
+    Build CampaignRawData column values from one scrape result
+
+    Applies language filtering (non-English text is dropped), strips characters the
+    database can't store and truncates oversized text.
+
+    Args:
+        result: Scrape result dict (url, text, html, images, links, error, metadata)
+        campaign_id: Campaign the row belongs to
+        fetched_at: Timestamp stored on the row
+        include_links: Whether raw HTML should be stored
+
+    Returns:
+        Dict of column values for an INSERT into campaign_raw_data
+    """
+    from near_duplicates import NEAR_DUP_ENABLED, fingerprint_to_hex, simhash
+    from scrape_cache import compute_content_hash
+
+    url = result.get("url", "unknown")
+    text = result.get("text", "")
+    html = result.get("html")
+    images = result.get("images", [])
+    links = result.get("links", [])
+    error = result.get("error")
+
+    # Build metadata JSON
+    meta = {
+        "type": "scraped",
+        "depth": result.get("depth", 0),
+        "scraped_at": result.get("scraped_at"),
+        "has_images": len(images) > 0,
+        "image_count": len(images),
+        "link_count": len(links)
+    }
+    if error:
+        meta["error"] = error
+    if images:
+        meta["sample_images"] = images[:5]  # Store first 5 images
+    fetch_meta = result.get("metadata") or {}
+    for fetch_key in FETCH_META_KEYS:
+        if fetch_key in fetch_meta:
+            meta[fetch_key] = fetch_meta[fetch_key]
+
+    # Language detection and filtering
+    safe_text = None
+    if text:
+        # Detect language before processing
+        if LANGDETECT_AVAILABLE:
+            try:
+                # Use first 1000 chars for faster detection
+                sample_text = text[:1000] if len(text) > 1000 else text
+                if len(sample_text.strip()) > 10:  # Need minimum text for detection
+                    detected_language = detect(sample_text)
+                    meta["detected_language"] = detected_language
+
+                    # Filter out non-English content
+                    if detected_language != 'en':
+                        logger.warning(f"🌐 Non-English content detected ({detected_language}) for {url}, filtering out")
+                        logger.warning(f"🌐 Sample text: {sample_text[:200]}...")
+                        meta["language_filtered"] = True
+                        meta["filter_reason"] = f"non_english_{detected_language}"
+                        safe_text = ""  # Skip non-English content
+                    else:
+                        logger.debug(f"✅ English content confirmed for {url}")
+                else:
+                    logger.debug(f"⚠️ Text too short for language detection for {url}")
+                    meta["detected_language"] = "unknown"
+            except LangDetectException as lang_err:
+                logger.warning(f"⚠️ Language detection failed for {url}: {lang_err}")
+                meta["detected_language"] = "unknown"
+                meta["language_detection_error"] = str(lang_err)
+            except Exception as lang_err:
+                logger.warning(f"⚠️ Unexpected error in language detection for {url}: {lang_err}")
+                meta["detected_language"] = "error"
+        else:
+            meta["detected_language"] = "not_checked"
+
+        # Only process text if it's English (or if language detection failed/not available)
+        if safe_text is None:  # Only process if not already filtered
+            try:
+                safe_text = _strip_4byte_chars(text)
+            except Exception as encode_err:
+                logger.warning(f"⚠️ Error encoding extracted_text for {url}: {encode_err}, using empty string")
+                safe_text = ""
+
+            # Smart truncation: Keep first portion if too large
+            if len(safe_text) > MAX_TEXT_SIZE:
+                safe_text = safe_text[:MAX_TEXT_SIZE]
+                logger.warning(f"⚠️ Truncated extracted_text for {url}: {len(text):,} chars → {len(safe_text):,} chars (exceeded MEDIUMTEXT 16MB limit)")
+                meta["text_truncated"] = True
+                meta["original_length"] = len(text)
+                meta["truncation_reason"] = "exceeded_mediumtext_limit"
+    else:
+        safe_text = ""
+
+    # Sanitize HTML the same way (only stored when links were requested)
+    safe_html = None
+    if html and include_links:
+        try:
+            safe_html = _strip_4byte_chars(html[:MAX_TEXT_SIZE])
+        except Exception as encode_err:
+            logger.warning(f"⚠️ Error encoding HTML for {url}: {encode_err}, storing as None")
+            safe_html = None
+
+    return {
+        "campaign_id": campaign_id,
+        "source_url": url,
+        "fetched_at": fetched_at,
+        "raw_html": safe_html,  # Sanitized HTML (no emojis)
+        "extracted_text": safe_text if safe_text else (f"Error scraping {url}: {error}" if error else ""),
+        "meta_json": json.dumps(meta),
+        "content_hash": compute_content_hash(safe_text),
+        "simhash": fingerprint_to_hex(simhash(safe_text)) if NEAR_DUP_ENABLED else None,
+    }
+
+
+def flag_near_duplicate(row: Dict[str, Any], original_url: str, distance: int):
+    """Record in a row's meta_json that it near-duplicates an already stored page"""
+    meta = json.loads(row["meta_json"]) if row.get("meta_json") else {}
+    meta["near_duplicate_of"] = original_url
+    meta["near_duplicate_distance"] = distance
+    row["meta_json"] = json.dumps(meta)
+
+
+class RawDataWriter:
+    """
+    Batched CampaignRawData inserts
+
+    Rows are buffered and written with a single executemany INSERT once the batch
+    reaches `batch_size` rows (or `max_chars` of text/HTML), then committed so the
+    research view shows them while scraping continues. If a batch fails, its rows
+    are retried one by one so a single bad page doesn't drop the whole batch.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int = RAW_DATA_WRITE_BATCH_SIZE,
+        max_chars: int = RAW_DATA_WRITE_BATCH_MAX_CHARS
+    ):
+        self.session = session
+        self.batch_size = max(1, batch_size)
+        self.max_chars = max_chars
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_chars = 0
+
+    def add(self, row: Dict[str, Any]):
+        """Buffer a row (from build_raw_data_row) and flush when the batch is full"""
+        self._pending.append(row)
+        self._pending_chars += len(row.get("extracted_text") or "") + len(row.get("raw_html") or "")
+        if len(self._pending) >= self.batch_size or self._pending_chars >= self.max_chars:
+            self.flush()
+
+    def _insert(self, rows: List[Dict[str, Any]]):
+        from models import CampaignRawData
+        self.session.execute(insert(CampaignRawData), rows)
+        self.session.commit()
+
+    def flush(self) -> int:
+        """
+        Write all buffered rows
+
+        Returns:
+            Number of rows written by this flush
+        """
+        if not self._pending:
+            return 0
+        rows, self._pending, self._pending_chars = self._pending, [], 0
+        try:
+            self._insert(rows)
+            written = len(rows)
+        except Exception as batch_err:
+            self.session.rollback()
+            logger.warning(f"⚠️ Batch insert of {len(rows)} raw data rows failed ({batch_err}), retrying row by row")
+            written = 0
+            for row in rows:
+                try:
+                    self._insert([row])
+                    written += 1
+                except Exception as row_err:
+                    self.session.rollback()
+                    self.failed += 1
+                    logger.error(f"❌ Failed to save raw data for {row.get('source_url')}: {row_err}")
+        self.written += written
+        self.batches += 1
+        logger.info(f"💾 Saved batch of {written} raw data rows ({self.written} total)")
+        return written
@@ -0,0 +1,362 @@
+"""
+Browser Pool for Playwright Scraping
+Keeps a small number of warm Chromium browsers alive for the whole process
+instead of launching (and tearing down) a browser for every scraped URL.
+
+The pool runs Playwright's async API on a dedicated event-loop thread, so it can
+be shared by analysis jobs running on different background threads (sync
+Playwright objects are bound to the thread that created them).
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+# Pool configuration (env overrides)
+BROWSER_POOL_SIZE = int(os.getenv("SCRAPER_BROWSER_POOL_SIZE", "2"))
+BROWSER_MAX_PAGES = int(os.getenv("SCRAPER_BROWSER_MAX_PAGES", "50"))  # Recycle after N pages
+BROWSER_MAX_RSS_MB = int(os.getenv("SCRAPER_BROWSER_MAX_RSS_MB", "700"))  # Recycle above this RSS
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+class BrowserLaunchError(RuntimeError):
+    """Raised when Chromium cannot be launched (usually: browsers not installed)"""
+
+
+def _child_pids(pid: int) -> Set[int]:
+    """Return all descendant PIDs of a process (psutil, or /proc on Linux)"""
+    if PSUTIL_AVAILABLE:
+        try:
+            return {c.pid for c in psutil.Process(pid).children(recursive=True)}
+        except Exception:
+            return set()
+
+    parents: Dict[int, List[int]] = {}
+    try:
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # Field 4 is the parent PID; the command name (field 2) may contain spaces
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+                parents.setdefault(ppid, []).append(int(entry))
+            except (OSError, ValueError, IndexError):
+                continue
+    except OSError:
+        return set()
+
+    descendants: Set[int] = set()
+    stack = [pid]
+    while stack:
+        for child in parents.get(stack.pop(), []):
+            if child not in descendants:
+                descendants.add(child)
+                stack.append(child)
+    return descendants
+
+
+def _parent_pid(pid: int) -> Optional[int]:
+    """Parent PID of a process, or None if it is gone"""
+    try:
+        if PSUTIL_AVAILABLE:
+            return psutil.Process(pid).ppid()
+        with open(f"/proc/{pid}/stat") as f:
+            return int(f.read().rsplit(")", 1)[1].split()[1])
+    except Exception:
+        return None
+
+
+def _process_tree_rss_mb(pid: int) -> float:
+    """Resident memory (MB) of a process plus all of its descendants"""
+    total_bytes = 0
+    for p in {pid} | _child_pids(pid):
+        try:
+            if PSUTIL_AVAILABLE:
+                total_bytes += psutil.Process(p).memory_info().rss
+            else:
+                with open(f"/proc/{p}/statm") as f:
+                    total_bytes += int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except Exception:
+            continue
+    return total_bytes / (1024 * 1024)
+
+
+class _PooledBrowser:
+    """Bookkeeping for one warm Chromium instance"""
+
+    def __init__(self, browser: Any, pid: Optional[int]):
+        self.browser = browser
+        self.pid = pid
+        self.pages_served = 0
+        self.active_pages = 0
+        self.launched_at = time.time()
+        self.retiring = False
+
+
+class BrowserPool:
+    """
+    Process-wide pool of warm Chromium browsers.
+
+    Each page gets its own fresh browser context (isolated cookies/storage), while
+    the expensive browser process is reused. A browser is retired once it has served
+    `max_pages` pages or its process tree exceeds `max_rss_mb`, and is closed as soon
+    as its in-flight pages finish.
+    """
+
+    def __init__(
+        self,
+        size: int = BROWSER_POOL_SIZE,
+        max_pages: int = BROWSER_MAX_PAGES,
+        max_rss_mb: int = BROWSER_MAX_RSS_MB
+    ):
+        self.size = max(1, size)
+        self.max_pages = max(1, max_pages)
+        self.max_rss_mb = max_rss_mb
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._lock: Optional[asyncio.Lock] = None
+        self._playwright = None
+        self._browsers: List[_PooledBrowser] = []
+        self._launches = 0
+        self._recycles = 0
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Event loop thread
+    # ------------------------------------------------------------------
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop owning all Playwright objects (started on first use)"""
+        with self._thread_lock:
+            if self._closed:
+                raise RuntimeError("Browser pool has been shut down")
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="browser-pool-loop",
+                    daemon=True
+                )
+                self._thread.start()
+                logger.info(f"🚀 Browser pool loop started (size={self.size}, max_pages={self.max_pages}, max_rss_mb={self.max_rss_mb})")
+            return self._loop
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """Schedule a coroutine on the pool's event loop without waiting for it"""
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("BrowserPool cannot be driven from its own event loop thread")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the pool's event loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run (may use `self.page()`)
+            timeout: Seconds to wait for the result
+
+        Returns:
+            The coroutine's return value
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    # ------------------------------------------------------------------
+    # Browser lifecycle (must run on the pool loop)
+    # ------------------------------------------------------------------
+    async def _ensure_started(self):
+        if self._playwright is None:
+            try:
+                from playwright.async_api import async_playwright
+            except ImportError as e:
+                raise BrowserLaunchError(
+                    "Playwright not available - install with: pip install playwright && playwright install chromium"
+                ) from e
+            self._playwright = await async_playwright().start()
+
+    async def _launch_browser(self) -> _PooledBrowser:
+        before = _child_pids(os.getpid())
+        try:
+            browser = await self._playwright.chromium.launch(headless=True)
+        except Exception as launch_err:
+            logger.error(f"Failed to launch Playwright browser: {launch_err}")
+            logger.error("Run 'playwright install chromium' to install browsers")
+            raise BrowserLaunchError(f"Playwright browser not installed: {str(launch_err)}") from launch_err
+
+        # Launches are serialized by the pool lock, so the new top-level Chromium process
+        # is the one that appeared during this launch (used for RSS accounting)
+        new_pids = _child_pids(os.getpid()) - before
+        roots = [p for p in new_pids if _parent_pid(p) not in new_pids]
+        pid = roots[0] if len(roots) == 1 else None
+
+        self._launches += 1
+        logger.info(f"✅ Launched pooled Chromium browser (pid={pid}, pool={len(self._browsers) + 1}/{self.size})")
+        return _PooledBrowser(browser, pid)
+
+    async def _close_browser(self, pooled: _PooledBrowser):
+        if pooled in self._browsers:
+            self._browsers.remove(pooled)
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled browser: {e}")
+
+    async def _acquire(self) -> _PooledBrowser:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            await self._ensure_started()
+
+            # Drop browsers that crashed or were disconnected
+            for pooled in list(self._browsers):
+                if not pooled.browser.is_connected():
+                    logger.warning("⚠️ Pooled browser disconnected, discarding it")
+                    self._browsers.remove(pooled)
+
+            live = [b for b in self._browsers if not b.retiring]
+            # Grow lazily: only launch another browser when every warm one is busy
+            if not live or (len(live) < self.size and all(b.active_pages > 0 for b in live)):
+                pooled = await self._launch_browser()
+                self._browsers.append(pooled)
+                live.append(pooled)
+
+            pooled = min(live, key=lambda b: b.active_pages)
+            pooled.active_pages += 1
+            pooled.pages_served += 1
+            if pooled.pages_served >= self.max_pages:
+                # Serve this page, then retire the browser once it is idle
+                pooled.retiring = True
+            return pooled
+
+    async def _release(self, pooled: _PooledBrowser):
+        pooled.active_pages -= 1
+        if not pooled.retiring and self.max_rss_mb and pooled.pid:
+            rss_mb = _process_tree_rss_mb(pooled.pid)
+            if rss_mb > self.max_rss_mb:
+                logger.info(f"♻️ Pooled browser pid={pooled.pid} using {rss_mb:.0f} MB (> {self.max_rss_mb} MB), recycling")
+                pooled.retiring = True
+        if pooled.retiring and pooled.active_pages <= 0:
+            self._recycles += 1
+            logger.info(f"♻️ Recycling pooled browser after {pooled.pages_served} pages")
+            await self._close_browser(pooled)
+
+    @asynccontextmanager
+    async def page(self, user_agent: str = DEFAULT_USER_AGENT, **context_kwargs):
+        """
+        Yield a new page in a fresh, isolated browser context on a warm browser.
+
+        Args:
+            user_agent: User agent for the new context
+            **context_kwargs: Extra arguments for `browser.new_context()`
+        """
+        pooled = await self._acquire()
+        context = None
+        try:
+            context = await pooled.browser.new_context(user_agent=user_agent, **context_kwargs)
+            page = await context.new_page()
+            yield page
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.debug(f"Error closing browser context: {e}")
+            await self._release(pooled)
+
+    async def _close_all(self):
+        for pooled in list(self._browsers):
+            await self._close_browser(pooled)
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping Playwright: {e}")
+            self._playwright = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool state (for logging / admin endpoints)"""
+        return {
+            "size": self.size,
+            "max_pages": self.max_pages,
+            "max_rss_mb": self.max_rss_mb,
+            "launches": self._launches,
+            "recycles": self._recycles,
+            "browsers": [
+                {
+                    "pid": b.pid,
+                    "pages_served": b.pages_served,
+                    "active_pages": b.active_pages,
+                    "retiring": b.retiring,
+                    "uptime_seconds": round(time.time() - b.launched_at, 1),
+                    "rss_mb": round(_process_tree_rss_mb(b.pid), 1) if b.pid else None,
+                }
+                for b in list(self._browsers)
+            ],
+        }
+
+    def shutdown(self, timeout: float = 15.0):
+        """Close all browsers, stop Playwright and the loop thread (idempotent)"""
+        with self._thread_lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_all(), loop).result(timeout=timeout)
+        except Exception as e:
+            logger.warning(f"⚠️ Error shutting down browser pool: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=timeout)
+        logger.info(f"✅ Browser pool shut down ({self._launches} launches, {self._recycles} recycles)")
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool (created lazily)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+        return _pool
+
+
+def shutdown_browser_pool():
+    """Shut down the process-wide browser pool if it was ever started"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_browser_pool)
@@ -0,0 +1,257 @@
+"""
+Crawl Frontier for Campaign Scraping
+Breadth-first, priority-ordered URL scheduler: canonical dedupe of normalized URLs,
+robots.txt awareness and link scoring by anchor-text relevance to campaign keywords
+"""
+
+import heapq
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+from scrape_cache import normalize_url
+
+logger = logging.getLogger(__name__)
+
+SCRAPER_RESPECT_ROBOTS = os.getenv("SCRAPER_RESPECT_ROBOTS", "true").lower() in ("1", "true", "yes")
+SCRAPER_LINKS_PER_PAGE = int(os.getenv("SCRAPER_LINKS_PER_PAGE", "5"))  # Best-scoring links followed per page
+ROBOTS_CACHE_TTL_SECONDS = 3600
+ROBOTS_TIMEOUT_SECONDS = 5
+
+# Penalty per page already scheduled from the same host, so one site can't eat the budget
+HOST_REPEAT_PENALTY = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = {
+    "the", "and", "for", "with", "from", "that", "this", "your", "you", "are", "how",
+    "what", "why", "www", "com", "html", "htm", "php", "aspx", "index", "page",
+}
+
+
+def _tokens(text: str) -> Set[str]:
+    return {t for t in _TOKEN_RE.findall((text or "").lower()) if len(t) >= 3 and t not in _STOPWORDS}
+
+
+class FrontierItem(NamedTuple):
+    url: str
+    depth: int
+    score: float
+    anchor_text: str = ""
+    parent_url: Optional[str] = None
+
+
+class RobotsCache:
+    """Per-host robots.txt rules, fetched once per host and cached in-process"""
+
+    def __init__(self, user_agent: str = "*"):
+        self.user_agent = user_agent
+        self._parsers: Dict[str, Tuple[float, Optional[RobotFileParser]]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, origin: str) -> Optional[RobotFileParser]:
+        from static_fetch import get_static_session
+
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        try:
+            response = get_static_session().get(f"{origin}/robots.txt", timeout=ROBOTS_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.debug(f"robots.txt unavailable for {origin}: {e}")
+            return None  # Unreachable robots.txt: allow
+
+        if response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif response.status_code >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(response.text.splitlines())
+        return parser
+
+    def allowed(self, url: str) -> bool:
+        """Whether robots.txt of the URL's host permits fetching it"""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            cached = self._parsers.get(origin)
+        if cached is None or time.time() - cached[0] > ROBOTS_CACHE_TTL_SECONDS:
+            parser = self._load(origin)
+            with self._lock:
+                self._parsers[origin] = (time.time(), parser)
+        else:
+            parser = cached[1]
+        if parser is None:
+            return True
+        try:
+            return parser.can_fetch(self.user_agent, url)
+        except Exception:
+            return True
+
+
+# Shared across crawls so each host's robots.txt is fetched once per hour, not once per campaign
+_robots_cache = RobotsCache()
+
+
+class CrawlFrontier:
+    """
+    Priority queue of URLs to crawl, ordered by (depth, -score).
+
+    Seeds keep their original (search rank) order at depth 0, whatever their host;
+    discovered links are scored by how well their anchor text and URL path match the
+    campaign keywords, minus a penalty for hosts that already have pages scheduled. Every URL is
+    deduplicated on its normalized form, and URLs already stored for the campaign
+    (`skip_urls`) never enter the queue.
+    """
+
+    def __init__(
+        self,
+        max_pages: int,
+        max_depth: int = 1,
+        keywords: Optional[List[str]] = None,
+        query: str = "",
+        skip_urls: Optional[Set[str]] = None,
+        respect_robots: bool = SCRAPER_RESPECT_ROBOTS,
+        links_per_page: int = SCRAPER_LINKS_PER_PAGE
+    ):
+        self.max_pages = max_pages
+        self.max_depth = max(1, max_depth)
+        self.links_per_page = max(1, links_per_page)
+        self.respect_robots = respect_robots
+        self.robots = _robots_cache
+        self._skip = {normalize_url(u) for u in (skip_urls or []) if u}
+        self._seen: Set[str] = set()
+        self._heap: List[Tuple[int, float, int, FrontierItem]] = []
+        self._seq = 0
+        self._host_counts: Dict[str, int] = {}
+        self.scheduled = 0
+        self.skipped_known = 0
+        self.disallowed = 0
+
+        # Keywords are the search targets; query words count as weaker context
+        self._keyword_phrases = [k.lower().strip() for k in (keywords or []) if k and k.strip()]
+        self._keyword_tokens: Set[str] = set()
+        for keyword in self._keyword_phrases:
+            self._keyword_tokens |= _tokens(keyword)
+        self._query_tokens = _tokens(query) - self._keyword_tokens
+
+    @property
+    def remaining_budget(self) -> int:
+        return max(self.max_pages - self.scheduled, 0)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def score_link(self, url: str, anchor_text: str = "") -> float:
+        """
+        Relevance of a discovered link to the campaign keywords
+
+        Args:
+            url: Absolute link URL
+            anchor_text: Visible text of the link
+
+        Returns:
+            Score (higher = crawl sooner); 0.0 when nothing matches
+        """
+        anchor_lower = (anchor_text or "").lower()
+        anchor_tokens = _tokens(anchor_text)
+        path_tokens = _tokens(urlsplit(url).path.replace("-", " ").replace("_", " "))
+
+        score = 0.0
+        for phrase in self._keyword_phrases:
+            if phrase and phrase in anchor_lower:
+                score += 2.0
+        score += 1.0 * len(self._keyword_tokens & anchor_tokens)
+        score += 0.5 * len(self._keyword_tokens & path_tokens)
+        score += 0.25 * len(self._query_tokens & (anchor_tokens | path_tokens))
+        return score
+
+    def _push(self, url: str, depth: int, score: float, anchor_text: str = "", parent_url: Optional[str] = None) -> bool:
+        if depth >= self.max_depth:
+            return False
+        normalized = normalize_url(url)
+        if normalized in self._seen:
+            return False
+        self._seen.add(normalized)
+        if normalized in self._skip:
+            self.skipped_known += 1
+            return False
+
+        host = urlsplit(normalized).netloc
+        # Seeds are ranked by the search engine, so only discovered links pay the host penalty
+        effective = score if depth == 0 else score - HOST_REPEAT_PENALTY * self._host_counts.get(host, 0)
+        self._host_counts[host] = self._host_counts.get(host, 0) + 1
+
+        item = FrontierItem(url, depth, effective, anchor_text, parent_url)
+        heapq.heappush(self._heap, (depth, -effective, self._seq, item))
+        self._seq += 1
+        return True
+
+    def add_seeds(self, urls: Iterable[str]) -> int:
+        """Queue initial URLs at depth 0, keeping their order (search rank). Returns count added."""
+        added = 0
+        for url in urls:
+            # Equal scores: the sequence number keeps original order
+            if self._push(url, 0, 0.0):
+                added += 1
+        return added
+
+    def add_links(self, parent: FrontierItem, links: Iterable[Tuple[str, str]]) -> int:
+        """
+        Queue the best-scoring links discovered on a crawled page
+
+        Args:
+            parent: Frontier item of the page the links came from
+            links: (url, anchor_text) pairs
+
+        Returns:
+            Number of links queued
+        """
+        if parent.depth + 1 >= self.max_depth:
+            return 0
+        scored = sorted(
+            ((self.score_link(url, anchor), url, anchor) for url, anchor in links),
+            key=lambda entry: entry[0],
+            reverse=True
+        )
+        added = 0
+        for score, url, anchor in scored:
+            if added >= self.links_per_page:
+                break
+            if self._push(url, parent.depth + 1, score, anchor, parent.url):
+                added += 1
+        return added
+
+    def mark_seen(self, url: Optional[str]):
+        """Record an alias (e.g. rel=canonical) of a crawled page so it isn't queued again"""
+        if url:
+            self._seen.add(normalize_url(url))
+
+    def pop_batch(self, limit: int) -> List[FrontierItem]:
+        """
+        Pop up to `limit` highest-priority items from the shallowest depth level
+
+        Items are not counted against the page budget until `mark_scheduled()`.
+        """
+        batch: List[FrontierItem] = []
+        if not self._heap or limit <= 0:
+            return batch
+        level = self._heap[0][0]
+        while self._heap and len(batch) < limit and self._heap[0][0] == level:
+            batch.append(heapq.heappop(self._heap)[3])
+        return batch
+
+    def is_allowed(self, url: str) -> bool:
+        """robots.txt check (blocking: may fetch robots.txt on first use of a host)"""
+        if not self.respect_robots:
+            return True
+        allowed = self.robots.allowed(url)
+        if not allowed:
+            self.disallowed += 1
+            logger.info(f"🤖 robots.txt disallows {url}, skipping")
+        return allowed
+
+    def mark_scheduled(self, count: int):
+        self.scheduled += count
@@ -0,0 +1,287 @@
+"""
+Tokenize-Once Document Artifacts
+Each scraped page is sentence-split, word-tokenized, POS-tagged and lemmatized once,
+when the analyze pipeline ingests it, instead of on every research request. The
+result is stored compactly in the document_artifact_cache table - a vocabulary of
+the document's distinct strings plus integer id arrays for tokens, lemmas and tags,
+and the token offsets where sentences start - keyed by the content hash of the text,
+so campaigns sharing a page share its artifact.
+
+Tokens are exactly word_tokenize(text) and tags exactly pos_tag() of them, so NE
+chunking, keyword counts, the word cloud and phrase extraction can start from the
+artifact instead of the raw text.
+"""
+
+import io
+import logging
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from scrape_cache import compute_content_hash
+
+logger = logging.getLogger(__name__)
+
+DOC_ARTIFACTS_ENABLED = os.getenv("DOC_ARTIFACTS_ENABLED", "true").lower() in ("1", "true", "yes")
+DOC_ARTIFACT_WORKERS = os.getenv("DOC_ARTIFACT_WORKERS", "auto")  # "auto" = one per core, up to the document count
+DOC_ARTIFACT_PARALLEL_MIN_DOCS = int(os.getenv("DOC_ARTIFACT_PARALLEL_MIN_DOCS", "4"))  # Fewer documents are processed in-process
+# Bump when the tokenization/tagging pipeline or the stored layout changes; older artifacts are rebuilt
+DOC_ARTIFACT_VERSION = 1
+
+_LOOKUP_CHUNK = 500  # Hashes per IN (...) query
+_SEPARATOR = "\n"  # Tokens never contain whitespace
+
+
+class DocumentArtifact:
+    """
+    Preprocessed form of one document
+
+    Attributes:
+        tokens: word_tokenize(text), original case
+        lemmas: WordNet lemma of each lowercased token
+        tags: Penn Treebank POS tag of each token (pos_tag on the original-case tokens)
+        sentence_starts: Token index where each sentence begins
+    """
+
+    __slots__ = ("tokens", "lemmas", "tags", "sentence_starts")
+
+    def __init__(self, tokens: List[str], lemmas: List[str], tags: List[str], sentence_starts: List[int]):
+        self.tokens = tokens
+        self.lemmas = lemmas
+        self.tags = tags
+        self.sentence_starts = sentence_starts
+
+    def tagged(self) -> List[Tuple[str, str]]:
+        """(token, tag) pairs, as pos_tag(word_tokenize(text)) returns them"""
+        return list(zip(self.tokens, self.tags))
+
+    def lower_tagged(self) -> List[Tuple[str, str]]:
+        """(lowercased token, tag) pairs"""
+        return [(token.lower(), tag) for token, tag in zip(self.tokens, self.tags)]
+
+    def sentences(self) -> List[List[str]]:
+        """Tokens grouped by sentence"""
+        bounds = list(self.sentence_starts) + [len(self.tokens)]
+        return [self.tokens[start:end] for start, end in zip(bounds, bounds[1:])]
+
+    def keyword_lemmas(self, stop_words) -> List[str]:
+        """Lemmas of alphanumeric, non-stopword tokens (preprocess_text(text, aggressive=True) without 'empty')"""
+        return [
+            lemma for token, lemma in zip(self.tokens, self.lemmas)
+            if token.isalnum() and token.lower() not in stop_words
+        ]
+
+
+def _id_dtype(size: int):
+    return np.uint16 if size <= np.iinfo(np.uint16).max + 1 else np.uint32
+
+
+def pack_artifact(artifact: DocumentArtifact) -> bytes:
+    """Compact binary form: string table + id arrays (np.savez_compressed)"""
+    vocab: Dict[str, int] = {}
+    token_ids = [vocab.setdefault(token, len(vocab)) for token in artifact.tokens]
+    lemma_ids = [vocab.setdefault(lemma, len(vocab)) for lemma in artifact.lemmas]
+    tagset: Dict[str, int] = {}
+    tag_ids = [tagset.setdefault(tag, len(tagset)) for tag in artifact.tags]
+    dtype = _id_dtype(len(vocab))
+    buffer = io.BytesIO()
+    np.savez_compressed(
+        buffer,
+        vocab=np.frombuffer(_SEPARATOR.join(vocab).encode("utf-8"), dtype=np.uint8),
+        tagset=np.frombuffer(_SEPARATOR.join(tagset).encode("utf-8"), dtype=np.uint8),
+        tokens=np.asarray(token_ids, dtype=dtype),
+        lemmas=np.asarray(lemma_ids, dtype=dtype),
+        tags=np.asarray(tag_ids, dtype=np.uint8),
+        sentence_starts=np.asarray(artifact.sentence_starts, dtype=np.uint32),
+    )
+    return buffer.getvalue()
+
+
+def unpack_artifact(blob: bytes) -> DocumentArtifact:
+    with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+        vocab = data["vocab"].tobytes().decode("utf-8").split(_SEPARATOR) if data["vocab"].size else []
+        tagset = data["tagset"].tobytes().decode("utf-8").split(_SEPARATOR) if data["tagset"].size else []
+        return DocumentArtifact(
+            tokens=[vocab[i] for i in data["tokens"].tolist()],
+            lemmas=[vocab[i] for i in data["lemmas"].tolist()],
+            tags=[tagset[i] for i in data["tags"].tolist()],
+            sentence_starts=data["sentence_starts"].tolist(),
+        )
+
+
+def build_document_artifact(text: str) -> DocumentArtifact:
+    """Sentence-split, tokenize, tag and lemmatize one document"""
+    from nltk import pos_tag
+    from nltk.stem import WordNetLemmatizer
+    from nltk.tokenize import sent_tokenize, word_tokenize
+    from nlp_models import ensure_nltk_resources
+
+    ensure_nltk_resources()
+    tokens: List[str] = []
+    sentence_starts: List[int] = []
+    # word_tokenize(text) is sent_tokenize + per-sentence tokenization; doing the two
+    # steps here gives the same tokens plus the sentence boundaries
+    for sentence in sent_tokenize(text or ""):
+        sentence_tokens = word_tokenize(sentence, preserve_line=True)
+        if sentence_tokens:
+            sentence_starts.append(len(tokens))
+            tokens.extend(sentence_tokens)
+    tags = [tag for _, tag in pos_tag(tokens)] if tokens else []
+    lemmatizer = WordNetLemmatizer()
+    lemma_of: Dict[str, str] = {}
+    lemmas = []
+    for token in tokens:
+        lower = token.lower()
+        if lower not in lemma_of:
+            lemma_of[lower] = lemmatizer.lemmatize(lower)
+        lemmas.append(lemma_of[lower])
+    return DocumentArtifact(tokens, lemmas, tags, sentence_starts)
+
+
+def build_packed_artifact(text: str) -> Optional[bytes]:
+    """build_document_artifact + pack_artifact (top-level so it can run in a worker process)"""
+    try:
+        return pack_artifact(build_document_artifact(text))
+    except Exception as e:
+        logger.warning(f"⚠️ Could not preprocess document (length {len(text) if text else 0}): {e}")
+        return None
+
+
+def _artifact_workers(doc_count: int) -> int:
+    if DOC_ARTIFACT_WORKERS != "auto":
+        try:
+            return max(1, int(DOC_ARTIFACT_WORKERS))
+        except ValueError:
+            return 1
+    return max(1, min(doc_count, os.cpu_count() or 1))
+
+
+def build_packed_artifacts(texts: Sequence[str]) -> List[Optional[bytes]]:
+    """build_packed_artifact for each text, in worker processes when there are enough"""
+    texts = list(texts)
+    workers = _artifact_workers(len(texts))
+    if workers > 1 and len(texts) >= max(2, DOC_ARTIFACT_PARALLEL_MIN_DOCS):
+        try:
+            from worker_pool import map_in_workers
+            return map_in_workers(build_packed_artifact, texts, workers=workers)
+        except Exception as e:
+            # Worker processes unavailable (e.g. inside a daemon process) - preprocess in-process
+            logger.warning(f"⚠️ Parallel document preprocessing failed ({e}), preprocessing sequentially")
+    return [build_packed_artifact(text) for text in texts]
+
+
+def _session():
+    from database import SessionLocal
+    return SessionLocal()
+
+
+def load_packed_artifacts(hashes: Sequence[str]) -> Dict[str, bytes]:
+    """Content hash -> stored packed artifact (current version only)"""
+    found: Dict[str, bytes] = {}
+    wanted = sorted({h for h in hashes if h})
+    if not DOC_ARTIFACTS_ENABLED or not wanted:
+        return found
+    try:
+        from models import DocumentArtifactCache
+        session = _session()
+        try:
+            for start in range(0, len(wanted), _LOOKUP_CHUNK):
+                rows = session.query(DocumentArtifactCache.content_hash, DocumentArtifactCache.artifact).filter(
+                    DocumentArtifactCache.content_hash.in_(wanted[start:start + _LOOKUP_CHUNK]),
+                    DocumentArtifactCache.version == DOC_ARTIFACT_VERSION
+                ).all()
+                found.update((content_hash, blob) for content_hash, blob in rows)
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Document artifact lookup failed: {e}")
+    return found
+
+
+def store_packed_artifacts(packed: Dict[str, bytes]):
+    """Insert or replace artifacts by content hash"""
+    if not DOC_ARTIFACTS_ENABLED or not packed:
+        return
+    try:
+        from models import DocumentArtifactCache
+        session = _session()
+        try:
+            existing = {
+                row.content_hash: row for row in session.query(DocumentArtifactCache).filter(
+                    DocumentArtifactCache.content_hash.in_(list(packed))
+                ).all()
+            }
+            now = datetime.now()
+            for content_hash, blob in packed.items():
+                row = existing.get(content_hash)
+                if row is None:
+                    row = DocumentArtifactCache(content_hash=content_hash)
+                    session.add(row)
+                row.version = DOC_ARTIFACT_VERSION
+                row.artifact = blob
+                row.created_at = now
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    except Exception as e:
+        # Concurrent ingestion of the same page can hit the unique key - the other writer wins
+        logger.warning(f"⚠️ Could not store document artifacts: {e}")
+
+
+def _packed_for(texts: Sequence[str], compute_missing: bool) -> Tuple[List[str], Dict[str, bytes], int]:
+    hashes = [compute_content_hash(text) or "" for text in texts]
+    packed = load_packed_artifacts(hashes)
+    built = 0
+    if compute_missing:
+        pending: Dict[str, str] = {}
+        for text, h in zip(texts, hashes):
+            if h and h not in packed and h not in pending:
+                pending[h] = text
+        if pending:
+            fresh = {h: blob for h, blob in zip(pending, build_packed_artifacts(list(pending.values()))) if blob is not None}
+            store_packed_artifacts(fresh)
+            packed.update(fresh)
+            built = len(fresh)
+    return hashes, packed, built
+
+
+def get_document_artifacts(texts: Sequence[str], compute_missing: bool = True) -> List[Optional[DocumentArtifact]]:
+    """
+    Artifacts for a corpus, building (and storing) the ones that don't exist yet
+
+    Args:
+        texts: Document texts
+        compute_missing: Preprocess documents without a stored artifact (False: None for them)
+
+    Returns:
+        One artifact per text, in order (None for empty texts or where preprocessing failed)
+    """
+    hashes, packed, built = _packed_for(texts, compute_missing)
+    if built:
+        logger.info(f"🧩 Preprocessed {built} of {len(texts)} documents (the rest from stored artifacts)")
+    decoded: Dict[str, DocumentArtifact] = {}
+    artifacts = []
+    for h in hashes:
+        if h in packed and h not in decoded:
+            decoded[h] = unpack_artifact(packed[h])
+        artifacts.append(decoded.get(h))
+    return artifacts
+
+
+def ensure_document_artifacts(texts: Sequence[str]) -> int:
+    """
+    Build and store artifacts for documents that don't have one (ingestion hook)
+
+    Returns:
+        Number of documents preprocessed
+    """
+    if not DOC_ARTIFACTS_ENABLED:
+        return 0
+    _, packed, built = _packed_for(texts, compute_missing=True)
+    logger.info(f"🧩 Document artifacts: {built} built, {len(packed) - built} already stored")
+    return built
@@ -0,0 +1,268 @@
+"""
+Per-Document Entity Cache
+Named-entity extraction (NLTK pos_tag + ne_chunk) is the most expensive step of the
+research view. Each document's extract_entities() output is stored on its
+CampaignRawData row together with the content hash of the text it came from, so a
+page is only run through NER once: re-requests and other campaigns that scraped the
+same page reuse the stored result, and campaign-level entities are a merge of the
+per-document results. Documents that do need extraction are processed in the shared
+worker pool (worker_pool.py).
+"""
+
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from scrape_cache import compute_content_hash
+
+logger = logging.getLogger(__name__)
+
+ENTITY_CACHE_ENABLED = os.getenv("ENTITY_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+ENTITY_EXTRACTION_WORKERS = os.getenv("ENTITY_EXTRACTION_WORKERS", "auto")  # "auto" = one per core, up to the uncached document count
+ENTITY_PARALLEL_MIN_DOCS = int(os.getenv("ENTITY_PARALLEL_MIN_DOCS", "4"))  # Fewer uncached documents are extracted in-process
+# Bump when extract_entities() changes its output for the same text; older stored results are re-extracted
+ENTITY_EXTRACTOR_VERSION = 1
+
+ENTITY_TYPES = ["persons", "organizations", "locations", "dates", "money", "percent", "time", "facility"]
+
+_LOOKUP_CHUNK = 500  # Hashes / ids per IN (...) query
+
+
+def _session():
+    from database import SessionLocal
+    return SessionLocal()
+
+
+def _chunks(values: List, size: int = _LOOKUP_CHUNK):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _decode(entities_json: Optional[str]) -> Optional[Dict[str, List[str]]]:
+    """Stored entities, or None if missing, unreadable or from another extractor version"""
+    if not entities_json:
+        return None
+    try:
+        payload = json.loads(entities_json)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != ENTITY_EXTRACTOR_VERSION:
+        return None
+    return payload.get("entities")
+
+
+def _encode(entities: Dict[str, List[str]]) -> str:
+    return json.dumps({"version": ENTITY_EXTRACTOR_VERSION, "entities": entities})
+
+
+def extract_document_entities(text: str, pos_tags: Optional[List[Tuple[str, str]]] = None) -> Optional[Dict[str, List[str]]]:
+    """
+    All entity types of one document (top-level so it can run in a worker process)
+
+    Args:
+        text: Document text
+        pos_tags: Tagged tokens from the document's stored artifact, if there is one
+
+    Returns:
+        extract_entities() output, or None if extraction failed
+    """
+    try:
+        from entity_extraction import extract_entities
+        return extract_entities(
+            text,
+            extract_persons=True,
+            extract_organizations=True,
+            extract_locations=True,
+            extract_dates=True,
+            extract_money=True,
+            extract_percent=True,
+            extract_time=True,
+            extract_facility=True,
+            pos_tags=pos_tags
+        )
+    except Exception as e:
+        logger.error(f"❌ Error extracting entities from text (length {len(text) if text else 0}): {e}")
+        return None
+
+
+def _extraction_workers(doc_count: int) -> int:
+    if ENTITY_EXTRACTION_WORKERS != "auto":
+        try:
+            return max(1, int(ENTITY_EXTRACTION_WORKERS))
+        except ValueError:
+            return 1
+    return max(1, min(doc_count, os.cpu_count() or 1))
+
+
+def extract_entities_parallel(
+    texts: Sequence[str],
+    workers: Optional[int] = None,
+    pos_tags: Optional[Sequence[Optional[List[Tuple[str, str]]]]] = None
+) -> List[Optional[Dict[str, List[str]]]]:
+    """
+    extract_document_entities() for each text, in worker processes when there are enough
+
+    Args:
+        texts: Documents to run NER on
+        workers: Worker processes (default ENTITY_EXTRACTION_WORKERS)
+        pos_tags: Already tagged tokens per text (None entries are tagged by the worker)
+
+    Returns:
+        One result per text, in order (None where extraction failed)
+    """
+    texts = list(texts)
+    pos_tags = list(pos_tags) if pos_tags is not None else [None] * len(texts)
+    workers = workers or _extraction_workers(len(texts))
+    if workers > 1 and len(texts) >= max(2, ENTITY_PARALLEL_MIN_DOCS):
+        try:
+            from worker_pool import map_in_workers
+            return map_in_workers(extract_document_entities, texts, pos_tags, workers=workers)
+        except Exception as e:
+            # Worker processes unavailable (e.g. inside a daemon process) - extract in-process
+            logger.warning(f"⚠️ Parallel entity extraction failed ({e}), extracting sequentially")
+    return [extract_document_entities(text, tags) for text, tags in zip(texts, pos_tags)]
+
+
+def load_cached_entities(row_ids: Sequence[Optional[int]], hashes: Sequence[str]):
+    """
+    Stored entities for the given documents
+
+    Looks at the documents' own rows first, then at any other row (in any campaign)
+    holding entities for the same content hash.
+
+    Args:
+        row_ids: CampaignRawData ids of the documents (None for documents without a row)
+        hashes: Content hashes of the documents' current text
+
+    Returns:
+        (content hash -> entities for the hashes with a usable stored result,
+         row id -> content hash of the row's own usable stored entities)
+    """
+    found: Dict[str, Dict[str, List[str]]] = {}
+    stored_hashes: Dict[int, Optional[str]] = {}
+    if not ENTITY_CACHE_ENABLED:
+        return found, stored_hashes
+    wanted = {h for h in hashes if h}
+
+    def collect(rows):
+        for entities_hash, entities_json in rows:
+            if entities_hash in wanted and entities_hash not in found:
+                entities = _decode(entities_json)
+                if entities is not None:
+                    found[entities_hash] = entities
+
+    try:
+        from models import CampaignRawData
+        session = _session()
+        try:
+            ids = [rid for rid in dict.fromkeys(row_ids) if rid is not None]
+            for chunk in _chunks(ids):
+                rows = session.query(CampaignRawData.id, CampaignRawData.entities_hash, CampaignRawData.entities_json).filter(
+                    CampaignRawData.id.in_(chunk)
+                ).all()
+                stored_hashes.update(
+                    (rid, entities_hash) for rid, entities_hash, entities_json in rows if _decode(entities_json) is not None
+                )
+                collect((entities_hash, entities_json) for _, entities_hash, entities_json in rows)
+            # Pages this corpus shares with other rows / campaigns
+            for chunk in _chunks(sorted(wanted - set(found))):
+                collect(session.query(CampaignRawData.entities_hash, CampaignRawData.entities_json).filter(
+                    CampaignRawData.entities_hash.in_(chunk), CampaignRawData.entities_json.isnot(None)
+                ).all())
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Entity cache lookup failed: {e}")
+    return found, stored_hashes
+
+
+def store_document_entities(row_entities: Dict[int, Dict[str, object]]):
+    """
+    Store per-document entities on their CampaignRawData rows
+
+    Args:
+        row_entities: Row id -> {"hash": content hash of the text, "entities": extract_entities() output}
+    """
+    if not ENTITY_CACHE_ENABLED or not row_entities:
+        return
+    try:
+        from models import CampaignRawData
+        session = _session()
+        try:
+            session.bulk_update_mappings(CampaignRawData, [
+                {"id": rid, "entities_hash": item["hash"], "entities_json": _encode(item["entities"])}
+                for rid, item in row_entities.items()
+            ])
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not store document entities: {e}")
+
+
+def extract_corpus_entities(
+    texts: Sequence[str],
+    row_ids: Optional[Sequence[Optional[int]]] = None
+) -> List[Optional[Dict[str, List[str]]]]:
+    """
+    Per-document entities for a corpus, running NER only on documents never seen before
+
+    Stored results are looked up by content hash; the remaining distinct documents
+    are extracted in parallel and their results stored on the documents' rows. Rows
+    whose page was already extracted elsewhere get a copy of that result.
+
+    Args:
+        texts: Document texts
+        row_ids: CampaignRawData id of each text (None entries / no list: nothing is stored for them)
+
+    Returns:
+        extract_entities() output per text, in order (None where extraction failed)
+    """
+    row_ids = list(row_ids) if row_ids is not None else [None] * len(texts)
+    hashes = [compute_content_hash(text) or "" for text in texts]
+    cached, stored_hashes = load_cached_entities(row_ids, hashes)
+
+    # One extraction per distinct document
+    pending: Dict[str, str] = {}
+    for text, h in zip(texts, hashes):
+        if h not in cached and h not in pending:
+            pending[h] = text
+    extracted = {}
+    if pending:
+        from doc_artifacts import get_document_artifacts
+        # Stored artifacts (built at ingestion) already hold the tagged tokens NE chunking starts from
+        artifacts = get_document_artifacts(list(pending.values()), compute_missing=False)
+        pos_tags = [artifact.tagged() if artifact is not None else None for artifact in artifacts]
+        extracted = dict(zip(pending, extract_entities_parallel(list(pending.values()), pos_tags=pos_tags)))
+    logger.info(
+        f"🏷️ Entities for {len(texts)} documents: {len(texts) - sum(1 for h in hashes if h in pending)} from cache, "
+        f"{len(pending)} extracted"
+    )
+
+    results = []
+    to_store: Dict[int, Dict[str, object]] = {}
+    for rid, h in zip(row_ids, hashes):
+        entities = cached.get(h) or extracted.get(h)
+        results.append(entities)
+        if rid is not None and h and entities is not None and stored_hashes.get(rid) != h:
+            to_store[rid] = {"hash": h, "entities": entities}
+    store_document_entities(to_store)
+    return results
+
+
+def merge_entities(per_document: Sequence[Optional[Dict[str, List[str]]]], limit: int = 20) -> Dict[str, List[str]]:
+    """
+    Campaign-level entities: per-document results concatenated in document order,
+    deduplicated (first occurrence wins) and cut to `limit` per type
+    """
+    merged: Dict[str, List[str]] = {}
+    for entity_type in ENTITY_TYPES:
+        values = dict.fromkeys(
+            value for entities in per_document if entities for value in entities.get(entity_type, [])
+        )
+        merged[entity_type] = list(values)[:limit]
+    return merged
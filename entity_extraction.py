@@ -0,0 +1,366 @@
+"""
+Named-Entity Extraction
+extract_entities(): NLTK NE chunking plus regex patterns over one document. Kept out of
+text_processing so entity_cache's worker processes only import NLTK and this module.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from nltk import ne_chunk, pos_tag
+from nltk.tokenize import word_tokenize
+
+logger = logging.getLogger(__name__)
+
+# Entity extraction vocabularies and patterns, built once at import instead of on every
+# extract_entities() call. Lists that are only used for membership are frozensets;
+# "contains any of" checks are single precompiled alternations.
+
+def _substring_alternation(words, flags=0):
+    """Regex that matches wherever any of the words occurs as a substring"""
+    return re.compile("|".join(re.escape(w) for w in sorted(set(words), key=len, reverse=True)), flags)
+
+
+def _scan_pattern(pattern: str, first_chars: str, flags=0):
+    """
+    Compile a findall/finditer pattern behind a lookahead on the characters a match
+    can start with. The matches are unchanged; the regex engine uses the leading
+    character class to skip ahead instead of trying the whole pattern at every position.
+    """
+    return re.compile(f"(?=[{first_chars}])(?:{pattern})", flags)
+
+
+_PERSON_SOFTWARE_UI_WORDS = frozenset([
+    'microsoft', 'word', 'excel', 'powerpoint', 'outlook', 'windows', 'macintosh', 'apple', 'mac',
+    'google', 'chrome', 'firefox', 'safari', 'edge', 'internet', 'explorer', 'browser',
+    'edit', 'view', 'file', 'insert', 'format', 'tools', 'table', 'help', 'developer',
+    'initial', 'predecessor', 'multi', 'type', 'license', 'trialware', 'website', 'tool',
+    'share', 'print', 'save', 'open', 'close', 'new', 'copy', 'paste', 'cut',
+    'office', 'media', 'unix', 'independent', 'wikimedia', 'foundation', 'project', 'wikipedia',
+    'regular', 'guys', 'built', 'wordperfect', 'eclectic', 'light', 'digital', 'writing'
+])
+_PERSON_SOFTWARE_UI_RE = _substring_alternation(_PERSON_SOFTWARE_UI_WORDS)
+
+_PERSON_COMMON_PHRASES = frozenset([
+    'edit view', 'tool word', 'type word', 'license trialware', 'microsoft word', 'apple macintosh',
+    # UI instruction phrases
+    'to how', 'duplicate pages', 'page document if', 'press ctrl', 'blank page', 'page break',
+    'different document you', 'sub duplicate', 'enter number', 'place your cursor', 'want to duplicate',
+    'min read', 'page you want', 'select all', 'copy paste'
+])
+
+_INSTRUCTION_WORDS = frozenset([
+    'to', 'how', 'duplicate', 'page', 'pages', 'document', 'if', 'press', 'ctrl', 'blank',
+    'break', 'different', 'you', 'sub', 'enter', 'number', 'place', 'your', 'cursor',
+    'want', 'min', 'read', 'select', 'copy', 'paste', 'open', 'close', 'save', 'print'
+])
+
+# Person names + locations / phrases NLTK mislabels as organizations
+_INVALID_ORG_RE = _substring_alternation(['louisville', 'muhammad', 'ali', 'regular guys built wordperfect', 'the eclectic light'])
+_GENERIC_ORG_WORDS = frozenset(['office', 'media', 'independent', 'digital', 'writing', 'page', 'document', 'tool', 'website'])
+_KNOWN_ORGS = frozenset(['microsoft', 'apple', 'google', 'amazon', 'meta', 'facebook', 'twitter', 'linkedin', 'nvidia', 'intel', 'amd'])
+# NLTK sometimes labels organizations as GPE
+_GPE_ORG_INDICATOR_RE = _substring_alternation([
+    'Corp', 'Corporation', 'Inc', 'LLC', 'Ltd', 'Company', 'University', 'College', 'School', 'Hospital',
+    'Foundation', 'Institute', 'Organization', 'Association'
+])
+
+_ORG_PATTERNS = [_scan_pattern(p, 'A-Z') for p in (
+    r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Corp|Corporation|Inc|LLC|Ltd|Company|Co|Industries|International|Group|Systems|Technologies|Solutions)\b',
+    r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:University|College|School|Institute|Academy|Foundation|Association|Society|Organization|Agency|Department|Bureau)\b',
+    r'\b(?:The\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Hospital|Clinic|Medical Center|Bank|Trust|Fund)\b',
+)]
+_ORG_EXCLUDE = frozenset({'The', 'A', 'An', 'United', 'States'})
+
+# Only complete dates: Month + Year, Month + Day + Year, numeric dates and years in context
+# Full and abbreviated month names, factored by prefix ("Jan(?:uary)?" tries "January" before "Jan" like the flat list did)
+_MONTHS = r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)'
+_DATE_PATTERNS = [_scan_pattern(p, first_chars, re.IGNORECASE) for p, first_chars in (
+    # Month Day, Year (e.g., "January 15, 2024", "Jan 15 2024")
+    (r'\b' + _MONTHS + r'\s+\d{1,2},?\s+\d{4}\b', 'adfjmnos'),
+    # Month Year (e.g., "January 2024", "Jan 2024")
+    (r'\b' + _MONTHS + r'\s+\d{4}\b', 'adfjmnos'),
+    # MM/DD/YYYY or DD-MM-YYYY (e.g., "01/15/2024", "15-01-2024")
+    (r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b', '0-9'),
+    # YYYY/MM/DD (e.g., "2024/01/15")
+    (r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b', '0-9'),
+    # Ordinal dates (e.g., "15th of January 2024", "the 15th of January 2024")
+    (r'\b(?:the\s+)?\d{1,2}(?:st|nd|rd|th)\s+(?:of\s+)?' + _MONTHS + r'\s+\d{4}\b', 't0-9'),
+    # Years with context (e.g., "in 2024", "2024.", "(2024)")
+    (r'\b(?:in\s+|the\s+year\s+)?(19\d{2}|20\d{2})(?:\s|$|\.|,|;|\)|\])\b', 'it0-9'),
+)]
+_DATE_MONTH_RE = _substring_alternation([
+    'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october', 'november', 'december',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
+])
+_YEAR_ONLY_RE = re.compile(r'^\d{4}$')
+
+# Capitalized word(s) that look like names: "John Smith", "Mary Ann Jones"
+_NAME_RE = _scan_pattern(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2}\b', 'A-Z')
+# Common capitalized words that aren't names
+_NAME_EXCLUDE_WORDS = frozenset({
+    'The', 'A', 'An', 'In', 'On', 'At', 'For', 'With', 'From', 'To', 'Of', 'And', 'Or', 'But', 'As', 'By',
+    'War', 'Prisoner', 'Escape', 'Camp', 'Life', 'Liberation', 'Discover', 'Earn', 'Points', 'Support',
+    'Login', 'Vietnam', 'United', 'States', 'America', 'World', 'Documentary', 'Mini', 'Series', 'Trailer',
+    'English', 'General', 'Seasons', 'Brasil', 'Crew', 'Artwork', 'Lists', 'Changed',
+    'Article', 'Talk', 'Read', 'Tools', 'Appearance', 'Text', 'Small', 'Standard', 'Large', 'Width',
+    'Wide', 'Color', 'Automatic', 'Light', 'Dark', 'Wikipedia', 'Nathu', 'La', 'Cho', 'Indochina', 'Wars',
+    # Software and product names
+    'Microsoft', 'Word', 'Excel', 'PowerPoint', 'Outlook', 'Windows', 'Macintosh', 'Apple', 'Mac', 'iOS', 'Android',
+    'Google', 'Chrome', 'Firefox', 'Safari', 'Edge', 'Internet', 'Explorer', 'Opera', 'Browser',
+    'Edit', 'View', 'File', 'Insert', 'Format', 'Table', 'Help', 'Developer', 'Initial', 'Predecessor',
+    'Multi', 'Type', 'License', 'Trialware', 'Website', 'Tool', 'Office', 'Media', 'Unix', 'Independent',
+    'Wikimedia', 'Foundation', 'Project', 'Meta',
+    # UI elements and actions
+    'Share', 'Print', 'Save', 'Open', 'Close', 'New', 'Copy', 'Paste', 'Cut', 'Undo', 'Redo', 'Find', 'Replace',
+    'Select', 'All', 'None', 'Zoom', 'Out', 'Fit', 'Page', 'Actual', 'Size',
+    'Font', 'Bold', 'Italic', 'Underline', 'Strikethrough', 'Subscript', 'Superscript',
+    'Align', 'Left', 'Center', 'Right', 'Justify', 'Bullet', 'Number', 'List', 'Indent', 'Decrease', 'Increase',
+    # Common phrases that look like names
+    'Regular', 'Guys', 'Built', 'Wordperfect', 'Eclectic',
+    # UI instruction words
+    'How', 'Duplicate', 'Pages', 'Document', 'If', 'Press', 'Ctrl', 'Blank', 'Break',
+    'Different', 'You', 'Sub', 'Enter', 'Place', 'Your', 'Cursor', 'Want', 'Min'
+})
+# Articles, titles, UI elements, software names and tutorial instructions that look like names;
+# one alternation replaces a re.search per pattern (a candidate is rejected if any of them matches)
+_NON_NAME_RE = re.compile("|".join("(?:%s)" % p for p in (
+    r'\b(Discover|Support|Login|Earn|Points|The War|That|Changed|America|Brasil|General|Seasons|Crew|Artwork|Lists|Documentary|Mini|Series|United States|English Trailer)\b',
+    r'\b[A-Z][a-z]+\s+(Earn|Points|Login|Support|War|That|Changed|America)\b',
+    r'\b(The|A|An)\s+[A-Z][a-z]+\s+[A-Z][a-z]+\b',  # Articles before capitalized words
+    r'\b(Article|Talk|Read|Tools|Appearance|Text|Small|Standard|Large|Width|Wide|Color|Automatic|Light|Dark|From|Wikipedia)\s+[A-Z][a-z]+\b',  # UI elements
+    r'\b[A-Z][a-z]+\s+(Talk|Read|Tools|Appearance|Text|Small|Standard|Large|Width|Wide|Color)\b',  # UI patterns
+    r'\b(Nathu|Cho)\s+La\b',  # Geographic locations
+    r'\bIndochina\s+Wars\b',  # Historical events
+    # Software and product names
+    r'\b(Microsoft|Apple|Google|Windows|Macintosh|Mac|Word|Excel|PowerPoint|Outlook|Chrome|Firefox|Safari|Edge|Internet|Explorer)\s+[A-Z][a-z]+\b',
+    r'\b[A-Z][a-z]+\s+(Word|Excel|PowerPoint|Outlook|Windows|Macintosh|Mac|Chrome|Firefox|Safari|Edge|Explorer|Browser|Office|Media|Unix|Developer|Initial|Predecessor|Multi|Type|License|Trialware|Website|Tool)\b',
+    r'\b(Edit|View|File|Insert|Format|Tools|Table|Help|Share|Print|Save|Open|Close|New|Copy|Paste|Cut)\s+[A-Z][a-z]+\b',
+    r'\b[A-Z][a-z]+\s+(Edit|View|File|Insert|Format|Tools|Table|Help|Share|Print|Save|Open|Close|New|Copy|Paste|Cut)\b',
+    # Software-specific patterns
+    r'\b(Microsoft|Word|Microsoft Word|Edit View|Tool Word|Developer|Type Word|License Trialware|Website)\b',
+    r'\b(Apple|Macintosh|Mac|iOS|Android|Google|Chrome|Firefox|Safari|Edge|Browser)\b',
+    # Common non-name phrases
+    r'\b(Regular|Guys|Built|Wordperfect|Eclectic|Light)\s+[A-Z][a-z]+\b',
+    r'\b[A-Z][a-z]+\s+(Regular|Guys|Built|Wordperfect|Eclectic|Light)\b',
+    # UI instruction patterns (common in tutorials)
+    r'\b(To|How)\s+[A-Z][a-z]+\b',  # "To How", "To Duplicate"
+    r'\b(To|How)\s+[A-Z][a-z]+\s+[A-Z][a-z]+\b',  # "To Duplicate Pages"
+    r'\b(Duplicate|Select|Enter|Press|Place|Want)\s+(Pages?|Ctrl|Number|Cursor|Your|To)\b',  # "Duplicate Pages", "Press Ctrl", "Enter Number"
+    r'\b(Blank|Page|Document|Break|Different)\s+(Page|Document|You|If)\b',  # "Blank Page", "Page Document", "Page Break"
+    r'\b(Page|Document|Press|Ctrl|Enter|Place|Cursor|Select)\s+(Document|If|Ctrl|Number|Your|All|Text)\b',  # "Page Document", "Press Ctrl", "Place Your"
+    r'\b(Min|Read|Sub|Duplicate)\s+(Read|Duplicate|Enter)\b',  # "Min Read", "Sub Duplicate"
+    r'\b[A-Z][a-z]+\s+(Page|Document|Ctrl|Number|Cursor|Read|Duplicate)\b',  # "Want To Duplicate", "Place Your Cursor"
+    r'\b(Windows|Command)\s+(Or|Command)\b',  # "(windows) or command"
+)), re.IGNORECASE)
+# Title/UI/software words that disqualify any word of a name candidate
+_NAME_COMMON_NON_NAMES = frozenset({
+    'the', 'war', 'that', 'changed', 'america', 'support', 'login', 'earn', 'points',
+    'article', 'talk', 'read', 'tools', 'appearance', 'text', 'small', 'standard', 'large',
+    'width', 'wide', 'color', 'automatic', 'light', 'dark', 'from', 'wikipedia', 'nathu',
+    'cho', 'la', 'indochina', 'wars', 'vietnam', 'united', 'states', 'world', 'documentary',
+    # Software and product names
+    'microsoft', 'word', 'excel', 'powerpoint', 'outlook', 'windows', 'macintosh', 'apple', 'mac',
+    'google', 'chrome', 'firefox', 'safari', 'edge', 'internet', 'explorer', 'browser',
+    'edit', 'view', 'file', 'insert', 'format', 'table', 'help', 'developer', 'initial',
+    'predecessor', 'multi', 'type', 'license', 'trialware', 'website', 'tool', 'office',
+    'media', 'unix', 'independent', 'wikimedia', 'foundation', 'project', 'regular', 'guys',
+    'built', 'wordperfect', 'eclectic',
+    # UI instruction words
+    'to', 'how', 'duplicate', 'page', 'pages', 'document', 'if', 'press', 'ctrl', 'blank',
+    'break', 'different', 'you', 'sub', 'enter', 'number', 'place', 'your', 'cursor',
+    'want', 'min', 'select', 'copy', 'paste', 'open', 'close', 'save', 'print'
+})
+
+_PLACE_PATTERNS = [_scan_pattern(p, first_chars) for p, first_chars in (
+    (r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:City|State|Province|Country|Region|Island|Islands|Republic|Kingdom|Empire)\b', 'A-Z'),
+    (r'\b(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:River|Mountain|Lake|Bay|Sea|Ocean|Gulf|Strait)\b', 'A-Zt'),
+)]
+_PLACE_EXCLUDE = frozenset({'The', 'A', 'An', 'United', 'States', 'America'})
+
+_MONEY_RE = _scan_pattern(r'\$[\d,]+(?:\.\d{2})?|[\d,]+(?:\.\d{2})?\s*(?:dollars|USD|EUR|€|£|GBP|yen|JPY)', '$0-9,', re.IGNORECASE)
+_PERCENT_RE = _scan_pattern(r'\d+(?:\.\d+)?%', '0-9')
+_TIME_RE = _scan_pattern(r'\b(?:0?[1-9]|1[0-2]):[0-5][0-9]\s*(?:AM|PM|am|pm)|(?:0?[0-9]|1[0-9]|2[0-3]):[0-5][0-9]\b|(?:noon|midnight|midday)', '0-9nm', re.IGNORECASE)
+_FACILITY_PATTERNS = [_scan_pattern(p, 'A-Z') for p in (
+    r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Hospital|Clinic|Medical Center|University|College|School|Building|Tower|Center|Centre|Museum|Library|Stadium|Arena|Theater|Theatre|Airport|Station)',
+    r'\b(?:The\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Building|Tower|Center|Centre)',
+)]
+
+
+def _is_instruction_phrase(entity_words: List[str]) -> bool:
+    """More than half of the words are UI/tutorial instruction words"""
+    instruction_count = sum(1 for word in entity_words if word.lower() in _INSTRUCTION_WORDS)
+    return instruction_count > len(entity_words) * 0.5
+
+
+def _is_nltk_person(entity_text: str) -> bool:
+    """Whether an NLTK PERSON chunk is a plausible name (not software, UI or an instruction)"""
+    entity_words = entity_text.split()
+    # Person names should be 2-4 words; single words are too ambiguous
+    if len(entity_words) == 1:
+        return False
+    entity_lower = entity_text.lower()
+    if any(word.lower() in _PERSON_SOFTWARE_UI_WORDS for word in entity_words):
+        return False
+    if _PERSON_SOFTWARE_UI_RE.search(entity_lower):
+        return False
+    if entity_lower in _PERSON_COMMON_PHRASES:
+        return False
+    return not _is_instruction_phrase(entity_words)
+
+
+def _is_nltk_organization(entity_text: str) -> bool:
+    """Whether an NLTK ORGANIZATION chunk is a plausible organization"""
+    entity_lower = entity_text.lower()
+    entity_words = entity_text.split()
+    if _INVALID_ORG_RE.search(entity_lower):
+        return False
+    # Single generic words like "Office" or "Media" (but not "Microsoft", "Apple", ...)
+    if len(entity_words) == 1 and entity_lower in _GENERIC_ORG_WORDS and entity_lower not in _KNOWN_ORGS:
+        return False
+    return not _is_instruction_phrase(entity_words)
+
+
+def _is_valid_date(full_match: str) -> bool:
+    """Complete dates only: must contain a month name or be a bare 4-digit year"""
+    if len(full_match) < 4:
+        return False
+    return bool(_DATE_MONTH_RE.search(full_match.lower()) or _YEAR_ONLY_RE.match(full_match))
+
+
+@lru_cache(maxsize=65536)
+def _is_name_candidate(match: str) -> bool:
+    """Whether a capitalized word sequence from _NAME_RE looks like a person's name"""
+    if _NON_NAME_RE.search(match):
+        return False
+    if match in _NAME_EXCLUDE_WORDS:
+        return False
+    words_in_match = match.split()
+    # Two or more proper-noun words, none of them a title/UI/software word
+    if len(words_in_match) < 2:
+        return False
+    if not all(word[0].isupper() and word[1:].islower() for word in words_in_match):
+        return False
+    return not any(word.lower() in _NAME_COMMON_NON_NAMES for word in words_in_match)
+
+
+def _append_new(values: List[str], seen: set, candidates):
+    """Append candidates not already in values (set-backed, keeps first-seen order)"""
+    for candidate in candidates:
+        if candidate not in seen:
+            seen.add(candidate)
+            values.append(candidate)
+
+
+def extract_entities(text: str, extract_persons: bool, extract_organizations: bool, extract_locations: bool, extract_dates: bool,
+                     extract_money: bool = False, extract_percent: bool = False, extract_time: bool = False, extract_facility: bool = False,
+                     pos_tags: Optional[List[Tuple[str, str]]] = None) -> Dict[str, List[str]]:
+    """
+    Named entities of one text (NLTK NE chunking plus regex patterns)
+
+    Args:
+        pos_tags: pos_tag(word_tokenize(text)) if already known (e.g. from the document's
+            stored artifact, see doc_artifacts.py) - skips tokenizing and tagging again
+    """
+    entities = {
+        'persons': [],
+        'organizations': [],
+        'locations': [],
+        'dates': [],
+        'money': [],
+        'percent': [],
+        'time': [],
+        'facility': []
+    }
+    if not any([extract_persons, extract_organizations, extract_locations, extract_dates, extract_money, extract_percent, extract_time, extract_facility]):
+        return entities
+
+    # Extract NLTK entities (PERSON, ORGANIZATION, GPE, DATE)
+    try:
+        if pos_tags is None:
+            words = word_tokenize(text)
+            pos_tags = pos_tag(words)
+        # Use binary=False to get detailed entity types (PERSON, ORGANIZATION, GPE, etc.)
+        chunks = ne_chunk(pos_tags, binary=False)
+    except Exception as e:
+        logger.warning(f"NLTK entity extraction failed: {e}, using regex fallback only")
+        chunks = []
+
+    for chunk in chunks:
+        if hasattr(chunk, 'label'):
+            entity_type = chunk.label()
+            entity_text = ' '.join(c[0] for c in chunk)
+            if entity_type == 'PERSON' and extract_persons:
+                # Filter out software names, UI elements, product names and instruction phrases
+                if _is_nltk_person(entity_text):
+                    entities['persons'].append(entity_text)
+            elif entity_type == 'ORGANIZATION' and extract_organizations:
+                if _is_nltk_organization(entity_text):
+                    entities['organizations'].append(entity_text)
+            # NLTK sometimes labels organizations as GPE, so check for organization indicators
+            elif entity_type == 'GPE':
+                if extract_organizations:
+                    if _GPE_ORG_INDICATOR_RE.search(entity_text):
+                        entities['organizations'].append(entity_text)
+                    elif extract_locations:
+                        # If not an organization, it's a location
+                        entities['locations'].append(entity_text)
+                elif extract_locations:
+                    entities['locations'].append(entity_text)
+            elif entity_type == 'DATE' and extract_dates:
+                entities['dates'].append(entity_text)
+            # NLTK sometimes labels facilities as ORGANIZATION, but we'll use regex for better coverage
+            elif entity_type == 'FACILITY' and extract_facility:
+                entities['facility'].append(entity_text)
+
+    # Enhanced organization extraction using regex (for organizations NLTK might miss)
+    if extract_organizations:
+        organizations = entities['organizations']
+        seen = set(organizations)
+        for pattern in _ORG_PATTERNS:
+            _append_new(organizations, seen, (
+                match for match in pattern.findall(text) if match and match not in _ORG_EXCLUDE
+            ))
+
+    # Enhanced date extraction using regex (for dates NLTK might miss)
+    if extract_dates:
+        dates = entities['dates']
+        seen = set(dates)
+        for pattern in _DATE_PATTERNS:
+            _append_new(dates, seen, (
+                full_match for full_match in (m.group(0).strip('.,;()[]') for m in pattern.finditer(text))
+                if _is_valid_date(full_match)
+            ))
+
+    # Pattern-based extraction for better coverage (especially for titles and short texts)
+    if extract_persons:
+        _append_new(entities['persons'], set(entities['persons']), (
+            match for match in _NAME_RE.findall(text) if _is_name_candidate(match)
+        ))
+
+    if extract_locations:
+        # DO NOT extract nationalities as locations - they are adjectives, not places.
+        # Place names are primarily handled by NLTK's GPE recognition above; these
+        # patterns catch "<Name> River", "<Name> City", ... that it misses
+        locations = entities['locations']
+        seen = set(locations)
+        for pattern in _PLACE_PATTERNS:
+            _append_new(locations, seen, (match for match in pattern.findall(text) if match not in _PLACE_EXCLUDE))
+
+    if extract_money:
+        entities['money'].extend(_MONEY_RE.findall(text))
+
+    if extract_percent:
+        entities['percent'].extend(_PERCENT_RE.findall(text))
+
+    if extract_time:
+        entities['time'].extend(_TIME_RE.findall(text))
+
+    # Facilities (buildings, hospitals, landmarks)
+    if extract_facility:
+        for pattern in _FACILITY_PATTERNS:
+            entities['facility'].extend(pattern.findall(text))
+
+    return entities
@@ -123,6 +123,26 @@ try:
 except Exception as e:
     logger.error(f"❌ Failed to include gas meter router: {e}")
 
+
+@app.on_event("startup")
+def warm_nlp_models():
+    """Load spaCy / NLTK models once up front so the first research request doesn't pay for it"""
+    try:
+        from nlp_models import start_background_warmup
+        start_background_warmup()
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to start NLP model warmup: {e}")
+
+
+@app.on_event("shutdown")
+def shutdown_scraper_browsers():
+    """Close pooled Playwright browsers so Chromium doesn't outlive the app"""
+    try:
+        from browser_pool import shutdown_browser_pool
+        shutdown_browser_pool()
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to shut down browser pool: {e}")
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -0,0 +1,9 @@
+-- Sitemap state is per campaign: each campaign's lastmod must match its own stored copy (MySQL/MariaDB).
+-- Per-site rows can't be attributed to a campaign and are dropped; the next re-crawl of each
+-- campaign records its state again. Safe to run once.
+DELETE FROM sitemap_url_state;
+ALTER TABLE sitemap_url_state ADD COLUMN campaign_id VARCHAR(255) NOT NULL AFTER id;
+ALTER TABLE sitemap_url_state DROP INDEX unique_site_url;
+ALTER TABLE sitemap_url_state DROP INDEX idx_site;
+ALTER TABLE sitemap_url_state ADD UNIQUE KEY unique_campaign_sitemap_url (campaign_id, url_hash);
+CREATE INDEX ix_sitemap_url_state_campaign_id ON sitemap_url_state (campaign_id);
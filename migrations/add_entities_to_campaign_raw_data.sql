@@ -0,0 +1,5 @@
+-- Per-document entity cache: extract_entities() output stored with the content hash of the text it came from.
+-- Safe to run once; ignore error if columns/index already exist (MySQL/MariaDB).
+ALTER TABLE campaign_raw_data ADD COLUMN entities_json LONGTEXT NULL;
+ALTER TABLE campaign_raw_data ADD COLUMN entities_hash VARCHAR(64) NULL;
+CREATE INDEX ix_campaign_raw_data_entities_hash ON campaign_raw_data (entities_hash);
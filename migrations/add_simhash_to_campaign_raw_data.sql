@@ -0,0 +1,3 @@
+-- Near-duplicate detection: 64-bit SimHash fingerprint (hex) of each scraped document.
+-- Safe to run once; ignore error if column already exists (MySQL/MariaDB).
+ALTER TABLE campaign_raw_data ADD COLUMN simhash VARCHAR(16) NULL;
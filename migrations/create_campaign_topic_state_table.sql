@@ -0,0 +1,12 @@
+-- Incremental system-model topic state per campaign (MySQL/MariaDB).
+-- One row per campaign; safe to run more than once.
+CREATE TABLE IF NOT EXISTS campaign_topic_state (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    campaign_id VARCHAR(255) NOT NULL,
+    settings_hash VARCHAR(64) NOT NULL,
+    doc_count INT NOT NULL,
+    state_blob LONGBLOB NOT NULL,
+    full_fit_at DATETIME NULL,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_campaign_topic_state (campaign_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
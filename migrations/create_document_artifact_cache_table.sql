@@ -0,0 +1,10 @@
+-- Tokenize-once document artifacts (MySQL/MariaDB).
+-- One row per extracted_text content hash; safe to run more than once.
+CREATE TABLE IF NOT EXISTS document_artifact_cache (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    content_hash VARCHAR(64) NOT NULL,
+    version INT NOT NULL,
+    artifact LONGBLOB NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_content_hash (content_hash)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
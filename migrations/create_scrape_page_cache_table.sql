@@ -0,0 +1,16 @@
+-- Shared page cache for web scraping (MySQL/MariaDB).
+-- One row per normalized URL, reused across campaigns; safe to run more than once.
+CREATE TABLE IF NOT EXISTS scrape_page_cache (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    url_hash VARCHAR(64) NOT NULL,
+    url TEXT NOT NULL,
+    extracted_text LONGTEXT NULL,
+    content_hash VARCHAR(64) NULL,
+    etag VARCHAR(512) NULL,
+    last_modified VARCHAR(255) NULL,
+    meta_json TEXT NULL,
+    fetched_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_url_hash (url_hash),
+    INDEX idx_fetched_at (fetched_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,14 @@
+-- Per-site sitemap state for incremental Site Builder re-crawls (MySQL/MariaDB).
+-- One row per site + normalized URL; safe to run more than once.
+CREATE TABLE IF NOT EXISTS sitemap_url_state (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    site VARCHAR(255) NOT NULL,
+    url_hash VARCHAR(64) NOT NULL,
+    url TEXT NOT NULL,
+    lastmod DATETIME NULL,
+    content_hash VARCHAR(64) NULL,
+    last_seen_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    last_scraped_at DATETIME NULL,
+    UNIQUE KEY unique_site_url (site, url_hash),
+    INDEX idx_site (site)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
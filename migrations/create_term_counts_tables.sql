@@ -0,0 +1,21 @@
+-- Precomputed per-document term counts and per-campaign totals (MySQL/MariaDB).
+-- One row per extracted_text content hash / per campaign; safe to run more than once.
+CREATE TABLE IF NOT EXISTS document_term_counts (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    content_hash VARCHAR(64) NOT NULL,
+    version INT NOT NULL,
+    counts LONGBLOB NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_term_counts_hash (content_hash)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS campaign_term_totals (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    campaign_id VARCHAR(255) NOT NULL,
+    version INT NOT NULL,
+    doc_count INT NOT NULL,
+    doc_hashes_json LONGTEXT NOT NULL,
+    totals LONGBLOB NOT NULL,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_campaign_term_totals (campaign_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,16 @@
+-- Content-addressed topic model cache (MySQL/MariaDB).
+-- One row per (corpus, method, settings) hash; safe to run more than once.
+CREATE TABLE IF NOT EXISTS topic_model_cache (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    cache_key VARCHAR(64) NOT NULL,
+    method VARCHAR(50) NOT NULL,
+    doc_count INT NOT NULL,
+    vocabulary LONGTEXT NOT NULL,
+    labels TEXT NULL,
+    matrices LONGBLOB NOT NULL,
+    meta_json TEXT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    last_used_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_cache_key (cache_key),
+    INDEX idx_last_used_at (last_used_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -32,8 +32,8 @@ class ContentStatus(str, enum.Enum):  # ✅ Store as string
 
 
 
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, DateTime
-from sqlalchemy.dialects.mysql import LONGTEXT
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, DateTime, LargeBinary, UniqueConstraint
+from sqlalchemy.dialects.mysql import LONGBLOB, LONGTEXT
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -270,10 +270,141 @@ class CampaignRawData(Base):
     extracted_text = Column(Text, nullable=True)
     meta_json = Column(Text, nullable=True)
     content_hash = Column(String(255), nullable=True)
+    simhash = Column(String(16), nullable=True)  # 64-bit SimHash (hex) for near-duplicate detection
+    entities_json = Column(LONGTEXT, nullable=True)  # JSON: extract_entities() output for extracted_text (see entity_cache.py)
+    entities_hash = Column(String(64), nullable=True, index=True)  # content hash of the text entities_json was extracted from
 
     def __repr__(self):
         return f"<CampaignRawData(id={self.id}, campaign_id={self.campaign_id}, url={self.source_url})>"
 
+# Shared cross-campaign cache of scraped pages, keyed by normalized URL
+# Serves repeat URLs within a TTL and revalidates with ETag/Last-Modified after that
+class ScrapePageCache(Base):
+    __tablename__ = "scrape_page_cache"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    url_hash = Column(String(64), unique=True, nullable=False, index=True)  # sha256 of normalized URL
+    url = Column(Text, nullable=False)  # Normalized URL
+    extracted_text = Column(LONGTEXT, nullable=True)
+    content_hash = Column(String(64), nullable=True)  # sha256 of extracted_text
+    etag = Column(String(512), nullable=True)
+    last_modified = Column(String(255), nullable=True)  # Raw Last-Modified header value
+    meta_json = Column(Text, nullable=True)  # JSON: images, links, fetch_method, ...
+    fetched_at = Column(DateTime, default=datetime.now, nullable=False)  # Last full fetch or successful revalidation
+    created_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'},
+    )
+
+    def __repr__(self):
+        return f"<ScrapePageCache(id={self.id}, url={self.url})>"
+
+# Per-campaign sitemap state for incremental Site Builder re-crawls
+# One row per campaign + sitemap URL: the lastmod seen when the campaign last scraped the page and its content hash
+class SitemapUrlState(Base):
+    __tablename__ = "sitemap_url_state"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    campaign_id = Column(String(255), nullable=False, index=True)  # stores Campaign.campaign_id UUID
+    site = Column(String(255), nullable=False)  # scheme://host of the Site Builder site
+    url_hash = Column(String(64), nullable=False)  # sha256 of normalized URL
+    url = Column(Text, nullable=False)  # Normalized URL
+    lastmod = Column(DateTime, nullable=True)  # Sitemap <lastmod> (naive UTC) the campaign's stored copy corresponds to
+    content_hash = Column(String(64), nullable=True)  # sha256 of extracted_text at last scrape
+    last_seen_at = Column(DateTime, default=datetime.now)  # Last sitemap parse that listed the URL
+    last_scraped_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("campaign_id", "url_hash", name="unique_campaign_sitemap_url"),
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'},
+    )
+
+    def __repr__(self):
+        return f"<SitemapUrlState(id={self.id}, campaign_id={self.campaign_id}, url={self.url})>"
+
+# Fitted topic models keyed by corpus + method + resolved settings (see topic_cache.py)
+# Shared by the research, compare-topics, TopicWizard and gap-analysis paths
+class TopicModelCache(Base):
+    __tablename__ = "topic_model_cache"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cache_key = Column(String(64), unique=True, nullable=False, index=True)  # sha256 of document hashes + method + settings
+    method = Column(String(50), nullable=False)  # e.g. "system", "topicwizard_nmf"
+    doc_count = Column(Integer, nullable=False)
+    vocabulary = Column(LONGTEXT, nullable=False)  # JSON list of feature names (H columns)
+    labels = Column(Text, nullable=True)  # JSON list, one label per topic (H rows)
+    matrices = Column(LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=False)  # np.savez_compressed W and H
+    meta_json = Column(Text, nullable=True)  # JSON: chosen K, coherence, ...
+    created_at = Column(DateTime, default=datetime.now)
+    last_used_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'},
+    )
+
+    def __repr__(self):
+        return f"<TopicModelCache(id={self.id}, method={self.method}, docs={self.doc_count})>"
+
+# Incremental system-model topic state per campaign (see topic_incremental.py)
+# Phrase models, vocabulary, per-document term counts and NMF factors of the last fit
+class CampaignTopicState(Base):
+    __tablename__ = "campaign_topic_state"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    campaign_id = Column(String(255), unique=True, nullable=False, index=True)  # stores Campaign.campaign_id UUID
+    settings_hash = Column(String(64), nullable=False)  # sha256 of the resolved system_model_* settings
+    doc_count = Column(Integer, nullable=False)
+    state_blob = Column(LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=False)  # JSON header + np.savez_compressed arrays (topic_incremental.pack_topic_state)
+    full_fit_at = Column(DateTime, nullable=True)  # Last full refit (phrases, vocabulary and K sweep)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    __table_args__ = (
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'},
+    )
+
+    def __repr__(self):
+        return f"<CampaignTopicState(id={self.id}, campaign_id={self.campaign_id}, docs={self.doc_count})>"
+
+# Tokenize-once document artifacts (see doc_artifacts.py), shared across campaigns by content hash
+# Tokens, lemmas, POS tags and sentence offsets as id arrays against the document's string table
+class DocumentArtifactCache(Base):
+    __tablename__ = "document_artifact_cache"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    content_hash = Column(String(64), unique=True, nullable=False, index=True)  # sha256 of extracted_text
+    version = Column(Integer, nullable=False)  # DOC_ARTIFACT_VERSION the artifact was built with
+    artifact = Column(LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=False)  # np.savez_compressed arrays
+    created_at = Column(DateTime, default=datetime.now)
+
+    def __repr__(self):
+        return f"<DocumentArtifactCache(id={self.id}, content_hash={self.content_hash})>"
+
+# Per-document term-frequency vectors (see term_counts.py), shared across campaigns by content hash
+class DocumentTermCounts(Base):
+    __tablename__ = "document_term_counts"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    content_hash = Column(String(64), unique=True, nullable=False, index=True)  # sha256 of extracted_text
+    version = Column(Integer, nullable=False)  # TERM_COUNTS_VERSION the vectors were counted with
+    counts = Column(LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=False)  # np.savez_compressed per-view arrays
+    created_at = Column(DateTime, default=datetime.now)
+
+    def __repr__(self):
+        return f"<DocumentTermCounts(id={self.id}, content_hash={self.content_hash})>"
+
+# Summed term vectors of a campaign's documents, adjusted as pages are added or removed
+class CampaignTermTotals(Base):
+    __tablename__ = "campaign_term_totals"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    campaign_id = Column(String(255), unique=True, nullable=False, index=True)  # stores Campaign.campaign_id UUID
+    version = Column(Integer, nullable=False)  # TERM_COUNTS_VERSION
+    doc_count = Column(Integer, nullable=False)
+    doc_hashes_json = Column(LONGTEXT, nullable=False)  # {content hash: occurrences}
+    totals = Column(LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=False)  # np.savez_compressed per-view arrays
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    __table_args__ = (
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'},
+    )
+
+    def __repr__(self):
+        return f"<CampaignTermTotals(id={self.id}, campaign_id={self.campaign_id}, docs={self.doc_count})>"
+
 # Research insights generated by research agents (keyword, topical-map, hashtag-generator, etc.)
 # These are cached to avoid re-calling the LLM for the same campaign/agent combination
 class CampaignResearchInsights(Base):
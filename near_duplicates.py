@@ -0,0 +1,173 @@
+"""
+Near-Duplicate Detection for Scraped Documents
+64-bit SimHash fingerprints over word shingles, indexed with LSH bands so that
+syndicated copies, AMP/print variants and paginated repeats are found without
+comparing every pair of documents
+"""
+
+import hashlib
+import logging
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NEAR_DUP_ENABLED = os.getenv("NEAR_DUP_ENABLED", "true").lower() in ("1", "true", "yes")
+NEAR_DUP_MAX_HAMMING = int(os.getenv("NEAR_DUP_MAX_HAMMING", "6"))  # Max differing bits (of 64) for a near-duplicate
+NEAR_DUP_ACTION = os.getenv("NEAR_DUP_ACTION", "mark").lower()  # "mark" = store flagged, "skip" = don't store
+NEAR_DUP_MIN_TOKENS = 30  # Shorter texts don't produce a meaningful fingerprint
+
+SHINGLE_SIZE = 3
+FINGERPRINT_BITS = 64
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_BIT_SHIFTS = np.arange(FINGERPRINT_BITS, dtype=np.uint64)
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def simhash(text: Optional[str]) -> Optional[int]:
+    """
+    64-bit SimHash of a document (word 3-shingles, weighted by frequency)
+
+    Args:
+        text: Document text
+
+    Returns:
+        Fingerprint as an int, or None for texts under NEAR_DUP_MIN_TOKENS words
+    """
+    tokens = _WORD_RE.findall((text or "").lower())
+    if len(tokens) < NEAR_DUP_MIN_TOKENS:
+        return None
+
+    shingles = Counter(" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1))
+    hashes = np.fromiter((_shingle_hash(s) for s in shingles), dtype=np.uint64, count=len(shingles))
+    weights = np.fromiter(shingles.values(), dtype=np.int64, count=len(shingles))
+
+    # bits[i, b] = bit b of shingle i; each shingle votes +weight / -weight per bit
+    bits = ((hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)).astype(np.int64)
+    votes = (weights[:, None] * (2 * bits - 1)).sum(axis=0)
+
+    fingerprint = 0
+    for bit in np.flatnonzero(votes > 0):
+        fingerprint |= 1 << int(bit)
+    return fingerprint
+
+
+def fingerprint_to_hex(fingerprint: Optional[int]) -> Optional[str]:
+    """Fixed-width hex form stored in CampaignRawData.simhash"""
+    return None if fingerprint is None else f"{fingerprint:016x}"
+
+
+def fingerprint_from_hex(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+    try:
+        return int(value, 16)
+    except ValueError:
+        return None
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class NearDuplicateIndex:
+    """
+    SimHash index with LSH banding
+
+    The 64 fingerprint bits are split into max_distance + 1 bands. Two fingerprints
+    within max_distance bits of each other must agree on at least one whole band
+    (pigeonhole), so only documents sharing a band bucket are compared.
+    """
+
+    def __init__(self, max_distance: int = NEAR_DUP_MAX_HAMMING):
+        self.max_distance = max(0, min(max_distance, FINGERPRINT_BITS // 2 - 1))
+        band_count = self.max_distance + 1
+        width = FINGERPRINT_BITS // band_count
+        # Last band absorbs the remainder bits
+        self._bands: List[Tuple[int, int]] = [
+            (i * width, (FINGERPRINT_BITS - i * width) if i == band_count - 1 else width)
+            for i in range(band_count)
+        ]
+        self._buckets: Dict[Tuple[int, int], List[Tuple[str, int]]] = {}
+        self.size = 0
+
+    def _band_keys(self, fingerprint: int):
+        for index, (shift, width) in enumerate(self._bands):
+            yield index, (fingerprint >> shift) & ((1 << width) - 1)
+
+    def find(self, fingerprint: Optional[int]) -> Optional[Tuple[str, int]]:
+        """
+        Closest indexed document within max_distance
+
+        Returns:
+            (key, hamming distance) of the closest match, or None
+        """
+        if fingerprint is None:
+            return None
+        best = None
+        for band_key in self._band_keys(fingerprint):
+            for key, other in self._buckets.get(band_key, ()):
+                distance = hamming_distance(fingerprint, other)
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (key, distance)
+        return best
+
+    def add(self, key: str, fingerprint: Optional[int]):
+        """Index a document fingerprint (None is ignored)"""
+        if fingerprint is None:
+            return
+        for band_key in self._band_keys(fingerprint):
+            self._buckets.setdefault(band_key, []).append((key, fingerprint))
+        self.size += 1
+
+    def check_and_add(self, key: str, fingerprint: Optional[int]) -> Optional[Tuple[str, int]]:
+        """
+        Look a document up and index it if it is not a near-duplicate
+
+        Returns:
+            (key, distance) of the document it duplicates, or None if it is unique
+        """
+        match = self.find(fingerprint)
+        if match is None:
+            self.add(key, fingerprint)
+        return match
+
+
+def unique_document_indices(
+    texts: List[str],
+    max_distance: int = NEAR_DUP_MAX_HAMMING,
+    simhashes: Optional[List[Optional[str]]] = None
+) -> List[int]:
+    """
+    Indices of the texts to keep after dropping near-duplicates (first copy wins)
+
+    Args:
+        texts: Documents in priority order
+        max_distance: Max differing SimHash bits for a near-duplicate
+        simhashes: Stored fingerprints (CampaignRawData.simhash hex) aligned with texts;
+            only texts without one are fingerprinted here
+
+    Returns:
+        Sorted indices of unique documents (all indices when detection is disabled)
+    """
+    if not NEAR_DUP_ENABLED or len(texts) < 2:
+        return list(range(len(texts)))
+    if simhashes is None or len(simhashes) != len(texts):
+        simhashes = [None] * len(texts)
+    index = NearDuplicateIndex(max_distance)
+    keep = []
+    for i, text in enumerate(texts):
+        fingerprint = fingerprint_from_hex(simhashes[i])
+        if fingerprint is None:
+            fingerprint = simhash(text)
+        if index.check_and_add(str(i), fingerprint) is None:
+            keep.append(i)
+    return keep
@@ -0,0 +1,258 @@
+"""
+NLP Model Registry
+Loads spaCy, the NLTK tokenizer/tagger/chunker resources and (optionally) the
+BERTopic sentence-embedding model once per process instead of on every research
+request. Models load lazily on first use or up front through warmup() (called from
+app startup); load times and memory footprint are kept for the admin endpoint.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+SPACY_MODEL_NAME = os.getenv("SPACY_MODEL_NAME", "en_core_web_sm")
+BERTOPIC_EMBEDDING_MODEL_NAME = os.getenv("BERTOPIC_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+NLP_WARMUP_ON_STARTUP = os.getenv("NLP_WARMUP_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+# Models loaded by warmup(); add "bertopic_embeddings" if BERTopic is used regularly (~90 MB)
+NLP_WARMUP_MODELS = [m.strip() for m in os.getenv("NLP_WARMUP_MODELS", "nltk,spacy").split(",") if m.strip()]
+
+# (download package, nltk.data path) - NLTK >= 3.9 ships the tokenizer, tagger and
+# chunker under new *_tab / *_eng names, older releases use the plain ones
+NLTK_RESOURCES = [
+    ("stopwords", "corpora/stopwords"),
+    ("punkt", "tokenizers/punkt"),
+    ("punkt_tab", "tokenizers/punkt_tab"),
+    ("wordnet", "corpora/wordnet"),
+    ("maxent_ne_chunker", "chunkers/maxent_ne_chunker"),
+    ("maxent_ne_chunker_tab", "chunkers/maxent_ne_chunker_tab"),
+    ("words", "corpora/words"),
+    ("averaged_perceptron_tagger", "taggers/averaged_perceptron_tagger"),
+    ("averaged_perceptron_tagger_eng", "taggers/averaged_perceptron_tagger_eng"),
+]
+
+_nltk_resources_checked = False
+_nltk_resources_lock = threading.Lock()
+
+
+def ensure_nltk_resources() -> List[str]:
+    """
+    Download missing NLTK resources (once per process)
+
+    Only resources that aren't installed are downloaded, so a normal start
+    costs a few filesystem lookups and no network access.
+
+    Returns:
+        Packages that had to be downloaded
+    """
+    global _nltk_resources_checked
+    with _nltk_resources_lock:
+        if _nltk_resources_checked:
+            return []
+        import nltk
+        downloaded = []
+        for package, path in NLTK_RESOURCES:
+            try:
+                nltk.data.find(path)
+            except LookupError:
+                if nltk.download(package, quiet=True):
+                    downloaded.append(package)
+        if downloaded:
+            logger.info(f"📥 Downloaded NLTK resources: {', '.join(downloaded)}")
+        _nltk_resources_checked = True
+        return downloaded
+
+
+def _rss_mb() -> Optional[float]:
+    """Resident memory of this process in MB (None if unavailable)"""
+    try:
+        if PSUTIL_AVAILABLE:
+            return psutil.Process().memory_info().rss / (1024 * 1024)
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of loaded NLP models
+
+    Each model has a loader; the first get() runs it under a per-model lock (so
+    concurrent requests wait for one load instead of loading twice) and keeps the
+    result. A loader that fails is recorded and get() returns None until reload().
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._models: Dict[str, Any] = {}
+        self._info: Dict[str, Dict[str, Any]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        """Register (or replace) the loader for a model"""
+        with self._registry_lock:
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+            self._info.setdefault(name, {"status": "not_loaded"})
+
+    def get(self, name: str) -> Optional[Any]:
+        """
+        Loaded model, loading it on first use
+
+        Returns:
+            The model, or None if its loader failed (dependency or model files missing)
+        """
+        if name in self._models:
+            return self._models[name]
+        if name not in self._loaders:
+            raise KeyError(f"Unknown NLP model: {name}")
+        with self._locks[name]:
+            if name in self._models:
+                return self._models[name]
+            if self._info[name].get("status") == "failed":
+                return None
+            return self._load(name)
+
+    def _load(self, name: str) -> Optional[Any]:
+        rss_before = _rss_mb()
+        start = time.perf_counter()
+        try:
+            model = self._loaders[name]()
+        except Exception as e:
+            self._info[name] = {"status": "failed", "error": str(e), "load_ms": int((time.perf_counter() - start) * 1000)}
+            logger.warning(f"⚠️ Could not load NLP model '{name}': {e}")
+            return None
+        load_ms = int((time.perf_counter() - start) * 1000)
+        rss_after = _rss_mb()
+        self._models[name] = model
+        self._info[name] = {
+            "status": "loaded",
+            "load_ms": load_ms,
+            # Process RSS growth during the load - approximate if other threads allocate meanwhile
+            "memory_mb": round(rss_after - rss_before, 1) if rss_before is not None and rss_after is not None else None,
+            "loaded_at": time.time(),
+        }
+        logger.info(f"✅ Loaded NLP model '{name}' in {load_ms} ms")
+        return model
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def reload(self, name: str) -> Optional[Any]:
+        """Drop a model (or a recorded failure) and load it again"""
+        with self._locks[name]:
+            self._models.pop(name, None)
+            return self._load(name)
+
+    def warmup(self, names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Load models ahead of the first request
+
+        Args:
+            names: Models to load (default NLP_WARMUP_MODELS)
+
+        Returns:
+            stats() after loading
+        """
+        start = time.perf_counter()
+        for name in (names or NLP_WARMUP_MODELS):
+            if name not in self._loaders:
+                logger.warning(f"⚠️ Unknown NLP model '{name}' in warmup list, skipping")
+                continue
+            self.get(name)
+        logger.info(f"🔥 NLP model warmup finished in {time.perf_counter() - start:.1f}s")
+        return self.stats()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of model states, load times and memory (for the admin endpoint)"""
+        rss = _rss_mb()
+        return {
+            "process_rss_mb": round(rss, 1) if rss is not None else None,
+            "models": {name: dict(info) for name, info in self._info.items()},
+        }
+
+
+def _load_nltk() -> Dict[str, Any]:
+    """NLTK resources plus warm tokenizer, tagger, chunker and WordNet"""
+    ensure_nltk_resources()
+    from nltk import ne_chunk, pos_tag
+    from nltk.corpus import stopwords, wordnet
+    from nltk.stem import WordNetLemmatizer
+    from nltk.tokenize import word_tokenize
+
+    # First calls load the punkt tables, the perceptron tagger, the NE chunker and
+    # WordNet; NLTK keeps them cached for the process afterwards
+    ne_chunk(pos_tag(word_tokenize("Warm up the Vernal NLP pipeline in Boston.")), binary=False)
+    wordnet.ensure_loaded()
+    lemmatizer = WordNetLemmatizer()
+    lemmatizer.lemmatize("models")
+    return {"stopwords": set(stopwords.words("english")), "lemmatizer": lemmatizer}
+
+
+def _load_spacy():
+    """spaCy pipeline used for topic tokenization (lemmatizer + tagger, no NER/parser)"""
+    import spacy
+    nlp = spacy.load(SPACY_MODEL_NAME, disable=["ner", "parser", "textcat"])
+    nlp.enable_pipe("lemmatizer")
+    return nlp
+
+
+def _load_bertopic_embeddings():
+    """Sentence-transformers model BERTopic embeds documents with"""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(BERTOPIC_EMBEDDING_MODEL_NAME)
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry (created lazily)"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+            _registry.register("nltk", _load_nltk)
+            _registry.register("spacy", _load_spacy)
+            _registry.register("bertopic_embeddings", _load_bertopic_embeddings)
+        return _registry
+
+
+def get_spacy_nlp():
+    """Shared spaCy pipeline, or None if spaCy / the model isn't installed"""
+    return get_model_registry().get("spacy")
+
+
+def _startup_warmup():
+    # Modules using NLTK directly (entity extraction, word cloud, phrase fallback) rely on
+    # the resources being installed, whether or not the "nltk" model is warmed
+    ensure_nltk_resources()
+    if NLP_WARMUP_ON_STARTUP:
+        get_model_registry().warmup()
+
+
+def start_background_warmup() -> threading.Thread:
+    """
+    Download missing NLTK resources and warm the registry on a daemon thread (app startup hook)
+
+    The server starts accepting requests right away; a request that needs a model
+    still loading waits for that load instead of starting a second one.
+    """
+    if not NLP_WARMUP_ON_STARTUP:
+        logger.info("ℹ️ NLP model warmup disabled (NLP_WARMUP_ON_STARTUP=false), only checking NLTK resources")
+    thread = threading.Thread(target=_startup_warmup, name="nlp-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,174 @@
+"""
+Page Loading Helpers for Playwright Scraping
+Request interception (skip images, media, fonts and ad/analytics hosts that never
+contribute text) and readiness detection that replaces a fixed post-load sleep
+with network-idle / DOM-stability signals capped by a timeout.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+SCRAPER_BLOCK_REQUESTS = os.getenv("SCRAPER_BLOCK_REQUESTS", "true").lower() in ("1", "true", "yes")
+SCRAPER_READY_TIMEOUT_MS = int(os.getenv("SCRAPER_READY_TIMEOUT_MS", "5000"))  # Max wait after DOMContentLoaded
+SCRAPER_DOM_QUIET_MS = int(os.getenv("SCRAPER_DOM_QUIET_MS", "500"))  # DOM unchanged this long = stable
+
+# Playwright resource types that never contribute extractable text
+BLOCKED_RESOURCE_TYPES = {
+    t.strip() for t in os.getenv("SCRAPER_BLOCKED_RESOURCE_TYPES", "image,media,font,ping").split(",") if t.strip()
+}
+
+# Ad, analytics and tracking hosts (suffix match); extend with SCRAPER_BLOCKED_HOSTS
+BLOCKED_HOST_SUFFIXES = (
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com", "google-analytics.com",
+    "googletagmanager.com", "googletagservices.com", "adservice.google.com", "connect.facebook.net",
+    "facebook.com/tr", "amazon-adsystem.com", "adnxs.com", "criteo.com", "criteo.net", "taboola.com",
+    "outbrain.com", "scorecardresearch.com", "quantserve.com", "hotjar.com", "mixpanel.com",
+    "segment.com", "segment.io", "fullstory.com", "clarity.ms", "bat.bing.com", "ads-twitter.com",
+    "ads.linkedin.com", "snap.licdn.com", "analytics.tiktok.com", "hs-analytics.net", "nr-data.net",
+    "pubmatic.com", "rubiconproject.com", "moatads.com", "chartbeat.com", "newrelic.com",
+) + tuple(h.strip().lower() for h in os.getenv("SCRAPER_BLOCKED_HOSTS", "").split(",") if h.strip())
+
+# Resolves once the document has finished loading and the DOM has not changed for quietMs
+# (or after maxMs). Returns true when the page actually settled.
+_DOM_STABLE_JS = """
+([quietMs, maxMs]) => new Promise(resolve => {
+    const start = performance.now();
+    let lastChange = start;
+    const observer = new MutationObserver(() => { lastChange = performance.now(); });
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    const check = () => {
+        const now = performance.now();
+        const settled = document.readyState === 'complete' && now - lastChange >= quietMs;
+        if (settled || now - start >= maxMs) {
+            observer.disconnect();
+            resolve(settled);
+        } else {
+            setTimeout(check, 100);
+        }
+    };
+    setTimeout(check, 100);
+})
+"""
+
+
+def is_blocked_host(url: str) -> bool:
+    """Whether a request URL belongs to a known ad/analytics/tracking host"""
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if not host:
+        return False
+    for suffix in BLOCKED_HOST_SUFFIXES:
+        # Entries like "facebook.com/tr" block one path on an otherwise allowed host
+        suffix_host, _, suffix_path = suffix.partition("/")
+        if host != suffix_host and not host.endswith(f".{suffix_host}"):
+            continue
+        if not suffix_path or parts.path == f"/{suffix_path}" or parts.path.startswith(f"/{suffix_path}/"):
+            return True
+    return False
+
+
+def should_block_request(url: str, resource_type: str, include_images: bool = False) -> bool:
+    """
+    Decide whether a browser request can be skipped
+
+    Args:
+        url: Request URL
+        resource_type: Playwright resource type ("document", "script", "image", ...)
+        include_images: Campaign extracts images, so image requests are let through
+
+    Returns:
+        True to abort the request
+    """
+    if resource_type == "document":
+        return is_blocked_host(url)  # Ad iframes are documents too; the main frame never matches
+    if resource_type == "image" and include_images:
+        return is_blocked_host(url)
+    return resource_type in BLOCKED_RESOURCE_TYPES or is_blocked_host(url)
+
+
+async def install_request_filter(page, include_images: bool = False) -> Dict[str, int]:
+    """
+    Route all requests of a page through should_block_request()
+
+    Args:
+        page: Async Playwright page (before navigation)
+        include_images: Let image requests through
+
+    Returns:
+        Live counters {"blocked": n, "allowed": n} updated as the page loads
+    """
+    counts = {"blocked": 0, "allowed": 0}
+    if not SCRAPER_BLOCK_REQUESTS:
+        return counts
+
+    async def handle(route):
+        request = route.request
+        try:
+            if should_block_request(request.url, request.resource_type, include_images):
+                counts["blocked"] += 1
+                await route.abort("blockedbyclient")
+            else:
+                counts["allowed"] += 1
+                await route.continue_()
+        except Exception as e:
+            # Page/context already closed while the request was in flight
+            logger.debug(f"Request routing failed for {request.url}: {e}")
+
+    await page.route("**/*", handle)
+    return counts
+
+
+async def wait_until_ready(page, timeout_ms: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Wait until a navigated page is ready for extraction
+
+    Returns as soon as either the network goes idle or the DOM stops changing
+    after the load event, and never waits longer than `timeout_ms`.
+
+    Args:
+        page: Async Playwright page after goto(wait_until="domcontentloaded")
+        timeout_ms: Cap on the wait (default SCRAPER_READY_TIMEOUT_MS)
+
+    Returns:
+        Dict with "ready_signal" ("network_idle", "dom_stable" or "timeout")
+        and "ready_wait_ms"
+    """
+    timeout_ms = SCRAPER_READY_TIMEOUT_MS if timeout_ms is None else timeout_ms
+    start = time.perf_counter()
+
+    async def network_idle():
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        return "network_idle"
+
+    async def dom_stable():
+        settled = await page.evaluate(_DOM_STABLE_JS, [SCRAPER_DOM_QUIET_MS, timeout_ms])
+        return "dom_stable" if settled else "timeout"
+
+    tasks = [asyncio.ensure_future(network_idle()), asyncio.ensure_future(dom_stable())]
+    signal = "timeout"
+    try:
+        pending = set(tasks)
+        deadline = start + timeout_ms / 1000
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            finished = [t.result() for t in done if not t.cancelled() and t.exception() is None]
+            if any(s != "timeout" for s in finished):
+                signal = next(s for s in finished if s != "timeout")
+                break
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        # Retrieve outcomes so cancelled/failed waits don't log "exception was never retrieved"
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return {"ready_signal": signal, "ready_wait_ms": int((time.perf_counter() - start) * 1000)}
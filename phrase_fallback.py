@@ -0,0 +1,144 @@
+"""
+Fallback Phrase Extraction
+Used by the research view when extract_topics() returns nothing. Every document of
+the campaign is reduced to its content words - stopwords and function words are
+masked out using the POS tags of its stored artifact (doc_artifacts.py) or, for
+documents without one, the perceptron tagger's word -> tag lexicon - and the n-grams
+of all documents are counted by one CountVectorizer and scored by TF-IDF summed over
+documents, in one sparse pass.
+
+Time and memory are bounded by PHRASE_FALLBACK_MAX_TOKENS: the content words kept per
+document are capped so the whole corpus stays within it (the distinct n-grams the
+vectorizer holds grow with the tokens it sees).
+"""
+
+import logging
+import os
+import re
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PHRASE_FALLBACK_MAX_TOKENS = int(os.getenv("PHRASE_FALLBACK_MAX_TOKENS", "400000"))  # Content words across the corpus
+PHRASE_FALLBACK_MAX_FEATURES = int(os.getenv("PHRASE_FALLBACK_MAX_FEATURES", "50000"))  # Most frequent n-grams scored; 0 = all
+
+# Stopwords on top of NLTK's English list
+PHRASE_EXTRA_STOPWORDS = {
+    'who', 'which', 'what', 'when', 'where', 'why', 'how', 'but', 'than', 'that', 'this',
+    'these', 'those', 'united', 'world', 'one', 'two', 'also', 'more', 'most', 'very'
+}
+# Pronouns, determiners, prepositions, conjunctions
+EXCLUDED_TAGS = {'PRP', 'PRP$', 'DT', 'IN', 'CC', 'TO'}
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+@lru_cache(maxsize=1)
+def phrase_stop_words() -> Set[str]:
+    """NLTK English stopwords + PHRASE_EXTRA_STOPWORDS"""
+    from nltk.corpus import stopwords
+    return set(stopwords.words('english')) | PHRASE_EXTRA_STOPWORDS
+
+
+@lru_cache(maxsize=1)
+def tagger_lexicon() -> Dict[str, str]:
+    """Lowercase words the perceptron tagger always tags the same way -> their tag"""
+    try:
+        from nltk.tag.perceptron import PerceptronTagger
+        return {word: tag for word, tag in PerceptronTagger().tagdict.items() if word.islower()}
+    except Exception as e:
+        logger.warning(f"⚠️ Tagger lexicon unavailable, masking by stopwords only: {e}")
+        return {}
+
+
+def content_words(text: str, artifact=None, min_word_len: int = 3, limit: Optional[int] = None,
+                  allowed: Optional[Dict[str, bool]] = None) -> List[str]:
+    """
+    Lowercased content words of a document, in order
+
+    Args:
+        text: Document text (tokenized by regex when there is no artifact)
+        artifact: The document's DocumentArtifact (its POS tags mask function words)
+        min_word_len: Shorter words are dropped
+        limit: Keep at most this many words
+        allowed: Word -> kept memo shared across documents
+    """
+    stops = phrase_stop_words()
+    lexicon = tagger_lexicon()
+    allowed = {} if allowed is None else allowed
+
+    def keep(word: str) -> bool:
+        kept = allowed.get(word)
+        if kept is None:
+            kept = allowed[word] = (
+                len(word) >= min_word_len and word.isalpha() and word not in stops
+                and lexicon.get(word) not in EXCLUDED_TAGS
+            )
+        return kept
+
+    # Lazy, so a capped document is only scanned up to its limit
+    if artifact is not None:
+        words = (
+            token.lower() for token, tag in zip(artifact.tokens, artifact.tags)
+            if tag not in EXCLUDED_TAGS and keep(token.lower())
+        )
+    else:
+        words = (match.group() for match in _WORD_RE.finditer((text or "").lower()) if keep(match.group()))
+    return list(islice(words, limit))
+
+
+def score_phrases(
+    texts: Sequence[str],
+    artifacts: Optional[Sequence] = None,
+    ngram_range: Tuple[int, int] = (2, 3),
+    min_word_len: int = 3,
+    top_n: int = 10
+) -> List[Tuple[str, float]]:
+    """
+    Highest-scoring n-grams of content words over the whole corpus
+
+    Args:
+        texts: Document texts
+        artifacts: DocumentArtifact (or None) per text
+        ngram_range: (min n, max n) of the phrases
+        min_word_len: Minimum length of the words phrases are built from
+        top_n: Number of phrases returned
+
+    Returns:
+        (phrase, score) pairs, best first; score is the phrase's TF-IDF summed over documents
+    """
+    try:
+        from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+    except ImportError:
+        logger.warning("⚠️ sklearn not available - fallback phrase extraction will not work")
+        return []
+    if not texts:
+        return []
+    artifacts = list(artifacts) if artifacts is not None else [None] * len(texts)
+    per_document = max(ngram_range[1], PHRASE_FALLBACK_MAX_TOKENS // len(texts))
+    allowed: Dict[str, bool] = {}
+    documents = [
+        " ".join(content_words(text, artifact, min_word_len, per_document, allowed))
+        for text, artifact in zip(texts, artifacts)
+    ]
+    vectorizer = CountVectorizer(
+        tokenizer=str.split, token_pattern=None, lowercase=False, ngram_range=ngram_range,
+        max_features=PHRASE_FALLBACK_MAX_FEATURES or None, dtype=np.float32
+    )
+    try:
+        counts = vectorizer.fit_transform(documents)
+    except ValueError:
+        # No document has enough content words for a single n-gram
+        return []
+    scores = np.asarray(TfidfTransformer(sublinear_tf=True).fit_transform(counts).sum(axis=0)).ravel()
+    names = vectorizer.get_feature_names_out()
+    best = np.argsort(-scores, kind="stable")[:top_n]
+    logger.info(
+        f"🧮 Scored {len(names)} {ngram_range[0]}-{ngram_range[1]}-grams over {len(texts)} documents "
+        f"({counts.sum():.0f} occurrences, up to {per_document} content words per document)"
+    )
+    return [(str(names[i]), round(float(scores[i]), 4)) for i in best if scores[i] > 0]
@@ -0,0 +1,224 @@
+"""
+Shared Scrape Cache
+Cross-campaign page cache keyed by normalized URL. Entries younger than the TTL are
+served directly; older ones are revalidated with a conditional GET (ETag /
+Last-Modified) so only pages that actually changed are downloaded again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+SCRAPE_CACHE_ENABLED = os.getenv("SCRAPE_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+SCRAPE_CACHE_TTL_SECONDS = int(os.getenv("SCRAPE_CACHE_TTL_SECONDS", str(24 * 3600)))
+MIN_CACHEABLE_TEXT_CHARS = 50  # Don't cache error pages / empty renders
+
+# Query parameters that never change page content
+TRACKING_PARAMS = {
+    "gclid", "fbclid", "msclkid", "dclid", "yclid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "igshid", "ref_src", "spm",
+}
+TRACKING_PARAM_PREFIXES = ("utm_",)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for caching and deduplication
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters, sorts the remaining query parameters and uses "/" for an empty path.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Normalized URL (the input unchanged if it can't be parsed)
+    """
+    if not url:
+        return url
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if not scheme or not host:
+        return url.strip()
+
+    netloc = host
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and _DEFAULT_PORTS.get(scheme) != port:
+        netloc = f"{host}:{port}"
+    if parts.username:
+        userinfo = parts.username + (f":{parts.password}" if parts.password else "")
+        netloc = f"{userinfo}@{netloc}"
+
+    query_pairs = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ]
+    query = urlencode(sorted(query_pairs), doseq=True)
+
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def hash_url(url: str) -> str:
+    """sha256 hex digest of the normalized URL (cache key)"""
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+
+def compute_content_hash(text: Optional[str]) -> Optional[str]:
+    """sha256 hex digest of extracted text (None for empty text)"""
+    if not text:
+        return None
+    return hashlib.sha256(text.encode("utf-8", errors="ignore")).hexdigest()
+
+
+def _session():
+    from database import SessionLocal
+    return SessionLocal()
+
+
+def get_cached_page(url: str, include_images: bool = False, include_links: bool = False) -> Optional[Dict[str, any]]:
+    """
+    Look up a URL in the shared cache
+
+    Args:
+        url: URL to look up (normalized internally)
+        include_images: Caller needs image URLs (entries without them don't qualify)
+        include_links: Caller needs links (entries without them don't qualify)
+
+    Returns:
+        None on a miss, otherwise a dict with "result" (scrape result shape),
+        "fresh" (within TTL), "validators" (headers for a conditional GET)
+        and "content_hash"
+    """
+    if not SCRAPE_CACHE_ENABLED:
+        return None
+    try:
+        from models import ScrapePageCache
+        session = _session()
+        try:
+            entry = session.query(ScrapePageCache).filter(ScrapePageCache.url_hash == hash_url(url)).first()
+            if entry is None:
+                return None
+            meta = json.loads(entry.meta_json) if entry.meta_json else {}
+            if (include_images and not meta.get("has_images_extracted")) or (include_links and not meta.get("has_links_extracted")):
+                return None
+
+            validators = {}
+            if entry.etag:
+                validators["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                validators["If-Modified-Since"] = entry.last_modified
+
+            age = datetime.now() - (entry.fetched_at or datetime.min)
+            return {
+                "result": {
+                    "text": entry.extracted_text or "",
+                    "html": None,
+                    "images": meta.get("images", []) if include_images else [],
+                    "links": meta.get("links", []) if include_links else [],
+                    "link_anchors": meta.get("link_anchors", {}) if include_links else {},
+                    "error": None
+                },
+                "fresh": age < timedelta(seconds=SCRAPE_CACHE_TTL_SECONDS),
+                "age_seconds": int(age.total_seconds()),
+                "validators": validators,
+                "content_hash": entry.content_hash,
+            }
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Scrape cache lookup failed for {url}: {e}")
+        return None
+
+
+def store_page(
+    url: str,
+    result: Dict[str, any],
+    include_images: bool = False,
+    include_links: bool = False,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None
+):
+    """
+    Insert or refresh a cache entry from a successful scrape result
+
+    Args:
+        url: Scraped URL
+        result: Scrape result dict (text/images/links/metadata)
+        include_images: Whether images were extracted for this result
+        include_links: Whether links were extracted for this result
+        etag: ETag response header, if any
+        last_modified: Last-Modified response header, if any
+    """
+    if not SCRAPE_CACHE_ENABLED:
+        return
+    text = result.get("text") or ""
+    if result.get("error") or len(text.strip()) < MIN_CACHEABLE_TEXT_CHARS:
+        return
+    try:
+        from models import ScrapePageCache
+        session = _session()
+        try:
+            key = hash_url(url)
+            entry = session.query(ScrapePageCache).filter(ScrapePageCache.url_hash == key).first()
+            meta = json.loads(entry.meta_json) if entry is not None and entry.meta_json else {}
+            # Keep previously extracted images/links if this fetch didn't ask for them
+            if include_images:
+                meta["images"] = result.get("images", [])
+                meta["has_images_extracted"] = True
+            if include_links:
+                meta["links"] = result.get("links", [])
+                meta["link_anchors"] = result.get("link_anchors", {})
+                meta["has_links_extracted"] = True
+            meta["fetch_method"] = (result.get("metadata") or {}).get("fetch_method")
+
+            if entry is None:
+                entry = ScrapePageCache(url_hash=key, url=normalize_url(url))
+                session.add(entry)
+            entry.extracted_text = text
+            entry.content_hash = compute_content_hash(text)
+            entry.etag = etag
+            entry.last_modified = last_modified
+            entry.meta_json = json.dumps(meta)
+            entry.fetched_at = datetime.now()
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    except Exception as e:
+        # Concurrent inserts of the same URL can hit the unique key - the other writer wins
+        logger.debug(f"Scrape cache store failed for {url}: {e}")
+
+
+def touch_page(url: str):
+    """Mark a cache entry as revalidated (server answered 304 Not Modified)"""
+    if not SCRAPE_CACHE_ENABLED:
+        return
+    try:
+        from models import ScrapePageCache
+        session = _session()
+        try:
+            session.query(ScrapePageCache).filter(ScrapePageCache.url_hash == hash_url(url)).update(
+                {ScrapePageCache.fetched_at: datetime.now()}, synchronize_session=False
+            )
+            session.commit()
+        finally:
+            session.close()
+    except Exception as e:
+        logger.debug(f"Scrape cache touch failed for {url}: {e}")
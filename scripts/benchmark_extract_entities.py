@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# scripts/benchmark_extract_entities.py
+# Per-document cost of extract_entities (entity_extraction.py) on ~100 KB pages, compared
+# with the implementation at an earlier git revision. Outputs of both versions are
+# compared for every page and the run fails if they differ.
+#
+# Usage:
+#   python scripts/benchmark_extract_entities.py [--baseline-rev REV] [--pages 20] [--page-kb 100] [--regex-only]
+#
+# --regex-only skips the NLTK tokenizer/tagger/chunker stage in both versions (it is
+# the same code in both and dominates the runtime), so the filter/regex stage is
+# measured on its own.
+
+import argparse
+import ast
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Last revision before extract_entities was optimized (its filters ran per call, inline)
+BASELINE_REV = "01d04fe"
+
+ENTITY_FLAGS = dict(
+    extract_persons=True, extract_organizations=True, extract_locations=True, extract_dates=True,
+    extract_money=True, extract_percent=True, extract_time=True, extract_facility=True
+)
+
+_SENTENCES = [
+    "John Smith met Mary Ann Jones at Stanford University on January 15, 2024 to discuss the merger.",
+    "Acme Industries and Global Technologies signed a $4,500,000 deal; shares rose 12.5% by 3:45 PM.",
+    "The Mississippi River flooded parts of Jackson City in 1998, according to the State Department.",
+    "Press Ctrl and select all to duplicate pages in Microsoft Word, then place your cursor on the blank page.",
+    "Researchers at the Mayo Clinic and Boston Medical Center published results in March 2023.",
+    "The Empire State Building and Willis Tower were lit at midnight on 07/04/2021.",
+    "In 2019, Robert Brown joined Northwind Group as chief economist after leaving First National Bank.",
+    "The Vietnam War changed America; the documentary mini series trailer is available in English.",
+    "Edit View Insert Format Tools Table Help - License Trialware, Developer Initial Predecessor.",
+    "Sarah Connor visited the Louvre Museum and the Lincoln Center on the 3rd of June 2022.",
+    "Prices start at 250 dollars or 230 EUR, a 15% discount for members of the Hudson Bay Association.",
+    "Min read: how to duplicate a page in a Word document if you want to keep the formatting.",
+]
+
+
+def make_page(size_kb: int, seed: int) -> str:
+    """Synthetic scraped page of roughly size_kb kilobytes (names, organizations, dates, UI noise)"""
+    rng = random.Random(seed)
+    parts, size = [], 0
+    while size < size_kb * 1024:
+        sentence = rng.choice(_SENTENCES)
+        # Vary numbers so pages don't collapse to a handful of distinct matches
+        sentence = re.sub(r"\d+", lambda m: str(rng.randint(1, 2030)), sentence)
+        parts.append(sentence)
+        size += len(sentence) + 1
+    return " ".join(parts)
+
+
+def _raise_nltk(*args, **kwargs):
+    raise RuntimeError("NLTK stage skipped (--regex-only)")
+
+
+def _source_at(rev: str, path: str) -> Optional[str]:
+    """Contents of `path` at git revision `rev` (None if the file doesn't exist there)"""
+    result = subprocess.run(
+        ["git", "show", f"{rev}:{path}"], capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    return result.stdout if result.returncode == 0 else None
+
+
+def _is_private_definition(node: ast.stmt) -> bool:
+    """Module-level helper function or table (name starting with "_")"""
+    if isinstance(node, ast.FunctionDef):
+        return node.name.startswith("_")
+    return isinstance(node, ast.Assign) and all(isinstance(t, ast.Name) and t.id.startswith("_") for t in node.targets)
+
+
+def load_baseline(rev: str, regex_only: bool):
+    """
+    extract_entities as it was at `rev`, executed from the files at that revision
+
+    Revisions with entity_extraction.py run that module as a whole. Older ones only
+    have text_processing.py (too heavy to import), so extract_entities is executed
+    together with the module's private helper functions and pattern tables.
+    """
+    namespace = {"__name__": "baseline"}
+    source = _source_at(rev, "entity_extraction.py")
+    if source is not None:
+        exec(compile(source, f"{rev}:entity_extraction.py", "exec"), namespace)
+    else:
+        source = _source_at(rev, "text_processing.py")
+        if source is None:
+            raise SystemExit(f"❌ Neither entity_extraction.py nor text_processing.py exists at {rev}")
+        tree = ast.parse(source)
+        nodes = [
+            n for n in tree.body
+            if (isinstance(n, ast.FunctionDef) and n.name == "extract_entities") or _is_private_definition(n)
+        ]
+        if not any(isinstance(n, ast.FunctionDef) and n.name == "extract_entities" for n in nodes):
+            raise SystemExit(f"❌ No extract_entities in text_processing.py at {rev}")
+        namespace.update({
+            "re": re, "Dict": Dict, "List": List, "Optional": Optional, "Tuple": Tuple,
+            "lru_cache": lru_cache, "logger": logging.getLogger("baseline"),
+        })
+        exec(compile(ast.Module(body=nodes, type_ignores=[]), f"{rev}:text_processing.py", "exec"), namespace)
+    if regex_only:
+        namespace.update(word_tokenize=_raise_nltk, pos_tag=_raise_nltk, ne_chunk=_raise_nltk)
+    else:
+        from nltk import ne_chunk, pos_tag
+        from nltk.tokenize import word_tokenize
+        namespace.update(word_tokenize=word_tokenize, pos_tag=pos_tag, ne_chunk=ne_chunk)
+    return namespace["extract_entities"]
+
+
+def load_current(regex_only: bool):
+    import entity_extraction
+    if regex_only:
+        entity_extraction.word_tokenize = _raise_nltk
+    return entity_extraction.extract_entities
+
+
+def time_per_doc(fn, pages: List[str]) -> float:
+    """Mean wall time per page in ms"""
+    start = time.perf_counter()
+    for page in pages:
+        fn(page, **ENTITY_FLAGS)
+    return (time.perf_counter() - start) * 1000 / len(pages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extract_entities against an earlier revision")
+    parser.add_argument("--baseline-rev", default=BASELINE_REV, help="Git revision with the implementation to compare against")
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-kb", type=int, default=100)
+    parser.add_argument("--regex-only", action="store_true", help="Skip the NLTK stage in both versions")
+    args = parser.parse_args()
+
+    # The fallback warning would be logged once per page
+    if args.regex_only:
+        logging.getLogger("baseline").setLevel(logging.ERROR)
+        logging.getLogger("entity_extraction").setLevel(logging.ERROR)
+
+    baseline = load_baseline(args.baseline_rev, args.regex_only)
+    current = load_current(args.regex_only)
+    pages = [make_page(args.page_kb, seed) for seed in range(args.pages)]
+
+    for i, page in enumerate(pages):
+        if baseline(page, **ENTITY_FLAGS) != current(page, **ENTITY_FLAGS):
+            logger.error(f"❌ Outputs differ on page {i}")
+            sys.exit(1)
+    logger.info(f"✅ Identical output on {len(pages)} pages of ~{args.page_kb} KB")
+
+    before = time_per_doc(baseline, pages)
+    after = time_per_doc(current, pages)
+    print(f"extract_entities per {args.page_kb} KB page ({'regex stage only' if args.regex_only else 'NLTK + regex'}):")
+    print(f"  before ({args.baseline_rev}): {before:8.1f} ms")
+    print(f"  after  (working tree): {after:8.1f} ms")
+    print(f"  speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
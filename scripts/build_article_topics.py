@@ -28,6 +28,7 @@ from sklearn.decomposition import NMF
 # Import project utilities
 from database import SessionLocal
 from models import SystemSettings
+from topic_cache import get_topic_result, store_topic_result, topic_cache_key
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -246,40 +247,61 @@ def main():
 
     logger.info(f"Processing {len(df)} documents")
 
-    # Tokenize
-    nlp = spacy_pipeline()
-    tokens, sentences = tokenize_docs(nlp, df["cleaned_text"].tolist())
-
-    # Phrase mining
-    bigram = Phrases(tokens, min_count=PHRASES_MIN_COUNT, threshold=PHRASES_THRESHOLD, delimiter=b"_")
-    trigram = Phrases(bigram[tokens], min_count=PHRASES_MIN_COUNT, threshold=PHRASES_THRESHOLD, delimiter=b"_")
-    bigr = Phraser(bigram)
-    trgr = Phraser(trigram)
-    tokens_phrased = [trgr[bigr[tok]] for tok in tokens]
-    docs_str = [" ".join(t) for t in tokens_phrased]
-
-    # Vectorize
-    tfidf = TfidfVectorizer(min_df=TFIDF_MIN_DF, max_df=TFIDF_MAX_DF, strip_accents="unicode")
-    X = tfidf.fit_transform(docs_str)
-    terms = tfidf.get_feature_names_out()
-    idf = tfidf.idf_
-
-    # K sweep (pick by coherence)
-    best = None
-    best_topic_terms = None
-    for K in K_GRID:
-        logger.info(f"Testing K={K}")
-        nmf = NMF(n_components=K, init="nndsvd", random_state=42, max_iter=500)
-        W = nmf.fit_transform(X)
-        H = nmf.components_
-        coh, topic_terms = coherence_from_H(H, terms, tokens_phrased, topn=TOP_WORDS)
-        logger.info(f"K={K}, coherence={coh:.3f}")
-        if (best is None) or (coh > best[0]):
-            best = (coh, K, nmf, W, H)
-            best_topic_terms = topic_terms
-
-    coherence, K, nmf, W, H = best
-    labels = label_topics(H, terms, idf, topm=TOP_WORDS)
+    # Reuse the fit from an earlier run when corpus and settings are unchanged
+    cache_key = topic_cache_key(df["cleaned_text"].tolist(), "article_topics", {
+        "phrases_min_count": PHRASES_MIN_COUNT,
+        "phrases_threshold": PHRASES_THRESHOLD,
+        "tfidf_min_df": TFIDF_MIN_DF,
+        "tfidf_max_df": TFIDF_MAX_DF,
+        "k_grid": K_GRID,
+        "top_words": TOP_WORDS,
+    })
+    cached = get_topic_result(cache_key)
+    if cached is not None and cached["labels"] is not None:
+        sentences = [sentence_split(t or "") for t in df["cleaned_text"].tolist()]
+        terms = np.array(cached["vocabulary"])
+        W, H, labels = cached["W"], cached["H"], cached["labels"]
+        K, coherence = cached["meta"]["k"], cached["meta"]["coherence"]
+        best_topic_terms = [[terms[i] for i in comp.argsort()[-TOP_WORDS:]] for comp in H]
+    else:
+        # Tokenize
+        nlp = spacy_pipeline()
+        tokens, sentences = tokenize_docs(nlp, df["cleaned_text"].tolist())
+
+        # Phrase mining
+        bigram = Phrases(tokens, min_count=PHRASES_MIN_COUNT, threshold=PHRASES_THRESHOLD, delimiter=b"_")
+        trigram = Phrases(bigram[tokens], min_count=PHRASES_MIN_COUNT, threshold=PHRASES_THRESHOLD, delimiter=b"_")
+        bigr = Phraser(bigram)
+        trgr = Phraser(trigram)
+        tokens_phrased = [trgr[bigr[tok]] for tok in tokens]
+        docs_str = [" ".join(t) for t in tokens_phrased]
+
+        # Vectorize
+        tfidf = TfidfVectorizer(min_df=TFIDF_MIN_DF, max_df=TFIDF_MAX_DF, strip_accents="unicode")
+        X = tfidf.fit_transform(docs_str)
+        terms = tfidf.get_feature_names_out()
+        idf = tfidf.idf_
+
+        # K sweep (pick by coherence)
+        best = None
+        best_topic_terms = None
+        for K in K_GRID:
+            logger.info(f"Testing K={K}")
+            nmf = NMF(n_components=K, init="nndsvd", random_state=42, max_iter=500)
+            W = nmf.fit_transform(X)
+            H = nmf.components_
+            coh, topic_terms = coherence_from_H(H, terms, tokens_phrased, topn=TOP_WORDS)
+            logger.info(f"K={K}, coherence={coh:.3f}")
+            if (best is None) or (coh > best[0]):
+                best = (coh, K, nmf, W, H)
+                best_topic_terms = topic_terms
+
+        coherence, K, nmf, W, H = best
+        labels = label_topics(H, terms, idf, topm=TOP_WORDS)
+        store_topic_result(
+            cache_key, "article_topics", terms, W, H, labels=labels,
+            meta={"k": int(K), "coherence": float(coherence)}
+        )
 
     # Topic ordering, coverage
     topic_strength = W.sum(axis=0)
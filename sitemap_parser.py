@@ -3,11 +3,18 @@ Sitemap Parser for Site Builder Campaign Type
 Parses sitemap.xml files to extract all URLs from a website
 """
 
+import gzip
+import heapq
+import io
 import logging
+import os
+import threading
+import time
 import xml.etree.ElementTree as ET
-from typing import List, Set, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import BinaryIO, Callable, Iterator, List, Tuple, Optional
 from urllib.parse import urljoin, urlparse
-from datetime import datetime
+from datetime import datetime, timezone
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -17,8 +24,17 @@ logger = logging.getLogger(__name__)
 # Namespaces for sitemap XML
 SITEMAP_NS = {"sitemap": "http://www.sitemaps.org/schemas/sitemap/0.9"}
 
+GZIP_MAGIC = b"\x1f\x8b"
+SITEMAP_READ_BUFFER_BYTES = 64 * 1024
 
-def create_session_with_retry() -> requests.Session:
+SITEMAP_MAX_WORKERS = int(os.getenv("SITEMAP_MAX_WORKERS", "8"))  # Concurrent child sitemap fetches per index
+SITEMAP_MAX_INDEX_DEPTH = 2  # Nested indexes followed below the top-level index
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def create_session_with_retry(pool_size: int = 10) -> requests.Session:
     """Create a requests session with retry strategy"""
     session = requests.Session()
     retry_strategy = Retry(
@@ -26,12 +42,26 @@ def create_session_with_retry() -> requests.Session:
         backoff_factor=1,
         status_forcelist=[429, 500, 502, 503, 504],
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
 
 
+def get_shared_session() -> requests.Session:
+    """
+    Process-wide keep-alive session for all sitemap and robots.txt requests
+    
+    The connection pool is sized for SITEMAP_MAX_WORKERS so concurrent child
+    sitemap fetches reuse connections to the same host instead of reconnecting.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session_with_retry(pool_size=max(10, SITEMAP_MAX_WORKERS))
+        return _shared_session
+
+
 def validate_url_format(url: str) -> Tuple[bool, Optional[str]]:
     """
     Validate URL format and basic structure
@@ -85,7 +115,7 @@ def validate_url_accessibility(url: str, timeout: int = 10) -> Tuple[bool, Optio
         http_status_code will be None if request failed before getting a response
     """
     try:
-        session = create_session_with_retry()
+        session = get_shared_session()
         response = session.get(
             url,
             timeout=timeout,
@@ -160,7 +190,7 @@ def quick_sitemap_check(site_url: str, timeout: int = 10) -> Tuple[bool, Optiona
             f"{base_url}/sitemap_index.xml",
         ]
         
-        session = create_session_with_retry()
+        session = get_shared_session()
         
         # Quick check: try sitemap.xml first (most common)
         for sitemap_url in potential_sitemaps[:1]:  # Only check first one for speed
@@ -240,7 +270,7 @@ def get_sitemap_from_robots_txt(robots_url: str) -> List[str]:
     """
     sitemap_urls = []
     try:
-        session = create_session_with_retry()
+        session = get_shared_session()
         response = session.get(robots_url, timeout=10, headers={
             "User-Agent": "Mozilla/5.0 (compatible; SiteBuilderBot/1.0)"
         })
@@ -258,6 +288,122 @@ def get_sitemap_from_robots_txt(robots_url: str) -> List[str]:
     return sitemap_urls
 
 
+def parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a sitemap <lastmod> value (W3C datetime)
+
+    Timezone-aware values are converted to naive UTC so dated entries can always be compared.
+
+    Args:
+        value: Raw lastmod text (e.g., "2025-11-18T04:18:32+00:00" or "2025-11-18")
+
+    Returns:
+        Naive UTC datetime, or None if missing/unparseable
+    """
+    if not value:
+        return None
+    date_str = value.strip()
+    try:
+        # Try full ISO format first
+        parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        # Try date-only format
+        try:
+            parsed = datetime.strptime(date_str.split('T')[0], '%Y-%m-%d')
+        except ValueError:
+            logger.debug(f"Could not parse date: {date_str}")
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _local_name(tag: str) -> str:
+    """Tag name without its XML namespace ("{ns}url" -> "url")"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_sitemap_entries(stream: BinaryIO) -> Iterator[Tuple[str, str, Optional[datetime]]]:
+    """
+    Incrementally parse a sitemap or sitemap index from a byte stream
+
+    Elements are cleared as soon as they have been read, so memory stays flat no
+    matter how many entries the file has. Namespaced and namespace-less sitemaps
+    are both accepted.
+
+    Args:
+        stream: File-like object with the (decompressed) XML
+
+    Yields:
+        (kind, loc, lastmod) where kind is "url" for page entries or "sitemap"
+        for child sitemaps of an index
+    """
+    root = None
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            continue
+
+        kind = _local_name(elem.tag)
+        if kind not in ("url", "sitemap") or elem is root:
+            continue
+
+        loc = None
+        lastmod = None
+        for child in elem:
+            child_name = _local_name(child.tag)
+            if child_name == "loc" and child.text:
+                loc = child.text.strip()
+            elif child_name == "lastmod" and child.text:
+                lastmod = child.text
+        if loc:
+            yield kind, loc, parse_lastmod(lastmod)
+
+        # Drop the finished entry (and everything parsed before it) from the tree
+        elem.clear()
+        root.clear()
+
+
+def _open_sitemap_stream(session: requests.Session, sitemap_url: str) -> Tuple[requests.Response, BinaryIO]:
+    """
+    GET a sitemap as a stream, transparently gunzipping .xml.gz files
+
+    Content-Encoding: gzip is undone by urllib3; gzip files served as-is
+    (application/x-gzip) are detected by their magic bytes and decompressed on the fly.
+    """
+    response = session.get(sitemap_url, timeout=30, stream=True, headers={
+        "User-Agent": "Mozilla/5.0 (compatible; SiteBuilderBot/1.0)"
+    })
+    response.raise_for_status()
+    response.raw.decode_content = True
+    stream = io.BufferedReader(response.raw, buffer_size=SITEMAP_READ_BUFFER_BYTES)
+    if stream.peek(2)[:2] == GZIP_MAGIC:
+        return response, gzip.GzipFile(fileobj=stream)
+    return response, stream
+
+
+class _MostRecentUrls:
+    """Keeps the N entries with the newest lastmod (undated entries rank last)"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._heap: List[Tuple[Tuple[bool, datetime, int], str, Optional[datetime]]] = []
+        self._seq = 0
+
+    def add(self, url: str, lastmod: Optional[datetime]):
+        # Earlier entries win ties, like a stable sort of the full list would
+        key = (lastmod is not None, lastmod or datetime.min, -self._seq)
+        self._seq += 1
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, (key, url, lastmod))
+        elif key > self._heap[0][0]:
+            heapq.heapreplace(self._heap, (key, url, lastmod))
+
+    def items(self) -> List[Tuple[str, Optional[datetime]]]:
+        return [(url, lastmod) for _, url, lastmod in sorted(self._heap, reverse=True)]
+
+
 def parse_sitemap_index(sitemap_url: str) -> List[str]:
     """
     Parse a sitemap index file and return URLs of individual sitemaps
@@ -268,119 +414,223 @@ def parse_sitemap_index(sitemap_url: str) -> List[str]:
     Returns:
         List of sitemap URLs from the index
     """
-    sitemap_urls = []
     try:
-        session = create_session_with_retry()
-        response = session.get(sitemap_url, timeout=30, headers={
-            "User-Agent": "Mozilla/5.0 (compatible; SiteBuilderBot/1.0)"
-        })
-        response.raise_for_status()
-        
-        root = ET.fromstring(response.content)
-        
-        # Check if it's a sitemap index
-        if root.tag.endswith("sitemapindex"):
-            # Try namespaced first
-            sitemap_elems = root.findall(".//sitemap:sitemap", SITEMAP_NS)
-            if not sitemap_elems:
-                # Fallback: try without namespace
-                sitemap_elems = root.findall(".//sitemap")
-            
-            for sitemap_elem in sitemap_elems:
-                # Try both namespaced and non-namespaced loc elements
-                loc_elem = sitemap_elem.find("sitemap:loc", SITEMAP_NS)
-                if loc_elem is None:
-                    loc_elem = sitemap_elem.find("loc")
-                
-                if loc_elem is not None and loc_elem.text:
-                    sitemap_urls.append(loc_elem.text.strip())
-                    logger.debug(f"Found sitemap in index: {loc_elem.text.strip()}")
-        
+        _, sitemap_urls = _read_sitemap(get_shared_session(), sitemap_url)
+        for sub_sitemap_url in sitemap_urls:
+            logger.debug(f"Found sitemap in index: {sub_sitemap_url}")
         return sitemap_urls
     except Exception as e:
         logger.error(f"Error parsing sitemap index {sitemap_url}: {e}")
         return []
 
 
-def parse_sitemap(sitemap_url: str, base_url: str = None) -> List[Tuple[str, Optional[datetime]]]:
+def _read_sitemap(
+    session: requests.Session,
+    sitemap_url: str,
+    base_url: str = None,
+    max_urls: Optional[int] = None,
+    most_recent: Optional[int] = None,
+    should_stop: Optional[Callable[[], bool]] = None
+) -> Tuple[List[Tuple[str, Optional[datetime]]], List[str]]:
+    """
+    Fetch and stream-parse one sitemap file (single request, no recursion)
+    
+    Returns:
+        (urls_with_dates, child_sitemap_urls) - child sitemaps are only set for an index
+    
+    Raises:
+        requests.RequestException: If the sitemap can't be fetched
+    """
+    top = _MostRecentUrls(most_recent) if most_recent and most_recent > 0 else None
+    urls_with_dates = []
+    child_sitemaps = []
+    
+    response, stream = _open_sitemap_stream(session, sitemap_url)
+    with response:
+        try:
+            for kind, loc, lastmod_date in iter_sitemap_entries(stream):
+                if should_stop is not None and should_stop():
+                    break
+                if kind == "sitemap":
+                    child_sitemaps.append(loc)
+                    continue
+                url = loc
+                # Resolve relative URLs if base_url provided
+                if base_url and not url.startswith("http"):
+                    url = urljoin(base_url, url)
+                if top is not None:
+                    top.add(url, lastmod_date)
+                else:
+                    urls_with_dates.append((url, lastmod_date))
+                    if max_urls and len(urls_with_dates) >= max_urls:
+                        logger.info(f"Reached {max_urls} URLs in sitemap {sitemap_url}, stopping early")
+                        break
+        except ET.ParseError as e:
+            # Keep what was parsed before the malformed part
+            logger.error(f"XML parse error for {sitemap_url}: {e}")
+    
+    if top is not None:
+        urls_with_dates = top.items()
+    return urls_with_dates, child_sitemaps
+
+
+def _collect_child_sitemap(
+    session: requests.Session,
+    sitemap_url: str,
+    base_url: str,
+    max_urls: Optional[int],
+    most_recent: Optional[int],
+    should_stop: Callable[[], bool],
+    depth: int
+) -> List[Tuple[str, Optional[datetime]]]:
+    """
+    Worker for _expand_sitemap_index: read one child sitemap, never raises
+    
+    Nested indexes aren't allowed by the sitemap protocol but do occur; they are
+    followed serially up to SITEMAP_MAX_INDEX_DEPTH.
+    """
+    if should_stop():
+        return []
+    try:
+        urls_with_dates, nested_sitemaps = _read_sitemap(
+            session, sitemap_url, base_url, max_urls, most_recent, should_stop
+        )
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to read child sitemap {sitemap_url}: {e}")
+        return []
+    
+    if nested_sitemaps and depth >= SITEMAP_MAX_INDEX_DEPTH:
+        logger.warning(f"⚠️ Not following {len(nested_sitemaps)} nested sitemaps in {sitemap_url} (max depth {SITEMAP_MAX_INDEX_DEPTH})")
+        return urls_with_dates
+    for nested_url in nested_sitemaps:
+        if should_stop() or (max_urls and len(urls_with_dates) >= max_urls):
+            break
+        remaining = max_urls - len(urls_with_dates) if max_urls else None
+        urls_with_dates.extend(_collect_child_sitemap(
+            session, nested_url, base_url, remaining, most_recent, should_stop, depth + 1
+        ))
+    return urls_with_dates
+
+
+def _expand_sitemap_index(
+    session: requests.Session,
+    index_url: str,
+    child_sitemaps: List[str],
+    base_url: str = None,
+    max_urls: Optional[int] = None,
+    most_recent: Optional[int] = None
+) -> List[Tuple[str, Optional[datetime]]]:
+    """
+    Read the child sitemaps of an index concurrently
+    
+    Children are fetched by up to SITEMAP_MAX_WORKERS threads over the shared
+    session. Results are assembled in index order, and as soon as the children
+    completed so far (from the start of the index) fill max_urls, pending fetches
+    are cancelled and running ones stop reading - so the URLs returned are the
+    same ones a serial walk of the index would return.
+    
+    Args:
+        session: Shared keep-alive session
+        index_url: URL of the index (for logging)
+        child_sitemaps: Child sitemap URLs in index order
+        base_url: Base URL for resolving relative URLs
+        max_urls: URL budget (None = read every child; ignored with most_recent)
+        most_recent: Keep the N newest URLs per child (caller merges the top-N)
+    
+    Returns:
+        List of (url, lastmod_date) tuples
+    """
+    budget = None if (most_recent and most_recent > 0) else max_urls
+    stop = threading.Event()
+    results: List[Optional[List[Tuple[str, Optional[datetime]]]]] = [None] * len(child_sitemaps)
+    completed_prefix = 0  # Children [0, completed_prefix) are done
+    prefix_url_count = 0
+    start = time.perf_counter()
+    
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(SITEMAP_MAX_WORKERS, len(child_sitemaps))),
+        thread_name_prefix="sitemap"
+    )
+    try:
+        futures = {
+            executor.submit(
+                _collect_child_sitemap, session, child_url, base_url, budget, most_recent, stop.is_set, 1
+            ): position
+            for position, child_url in enumerate(child_sitemaps)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            while completed_prefix < len(results) and results[completed_prefix] is not None:
+                prefix_url_count += len(results[completed_prefix])
+                completed_prefix += 1
+            if budget and prefix_url_count >= budget:
+                logger.info(f"Reached {budget} URLs after {completed_prefix}/{len(child_sitemaps)} child sitemaps of {index_url}, stopping early")
+                break
+    finally:
+        # Don't wait for in-flight fetches - they see the stop flag and return
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    urls_with_dates = []
+    for position in range(completed_prefix if budget else len(results)):
+        urls_with_dates.extend(results[position] or [])
+    if budget:
+        urls_with_dates = urls_with_dates[:budget]
+    logger.info(
+        f"Expanded sitemap index {index_url}: {sum(r is not None for r in results)}/{len(child_sitemaps)} "
+        f"child sitemaps, {len(urls_with_dates)} URLs in {time.perf_counter() - start:.1f}s"
+    )
+    return urls_with_dates
+
+
+def parse_sitemap(
+    sitemap_url: str,
+    base_url: str = None,
+    max_urls: Optional[int] = None,
+    most_recent: Optional[int] = None
+) -> List[Tuple[str, Optional[datetime]]]:
     """
-    Parse a sitemap XML file and extract all URLs with their lastmod dates
+    Parse a sitemap XML file (plain or gzipped) and extract URLs with their lastmod dates
+    
+    The response is parsed as it streams in, so memory stays bounded on very large
+    sitemaps. Sitemap indexes are fetched once and their child sitemaps are read
+    concurrently (see _expand_sitemap_index).
     
     Args:
         sitemap_url: URL to sitemap XML file
         base_url: Base URL for resolving relative URLs (optional)
+        max_urls: Stop reading once this many URLs were collected (ignored with most_recent)
+        most_recent: Keep only the N URLs with the newest lastmod (whole sitemap is scanned)
     
     Returns:
-        List of tuples: (url, lastmod_date) where lastmod_date can be None
+        List of tuples: (url, lastmod_date) where lastmod_date can be None;
+        newest first when most_recent is set
     """
-    urls_with_dates = []
+    use_top = bool(most_recent and most_recent > 0)
+    if not use_top and max_urls is not None and max_urls <= 0:
+        return []
+    
     try:
-        session = create_session_with_retry()
-        response = session.get(sitemap_url, timeout=30, headers={
-            "User-Agent": "Mozilla/5.0 (compatible; SiteBuilderBot/1.0)"
-        })
-        response.raise_for_status()
-        
-        root = ET.fromstring(response.content)
-        
-        # Check if it's a sitemap index
-        if root.tag.endswith("sitemapindex"):
-            logger.info(f"Sitemap {sitemap_url} is a sitemap index, fetching individual sitemaps...")
-            sitemap_urls = parse_sitemap_index(sitemap_url)
-            for sub_sitemap_url in sitemap_urls:
-                sub_urls = parse_sitemap(sub_sitemap_url, base_url)
-                urls_with_dates.extend(sub_urls)
-            return urls_with_dates
-        
-        # Parse regular sitemap
-        # Try namespaced first (standard sitemap format)
-        url_elems = root.findall(".//sitemap:url", SITEMAP_NS)
-        if not url_elems:
-            # Fallback: try without namespace (some sitemaps don't use namespaces)
-            url_elems = root.findall(".//url")
-        
-        for url_elem in url_elems:
-            # Try both namespaced and non-namespaced loc elements
-            loc_elem = url_elem.find("sitemap:loc", SITEMAP_NS)
-            if loc_elem is None:
-                loc_elem = url_elem.find("loc")
-            
-            if loc_elem is not None and loc_elem.text:
-                url = loc_elem.text.strip()
-                # Resolve relative URLs if base_url provided
-                if base_url and not url.startswith("http"):
-                    url = urljoin(base_url, url)
-                
-                # Try to extract lastmod date
-                lastmod_date = None
-                lastmod_elem = url_elem.find("sitemap:lastmod", SITEMAP_NS)
-                if lastmod_elem is None:
-                    lastmod_elem = url_elem.find("lastmod")
-                
-                if lastmod_elem is not None and lastmod_elem.text:
-                    try:
-                        # Parse ISO 8601 date format (e.g., "2025-11-18T04:18:32+00:00" or "2025-11-18")
-                        date_str = lastmod_elem.text.strip()
-                        # Try full ISO format first
-                        try:
-                            lastmod_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                        except ValueError:
-                            # Try date-only format
-                            try:
-                                lastmod_date = datetime.strptime(date_str.split('T')[0], '%Y-%m-%d')
-                            except ValueError:
-                                logger.debug(f"Could not parse date: {date_str}")
-                    except Exception as e:
-                        logger.debug(f"Error parsing lastmod date for {url}: {e}")
-                
-                urls_with_dates.append((url, lastmod_date))
+        session = get_shared_session()
+        urls_with_dates, child_sitemaps = _read_sitemap(session, sitemap_url, base_url, max_urls, most_recent)
+        
+        # Sitemap index: follow child sitemaps with the remaining budget
+        if child_sitemaps:
+            logger.info(f"Sitemap {sitemap_url} is a sitemap index with {len(child_sitemaps)} sitemaps, fetching individual sitemaps...")
+            remaining = max_urls - len(urls_with_dates) if max_urls and not use_top else None
+            if remaining is None or remaining > 0:
+                urls_with_dates.extend(_expand_sitemap_index(
+                    session, sitemap_url, child_sitemaps, base_url, remaining, most_recent
+                ))
+            if use_top:
+                top = _MostRecentUrls(most_recent)
+                for url, lastmod_date in urls_with_dates:
+                    top.add(url, lastmod_date)
+                urls_with_dates = top.items()
         
         logger.info(f"Parsed {len(urls_with_dates)} URLs from sitemap {sitemap_url}")
         return urls_with_dates
     
-    except ET.ParseError as e:
-        logger.error(f"XML parse error for {sitemap_url}: {e}")
-        return []
     except requests.RequestException as e:
         logger.error(f"Request error fetching {sitemap_url}: {e}")
         return []
@@ -393,6 +643,27 @@ def parse_sitemap_from_site(site_url: str, max_urls: int = 1000, most_recent: Op
     """
     Main function to parse sitemap from a website
     
+    Same as parse_sitemap_entries_from_site() without the lastmod dates.
+    
+    Args:
+        site_url: Base URL of the website
+        max_urls: Maximum number of URLs to return (for performance)
+        most_recent: If provided, return only the N most recent URLs based on lastmod date
+    
+    Returns:
+        List of URLs found in the sitemap(s), optionally filtered by date
+    """
+    return [url for url, _ in parse_sitemap_entries_from_site(site_url, max_urls=max_urls, most_recent=most_recent)]
+
+
+def parse_sitemap_entries_from_site(
+    site_url: str,
+    max_urls: int = 1000,
+    most_recent: Optional[int] = None
+) -> List[Tuple[str, Optional[datetime]]]:
+    """
+    Parse the sitemap(s) of a website into URLs with their lastmod dates
+    
     Attempts multiple strategies:
     1. Try common sitemap URLs (sitemap.xml, sitemap_index.xml)
     2. Check robots.txt for sitemap location
@@ -405,7 +676,7 @@ def parse_sitemap_from_site(site_url: str, max_urls: int = 1000, most_recent: Op
         most_recent: If provided, return only the N most recent URLs based on lastmod date
     
     Returns:
-        List of URLs found in the sitemap(s), optionally filtered by date
+        List of (url, lastmod_date) tuples found in the sitemap(s), optionally filtered by date
     """
     try:
         # Normalize the site URL
@@ -428,6 +699,13 @@ def parse_sitemap_from_site(site_url: str, max_urls: int = 1000, most_recent: Op
         
         all_urls_with_dates: List[Tuple[str, Optional[datetime]]] = []
         errors_encountered = []
+        collect_limit = max_urls * 2  # Collect more than needed so domain filtering still leaves max_urls
+        
+        def remaining_budget() -> Optional[int]:
+            # With most_recent every sitemap is scanned in full (top-N kept per sitemap)
+            if most_recent and most_recent > 0:
+                return None
+            return max(collect_limit - len(all_urls_with_dates), 0)
         
         # Strategy 1: Try common sitemap URLs (auto-discovery)
         potential_sitemaps = find_sitemap_urls(base_url)
@@ -436,7 +714,7 @@ def parse_sitemap_from_site(site_url: str, max_urls: int = 1000, most_recent: Op
             logger.info(f"   [{i}] {sitemap_loc}")
         
         for sitemap_url in potential_sitemaps:
-            if len(all_urls_with_dates) >= max_urls * 2:  # Collect more if we need to filter by date
+            if len(all_urls_with_dates) >= collect_limit and not (most_recent and most_recent > 0):
                 break
             
             try:
@@ -448,17 +726,23 @@ def parse_sitemap_from_site(site_url: str, max_urls: int = 1000, most_recent: Op
                         logger.info(f"✅ Found {len(sitemap_urls_from_robots)} sitemap(s) in robots.txt: {sitemap_urls_from_robots}")
                         for robots_sitemap_url in sitemap_urls_from_robots:
                             logger.info(f"🔍 Parsing sitemap from robots.txt: {robots_sitemap_url}")
-                            urls_with_dates = parse_sitemap(robots_sitemap_url, base_url)
+                            urls_with_dates = parse_sitemap(
+                                robots_sitemap_url, base_url,
+                                max_urls=remaining_budget(), most_recent=most_recent
+                            )
                             if urls_with_dates:
                                 logger.info(f"✅ Parsed {len(urls_with_dates)} URLs from {robots_sitemap_url}")
                             all_urls_with_dates.extend(urls_with_dates)
-                            if len(all_urls_with_dates) >= max_urls * 2:
+                            if remaining_budget() == 0:
                                 break
                     else:
                         logger.debug(f"⚠️ No sitemap URLs found in robots.txt")
                 else:
                     logger.info(f"🔍 Trying sitemap: {sitemap_url}")
-                    urls_with_dates = parse_sitemap(sitemap_url, base_url)
+                    urls_with_dates = parse_sitemap(
+                        sitemap_url, base_url,
+                        max_urls=remaining_budget(), most_recent=most_recent
+                    )
                     if urls_with_dates:
                         logger.info(f"✅ Successfully parsed sitemap from {sitemap_url}, found {len(urls_with_dates)} URLs")
                         all_urls_with_dates.extend(urls_with_dates)
@@ -521,16 +805,13 @@ def parse_sitemap_from_site(site_url: str, max_urls: int = 1000, most_recent: Op
             urls_with_dates = len([d for d in filtered_urls_with_dates if d[1] is not None])
             logger.info(f"✅ Selected {most_recent} most recent URLs ({urls_with_dates} with dates, {most_recent - urls_with_dates} without dates)")
         
-        # Extract just the URLs
-        filtered_urls = [url for url, _ in filtered_urls_with_dates]
-        
         # Apply max_urls limit
-        if len(filtered_urls) > max_urls:
-            filtered_urls = filtered_urls[:max_urls]
+        if len(filtered_urls_with_dates) > max_urls:
+            filtered_urls_with_dates = filtered_urls_with_dates[:max_urls]
         
-        if filtered_urls:
-            logger.info(f"✅ Total URLs extracted from {site_url}: {len(filtered_urls)}")
-            logger.info(f"✅ First 5 URLs: {filtered_urls[:5]}")
+        if filtered_urls_with_dates:
+            logger.info(f"✅ Total URLs extracted from {site_url}: {len(filtered_urls_with_dates)}")
+            logger.info(f"✅ First 5 URLs: {[url for url, _ in filtered_urls_with_dates[:5]]}")
         else:
             logger.error(f"❌ No URLs extracted from {site_url}")
             logger.error(f"❌ Total URLs found before filtering: {len(all_urls_with_dates)}")
@@ -542,9 +823,9 @@ def parse_sitemap_from_site(site_url: str, max_urls: int = 1000, most_recent: Op
             if len(all_urls_with_dates) > 0:
                 logger.error(f"❌ Sample URLs found (may have been filtered): {[url for url, _ in all_urls_with_dates[:5]]}")
         
-        return filtered_urls
+        return filtered_urls_with_dates
     except Exception as e:
-        logger.error(f"❌ Critical error in parse_sitemap_from_site for {site_url}: {e}")
+        logger.error(f"❌ Critical error in parse_sitemap_entries_from_site for {site_url}: {e}")
         import traceback
         logger.error(traceback.format_exc())
         return []
@@ -0,0 +1,165 @@
+"""
+Sitemap State for Incremental Site Builder Re-crawls
+Remembers, per campaign, every sitemap URL with the lastmod it had when the
+campaign last scraped it and the hash of the text stored for it. A re-run then only
+scrapes URLs that are new to the campaign or whose lastmod moved forward since the
+campaign's own copy; everything else is reused from the campaign's stored raw data.
+The state is per campaign (not per site) because the stored copies are: another
+campaign re-crawling the same site must not make this campaign's copy look current.
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from scrape_cache import hash_url, normalize_url
+
+logger = logging.getLogger(__name__)
+
+SITEMAP_INCREMENTAL_ENABLED = os.getenv("SITEMAP_INCREMENTAL_ENABLED", "true").lower() in ("1", "true", "yes")
+
+
+def site_key(site_url: str) -> str:
+    """scheme://host identifying a Site Builder site (www. and paths are kept apart on purpose)"""
+    parts = urlsplit((site_url or "").strip())
+    return f"{parts.scheme.lower()}://{(parts.netloc or '').lower()}"
+
+
+def _session():
+    from database import SessionLocal
+    return SessionLocal()
+
+
+def load_sitemap_state(campaign_id: str) -> Dict[str, Dict[str, any]]:
+    """
+    Stored sitemap state of a campaign
+
+    Args:
+        campaign_id: Campaign.campaign_id
+
+    Returns:
+        Dict keyed by normalized URL with "lastmod" and "content_hash"
+        (empty if nothing is stored or the lookup failed)
+    """
+    try:
+        from models import SitemapUrlState
+        session = _session()
+        try:
+            rows = session.query(
+                SitemapUrlState.url, SitemapUrlState.lastmod, SitemapUrlState.content_hash
+            ).filter(SitemapUrlState.campaign_id == campaign_id).all()
+            return {row.url: {"lastmod": row.lastmod, "content_hash": row.content_hash} for row in rows}
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not load sitemap state for campaign {campaign_id}: {e}")
+        return {}
+
+
+def plan_incremental_crawl(
+    entries: List[Tuple[str, Optional[datetime]]],
+    state: Dict[str, Dict[str, any]],
+    known_urls: Iterable[str]
+) -> Dict[str, any]:
+    """
+    Decide which sitemap URLs a re-run has to scrape
+
+    A URL is due when the campaign has no stored row for it ("new") or when its
+    sitemap lastmod is later than the one recorded at its last scrape ("changed").
+    URLs without a lastmod can't be compared and keep their stored copy.
+
+    Args:
+        entries: (url, lastmod) pairs from the current sitemap
+        state: Output of load_sitemap_state()
+        known_urls: source_url values already stored for the campaign
+
+    Returns:
+        Dict with "new" and "changed" (sitemap URLs to scrape), "unchanged" (count),
+        "skip_urls" (known_urls minus the changed pages, for the scraper's frontier
+        filter) and "superseded" (stored source_urls replaced by changed pages,
+        keyed by normalized URL)
+    """
+    stored: Dict[str, List[str]] = {}
+    for url in known_urls:
+        stored.setdefault(normalize_url(url), []).append(url)
+
+    new, changed, unchanged = [], [], 0
+    superseded: Dict[str, List[str]] = {}
+    for url, lastmod in entries:
+        key = normalize_url(url)
+        if key not in stored:
+            new.append(url)
+            continue
+        previous = (state.get(key) or {}).get("lastmod")
+        if lastmod is not None and previous is not None and lastmod > previous:
+            changed.append(url)
+            superseded[key] = stored[key]
+        else:
+            unchanged += 1
+
+    superseded_urls = {url for urls in superseded.values() for url in urls}
+    return {
+        "new": new,
+        "changed": changed,
+        "unchanged": unchanged,
+        "skip_urls": {url for url in known_urls if url not in superseded_urls},
+        "superseded": superseded,
+    }
+
+
+def save_sitemap_state(
+    campaign_id: str,
+    site_url: str,
+    entries: List[Tuple[str, Optional[datetime]]],
+    content_hashes: Dict[str, Optional[str]],
+    pending_urls: Set[str]
+):
+    """
+    Record the sitemap as seen on this run of a campaign
+
+    Args:
+        campaign_id: Campaign.campaign_id
+        site_url: Site Builder base URL
+        entries: (url, lastmod) pairs from the current sitemap
+        content_hashes: Normalized URL -> content hash for pages scraped successfully this run
+        pending_urls: Normalized URLs that were due but not scraped successfully; their
+            previous lastmod is kept so the next run tries them again
+    """
+    try:
+        from models import SitemapUrlState
+        session = _session()
+        try:
+            site = site_key(site_url)
+            existing = {
+                row.url_hash: row
+                for row in session.query(SitemapUrlState).filter(SitemapUrlState.campaign_id == campaign_id).all()
+            }
+            now = datetime.now()
+            for url, lastmod in entries:
+                key = normalize_url(url)
+                if key in pending_urls:
+                    continue
+                url_hash = hash_url(url)
+                row = existing.get(url_hash)
+                if row is None:
+                    row = SitemapUrlState(campaign_id=campaign_id, site=site, url_hash=url_hash, url=key)
+                    session.add(row)
+                    existing[url_hash] = row
+                # A run whose sitemap omits lastmod keeps the stored date, so the next dated
+                # lastmod is still compared against it
+                if lastmod is not None:
+                    row.lastmod = lastmod
+                row.last_seen_at = now
+                if key in content_hashes:
+                    row.content_hash = content_hashes[key]
+                    row.last_scraped_at = now
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not save sitemap state for campaign {campaign_id}: {e}")
@@ -0,0 +1,270 @@
+"""
+Static HTML Fetcher for Campaign Scraping
+Plain-HTTP fast path: server-rendered pages are fetched with a pooled requests
+session and parsed with BeautifulSoup/lxml, so only JS-rendered pages need Playwright
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+try:
+    from bs4 import BeautifulSoup, UnicodeDammit
+    BS4_AVAILABLE = True
+except ImportError:
+    BeautifulSoup = None
+    UnicodeDammit = None
+    BS4_AVAILABLE = False
+    logger.warning("⚠️ beautifulsoup4 not available - static fetch disabled, every page will use Playwright")
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+STATIC_FETCH_ENABLED = os.getenv("SCRAPER_STATIC_FIRST", "true").lower() in ("1", "true", "yes")
+STATIC_FETCH_TIMEOUT = float(os.getenv("SCRAPER_STATIC_TIMEOUT_SECONDS", "15"))
+STATIC_MIN_TEXT_CHARS = int(os.getenv("SCRAPER_STATIC_MIN_TEXT_CHARS", "500"))  # Less than this looks JS-rendered
+STATIC_MAX_BYTES = 5 * 1024 * 1024  # Don't parse huge responses in the fast path
+
+# Used for the "time saved" estimate until real browser timings have been observed
+DEFAULT_BROWSER_PAGE_MS = int(os.getenv("SCRAPER_BROWSER_PAGE_ESTIMATE_MS", "4000"))
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Same main-content selectors as the Playwright extractor
+CONTENT_SELECTORS = [
+    'article', 'main', '[role="main"]',
+    '.content', '#content', '.post-content',
+    '.article-content', '.entry-content'
+]
+
+# Empty mount points of common single-page-app frameworks
+SPA_ROOT_SELECTORS = ['#root', '#__next', '#app', '#__nuxt', '[data-reactroot]', '[ng-app]', '[ng-version]']
+
+NOSCRIPT_JS_PATTERN = re.compile(r"(enable|requires?|turn on)\s+javascript|javascript\s+(is\s+)?(disabled|required)", re.IGNORECASE)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+_browser_ms_lock = threading.Lock()
+_browser_ms_avg: Optional[float] = None
+
+
+def get_static_session() -> requests.Session:
+    """Shared requests session with a connection pool sized for concurrent scraping"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            pool_size = max(10, int(os.getenv("SCRAPER_MAX_CONCURRENCY", "6")) * 2)
+            session = requests.Session()
+            retry_strategy = Retry(
+                total=2,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET", "HEAD"],
+            )
+            adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({
+                "User-Agent": USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            })
+            _session = session
+        return _session
+
+
+def record_browser_page_ms(elapsed_ms: float):
+    """Feed an observed Playwright page time into the running average used for savings estimates"""
+    global _browser_ms_avg
+    with _browser_ms_lock:
+        if _browser_ms_avg is None:
+            _browser_ms_avg = float(elapsed_ms)
+        else:
+            _browser_ms_avg = 0.8 * _browser_ms_avg + 0.2 * float(elapsed_ms)
+
+
+def estimated_browser_page_ms() -> int:
+    """Average browser page time seen so far (or the configured default)"""
+    with _browser_ms_lock:
+        return int(_browser_ms_avg) if _browser_ms_avg is not None else DEFAULT_BROWSER_PAGE_MS
+
+
+def _clean_text(text: str) -> str:
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def extract_main_text(soup) -> str:
+    """
+    Extract main content text from parsed HTML (mirrors the Playwright selector logic)
+
+    Args:
+        soup: BeautifulSoup document (script/style already removed)
+
+    Returns:
+        Whitespace-normalized text of the largest main-content element, or the body
+    """
+    text_content = ""
+    for selector in CONTENT_SELECTORS:
+        elements = soup.select(selector)
+        if elements:
+            for element in elements:
+                text = element.get_text(" ")
+                if len(text) > len(text_content):
+                    text_content = text
+            break
+
+    text_content = _clean_text(text_content)
+    if not text_content:
+        body = soup.body or soup
+        text_content = _clean_text(body.get_text(" "))
+    return text_content
+
+
+def detect_js_rendered(soup, text: str, noscript_requires_js: bool = False) -> Optional[str]:
+    """
+    Heuristic: does this page need a real browser to render its content?
+
+    Args:
+        soup: Parsed document with scripts/noscript removed
+        text: Main text extracted from the static HTML
+        noscript_requires_js: A <noscript> block asked the visitor to enable JavaScript
+
+    Returns:
+        Escalation reason ("spa_root", "noscript_js_required", "thin_body_text") or None
+    """
+    body_text_len = len(_clean_text((soup.body or soup).get_text(" ")))
+
+    for selector in SPA_ROOT_SELECTORS:
+        root = soup.select_one(selector)
+        if root is not None and len(_clean_text(root.get_text(" "))) < STATIC_MIN_TEXT_CHARS:
+            return "spa_root"
+
+    if noscript_requires_js and len(text) < STATIC_MIN_TEXT_CHARS * 2:
+        return "noscript_js_required"
+
+    if body_text_len < STATIC_MIN_TEXT_CHARS:
+        return "thin_body_text"
+
+    return None
+
+
+def fetch_static(
+    url: str,
+    include_images: bool = False,
+    include_links: bool = False,
+    timeout: float = STATIC_FETCH_TIMEOUT,
+    validators: Optional[Dict[str, str]] = None
+) -> Tuple[Optional[Dict[str, any]], Optional[str], int]:
+    """
+    Try to scrape a page without a browser
+
+    Args:
+        url: URL to fetch
+        include_images: Whether to extract image URLs
+        include_links: Whether to keep the HTML for link extraction
+        timeout: Request timeout in seconds
+        validators: Conditional request headers (If-None-Match / If-Modified-Since)
+
+    Returns:
+        Tuple of (result, escalation_reason, elapsed_ms). `result` has the same shape as
+        scrape_with_playwright() (links are left for the caller to extract from "html")
+        plus "http_validators" (ETag / Last-Modified), and is None when the page should
+        be escalated to Playwright. A 304 answer to a conditional request returns
+        (None, "not_modified", elapsed_ms).
+    """
+    start = time.perf_counter()
+
+    def elapsed_ms() -> int:
+        return int((time.perf_counter() - start) * 1000)
+
+    if not BS4_AVAILABLE:
+        return None, "static_parser_unavailable", 0
+
+    try:
+        response = get_static_session().get(url, timeout=timeout, stream=True, headers=validators or None)
+    except Exception as e:
+        logger.debug(f"Static fetch failed for {url}: {e}")
+        return None, "static_fetch_error", elapsed_ms()
+
+    try:
+        if response.status_code == 304 and validators:
+            return None, "not_modified", elapsed_ms()
+        if response.status_code >= 400:
+            return None, f"http_{response.status_code}", elapsed_ms()
+
+        content_type = response.headers.get("Content-Type", "").lower()
+        if content_type and "html" not in content_type:
+            return None, "non_html_content", elapsed_ms()
+
+        raw = response.raw.read(STATIC_MAX_BYTES + 1, decode_content=True)
+        if len(raw) > STATIC_MAX_BYTES:
+            return None, "response_too_large", elapsed_ms()
+        if "charset" in content_type and response.encoding:
+            html = raw.decode(response.encoding, errors="replace")
+        else:
+            # No declared charset: let bs4 sniff <meta charset> / BOM / content
+            html = UnicodeDammit(raw).unicode_markup or ""
+    except Exception as e:
+        logger.debug(f"Static fetch read failed for {url}: {e}")
+        return None, "static_fetch_error", elapsed_ms()
+    finally:
+        response.close()
+
+    try:
+        soup = BeautifulSoup(html, HTML_PARSER)
+
+        canonical_url = None
+        canonical = soup.find("link", rel="canonical", href=True)
+        if canonical is not None:
+            canonical_url = urljoin(response.url or url, canonical["href"])
+
+        # Image URLs come from the untouched document
+        images = []
+        if include_images:
+            for img in soup.select('img[src]'):
+                absolute_url = urljoin(response.url or url, img.get('src', ''))
+                if absolute_url.startswith(('http://', 'https://')):
+                    images.append(absolute_url)
+
+        noscript_requires_js = any(
+            NOSCRIPT_JS_PATTERN.search(noscript.get_text(" ")) for noscript in soup.find_all("noscript")
+        )
+        # Browsers with JS enabled never render these
+        for tag in soup(['script', 'style', 'template', 'svg', 'noscript']):
+            tag.decompose()
+        text = extract_main_text(soup)
+
+        reason = detect_js_rendered(soup, text, noscript_requires_js)
+        if reason:
+            return None, reason, elapsed_ms()
+
+        result = {
+            "text": text,
+            "html": html if include_links else None,
+            "images": list(dict.fromkeys(images))[:50],  # Limit to 50 images
+            "links": [],
+            "error": None,
+            "canonical_url": canonical_url,
+            "http_validators": {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        }
+        return result, None, elapsed_ms()
+    except Exception as e:
+        logger.warning(f"Static extraction failed for {url}: {e}")
+        return None, "static_parse_error", elapsed_ms()
@@ -0,0 +1,411 @@
+"""
+Precomputed Term Counts
+Each scraped page gets sparse term-frequency vectors, computed once from its stored
+tokenize-once artifact (doc_artifacts.py) and kept in the document_term_counts table
+by content hash:
+
+- "cloud": lowercased words of the research word cloud (no stopwords or function
+  words, alphabetic, at least 3 characters)
+- "keywords": lemmas counted by extract_keywords()
+
+Term ids are 64-bit hashes of the term, so vectors from any documents can be added
+without a shared vocabulary. Each campaign keeps its summed vectors together with
+the content hashes they cover (campaign_term_totals table); when pages are added or
+removed only their vectors are added to or subtracted from the totals, so word
+clouds, keyword lists and hashtag seeds don't touch raw text. Every caller passes the
+corpus selected by campaign_corpus_texts(), so they all update the same totals.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from scrape_cache import compute_content_hash
+
+logger = logging.getLogger(__name__)
+
+TERM_COUNTS_ENABLED = os.getenv("TERM_COUNTS_ENABLED", "true").lower() in ("1", "true", "yes")
+# Bump when a view's filtering changes; older document vectors and campaign totals are rebuilt
+TERM_COUNTS_VERSION = 1
+
+VIEWS = ("cloud", "keywords")
+
+# Word cloud stopwords on top of NLTK's English list
+WORD_CLOUD_EXTRA_STOPWORDS = {
+    'who', 'which', 'what', 'when', 'where', 'why', 'how', 'but', 'than', 'that', 'this',
+    'these', 'those', 'united', 'world', 'one', 'two', 'also', 'more', 'most', 'very',
+    'much', 'many', 'some', 'any', 'all', 'each', 'every', 'both', 'few', 'other',
+    'such', 'only', 'just', 'even', 'still', 'yet', 'already', 'never', 'always',
+    'often', 'sometimes', 'usually', 'generally', 'particularly', 'especially',
+    'however', 'therefore', 'thus', 'hence', 'moreover', 'furthermore', 'nevertheless'
+}
+# Function word POS tags excluded from the word cloud (pronouns, determiners, prepositions, conjunctions, etc.)
+FUNCTION_WORD_TAGS = {'PRP', 'PRP$', 'DT', 'IN', 'CC', 'TO', 'WDT', 'WP', 'WP$', 'WRB', 'PDT', 'RP', 'EX'}
+
+_LOOKUP_CHUNK = 500  # Hashes per IN (...) query
+_SEPARATOR = "\n"  # Terms never contain whitespace
+_FALLBACK_WORD_RE = re.compile(r"[A-Za-z]{3,}")
+
+
+@lru_cache(maxsize=1)
+def cloud_stop_words() -> Set[str]:
+    """NLTK English stopwords + WORD_CLOUD_EXTRA_STOPWORDS"""
+    from nltk.corpus import stopwords
+    return set(stopwords.words('english')) | WORD_CLOUD_EXTRA_STOPWORDS
+
+
+def _keyword_stop_words() -> Set[str]:
+    from text_processing import get_stop_words
+    return get_stop_words()
+
+
+def term_ids(terms: Sequence[str]) -> np.ndarray:
+    """64-bit term ids (blake2b of the UTF-8 term)"""
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest(), "little") for term in terms),
+        dtype=np.uint64, count=len(terms)
+    )
+
+
+class TermCounts:
+    """
+    Sparse term-frequency vector
+
+    Attributes:
+        ids: Sorted term ids (uint64)
+        counts: Count of each id (int64)
+        terms: Term string of each id
+    """
+
+    __slots__ = ("ids", "counts", "terms")
+
+    def __init__(self, ids: np.ndarray, counts: np.ndarray, terms: List[str]):
+        self.ids = ids
+        self.counts = counts
+        self.terms = terms
+
+    @classmethod
+    def empty(cls) -> "TermCounts":
+        return cls(np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64), [])
+
+    @classmethod
+    def from_terms(cls, terms: Iterable[str]) -> "TermCounts":
+        counted = Counter(terms)
+        if not counted:
+            return cls.empty()
+        vocab = list(counted)
+        ids = term_ids(vocab)
+        order = np.argsort(ids)
+        return cls(ids[order], np.asarray([counted[vocab[i]] for i in order], dtype=np.int64), [vocab[i] for i in order])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def top(self, n: int) -> List[Tuple[str, int]]:
+        """n most frequent terms, highest count first (ties alphabetical)"""
+        if n <= 0 or not len(self.ids):
+            return []
+        if len(self.counts) > n:
+            # Only terms reaching the n-th highest count can be in the result
+            threshold = np.partition(self.counts, len(self.counts) - n)[len(self.counts) - n]
+            candidates = np.flatnonzero(self.counts >= threshold)
+        else:
+            candidates = np.arange(len(self.counts))
+        ranked = sorted(((-int(self.counts[i]), self.terms[i]) for i in candidates))[:n]
+        return [(term, -negative) for negative, term in ranked]
+
+
+def sum_term_counts(weighted: Iterable[Tuple[Optional[TermCounts], int]]) -> TermCounts:
+    """
+    Weighted sum of vectors (negative weights subtract); terms whose total drops to 0 are dropped
+
+    Args:
+        weighted: (vector, weight) pairs; None vectors are skipped
+    """
+    parts = [(vector, weight) for vector, weight in weighted if vector is not None and len(vector) and weight]
+    if not parts:
+        return TermCounts.empty()
+    ids = np.concatenate([vector.ids for vector, _ in parts])
+    counts = np.concatenate([vector.counts * weight for vector, weight in parts])
+    unique, first, inverse = np.unique(ids, return_index=True, return_inverse=True)
+    # float64 weights are exact for any realistic count
+    totals = np.rint(np.bincount(inverse.ravel(), weights=counts, minlength=len(unique))).astype(np.int64)
+    keep = np.flatnonzero(totals > 0)
+    terms = [term for vector, _ in parts for term in vector.terms]
+    return TermCounts(unique[keep], totals[keep], [terms[i] for i in first[keep]])
+
+
+def pack_views(views: Dict[str, TermCounts]) -> bytes:
+    """Compact binary form of per-view vectors (np.savez_compressed)"""
+    arrays = {}
+    for view, vector in views.items():
+        arrays[f"{view}_ids"] = vector.ids
+        arrays[f"{view}_counts"] = vector.counts.astype(np.uint32)
+        arrays[f"{view}_terms"] = np.frombuffer(_SEPARATOR.join(vector.terms).encode("utf-8"), dtype=np.uint8)
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def unpack_views(blob: bytes) -> Dict[str, TermCounts]:
+    views = {}
+    with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+        for view in VIEWS:
+            if f"{view}_ids" not in data.files:
+                continue
+            raw_terms = data[f"{view}_terms"]
+            views[view] = TermCounts(
+                data[f"{view}_ids"].astype(np.uint64),
+                data[f"{view}_counts"].astype(np.int64),
+                raw_terms.tobytes().decode("utf-8").split(_SEPARATOR) if raw_terms.size else [],
+            )
+    return views
+
+
+def document_views(artifact, keyword_stop_words: Set[str]) -> Dict[str, TermCounts]:
+    """Term vectors of one document from its DocumentArtifact"""
+    stops = cloud_stop_words()
+    cloud = (
+        word for word, tag in artifact.lower_tagged()
+        if word not in stops and tag not in FUNCTION_WORD_TAGS and len(word) >= 3 and word.isalpha()
+    )
+    keywords = (lemma for lemma in artifact.keyword_lemmas(keyword_stop_words) if lemma != "empty")
+    return {"cloud": TermCounts.from_terms(cloud), "keywords": TermCounts.from_terms(keywords)}
+
+
+def fallback_views(text: str, keyword_stop_words: Set[str]) -> Dict[str, TermCounts]:
+    """Regex-tokenized vectors for a document without an artifact (NLTK unavailable); not stored"""
+    words = _FALLBACK_WORD_RE.findall((text or "").lower())
+    stops = cloud_stop_words()
+    return {
+        "cloud": TermCounts.from_terms(w for w in words if w not in stops),
+        "keywords": TermCounts.from_terms(w for w in words if w not in keyword_stop_words),
+    }
+
+
+def _session():
+    from database import SessionLocal
+    return SessionLocal()
+
+
+def load_document_views(hashes: Iterable[str]) -> Dict[str, Dict[str, TermCounts]]:
+    """Content hash -> stored per-view vectors (current version only)"""
+    found: Dict[str, Dict[str, TermCounts]] = {}
+    wanted = sorted({h for h in hashes if h})
+    if not TERM_COUNTS_ENABLED or not wanted:
+        return found
+    try:
+        from models import DocumentTermCounts
+        session = _session()
+        try:
+            for start in range(0, len(wanted), _LOOKUP_CHUNK):
+                rows = session.query(DocumentTermCounts.content_hash, DocumentTermCounts.counts).filter(
+                    DocumentTermCounts.content_hash.in_(wanted[start:start + _LOOKUP_CHUNK]),
+                    DocumentTermCounts.version == TERM_COUNTS_VERSION
+                ).all()
+                found.update((content_hash, unpack_views(blob)) for content_hash, blob in rows)
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Document term count lookup failed: {e}")
+    return found
+
+
+def store_document_views(views_by_hash: Dict[str, Dict[str, TermCounts]]):
+    """Insert or replace per-document vectors by content hash"""
+    if not TERM_COUNTS_ENABLED or not views_by_hash:
+        return
+    try:
+        from models import DocumentTermCounts
+        session = _session()
+        try:
+            existing = {
+                row.content_hash: row for row in session.query(DocumentTermCounts).filter(
+                    DocumentTermCounts.content_hash.in_(list(views_by_hash))
+                ).all()
+            }
+            now = datetime.now()
+            for content_hash, views in views_by_hash.items():
+                row = existing.get(content_hash)
+                if row is None:
+                    row = DocumentTermCounts(content_hash=content_hash)
+                    session.add(row)
+                row.version = TERM_COUNTS_VERSION
+                row.counts = pack_views(views)
+                row.created_at = now
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    except Exception as e:
+        # Concurrent ingestion of the same page can hit the unique key - the other writer wins
+        logger.warning(f"⚠️ Could not store document term counts: {e}")
+
+
+def document_term_views(texts: Sequence[str]) -> Tuple[List[str], Dict[str, Dict[str, TermCounts]], bool]:
+    """
+    Per-view vectors for a corpus, computing (and storing) the missing ones from the documents' artifacts
+
+    Returns:
+        (content hash of each text, content hash -> vectors, whether any document had no
+         artifact and got unstored regex-tokenized vectors)
+    """
+    hashes = [compute_content_hash(text) or "" for text in texts]
+    views = load_document_views(hashes)
+    pending: Dict[str, str] = {}
+    for text, h in zip(texts, hashes):
+        if h and h not in views and h not in pending:
+            pending[h] = text
+    used_fallback = False
+    if pending:
+        from doc_artifacts import get_document_artifacts
+        keyword_stop_words = _keyword_stop_words()
+        fresh = {}
+        for (h, text), artifact in zip(pending.items(), get_document_artifacts(list(pending.values()))):
+            if artifact is not None:
+                fresh[h] = document_views(artifact, keyword_stop_words)
+            else:
+                views[h] = fallback_views(text, keyword_stop_words)
+                used_fallback = True
+        store_document_views(fresh)
+        views.update(fresh)
+        logger.info(f"🔢 Counted terms of {len(pending)} of {len(set(hashes))} documents (the rest from stored counts)")
+    return hashes, views, used_fallback
+
+
+def corpus_term_totals(texts: Sequence[str]) -> Dict[str, TermCounts]:
+    """Summed per-view vectors of a corpus (duplicate texts count once per occurrence)"""
+    hashes, views, _ = document_term_views(texts)
+    multiplicity = Counter(h for h in hashes if h)
+    return {
+        view: sum_term_counts((views.get(h, {}).get(view), m) for h, m in multiplicity.items())
+        for view in VIEWS
+    }
+
+
+def load_campaign_totals(campaign_id: str) -> Optional[Tuple[Dict[str, int], Dict[str, TermCounts]]]:
+    """(content hash -> occurrences, per-view totals) stored for a campaign, or None"""
+    if not TERM_COUNTS_ENABLED:
+        return None
+    try:
+        from models import CampaignTermTotals
+        session = _session()
+        try:
+            row = session.query(CampaignTermTotals).filter(
+                CampaignTermTotals.campaign_id == campaign_id,
+                CampaignTermTotals.version == TERM_COUNTS_VERSION
+            ).first()
+            if row is None:
+                return None
+            return json.loads(row.doc_hashes_json), unpack_views(row.totals)
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not load term totals for campaign {campaign_id}: {e}")
+        return None
+
+
+def save_campaign_totals(campaign_id: str, doc_hashes: Dict[str, int], totals: Dict[str, TermCounts]):
+    """Insert or replace the term totals of a campaign"""
+    if not TERM_COUNTS_ENABLED:
+        return
+    try:
+        from models import CampaignTermTotals
+        session = _session()
+        try:
+            row = session.query(CampaignTermTotals).filter(CampaignTermTotals.campaign_id == campaign_id).first()
+            if row is None:
+                row = CampaignTermTotals(campaign_id=campaign_id)
+                session.add(row)
+            row.version = TERM_COUNTS_VERSION
+            row.doc_count = sum(doc_hashes.values())
+            row.doc_hashes_json = json.dumps(doc_hashes)
+            row.totals = pack_views(totals)
+            row.updated_at = datetime.now()
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not save term totals for campaign {campaign_id}: {e}")
+
+
+def is_campaign_corpus_page(source_url: Optional[str], text: Optional[str]) -> bool:
+    """Whether a CampaignRawData row belongs to the campaign corpus (scraped, non-blank text)"""
+    return bool(text and text.strip()) and not (source_url and source_url.startswith(("error:", "placeholder:")))
+
+
+def campaign_corpus_texts(pages: Iterable[Tuple[Optional[str], Optional[str]]]) -> List[str]:
+    """
+    Texts of a campaign's corpus, in row order
+
+    Args:
+        pages: (source_url, extracted_text) of the campaign's CampaignRawData rows
+
+    Returns:
+        Texts of the rows is_campaign_corpus_page() accepts
+    """
+    return [text for url, text in pages if is_campaign_corpus_page(url, text)]
+
+
+def campaign_term_totals(campaign_id: str, texts: Sequence[str]) -> Dict[str, TermCounts]:
+    """
+    Summed per-view vectors of a campaign's corpus, updated incrementally
+
+    The stored totals are adjusted by the vectors of pages added or removed since they
+    were saved; they are rebuilt from all document vectors when nothing usable is stored
+    or a removed page's vector is gone.
+
+    Args:
+        campaign_id: Campaign.campaign_id
+        texts: The campaign's current corpus (campaign_corpus_texts())
+
+    Returns:
+        View name ("cloud", "keywords") -> totals
+    """
+    hashes = [compute_content_hash(text) or "" for text in texts]
+    current = Counter(h for h in hashes if h)
+    stored = load_campaign_totals(campaign_id)
+    if stored is not None:
+        stored_hashes, stored_totals = stored
+        added = {h: m for h, m in current.items() if m > stored_hashes.get(h, 0)}
+        removed = {h: m for h, m in stored_hashes.items() if m > current.get(h, 0)}
+        if not added and not removed:
+            return stored_totals
+        # Vectors of removed pages come from the document table - their text is gone
+        removed_views = load_document_views(removed)
+        if len(removed_views) == len(removed):
+            changed_texts = list({h: text for text, h in zip(texts, hashes) if h in added}.values())
+            _, added_views, used_fallback = document_term_views(changed_texts)
+            totals = {
+                view: sum_term_counts(
+                    [(stored_totals.get(view), 1)]
+                    + [(added_views.get(h, {}).get(view), m - stored_hashes.get(h, 0)) for h, m in added.items()]
+                    + [(removed_views[h].get(view), -(m - current.get(h, 0))) for h, m in removed.items()]
+                )
+                for view in VIEWS
+            }
+            if not used_fallback:
+                save_campaign_totals(campaign_id, dict(current), totals)
+            logger.info(f"🔢 Term totals of campaign {campaign_id}: {len(added)} pages added, {len(removed)} removed")
+            return totals
+
+    _, views, used_fallback = document_term_views(texts)
+    totals = {view: sum_term_counts((views.get(h, {}).get(view), m) for h, m in current.items()) for view in VIEWS}
+    if not used_fallback:
+        save_campaign_totals(campaign_id, dict(current), totals)
+    logger.info(f"🔢 Term totals of campaign {campaign_id} built from {len(current)} documents")
+    return totals
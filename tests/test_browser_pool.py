@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for the warm Chromium browser pool.
+
+Browsers must be reused across pages, recycled after max_pages pages or once their
+process tree grows past max_rss_mb, kept open while a retiring browser still has
+pages in flight, and closed on shutdown. Playwright is replaced by a fake launcher.
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import browser_pool
+from browser_pool import BrowserPool
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self):
+        return self.browser
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, pid):
+        self.pid = pid
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, user_agent=None, **kwargs):
+        return FakeContext(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    """Stands in for async_playwright().start(); every launch adds one child process"""
+
+    def __init__(self):
+        self.chromium = self
+        self.browsers = []
+        self.stopped = False
+
+    async def launch(self, headless=True):
+        browser = FakeBrowser(pid=1000 + len(self.browsers))
+        self.browsers.append(browser)
+        return browser
+
+    def child_pids(self, pid):
+        return {b.pid for b in self.browsers}
+
+    async def stop(self):
+        self.stopped = True
+
+
+class TestBrowserPool(unittest.TestCase):
+    """Reuse, recycling and shutdown."""
+
+    def setUp(self):
+        self.playwright = FakePlaywright()
+        self.rss_mb = {}
+        for name, fake in (
+            ("_child_pids", self.playwright.child_pids),
+            ("_parent_pid", lambda pid: os.getpid()),
+            ("_process_tree_rss_mb", lambda pid: self.rss_mb.get(pid, 100.0)),
+        ):
+            patch = mock.patch.object(browser_pool, name, side_effect=fake)
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def make_pool(self, **kwargs):
+        pool = BrowserPool(**kwargs)
+        pool._playwright = self.playwright
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def open_page(self, pool):
+        """Open and close one page, returning the browser that served it"""
+        async def visit():
+            async with pool.page() as page:
+                return page
+        return pool.run(visit(), timeout=5)
+
+    def test_browser_is_reused_then_recycled_after_max_pages(self):
+        pool = self.make_pool(size=1, max_pages=3, max_rss_mb=0)
+        served = [self.open_page(pool) for _ in range(4)]
+        first = self.playwright.browsers[0]
+        self.assertEqual(served[:3], [first] * 3)
+        self.assertTrue(first.closed)
+        self.assertIsNot(served[3], first)
+        self.assertFalse(served[3].closed)
+        stats = pool.stats()
+        self.assertEqual((stats["launches"], stats["recycles"]), (2, 1))
+
+    def test_browser_over_rss_limit_is_recycled(self):
+        pool = self.make_pool(size=1, max_pages=50, max_rss_mb=700)
+        first = self.open_page(pool)
+        self.assertEqual(first.pid, 1000)
+        self.assertFalse(first.closed)
+        self.rss_mb[first.pid] = 900.0
+        self.assertIs(self.open_page(pool), first)
+        self.assertTrue(first.closed)
+        second = self.open_page(pool)
+        self.assertIsNot(second, first)
+        self.assertFalse(second.closed)
+
+    def test_retiring_browser_stays_open_until_its_pages_finish(self):
+        pool = self.make_pool(size=1, max_pages=2, max_rss_mb=0)
+
+        async def overlapping_pages():
+            async with pool.page() as first_page:
+                async with pool.page() as second_page:
+                    self.assertIs(first_page, second_page)
+                    # Reached max_pages: no new pages, but the ones in flight keep it open
+                    self.assertTrue(pool._browsers[0].retiring)
+                    async with pool.page() as third_page:
+                        self.assertIsNot(third_page, first_page)
+                self.assertFalse(first_page.closed)
+            return first_page, third_page
+
+        retired, replacement = pool.run(overlapping_pages(), timeout=5)
+        self.assertTrue(retired.closed)
+        self.assertFalse(replacement.closed)
+        self.assertEqual([b.browser for b in pool._browsers], [replacement])
+
+    def test_shutdown_closes_browsers_and_stops_loop(self):
+        pool = self.make_pool(size=2)
+        browser = self.open_page(pool)
+        thread = pool._thread
+        pool.shutdown(timeout=5)
+        self.assertTrue(browser.closed)
+        self.assertTrue(self.playwright.stopped)
+        self.assertFalse(thread.is_alive())
+        with self.assertRaises(RuntimeError):
+            pool.loop
+        pool.shutdown(timeout=5)  # idempotent
+
+
+if __name__ == '__main__':
+    unittest.main()
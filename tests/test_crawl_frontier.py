@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the crawl frontier scheduler.
+
+Covers breadth-first ordering, normalized dedupe, the skip list of already
+stored URLs, keyword scoring of discovered links and the page budget.
+robots.txt is disabled here so the tests never touch the network.
+"""
+
+import sys
+import os
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawl_frontier import CrawlFrontier
+
+
+class TestCrawlFrontier(unittest.TestCase):
+    """CrawlFrontier scheduling behaviour."""
+
+    def make_frontier(self, max_pages=10, max_depth=2, **kwargs):
+        return CrawlFrontier(max_pages, max_depth=max_depth, respect_robots=False, **kwargs)
+
+    def test_seeds_keep_search_order(self):
+        frontier = self.make_frontier()
+        frontier.add_seeds(["https://a.com/1", "https://b.com/1", "https://c.com/1"])
+        self.assertEqual([i.url for i in frontier.pop_batch(10)], ["https://a.com/1", "https://b.com/1", "https://c.com/1"])
+
+    def test_same_host_seeds_keep_search_order(self):
+        frontier = self.make_frontier()
+        seeds = ["https://a.com/1", "https://a.com/2", "https://b.com/1", "https://a.com/3"]
+        frontier.add_seeds(seeds)
+        batch = frontier.pop_batch(10)
+        self.assertEqual([i.url for i in batch], seeds)
+        self.assertEqual({i.score for i in batch}, {0.0})
+
+    def test_normalized_duplicates_are_dropped(self):
+        frontier = self.make_frontier()
+        added = frontier.add_seeds(["https://a.com/x", "https://A.com/x#top", "https://a.com/x?utm_source=feed"])
+        self.assertEqual(added, 1)
+
+    def test_skip_urls_never_enter_queue(self):
+        frontier = self.make_frontier(skip_urls={"https://a.com/known"})
+        frontier.add_seeds(["https://a.com/known", "https://a.com/new"])
+        self.assertEqual([i.url for i in frontier.pop_batch(10)], ["https://a.com/new"])
+        self.assertEqual(frontier.skipped_known, 1)
+
+    def test_breadth_first_levels(self):
+        frontier = self.make_frontier()
+        frontier.add_seeds(["https://a.com/", "https://b.com/"])
+        first = frontier.pop_batch(1)[0]
+        frontier.add_links(first, [("https://a.com/child", "")])
+        # Remaining depth-0 seed comes before the depth-1 child
+        batch = frontier.pop_batch(10)
+        self.assertEqual([i.url for i in batch], ["https://b.com/"])
+        self.assertEqual([i.url for i in frontier.pop_batch(10)], ["https://a.com/child"])
+
+    def test_links_scored_by_keyword_relevance(self):
+        frontier = self.make_frontier(keywords=["soil health"], links_per_page=2)
+        frontier.add_seeds(["https://a.com/"])
+        parent = frontier.pop_batch(1)[0]
+        frontier.add_links(parent, [
+            ("https://a.com/about", "About us"),
+            ("https://a.com/contact", "Contact"),
+            ("https://a.com/guide", "Soil health guide"),
+            ("https://a.com/soil-testing", "Testing"),
+        ])
+        urls = [i.url for i in frontier.pop_batch(10)]
+        self.assertEqual(urls, ["https://a.com/guide", "https://a.com/soil-testing"])
+
+    def test_links_not_added_beyond_max_depth(self):
+        frontier = self.make_frontier(max_depth=1)
+        frontier.add_seeds(["https://a.com/"])
+        parent = frontier.pop_batch(1)[0]
+        self.assertEqual(frontier.add_links(parent, [("https://a.com/x", "x")]), 0)
+
+    def test_budget(self):
+        frontier = self.make_frontier(max_pages=2)
+        frontier.add_seeds(["https://a.com/1", "https://b.com/1", "https://c.com/1"])
+        batch = frontier.pop_batch(frontier.remaining_budget)
+        self.assertEqual(len(batch), 2)
+        frontier.mark_scheduled(len(batch))
+        self.assertEqual(frontier.remaining_budget, 0)
+        self.assertEqual(frontier.pop_batch(frontier.remaining_budget), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
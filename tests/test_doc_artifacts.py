@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for tokenize-once document artifacts.
+
+The packed form must round-trip exactly, and stored artifacts must be reused so a
+document is only preprocessed once.
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import doc_artifacts
+from doc_artifacts import DocumentArtifact, get_document_artifacts, pack_artifact, unpack_artifact
+
+
+def sample_artifact(text="Solar panels work. They convert light."):
+    tokens = text.replace(".", " .").split()
+    return DocumentArtifact(
+        tokens=tokens,
+        lemmas=[t.lower().rstrip("s") if t.isalpha() else t for t in tokens],
+        tags=["NNS" if t.isalpha() else "." for t in tokens],
+        sentence_starts=[0] + [i + 1 for i, t in enumerate(tokens[:-1]) if t == "."],
+    )
+
+
+class TestPacking(unittest.TestCase):
+    """Compact storage format."""
+
+    def test_round_trip(self):
+        artifact = sample_artifact()
+        restored = unpack_artifact(pack_artifact(artifact))
+        self.assertEqual(restored.tokens, artifact.tokens)
+        self.assertEqual(restored.lemmas, artifact.lemmas)
+        self.assertEqual(restored.tags, artifact.tags)
+        self.assertEqual(restored.sentence_starts, artifact.sentence_starts)
+
+    def test_empty_document(self):
+        restored = unpack_artifact(pack_artifact(DocumentArtifact([], [], [], [])))
+        self.assertEqual((restored.tokens, restored.sentences()), ([], []))
+
+    def test_views(self):
+        artifact = sample_artifact()
+        self.assertEqual(artifact.sentences(), [["Solar", "panels", "work", "."], ["They", "convert", "light", "."]])
+        self.assertEqual(artifact.lower_tagged()[0], ("solar", "NNS"))
+        self.assertEqual(artifact.keyword_lemmas({"they"}), ["solar", "panel", "work", "convert", "light"])
+
+
+class TestGetDocumentArtifacts(unittest.TestCase):
+    """Stored artifacts are reused, missing ones built once per distinct text."""
+
+    def setUp(self):
+        self.texts = ["Solar panels work.", "Wind turbines spin.", "Solar panels work."]
+        self.built = []
+        self.store = {}
+
+    def fake_build(self, texts):
+        self.built.extend(texts)
+        return [pack_artifact(sample_artifact(t)) for t in texts]
+
+    def run_get(self, **kwargs):
+        with mock.patch.object(doc_artifacts, "load_packed_artifacts", side_effect=lambda hashes: {h: self.store[h] for h in hashes if h in self.store}), \
+                mock.patch.object(doc_artifacts, "store_packed_artifacts", side_effect=self.store.update), \
+                mock.patch.object(doc_artifacts, "build_packed_artifacts", side_effect=self.fake_build):
+            return get_document_artifacts(self.texts, **kwargs)
+
+    def test_built_once_then_reused(self):
+        first = self.run_get()
+        self.assertEqual(self.built, ["Solar panels work.", "Wind turbines spin."])
+        self.assertEqual(first[2].tokens, ["Solar", "panels", "work", "."])
+        second = self.run_get()
+        self.assertEqual(len(self.built), 2)
+        self.assertEqual([a.tokens for a in second], [a.tokens for a in first])
+
+    def test_without_compute_missing(self):
+        self.assertEqual(self.run_get(compute_missing=False), [None, None, None])
+        self.assertEqual(self.built, [])
+
+    def test_database_unavailable(self):
+        with mock.patch.object(doc_artifacts, "_session", side_effect=RuntimeError("no database")), \
+                mock.patch.object(doc_artifacts, "build_packed_artifacts", side_effect=self.fake_build):
+            artifacts = get_document_artifacts(self.texts)
+        self.assertEqual(artifacts[1].tokens, ["Wind", "turbines", "spin", "."])
+
+
+if __name__ == '__main__':
+    unittest.main()
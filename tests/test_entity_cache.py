@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-document entity cache.
+
+Only documents without a stored result may go through NER, each distinct page once,
+and campaign entities must merge per-document results in document order.
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import entity_cache
+from entity_cache import extract_corpus_entities, merge_entities
+from scrape_cache import compute_content_hash
+
+
+def fake_entities(text):
+    return {"persons": [text.split()[0]], "organizations": [], "dates": ["2024"]}
+
+
+class TestExtractCorpusEntities(unittest.TestCase):
+    """Cache lookups, extraction of misses and what gets stored."""
+
+    def setUp(self):
+        self.texts = ["Alice page one", "Bob page two", "Alice page one", "Carol page three"]
+        self.hashes = [compute_content_hash(t) for t in self.texts]
+        self.extracted = []
+        self.stored = {}
+
+    def run_extraction(self, cached, stored_hashes, row_ids=(1, 2, 3, 4)):
+        def parallel(texts, pos_tags=None):
+            self.extracted.extend(texts)
+            return [fake_entities(t) for t in texts]
+
+        with mock.patch.object(entity_cache, "load_cached_entities", return_value=(cached, stored_hashes)), \
+                mock.patch.object(entity_cache, "extract_entities_parallel", side_effect=parallel), \
+                mock.patch.object(entity_cache, "store_document_entities", side_effect=self.stored.update):
+            return extract_corpus_entities(self.texts, list(row_ids))
+
+    def test_cold_cache_extracts_each_distinct_page_once(self):
+        results = self.run_extraction({}, {})
+        self.assertEqual(self.extracted, ["Alice page one", "Bob page two", "Carol page three"])
+        self.assertEqual([r["persons"] for r in results], [["Alice"], ["Bob"], ["Alice"], ["Carol"]])
+        self.assertEqual(sorted(self.stored), [1, 2, 3, 4])
+        self.assertEqual(self.stored[3]["hash"], self.hashes[2])
+
+    def test_warm_cache_skips_ner(self):
+        cached = {h: fake_entities(t) for t, h in zip(self.texts, self.hashes)}
+        stored_hashes = dict(zip([1, 2, 3, 4], self.hashes))
+        results = self.run_extraction(cached, stored_hashes)
+        self.assertEqual(self.extracted, [])
+        self.assertEqual(self.stored, {})
+        self.assertEqual(results[3]["persons"], ["Carol"])
+
+    def test_shared_page_copied_to_own_row(self):
+        # Bob's page was extracted for another campaign; row 2 has nothing stored yet
+        cached = {self.hashes[1]: fake_entities("Bob page two")}
+        stored_hashes = {1: self.hashes[0], 3: self.hashes[2], 4: self.hashes[3]}
+        cached.update({h: fake_entities(t) for t, h in zip(self.texts, self.hashes) if h != self.hashes[1]})
+        self.run_extraction(cached, stored_hashes)
+        self.assertEqual(self.extracted, [])
+        self.assertEqual(list(self.stored), [2])
+
+    def test_failed_extraction_not_stored(self):
+        with mock.patch.object(entity_cache, "load_cached_entities", return_value=({}, {})), \
+                mock.patch.object(entity_cache, "extract_entities_parallel", side_effect=lambda texts, pos_tags=None: [None] * len(texts)), \
+                mock.patch.object(entity_cache, "store_document_entities", side_effect=self.stored.update):
+            results = extract_corpus_entities(self.texts, [1, 2, 3, 4])
+        self.assertEqual(results, [None] * 4)
+        self.assertEqual(self.stored, {})
+
+    def test_lookup_failure_falls_back_to_extraction(self):
+        with mock.patch.object(entity_cache, "_session", side_effect=RuntimeError("no database")), \
+                mock.patch.object(entity_cache, "extract_entities_parallel", side_effect=lambda texts, pos_tags=None: [fake_entities(t) for t in texts]):
+            results = extract_corpus_entities(self.texts, [1, 2, 3, 4])
+        self.assertEqual(results[1]["persons"], ["Bob"])
+
+
+class TestStoredFormat(unittest.TestCase):
+    """Stored JSON carries the extractor version."""
+
+    def test_round_trip(self):
+        entities = fake_entities("Alice")
+        self.assertEqual(entity_cache._decode(entity_cache._encode(entities)), entities)
+
+    def test_other_version_or_garbage_ignored(self):
+        self.assertIsNone(entity_cache._decode('{"version": 0, "entities": {}}'))
+        self.assertIsNone(entity_cache._decode("not json"))
+        self.assertIsNone(entity_cache._decode(None))
+
+
+class TestMergeEntities(unittest.TestCase):
+    """Campaign-level merge."""
+
+    def test_order_dedupe_and_limit(self):
+        merged = merge_entities([
+            {"persons": ["Alice", "Bob"], "dates": ["2024"]},
+            None,
+            {"persons": ["Bob", "Carol"]},
+        ], limit=2)
+        self.assertEqual(merged["persons"], ["Alice", "Bob"])
+        self.assertEqual(merged["dates"], ["2024"])
+        self.assertEqual(merged["facility"], [])
+        self.assertEqual(list(merged), entity_cache.ENTITY_TYPES)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for SimHash near-duplicate detection.
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from near_duplicates import (
+    NearDuplicateIndex, simhash, hamming_distance,
+    fingerprint_to_hex, fingerprint_from_hex, unique_document_indices, NEAR_DUP_MAX_HAMMING
+)
+
+ARTICLE = (
+    "Healthy soil is the foundation of every productive garden. Compost adds organic matter, "
+    "feeds microbes and improves structure so roots can reach water and nutrients. Cover crops "
+    "protect the surface over winter, reduce erosion and fix nitrogen for the next season. "
+    "Testing the soil every few years shows which amendments are actually needed and keeps "
+    "gardeners from adding lime or fertilizer that the beds do not require at all."
+)
+OTHER = (
+    "Electric bikes have changed the daily commute in many cities. A mid drive motor handles hills "
+    "well, while hub motors are cheaper and quieter. Battery capacity decides the range, and a good "
+    "charger extends battery life. Riders should check local rules about speed limits and helmets "
+    "before buying, and budget for regular brake and chain maintenance throughout the year."
+)
+
+
+class TestSimHash(unittest.TestCase):
+    """Fingerprints and the LSH index."""
+
+    def test_short_text_has_no_fingerprint(self):
+        self.assertIsNone(simhash("too short to fingerprint"))
+
+    def test_boilerplate_variant_stays_close(self):
+        page = ARTICLE + " " + OTHER
+        variant = "Home Menu Subscribe " + page + " Share this article."
+        self.assertLessEqual(hamming_distance(simhash(page), simhash(variant)), NEAR_DUP_MAX_HAMMING)
+        self.assertGreater(hamming_distance(simhash(ARTICLE), simhash(OTHER)), NEAR_DUP_MAX_HAMMING * 2)
+
+    def test_hex_round_trip(self):
+        fingerprint = simhash(ARTICLE)
+        self.assertEqual(len(fingerprint_to_hex(fingerprint)), 16)
+        self.assertEqual(fingerprint_from_hex(fingerprint_to_hex(fingerprint)), fingerprint)
+
+    def test_index_finds_within_distance(self):
+        index = NearDuplicateIndex(max_distance=3)
+        index.add("a", 0b1011 << 40)
+        self.assertEqual(index.find((0b1011 << 40) ^ 0b111), ("a", 3))
+        self.assertIsNone(index.find((0b1011 << 40) ^ 0b1111))
+
+    def test_unique_document_indices_keeps_first_copy(self):
+        self.assertEqual(unique_document_indices([ARTICLE, OTHER, ARTICLE + " "]), [0, 1])
+
+    def test_unique_document_indices_uses_stored_fingerprints(self):
+        stored = [fingerprint_to_hex(simhash(ARTICLE)), None, fingerprint_to_hex(simhash(ARTICLE))]
+        with mock.patch("near_duplicates.simhash", side_effect=simhash) as computed:
+            keep = unique_document_indices([ARTICLE, OTHER, ARTICLE + " "], simhashes=stored)
+        self.assertEqual(keep, [0, 1])
+        # Only the text without a stored fingerprint is hashed
+        computed.assert_called_once_with(OTHER)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the NLP model registry.
+
+Uses stand-in loaders, so no spaCy/NLTK model files are needed: models load
+once per process (also under concurrent first use), failures are recorded
+instead of retried on every call, and stats report load times.
+"""
+
+import sys
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nlp_models
+from nlp_models import ModelRegistry
+
+
+class TestModelRegistry(unittest.TestCase):
+    """ModelRegistry loading and bookkeeping."""
+
+    def test_loads_once_under_concurrent_use(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        registry = ModelRegistry()
+        registry.register("m", loader)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get("m"))) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(r) for r in results}), 1)
+        self.assertTrue(registry.is_loaded("m"))
+
+    def test_failed_loader_is_not_retried_until_reload(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            raise OSError("model not installed")
+
+        registry = ModelRegistry()
+        registry.register("broken", loader)
+        self.assertIsNone(registry.get("broken"))
+        self.assertIsNone(registry.get("broken"))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(registry.stats()["models"]["broken"]["status"], "failed")
+        registry.reload("broken")
+        self.assertEqual(len(calls), 2)
+
+    def test_warmup_reports_stats(self):
+        registry = ModelRegistry()
+        registry.register("a", lambda: "A")
+        registry.register("b", lambda: "B")
+        stats = registry.warmup(["a", "unknown"])
+        self.assertEqual(stats["models"]["a"]["status"], "loaded")
+        self.assertIn("load_ms", stats["models"]["a"])
+        self.assertEqual(stats["models"]["b"]["status"], "not_loaded")
+
+    def test_unknown_model(self):
+        with self.assertRaises(KeyError):
+            ModelRegistry().get("nope")
+
+
+class TestStartupWarmup(unittest.TestCase):
+    """start_background_warmup (app startup hook)."""
+
+    def run_hook(self, enabled):
+        registry = mock.Mock()
+        with mock.patch.object(nlp_models, "NLP_WARMUP_ON_STARTUP", enabled), \
+                mock.patch.object(nlp_models, "ensure_nltk_resources") as ensure, \
+                mock.patch.object(nlp_models, "get_model_registry", return_value=registry):
+            nlp_models.start_background_warmup().join(5)
+        return ensure, registry
+
+    def test_downloads_nltk_resources_and_warms(self):
+        ensure, registry = self.run_hook(True)
+        ensure.assert_called_once()
+        registry.warmup.assert_called_once()
+
+    def test_disabled_warmup_still_checks_nltk_resources(self):
+        ensure, registry = self.run_hook(False)
+        ensure.assert_called_once()
+        registry.warmup.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for Playwright request interception rules.
+
+Documents and scripts must always load (JS-rendered pages need them); images,
+media and fonts are skipped unless the campaign extracts images, and known
+ad/analytics hosts are blocked regardless of resource type.
+"""
+
+import sys
+import os
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from page_loading import should_block_request, is_blocked_host
+
+
+class TestRequestFilter(unittest.TestCase):
+    """should_block_request() decisions."""
+
+    def test_document_and_scripts_load(self):
+        self.assertFalse(should_block_request("https://example.com/", "document"))
+        self.assertFalse(should_block_request("https://example.com/app.js", "script"))
+        self.assertFalse(should_block_request("https://example.com/api/posts", "fetch"))
+
+    def test_heavy_resources_blocked(self):
+        for resource_type in ("image", "media", "font"):
+            self.assertTrue(should_block_request("https://example.com/asset", resource_type))
+
+    def test_images_allowed_when_extracting_images(self):
+        self.assertFalse(should_block_request("https://example.com/a.png", "image", include_images=True))
+        self.assertTrue(should_block_request("https://example.com/a.mp4", "media", include_images=True))
+
+    def test_ad_and_analytics_hosts_blocked(self):
+        self.assertTrue(should_block_request("https://www.googletagmanager.com/gtm.js", "script"))
+        self.assertTrue(should_block_request("https://securepubads.g.doubleclick.net/tag", "document"))
+        self.assertTrue(should_block_request("https://stats.doubleclick.net/x.gif", "image", include_images=True))
+
+    def test_host_suffix_match_is_exact(self):
+        self.assertTrue(is_blocked_host("https://static.hotjar.com/c/hotjar.js"))
+        self.assertFalse(is_blocked_host("https://nothotjar.com/page"))
+        self.assertTrue(is_blocked_host("https://www.facebook.com/tr?id=1"))
+        self.assertFalse(is_blocked_host("https://www.facebook.com/groups/x"))
+        self.assertFalse(is_blocked_host("https://www.facebook.com/trending"))
+
+
+if __name__ == "__main__":
+    unittest.main()
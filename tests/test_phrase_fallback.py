@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for the fallback phrase extraction's content-word masking.
+
+Function words must be masked by the artifact's POS tags where there is an artifact
+and by the tagger lexicon where there isn't.
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import phrase_fallback
+from doc_artifacts import DocumentArtifact
+from phrase_fallback import content_words
+
+
+class TestContentWords(unittest.TestCase):
+    """content_words."""
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(phrase_fallback, "phrase_stop_words", return_value={"the", "and"}),
+            mock.patch.object(phrase_fallback, "tagger_lexicon", return_value={"within": "IN", "solar": "JJ"}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_artifact_tags_mask_function_words(self):
+        tokens = ["Solar", "panels", "near", "the", "roof", "and", "2024", "it"]
+        artifact = DocumentArtifact(tokens, tokens, ["JJ", "NNS", "IN", "DT", "NN", "CC", "CD", "PRP"], [0])
+        self.assertEqual(content_words("", artifact), ["solar", "panels", "roof"])
+
+    def test_lexicon_masks_words_without_artifact(self):
+        text = "Solar panels within the roof, and wind."
+        self.assertEqual(content_words(text), ["solar", "panels", "roof", "wind"])
+        self.assertEqual(content_words(text, min_word_len=5), ["solar", "panels"])
+
+    def test_limit(self):
+        self.assertEqual(content_words("solar panels roof wind", limit=2), ["solar", "panels"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for turning scrape results into CampaignRawData column values and for the
+batched writer that inserts them.
+"""
+
+import sys
+import os
+import json
+import unittest
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.raw_data_writer import RawDataWriter, build_raw_data_row
+
+
+class FakeSession:
+    """Records executemany INSERTs; any statement carrying a row whose URL is in `bad` fails"""
+
+    def __init__(self, bad=()):
+        self.bad = set(bad)
+        self.executed = []
+        self.committed = []
+        self.rollbacks = 0
+        self._open = []
+
+    def execute(self, statement, rows):
+        if any(row["source_url"] in self.bad for row in rows):
+            raise RuntimeError("Incorrect string value")
+        self.executed.append((statement.table.name, [row["source_url"] for row in rows]))
+        self._open.extend(row["source_url"] for row in rows)
+
+    def commit(self):
+        self.committed.extend(self._open)
+        self._open = []
+
+    def rollback(self):
+        self.rollbacks += 1
+        self._open = []
+
+
+def row(url, text="text"):
+    return {"source_url": url, "extracted_text": text, "raw_html": None}
+
+
+class TestBuildRawDataRow(unittest.TestCase):
+    """build_raw_data_row() output."""
+
+    def test_error_result_keeps_error_text(self):
+        row = build_raw_data_row(
+            {"url": "https://example.com/x", "text": "", "error": "timeout"},
+            "c1", datetime(2024, 1, 1)
+        )
+        self.assertEqual(row["extracted_text"], "Error scraping https://example.com/x: timeout")
+        self.assertIsNone(row["content_hash"])
+        self.assertEqual(json.loads(row["meta_json"])["error"], "timeout")
+
+    def test_strips_4byte_characters_and_copies_fetch_meta(self):
+        row = build_raw_data_row(
+            {
+                "url": "https://example.com/a",
+                "text": "Short \U0001F600 note",
+                "html": "<p>\U0001F600</p>",
+                "metadata": {"fetch_method": "static", "query": "ignored"},
+            },
+            "c1", datetime(2024, 1, 1), include_links=True
+        )
+        self.assertEqual(row["extracted_text"], "Short  note")
+        self.assertEqual(row["raw_html"], "<p></p>")
+        meta = json.loads(row["meta_json"])
+        self.assertEqual(meta["fetch_method"], "static")
+        self.assertNotIn("query", meta)
+
+    def test_html_only_stored_with_links(self):
+        row = build_raw_data_row({"url": "https://example.com/a", "text": "hi", "html": "<p>hi</p>"}, "c1", datetime(2024, 1, 1))
+        self.assertIsNone(row["raw_html"])
+
+
+class TestRawDataWriter(unittest.TestCase):
+    """RawDataWriter batching and failure handling."""
+
+    def test_flushes_one_executemany_per_full_batch(self):
+        session = FakeSession()
+        writer = RawDataWriter(session, batch_size=2)
+        writer.add(row("a"))
+        self.assertEqual(session.executed, [])
+        writer.add(row("b"))
+        writer.add(row("c"))
+        self.assertEqual(session.executed, [("campaign_raw_data", ["a", "b"])])
+        self.assertEqual(session.committed, ["a", "b"])
+        self.assertEqual((writer.written, writer.batches), (2, 1))
+
+    def test_large_text_flushes_early(self):
+        session = FakeSession()
+        writer = RawDataWriter(session, batch_size=10, max_chars=100)
+        writer.add(row("a", "x" * 60))
+        writer.add(row("b", "x" * 60))
+        self.assertEqual(session.executed, [("campaign_raw_data", ["a", "b"])])
+
+    def test_failed_batch_is_retried_row_by_row(self):
+        session = FakeSession(bad={"b"})
+        writer = RawDataWriter(session, batch_size=3)
+        for url in ("a", "b", "c"):
+            writer.add(row(url))
+        self.assertEqual(session.executed, [("campaign_raw_data", ["a"]), ("campaign_raw_data", ["c"])])
+        self.assertEqual(session.committed, ["a", "c"])
+        self.assertEqual(session.rollbacks, 2)
+        self.assertEqual((writer.written, writer.failed, writer.batches), (2, 1, 1))
+
+    def test_final_flush_writes_remainder(self):
+        session = FakeSession()
+        writer = RawDataWriter(session, batch_size=2)
+        for url in ("a", "b", "c"):
+            writer.add(row(url))
+        self.assertEqual(writer.flush(), 1)
+        self.assertEqual(session.executed[-1], ("campaign_raw_data", ["c"]))
+        self.assertEqual(session.committed, ["a", "b", "c"])
+        self.assertEqual(writer.flush(), 0)
+        self.assertEqual((writer.written, writer.batches), (3, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for scrape cache URL normalization and hashing.
+
+The cache key must be stable across cosmetic URL differences (case, default
+ports, fragments, tracking parameters, query order) without merging pages that
+really are different.
+"""
+
+import sys
+import os
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrape_cache import normalize_url, hash_url, compute_content_hash
+
+
+class TestNormalizeUrl(unittest.TestCase):
+    """normalize_url() canonicalization rules."""
+
+    def test_lowercases_scheme_and_host(self):
+        self.assertEqual(normalize_url("HTTPS://Example.COM/Path"), "https://example.com/Path")
+
+    def test_drops_default_port_keeps_custom_port(self):
+        self.assertEqual(normalize_url("https://example.com:443/a"), "https://example.com/a")
+        self.assertEqual(normalize_url("http://example.com:80/a"), "http://example.com/a")
+        self.assertEqual(normalize_url("http://example.com:8080/a"), "http://example.com:8080/a")
+
+    def test_empty_path_becomes_slash(self):
+        self.assertEqual(normalize_url("https://example.com"), "https://example.com/")
+
+    def test_drops_fragment_and_tracking_params(self):
+        self.assertEqual(
+            normalize_url("https://example.com/a?utm_source=x&id=3&fbclid=y#section"),
+            "https://example.com/a?id=3"
+        )
+
+    def test_sorts_query_params(self):
+        self.assertEqual(
+            normalize_url("https://example.com/a?b=2&a=1"),
+            normalize_url("https://example.com/a?a=1&b=2")
+        )
+
+    def test_distinct_pages_stay_distinct(self):
+        self.assertNotEqual(hash_url("https://example.com/a"), hash_url("https://example.com/b"))
+        self.assertNotEqual(hash_url("https://example.com/a?page=1"), hash_url("https://example.com/a?page=2"))
+
+    def test_equivalent_urls_share_hash(self):
+        self.assertEqual(
+            hash_url("https://Example.com/a?utm_medium=email#top"),
+            hash_url("https://example.com/a")
+        )
+
+
+class TestContentHash(unittest.TestCase):
+    """compute_content_hash() behaviour."""
+
+    def test_empty_text_has_no_hash(self):
+        self.assertIsNone(compute_content_hash(""))
+        self.assertIsNone(compute_content_hash(None))
+
+    def test_hash_is_sha256_hex(self):
+        digest = compute_content_hash("hello")
+        self.assertEqual(len(digest), 64)
+        self.assertEqual(digest, compute_content_hash("hello"))
+        self.assertNotEqual(digest, compute_content_hash("hello!"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the DuckDuckGo search fan-out: rank fusion and the result cache.
+DDGS is replaced by a stub so no network access happens.
+"""
+
+import sys
+import os
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import web_scraping
+
+
+class _StubDDGS:
+    calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def text(self, query, max_results=10):
+        _StubDDGS.calls.append(query)
+        return [{"href": f"https://example.com/{query.replace(' ', '-')}/{i}"} for i in range(3)]
+
+
+class TestSearchFanout(unittest.TestCase):
+    """Rank fusion and caching of search results."""
+
+    def setUp(self):
+        self._ddgs = web_scraping.DDGS
+        web_scraping.DDGS = _StubDDGS
+        _StubDDGS.calls = []
+        web_scraping._search_cache.clear()
+
+    def tearDown(self):
+        web_scraping.DDGS = self._ddgs
+        web_scraping._search_cache.clear()
+
+    def test_fusion_rewards_urls_found_by_several_queries(self):
+        fused = web_scraping._fuse_ranked_urls([["https://a.com/1", "https://a.com/2"], ["https://a.com/2#x", "https://a.com/3"]], 10)
+        self.assertEqual(fused, ["https://a.com/2", "https://a.com/1", "https://a.com/3"])
+
+    def test_fusion_respects_max_results(self):
+        self.assertEqual(len(web_scraping._fuse_ranked_urls([["https://a.com/1", "https://a.com/2", "https://a.com/3"]], 2)), 2)
+
+    def test_cache_is_keyed_by_normalized_query(self):
+        first = web_scraping._cached_search("Soil  Health", 5)
+        second = web_scraping._cached_search("soil health", 5)
+        self.assertEqual(first, second)
+        self.assertEqual(len(_StubDDGS.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming sitemap parser.
+
+Sitemaps are served from memory through a stub session, so the tests cover
+plain and gzipped files, namespace handling, early stop on max_urls and the
+top-N by lastmod used for most_recent without touching the network.
+"""
+
+import gzip
+import io
+import sys
+import os
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import requests
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sitemap_parser
+from sitemap_parser import iter_sitemap_entries, parse_lastmod, parse_sitemap
+
+
+def urlset(entries, namespace=True):
+    ns = ' xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"' if namespace else ""
+    body = "".join(
+        f"<url><loc>{loc}</loc>" + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "") + "</url>"
+        for loc, lastmod in entries
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset{ns}>{body}</urlset>'.encode("utf-8")
+
+
+class StubSession:
+    """Serves canned bodies by URL and records which URLs were requested."""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.raw = io.BytesIO(self.bodies[url])
+        return response
+
+
+class TestSitemapParser(unittest.TestCase):
+    """Streaming sitemap parsing."""
+
+    def parse(self, bodies, url, **kwargs):
+        session = StubSession(bodies)
+        with mock.patch.object(sitemap_parser, "get_shared_session", return_value=session):
+            return parse_sitemap(url, **kwargs), session
+
+    def test_iter_entries_without_namespace(self):
+        data = urlset([("https://a.com/1", "2025-01-02"), ("https://a.com/2", None)], namespace=False)
+        entries = list(iter_sitemap_entries(io.BytesIO(data)))
+        self.assertEqual(entries, [
+            ("url", "https://a.com/1", datetime(2025, 1, 2)),
+            ("url", "https://a.com/2", None),
+        ])
+
+    def test_lastmod_normalized_to_naive_utc(self):
+        self.assertEqual(parse_lastmod("2025-01-02T10:00:00+02:00"), datetime(2025, 1, 2, 8, 0))
+        self.assertEqual(parse_lastmod("2025-01-02T10:00:00Z"), datetime(2025, 1, 2, 10, 0))
+        self.assertIsNone(parse_lastmod("yesterday"))
+
+    def test_gzip_sitemap(self):
+        data = gzip.compress(urlset([("https://a.com/1", None), ("https://a.com/2", None)]))
+        urls, _ = self.parse({"https://a.com/sitemap.xml.gz": data}, "https://a.com/sitemap.xml.gz")
+        self.assertEqual([u for u, _ in urls], ["https://a.com/1", "https://a.com/2"])
+
+    def test_stops_at_max_urls(self):
+        data = urlset([(f"https://a.com/{i}", None) for i in range(100)])
+        urls, _ = self.parse({"https://a.com/sitemap.xml": data}, "https://a.com/sitemap.xml", max_urls=5)
+        self.assertEqual([u for u, _ in urls], [f"https://a.com/{i}" for i in range(5)])
+
+    def test_most_recent_keeps_newest(self):
+        data = urlset([
+            ("https://a.com/old", "2020-01-01"),
+            ("https://a.com/undated", None),
+            ("https://a.com/new", "2025-06-01T00:00:00Z"),
+            ("https://a.com/mid", "2023-03-03"),
+        ])
+        urls, _ = self.parse({"https://a.com/sitemap.xml": data}, "https://a.com/sitemap.xml", most_recent=2)
+        self.assertEqual([u for u, _ in urls], ["https://a.com/new", "https://a.com/mid"])
+
+    def test_index_followed_within_budget(self):
+        index = (
+            b'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            b"<sitemap><loc>https://a.com/s1.xml</loc></sitemap>"
+            b"<sitemap><loc>https://a.com/s2.xml</loc></sitemap>"
+            b"</sitemapindex>"
+        )
+        bodies = {
+            "https://a.com/sitemap.xml": index,
+            "https://a.com/s1.xml": urlset([(f"https://a.com/x{i}", None) for i in range(3)]),
+            "https://a.com/s2.xml": urlset([(f"https://a.com/y{i}", None) for i in range(3)]),
+        }
+        urls, session = self.parse(bodies, "https://a.com/sitemap.xml", max_urls=3)
+        self.assertEqual([u for u, _ in urls], ["https://a.com/x0", "https://a.com/x1", "https://a.com/x2"])
+        self.assertEqual(session.requested.count("https://a.com/sitemap.xml"), 1)
+
+    def test_index_children_merged_in_index_order(self):
+        children = [f"https://a.com/s{i}.xml" for i in range(12)]
+        index = (
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            + "".join(f"<sitemap><loc>{c}</loc></sitemap>" for c in children)
+            + "</sitemapindex>"
+        ).encode("utf-8")
+        bodies = {"https://a.com/sitemap.xml": index}
+        for i, child in enumerate(children):
+            bodies[child] = urlset([(f"https://a.com/{i}/{j}", None) for j in range(2)])
+        urls, session = self.parse(bodies, "https://a.com/sitemap.xml")
+        self.assertEqual([u for u, _ in urls], [f"https://a.com/{i}/{j}" for i in range(12) for j in range(2)])
+        self.assertEqual(len(session.requested), 13)
+
+
+if __name__ == "__main__":
+    unittest.main()
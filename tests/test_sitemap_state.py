@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental Site Builder crawl plan.
+
+Only URLs that are new to the campaign or whose sitemap lastmod moved forward
+since the last scrape should be scheduled; everything else is reused.
+"""
+
+import sys
+import os
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sitemap_state
+from models import SitemapUrlState
+from sitemap_state import load_sitemap_state, plan_incremental_crawl, save_sitemap_state, site_key
+
+
+class TestIncrementalCrawlPlan(unittest.TestCase):
+    """plan_incremental_crawl decisions."""
+
+    def setUp(self):
+        self.state = {
+            "https://a.com/old": {"lastmod": datetime(2025, 1, 1), "content_hash": "x"},
+            "https://a.com/edited": {"lastmod": datetime(2025, 1, 1), "content_hash": "y"},
+            "https://a.com/undated": {"lastmod": None, "content_hash": "z"},
+        }
+        self.known = {"https://a.com/old", "https://a.com/edited", "https://a.com/undated"}
+
+    def test_first_run_scrapes_everything(self):
+        plan = plan_incremental_crawl([("https://a.com/1", None), ("https://a.com/2", datetime(2025, 1, 1))], {}, set())
+        self.assertEqual(plan["new"], ["https://a.com/1", "https://a.com/2"])
+        self.assertEqual(plan["changed"], [])
+
+    def test_only_new_and_moved_lastmod_are_due(self):
+        entries = [
+            ("https://a.com/old", datetime(2025, 1, 1)),
+            ("https://a.com/edited", datetime(2025, 3, 1)),
+            ("https://a.com/undated", datetime(2025, 3, 1)),
+            ("https://a.com/fresh", None),
+        ]
+        plan = plan_incremental_crawl(entries, self.state, self.known)
+        self.assertEqual(plan["new"], ["https://a.com/fresh"])
+        self.assertEqual(plan["changed"], ["https://a.com/edited"])
+        self.assertEqual(plan["unchanged"], 2)
+        # Changed page leaves the skip list so the scraper fetches it again
+        self.assertEqual(plan["skip_urls"], {"https://a.com/old", "https://a.com/undated"})
+        self.assertEqual(plan["superseded"], {"https://a.com/edited": ["https://a.com/edited"]})
+
+    def test_stored_url_without_state_is_reused(self):
+        plan = plan_incremental_crawl([("https://a.com/page#top", datetime(2025, 5, 1))], {}, {"https://a.com/page"})
+        self.assertEqual((plan["new"], plan["changed"], plan["unchanged"]), ([], [], 1))
+
+    def test_site_key(self):
+        self.assertEqual(site_key("HTTPS://Example.com/blog/"), "https://example.com")
+
+
+class TestStoredState(unittest.TestCase):
+    """load_sitemap_state / save_sitemap_state against a database."""
+
+    URL = "https://a.com/page"
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        SitemapUrlState.__table__.create(engine)
+        patch = mock.patch.object(sitemap_state, "_session", sessionmaker(bind=engine))
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_state_is_per_campaign(self):
+        # Both campaigns stored the page at L1; campaign A re-crawls it at L2
+        l1, l2 = datetime(2025, 1, 1), datetime(2025, 2, 1)
+        save_sitemap_state("campaign-a", "https://a.com", [(self.URL, l1)], {self.URL: "h1"}, set())
+        save_sitemap_state("campaign-b", "https://a.com", [(self.URL, l1)], {self.URL: "h1"}, set())
+        save_sitemap_state("campaign-a", "https://a.com", [(self.URL, l2)], {self.URL: "h2"}, set())
+
+        plan_b = plan_incremental_crawl([(self.URL, l2)], load_sitemap_state("campaign-b"), [self.URL])
+        self.assertEqual(plan_b["changed"], [self.URL])
+        plan_a = plan_incremental_crawl([(self.URL, l2)], load_sitemap_state("campaign-a"), [self.URL])
+        self.assertEqual((plan_a["changed"], plan_a["unchanged"]), ([], 1))
+
+    def test_missing_lastmod_keeps_stored_date(self):
+        save_sitemap_state("campaign-a", "https://a.com", [(self.URL, datetime(2025, 1, 1))], {self.URL: "h1"}, set())
+        save_sitemap_state("campaign-a", "https://a.com", [(self.URL, None)], {}, set())
+        state = load_sitemap_state("campaign-a")
+        self.assertEqual(state[self.URL]["lastmod"], datetime(2025, 1, 1))
+        plan = plan_incremental_crawl([(self.URL, datetime(2025, 3, 1))], state, [self.URL])
+        self.assertEqual(plan["changed"], [self.URL])
+
+
+if __name__ == "__main__":
+    unittest.main()
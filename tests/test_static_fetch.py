@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the static (no browser) fetch path.
+
+Pages that only render with JavaScript must be escalated to Playwright with the
+matching reason, server-rendered pages must not be, and a 304 answer to a
+conditional request must report "not_modified". Requests go to a fake session.
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import static_fetch
+from static_fetch import fetch_static
+
+ARTICLE = " ".join(["Soil health depends on organic matter, microbes and careful crop rotation."] * 20)
+
+
+class FakeRaw:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def read(self, amount, decode_content=False):
+        return self.body[:amount]
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=b"", headers=None, url="https://example.com/page"):
+        self.status_code = status_code
+        self.raw = FakeRaw(body)
+        self.headers = headers if headers is not None else {"Content-Type": "text/html; charset=utf-8"}
+        self.encoding = "utf-8"
+        self.url = url
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def get(self, url, timeout=None, stream=False, headers=None):
+        self.requests.append((url, headers))
+        return self.response
+
+
+class TestFetchStatic(unittest.TestCase):
+    """fetch_static() escalation decisions."""
+
+    def fetch(self, html=None, response=None, **kwargs):
+        response = response or FakeResponse(body=html.encode("utf-8"))
+        self.session = FakeSession(response)
+        with mock.patch.object(static_fetch, "get_static_session", return_value=self.session), \
+                mock.patch.object(static_fetch, "STATIC_MIN_TEXT_CHARS", 500):
+            return fetch_static("https://example.com/page", **kwargs)
+
+    def test_server_rendered_page_is_not_escalated(self):
+        html = (
+            f"<html><head><link rel='canonical' href='/canonical'></head><body>"
+            f"<nav>Menu</nav><article><h1>Soil</h1><p>{ARTICLE}</p></article>"
+            f"<script>var tracking = 1;</script></body></html>"
+        )
+        response = FakeResponse(body=html.encode("utf-8"), headers={
+            "Content-Type": "text/html; charset=utf-8", "ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        })
+        result, reason, _ = self.fetch(response=response)
+        self.assertIsNone(reason)
+        self.assertTrue(result["text"].startswith("Soil Soil health depends"))
+        self.assertNotIn("tracking", result["text"])
+        self.assertEqual(result["canonical_url"], "https://example.com/canonical")
+        self.assertEqual(result["http_validators"], {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+        self.assertTrue(response.closed)
+
+    def test_empty_spa_root_is_escalated(self):
+        html = f"<html><body><div id='root'></div><footer>{ARTICLE}</footer></body></html>"
+        self.assertEqual(self.fetch(html)[1], "spa_root")
+
+    def test_noscript_asking_for_javascript_is_escalated(self):
+        short_article = ARTICLE[:700]
+        html = (
+            f"<html><body><noscript>You need to enable JavaScript to run this app.</noscript>"
+            f"<main>{short_article}</main></body></html>"
+        )
+        self.assertEqual(self.fetch(html)[1], "noscript_js_required")
+        # Long server-rendered content wins over a boilerplate <noscript>
+        html = f"<html><body><noscript>Please enable JavaScript.</noscript><main>{ARTICLE}</main></body></html>"
+        self.assertIsNone(self.fetch(html)[1])
+
+    def test_thin_body_text_is_escalated(self):
+        html = "<html><body><main>Loading...</main><script>render()</script></body></html>"
+        result, reason, _ = self.fetch(html)
+        self.assertIsNone(result)
+        self.assertEqual(reason, "thin_body_text")
+
+    def test_not_modified_answer_to_conditional_request(self):
+        validators = {"If-None-Match": '"v1"'}
+        response = FakeResponse(status_code=304)
+        result, reason, _ = self.fetch(response=response, validators=validators)
+        self.assertIsNone(result)
+        self.assertEqual(reason, "not_modified")
+        self.assertEqual(self.session.requests, [("https://example.com/page", validators)])
+        self.assertTrue(response.closed)
+
+    def test_plain_request_sends_no_validators(self):
+        html = f"<html><body><article>{ARTICLE}</article></body></html>"
+        self.fetch(html)
+        self.assertEqual(self.session.requests, [("https://example.com/page", None)])
+
+    def test_http_errors_and_non_html_are_escalated(self):
+        self.assertEqual(self.fetch(response=FakeResponse(status_code=403))[1], "http_403")
+        pdf = FakeResponse(body=b"%PDF", headers={"Content-Type": "application/pdf"})
+        self.assertEqual(self.fetch(response=pdf)[1], "non_html_content")
+
+
+if __name__ == '__main__':
+    unittest.main()
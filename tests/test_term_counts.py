@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for precomputed per-document term counts.
+
+Campaign totals must equal the sum over the current corpus however they were reached,
+and only pages added since the last update may be counted.
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import doc_artifacts
+import term_counts
+from doc_artifacts import DocumentArtifact
+from scrape_cache import compute_content_hash
+from term_counts import (
+    TermCounts, campaign_corpus_texts, campaign_term_totals, pack_views, sum_term_counts, unpack_views
+)
+
+STOP_WORDS = {"the", "and", "is"}
+
+
+def fake_artifact(text):
+    tokens = text.split()
+    return DocumentArtifact(
+        tokens=tokens,
+        lemmas=[t.lower().rstrip("s") for t in tokens],
+        tags=["DT" if t.lower() == "the" else "NN" for t in tokens],
+        sentence_starts=[0] if tokens else [],
+    )
+
+
+class TestTermCounts(unittest.TestCase):
+    """Vector arithmetic and storage format."""
+
+    def test_top_breaks_ties_alphabetically(self):
+        counts = TermCounts.from_terms(["solar", "wind", "solar", "hydro", "wind", "grid"])
+        self.assertEqual(counts.top(3), [("solar", 2), ("wind", 2), ("grid", 1)])
+        self.assertEqual(counts.top(0), [])
+
+    def test_weighted_sum_drops_zero_terms(self):
+        a = TermCounts.from_terms(["solar", "wind", "wind"])
+        b = TermCounts.from_terms(["wind", "hydro"])
+        total = sum_term_counts([(a, 2), (b, 1), (TermCounts.from_terms(["solar"]), -2), (None, 1)])
+        self.assertEqual(dict(total.top(10)), {"wind": 5, "hydro": 1})
+
+    def test_pack_round_trip(self):
+        views = {"cloud": TermCounts.from_terms(["solar", "énergie", "solar"]), "keywords": TermCounts.empty()}
+        restored = unpack_views(pack_views(views))
+        self.assertEqual(restored["cloud"].top(5), [("solar", 2), ("énergie", 1)])
+        self.assertEqual(len(restored["keywords"]), 0)
+
+
+class TestCampaignTermTotals(unittest.TestCase):
+    """Incremental campaign totals."""
+
+    def setUp(self):
+        self.document_store = {}
+        self.campaign_store = {}
+        self.counted = []
+        patches = [
+            mock.patch.object(term_counts, "cloud_stop_words", return_value=STOP_WORDS),
+            mock.patch.object(term_counts, "_keyword_stop_words", return_value=STOP_WORDS),
+            mock.patch.object(term_counts, "load_document_views", side_effect=lambda hashes: {
+                h: self.document_store[h] for h in hashes if h in self.document_store
+            }),
+            mock.patch.object(term_counts, "store_document_views", side_effect=self.document_store.update),
+            mock.patch.object(term_counts, "load_campaign_totals", side_effect=self.campaign_store.get),
+            mock.patch.object(term_counts, "save_campaign_totals", side_effect=lambda cid, hashes, totals: self.campaign_store.update({cid: (hashes, totals)})),
+            mock.patch.object(doc_artifacts, "get_document_artifacts", side_effect=self.fake_artifacts),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def fake_artifacts(self, texts):
+        self.counted.extend(texts)
+        return [fake_artifact(t) if t != "broken page" else None for t in texts]
+
+    def cloud(self, texts):
+        return dict(campaign_term_totals("c1", texts)["cloud"].top(100))
+
+    def test_added_pages_only_are_counted(self):
+        texts = ["The solar panels", "Wind and solar", "The solar panels"]
+        self.assertEqual(self.cloud(texts), {"solar": 3, "panels": 2, "wind": 1})
+        self.assertEqual(self.counted, ["The solar panels", "Wind and solar"])
+        self.counted.clear()
+        self.assertEqual(self.cloud(texts + ["Hydro dams"]), {"solar": 3, "panels": 2, "wind": 1, "hydro": 1, "dams": 1})
+        self.assertEqual(self.counted, ["Hydro dams"])
+
+    def test_removed_pages_are_subtracted(self):
+        self.cloud(["The solar panels", "Wind and solar", "The solar panels"])
+        self.counted.clear()
+        self.assertEqual(self.cloud(["Wind and solar", "The solar panels"]), {"solar": 2, "panels": 1, "wind": 1})
+        self.assertEqual(self.counted, [])
+
+    def test_keywords_view_uses_lemmas(self):
+        totals = campaign_term_totals("c1", ["The solar panels", "Panels is fine"])
+        self.assertEqual(dict(totals["keywords"].top(10)), {"panel": 2, "solar": 1, "fine": 1})
+
+    def test_corpus_keeps_short_pages_and_drops_error_rows(self):
+        rows = [
+            ("https://a.com/1", "Solar panels on the roof"),
+            ("https://a.com/2", "Wind"),
+            ("https://a.com/3", "   "),
+            ("error:timeout", "Error scraping https://a.com/4: timeout"),
+            ("placeholder:none", "No pages yet"),
+            (None, "Pasted text"),
+        ]
+        corpus = campaign_corpus_texts(rows)
+        self.assertEqual(corpus, ["Solar panels on the roof", "Wind", "Pasted text"])
+        # Callers building the corpus from the same rows keep the stored totals current
+        self.cloud(corpus)
+        self.counted.clear()
+        self.cloud(campaign_corpus_texts(rows))
+        self.assertEqual(self.counted, [])
+
+    def test_fallback_counts_not_saved(self):
+        totals = campaign_term_totals("c1", ["broken page", "Wind farms"])
+        self.assertEqual(dict(totals["cloud"].top(10)), {"broken": 1, "page": 1, "wind": 1, "farms": 1})
+        self.assertEqual(self.campaign_store, {})
+        self.assertEqual(list(self.document_store), [compute_content_hash("Wind farms")])
+
+
+if __name__ == '__main__':
+    unittest.main()
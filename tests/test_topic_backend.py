@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-lean topic model backend.
+
+The memory estimate has to grow with the corpus and the topic count, and "auto"
+must switch to MiniBatchNMF / fewer concurrent fits when the budget is exceeded.
+"""
+
+import sys
+import os
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+import scipy.sparse as sp
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import topic_backend
+from topic_backend import choose_backend, estimate_nmf_memory_mb, memory_capped_workers, plan_nmf_fit
+
+try:
+    import text_processing
+except Exception:
+    text_processing = None
+
+
+def corpus(n_docs, n_terms, density=0.01, dtype=np.float32):
+    return sp.random(n_docs, n_terms, density=density, format="csr", dtype=dtype, random_state=0)
+
+
+class TestMemoryEstimate(unittest.TestCase):
+    """estimate_nmf_memory_mb."""
+
+    def test_grows_with_corpus_and_topics(self):
+        small, large = corpus(100, 5000), corpus(1000, 5000)
+        self.assertLess(estimate_nmf_memory_mb(small, 10, "batch"), estimate_nmf_memory_mb(large, 10, "batch"))
+        self.assertLess(estimate_nmf_memory_mb(small, 10, "batch"), estimate_nmf_memory_mb(small, 25, "batch"))
+
+    def test_float32_halves_matrix_memory(self):
+        X32 = corpus(500, 5000)
+        X64 = X32.astype(np.float64)
+        self.assertLess(estimate_nmf_memory_mb(X32, 10, "batch"), estimate_nmf_memory_mb(X64, 10, "batch"))
+
+    def test_minibatch_avoids_the_transposed_copy(self):
+        X = corpus(5000, 2000, density=0.05)
+        self.assertLess(estimate_nmf_memory_mb(X, 10, "minibatch"), estimate_nmf_memory_mb(X, 10, "batch"))
+
+
+class TestBackendChoice(unittest.TestCase):
+    """Backend and worker selection under a memory budget."""
+
+    def test_small_corpus_stays_full_batch(self):
+        with mock.patch.object(topic_backend, "TOPIC_MODEL_BACKEND", "auto"):
+            self.assertEqual(choose_backend(corpus(100, 1000), 10), "batch")
+
+    def test_large_or_over_budget_corpus_uses_minibatch(self):
+        X = corpus(300, 5000)
+        with mock.patch.object(topic_backend, "TOPIC_MODEL_BACKEND", "auto"), \
+                mock.patch.object(topic_backend, "TOPIC_MINIBATCH_MIN_DOCS", 200):
+            self.assertEqual(choose_backend(X, 10), "minibatch")
+        with mock.patch.object(topic_backend, "TOPIC_MODEL_BACKEND", "auto"), \
+                mock.patch.object(topic_backend, "TOPIC_MEMORY_BUDGET_MB", 0.01):
+            self.assertEqual(choose_backend(X, 10), "minibatch")
+
+    def test_explicit_backend_wins(self):
+        with mock.patch.object(topic_backend, "TOPIC_MODEL_BACKEND", "batch"):
+            self.assertEqual(choose_backend(corpus(5000, 1000), 10), "batch")
+
+    def test_workers_capped_by_budget(self):
+        X = corpus(1000, 5000)
+        per_fit = estimate_nmf_memory_mb(X, 10, "batch")
+        with mock.patch.object(topic_backend, "TOPIC_MEMORY_BUDGET_MB", per_fit * 2.5):
+            self.assertEqual(memory_capped_workers(X, 10, "batch", 8), 2)
+        with mock.patch.object(topic_backend, "TOPIC_MEMORY_BUDGET_MB", per_fit / 2):
+            self.assertEqual(memory_capped_workers(X, 10, "batch", 8), 1)
+
+    def test_plan_reports_estimate(self):
+        with mock.patch.object(topic_backend, "TOPIC_MODEL_BACKEND", "batch"):
+            plan = plan_nmf_fit(corpus(100, 1000), 10, workers=2)
+        self.assertEqual(plan["backend"], "batch")
+        self.assertAlmostEqual(plan["estimate_mb"], 2 * estimate_nmf_memory_mb(corpus(100, 1000), 10, "batch"))
+
+
+@unittest.skipUnless(text_processing is not None, "text_processing dependencies not installed")
+class TestKSweepConcurrency(unittest.TestCase):
+    """sweep_nmf_k_grid keeps concurrent fits within plan_nmf_fit's worker count."""
+
+    def setUp(self):
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        self.threads = ThreadPoolExecutor(max_workers=16)
+        self.addCleanup(self.threads.shutdown)
+
+    def fake_fit(self, X, K, random_state, max_iter, backend="batch"):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        nmf = mock.Mock(components_=np.random.RandomState(K).rand(K, X.shape[1]))
+        return nmf, np.random.RandomState(K).rand(X.shape[0], K)
+
+    def test_concurrent_fits_never_exceed_planned_workers(self):
+        X = corpus(40, 30, density=0.3)
+        terms = np.array([f"w{i}" for i in range(30)])
+        tokens = [[f"w{(d + i) % 30}" for i in range(8)] for d in range(40)]
+        submitted = []
+
+        def submit(fn, *args):
+            submitted.append(args[1])
+            return self.threads.submit(self.fake_fit, *args)
+
+        plan = {"backend": "batch", "workers": 2, "estimate_mb": 1.0}
+        for patience in (0, 2):
+            self.max_active = 0
+            submitted.clear()
+            with mock.patch.object(text_processing, "plan_nmf_fit", return_value=plan), \
+                    mock.patch("worker_pool.submit_to_workers", side_effect=submit):
+                best, _ = text_processing.sweep_nmf_k_grid(X, terms, tokens, [2, 3, 4, 5, 6, 7], 5, workers=8, patience=patience)
+            self.assertIsNotNone(best)
+            self.assertLessEqual(self.max_active, plan["workers"])
+            self.assertEqual(self.max_active, 2)
+        self.assertEqual(submitted[:2], [2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed topic model cache.
+
+The key must change whenever a document, the document order, the method or a
+setting changes, and a stored fit must be served back unchanged.
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import topic_cache
+from topic_cache import get_topic_result, store_topic_result, topic_cache_key
+
+
+class TestTopicCacheKey(unittest.TestCase):
+    """topic_cache_key invalidation."""
+
+    def setUp(self):
+        self.texts = ["first document about solar panels", "second document about wind turbines"]
+        self.settings = {"tfidf_min_df": 3, "tfidf_max_df": 0.7, "k_grid": [10, 15]}
+        self.key = topic_cache_key(self.texts, "system", self.settings)
+
+    def test_same_question_same_key(self):
+        self.assertEqual(self.key, topic_cache_key(list(self.texts), "system", dict(self.settings)))
+
+    def test_corpus_change_changes_key(self):
+        self.assertNotEqual(self.key, topic_cache_key(self.texts + ["third"], "system", self.settings))
+        self.assertNotEqual(self.key, topic_cache_key([self.texts[0], self.texts[1] + "!"], "system", self.settings))
+        self.assertNotEqual(self.key, topic_cache_key(self.texts[::-1], "system", self.settings))
+
+    def test_method_and_settings_change_key(self):
+        self.assertNotEqual(self.key, topic_cache_key(self.texts, "topicwizard_nmf", self.settings))
+        self.assertNotEqual(self.key, topic_cache_key(self.texts, "system", {**self.settings, "tfidf_min_df": 2}))
+
+
+class TestTopicCacheStore(unittest.TestCase):
+    """Storing and reading back fitted models."""
+
+    def setUp(self):
+        topic_cache.clear_topic_cache_memory()
+        self.W = np.array([[0.5, 0.0], [0.1, 0.9]])
+        self.H = np.array([[1.0, 0.0, 0.2], [0.0, 0.7, 0.3]])
+
+    def tearDown(self):
+        topic_cache.clear_topic_cache_memory()
+
+    def test_store_then_get_without_database(self):
+        with mock.patch.object(topic_cache, "_session", side_effect=RuntimeError("no database")):
+            self.assertIsNone(get_topic_result("k1"))
+            store_topic_result("k1", "system", ["solar", "wind", "grid"], self.W, self.H, labels=["solar", "wind"], meta={"k": 2})
+            cached = get_topic_result("k1")
+        self.assertEqual(cached["vocabulary"], ["solar", "wind", "grid"])
+        self.assertEqual(cached["labels"], ["solar", "wind"])
+        self.assertEqual(cached["meta"], {"k": 2})
+        np.testing.assert_array_equal(cached["W"], self.W)
+        np.testing.assert_array_equal(cached["H"], self.H)
+
+    def test_matrices_round_trip(self):
+        W, H = topic_cache._unpack_matrices(topic_cache._pack_matrices(self.W, self.H))
+        np.testing.assert_array_equal(W, self.W)
+        np.testing.assert_array_equal(H, self.H)
+        self.assertEqual(W.dtype, self.W.dtype)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental campaign topic modeling.
+
+Only documents new to the stored state should be folded in, and a full refit
+must be requested when settings change or too much of the corpus changed.
+"""
+
+import io
+import sys
+import os
+import unittest
+
+from unittest import mock
+
+import numpy as np
+import scipy.sparse as sp
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import topic_incremental
+from topic_incremental import (
+    StoredPhrases, pack_topic_state, plan_topic_update, relative_errors, smoothed_idf, tfidf_from_counts,
+    unpack_topic_state
+)
+
+try:
+    import sklearn  # noqa: F401
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+try:
+    import text_processing
+except Exception:
+    text_processing = None
+
+SOLAR = "solar panel roof inverter battery grid"
+FOOTBALL = "football match goal league striker stadium"
+
+
+def make_state(doc_hashes, folded=0):
+    return {
+        "settings_hash": "s1",
+        "doc_hashes": list(doc_hashes),
+        "docs_at_full_fit": len(doc_hashes),
+        "folded_since_full_fit": folded,
+    }
+
+
+class TestTopicUpdatePlan(unittest.TestCase):
+    """plan_topic_update decisions."""
+
+    def setUp(self):
+        self.hashes = [f"h{i}" for i in range(20)]
+        self.state = make_state(self.hashes)
+
+    def test_no_state_or_new_settings_is_full_refit(self):
+        self.assertEqual(plan_topic_update(None, self.hashes, "s1")["mode"], "full")
+        self.assertEqual(plan_topic_update(self.state, self.hashes, "s2")["mode"], "full")
+
+    def test_same_documents_in_any_order_is_unchanged(self):
+        self.assertEqual(plan_topic_update(self.state, self.hashes[::-1], "s1")["mode"], "unchanged")
+
+    def test_only_new_documents_are_folded_in(self):
+        plan = plan_topic_update(self.state, self.hashes + ["n1", "n2", "n1"], "s1")
+        self.assertEqual(plan["mode"], "incremental")
+        self.assertEqual(plan["new_indices"], [20, 21])
+        self.assertEqual(plan["removed"], 0)
+
+    def test_large_cumulative_change_forces_full_refit(self):
+        limit = int(topic_incremental.SYSTEM_MODEL_INCREMENTAL_MAX_CHANGE_FRACTION * len(self.hashes))
+        state = make_state(self.hashes, folded=limit)
+        self.assertEqual(plan_topic_update(state, self.hashes + ["n1"], "s1")["mode"], "full")
+        self.assertEqual(plan_topic_update(self.state, self.hashes[limit + 1:], "s1")["mode"], "full")
+
+
+class TestTfidfFromCounts(unittest.TestCase):
+    """TF-IDF rebuilt from stored counts."""
+
+    def test_matches_smooth_idf_and_l2_norm(self):
+        counts = sp.csr_matrix(np.array([[2, 0, 1], [0, 1, 1], [0, 0, 0]]))
+        idf = smoothed_idf(counts)
+        np.testing.assert_allclose(idf, np.log(4 / np.array([2, 2, 3])) + 1)
+        X = tfidf_from_counts(counts, idf).toarray()
+        np.testing.assert_allclose(np.linalg.norm(X[:2], axis=1), [1.0, 1.0])
+        np.testing.assert_array_equal(X[2], [0, 0, 0])
+
+    def test_relative_errors(self):
+        X = sp.csr_matrix(np.array([[1.0, 0.0], [0.6, 0.8], [0.0, 0.0]]))
+        H = np.array([[1.0, 0.0]])
+        W = np.array([[1.0], [0.6], [0.0]])
+        np.testing.assert_allclose(relative_errors(X, W, H), [0.0, 0.8, 0.0], atol=1e-12)
+
+
+class TestStoredState(unittest.TestCase):
+    """Storage form of the state."""
+
+    def test_stored_phrases_join_like_gensim(self):
+        phrases = StoredPhrases({"solar_panel": 12.0, "bank_of_america": 30.0, "wind_farm": 3.0}, 10.0, "_", ["of", "the"])
+        self.assertEqual(
+            phrases[["the", "solar", "panel", "bank", "of", "america", "wind", "farm", "of"]],
+            ["the", "solar_panel", "bank_of_america", "wind", "farm", "of"]
+        )
+
+    def test_pack_round_trip_without_pickle(self):
+        bigram = StoredPhrases({"solar_panel": 12.0}, 10.0, "_", ["of"])
+        state = dict(make_state(["h1", "h2"]), version=topic_incremental.TOPIC_STATE_VERSION, terms=["solar_panel", "wind"],
+                     bigram=bigram, trigram=StoredPhrases({}, 10.0), counts=sp.csr_matrix(np.array([[2, 0], [0, 3]])),
+                     W=np.array([[0.5], [0.25]]), H=np.array([[1.0, 2.0]], dtype=np.float32), labels=["Solar Panel"],
+                     k=1, coherence=0.4, baseline_error=0.1, baseline_oov=0.05)
+        blob = pack_topic_state(state)
+        with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+            self.assertIn("header", data.files)
+        restored = unpack_topic_state(blob)
+        np.testing.assert_array_equal(restored["counts"].toarray(), [[2, 0], [0, 3]])
+        np.testing.assert_array_equal(restored["H"], state["H"])
+        self.assertEqual(restored["H"].dtype, np.float32)
+        self.assertEqual(restored["doc_hashes"], ["h1", "h2"])
+        self.assertEqual(restored["labels"], ["Solar Panel"])
+        self.assertEqual(restored["bigram"][["solar", "panel"]], ["solar_panel"])
+
+    def test_unreadable_blob_is_missing_state(self):
+        import pickle
+        self.assertIsNone(unpack_topic_state(pickle.dumps({"version": 1})))
+
+
+def fitted_state(texts):
+    """State of a 2-topic full fit on texts (whitespace tokens, no phrases)"""
+    from sklearn.decomposition import NMF
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from topic_cache import document_hashes
+    docs_str = [" ".join(text.split()) for text in texts]
+    tfidf = TfidfVectorizer(strip_accents="unicode")
+    X = tfidf.fit_transform(docs_str)
+    nmf = NMF(n_components=2, init="nndsvd", random_state=0, max_iter=500)
+    W = nmf.fit_transform(X)
+    no_phrases = StoredPhrases({}, 10.0)
+    return topic_incremental.build_topic_state(
+        "s1", document_hashes(texts), no_phrases, no_phrases, docs_str, tfidf.get_feature_names_out(),
+        X, W, nmf.components_, 2, 0.5, ["solar", "football"]
+    )
+
+
+def corpus(n=6):
+    """n solar and n football pages, each a rotation of its topic's words"""
+    texts = []
+    for topic in (SOLAR, FOOTBALL):
+        words = topic.split()
+        texts.extend(" ".join(words[i:] + words[:i][:2]) for i in range(n))
+    return texts
+
+
+@unittest.skipUnless(SKLEARN_AVAILABLE, "sklearn not installed")
+class TestFoldInDocuments(unittest.TestCase):
+    """fold_in_documents against a real fitted state."""
+
+    def setUp(self):
+        from topic_cache import document_hashes
+        self.texts = corpus()
+        self.hashes = document_hashes(self.texts)
+        self.state = fitted_state(self.texts)
+        self.topic = {h: int(np.argmax(w)) for h, w in zip(self.hashes, self.state["W"])}
+
+    def fold(self, hashes, new_texts):
+        new_tokens = {hashes.index(h): text.split() for h, text in new_texts.items()}
+        return topic_incremental.fold_in_documents(self.state, hashes, new_tokens, random_state=0)
+
+    def test_new_documents_are_appended_in_corpus_order(self):
+        new_text = "inverter battery solar grid roof panel"
+        hashes = self.hashes + ["n1"]
+        updated = self.fold(hashes, {"n1": new_text})
+        self.assertIsNotNone(updated)
+        self.assertEqual(updated["doc_hashes"], hashes)
+        self.assertEqual(updated["W"].shape, (len(hashes), 2))
+        self.assertEqual(updated["counts"].shape, (len(hashes), len(self.state["terms"])))
+        self.assertEqual(updated["folded_since_full_fit"], 1)
+        self.assertIn("idf", updated)
+        solar_topic = self.topic[self.hashes[0]]
+        self.assertEqual(int(np.argmax(updated["W"][-1])), solar_topic)
+        for h, w in zip(self.hashes, updated["W"]):
+            self.assertEqual(int(np.argmax(w)), self.topic[h])
+
+    def test_removed_and_added_documents_keep_row_order(self):
+        kept = [self.hashes[7], self.hashes[0], self.hashes[3], self.hashes[10], self.hashes[5]]
+        hashes = kept[:2] + ["n1"] + kept[2:] + ["n2"]
+        updated = self.fold(hashes, {"n1": " ".join(reversed(FOOTBALL.split())), "n2": "roof solar grid battery inverter panel"})
+        self.assertIsNotNone(updated)
+        self.assertEqual(updated["doc_hashes"], hashes)
+        self.assertEqual(updated["W"].shape[0], len(hashes))
+        self.assertEqual(updated["folded_since_full_fit"], 2 + len(self.hashes) - len(kept))
+        row_of = {h: i for i, h in enumerate(self.hashes)}
+        for i, h in enumerate(hashes):
+            if h in row_of:
+                np.testing.assert_array_equal(updated["counts"][i].toarray(), self.state["counts"][row_of[h]].toarray())
+                self.assertEqual(int(np.argmax(updated["W"][i])), self.topic[h])
+        self.assertEqual(int(np.argmax(updated["W"][2])), self.topic[self.hashes[6]])
+        self.assertEqual(int(np.argmax(updated["W"][-1])), self.topic[self.hashes[0]])
+
+    def test_removal_only(self):
+        hashes = self.hashes[2:]
+        updated = self.fold(hashes, {})
+        self.assertEqual(updated["doc_hashes"], hashes)
+        self.assertEqual(updated["W"].shape[0], len(hashes))
+        np.testing.assert_array_equal(updated["counts"].toarray(), self.state["counts"][2:].toarray())
+
+    def test_out_of_vocabulary_pages_need_full_refit(self):
+        self.assertIsNone(self.fold(self.hashes + ["n1"], {"n1": "recipe flour oven butter sugar yeast"}))
+
+    def test_badly_explained_pages_need_full_refit(self):
+        self.state["baseline_error"] = 1e-6
+        self.assertIsNone(self.fold(self.hashes + ["n1"], {"n1": "solar football goal battery"}))
+
+
+@unittest.skipUnless(SKLEARN_AVAILABLE and text_processing is not None, "sklearn or text_processing dependencies not installed")
+class TestIncrementalSystemTopics(unittest.TestCase):
+    """_incremental_system_topics driven by the stored state."""
+
+    settings = {"K_GRID": [2]}
+
+    def setUp(self):
+        self.texts = corpus()
+        self.stored = {}
+        self.tokenized = []
+        state = fitted_state(self.texts)
+        state["settings_hash"] = topic_incremental.settings_fingerprint(self.settings)
+        self.stored["c1"] = state
+        patches = [
+            mock.patch.object(text_processing, "load_topic_state", side_effect=lambda cid: self.stored.get(cid)),
+            mock.patch.object(text_processing, "save_topic_state", side_effect=self.stored.__setitem__),
+            mock.patch.object(text_processing, "system_model_tokenize", side_effect=self.tokenize),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tokenize(self, texts, nlp=None):
+        self.tokenized.extend(texts)
+        return [text.split() for text in texts]
+
+    def topics(self, texts):
+        return text_processing._incremental_system_topics("c1", texts, self.settings, None, 5, 0)
+
+    def test_unchanged_corpus_reuses_stored_topics(self):
+        W, labels = self.topics(self.texts)
+        self.assertIs(W, self.stored["c1"]["W"])
+        self.assertEqual(labels, ["solar", "football"])
+        self.assertEqual(self.tokenized, [])
+
+    def test_only_new_pages_are_tokenized_and_state_is_saved(self):
+        texts = self.texts[1:] + ["inverter battery solar grid roof panel"]
+        W, labels = self.topics(texts)
+        self.assertEqual(self.tokenized, texts[-1:])
+        self.assertEqual(W.shape, (len(texts), 2))
+        self.assertEqual(len(labels), 2)
+        saved = self.stored["c1"]
+        self.assertNotIn("idf", saved)
+        self.assertEqual(saved["labels"], labels)
+        self.assertEqual(saved["folded_since_full_fit"], 2)
+        # The saved state is current: the same corpus again needs no work
+        self.tokenized.clear()
+        W_again, _ = self.topics(texts)
+        self.assertIs(W_again, saved["W"])
+        self.assertEqual(self.tokenized, [])
+
+    def test_drift_or_missing_state_falls_back_to_full_refit(self):
+        state = self.stored["c1"]
+        self.assertEqual(self.topics(self.texts + ["recipe flour oven butter sugar yeast"]), (None, None))
+        self.assertIs(self.stored["c1"], state)
+        self.stored.clear()
+        self.assertEqual(self.topics(self.texts), (None, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
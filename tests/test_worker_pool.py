@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared worker process pool.
+
+Requests must reuse one pool instead of starting their own, results must keep input
+order, and a pool whose workers died must be replaced on the next call.
+"""
+
+import sys
+import os
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import worker_pool
+from worker_pool import get_worker_pool, map_in_workers, shutdown_worker_pool, submit_to_workers
+
+
+class TestWorkerPool(unittest.TestCase):
+    """Pool reuse, ordering and recovery."""
+
+    def setUp(self):
+        patch = mock.patch.object(worker_pool, "WORKER_POOL_SIZE", "2")
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.addCleanup(shutdown_worker_pool)
+
+    def test_calls_share_one_pool_and_keep_order(self):
+        self.assertEqual(map_in_workers(pow, [2, 3, 4, 5, 6], [2] * 5), [4, 9, 16, 25, 36])
+        pool = get_worker_pool()
+        self.assertEqual(submit_to_workers(pow, 2, 10).result(), 1024)
+        self.assertEqual(map_in_workers(abs, [-1, -2], workers=8), [1, 2])
+        self.assertIs(get_worker_pool(), pool)
+
+    def test_broken_pool_is_replaced(self):
+        broken = mock.Mock()
+        broken.map.side_effect = BrokenProcessPool("worker died")
+        with mock.patch.object(worker_pool, "_pool", broken):
+            with self.assertRaises(BrokenProcessPool):
+                map_in_workers(abs, [-1])
+            self.assertIsNone(worker_pool._pool)
+        broken.shutdown.assert_called_once()
+        self.assertEqual(map_in_workers(abs, [-3]), [3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,9 @@
 from pydantic import BaseModel
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set
 import nltk
 from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer, PorterStemmer
 from nltk.corpus import stopwords
-from nltk import pos_tag, ne_chunk
 # Gensim is optional - only needed for system model topic extraction
 try:
     import gensim
@@ -17,10 +16,13 @@ except ImportError:
     GENSIM_AVAILABLE_TOP_LEVEL = False
     logger.warning("⚠️ Gensim not available at module level - system model topic extraction will not work")
 from collections import Counter
+from functools import lru_cache
 import numpy as np
 import logging
 import os
 import json
+import re
+import time
 
 from openai_model_config import get_openai_default_model
 
@@ -62,27 +64,34 @@ except ImportError:
     BERTOPIC_AVAILABLE = False
     logger.warning("⚠️ BERTopic not available - bertopic_model function will not work")
 
-# Ensure NLTK resources are downloaded
-try:
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/wordnet')
-    nltk.data.find('chunkers/maxent_ne_chunker')
-    nltk.data.find('corpora/words')
-    nltk.data.find('taggers/averaged_perceptron_tagger')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
-    nltk.download('punkt', quiet=True)
-    nltk.download('wordnet', quiet=True)
-    nltk.download('maxent_ne_chunker', quiet=True)
-    nltk.download('words', quiet=True)
-    nltk.download('averaged_perceptron_tagger', quiet=True)
+# NLTK resources are downloaded by the model registry's NLTK loader (on first use or at
+# startup warmup, see nlp_models.py), never at import
+from entity_extraction import extract_entities  # noqa: F401 - re-exported; entity workers import entity_extraction directly
+from nlp_models import get_model_registry, get_spacy_nlp, BERTOPIC_EMBEDDING_MODEL_NAME, SPACY_MODEL_NAME
+from term_counts import campaign_term_totals, corpus_term_totals
+from topic_backend import backend_settings, fit_nmf_candidate, make_nmf, make_tfidf_vectorizer, plan_nmf_fit
+from topic_cache import document_hashes, get_topic_result, store_topic_result, topic_cache_key
+from topic_incremental import (
+    SYSTEM_MODEL_INCREMENTAL_ENABLED, build_topic_state, fold_in_documents, load_topic_state,
+    plan_topic_update, save_topic_state, settings_fingerprint,
+)
 
 lemmatizer = WordNetLemmatizer()
 stemmer = PorterStemmer()
 # Domain-specific stop words
 additional_stopwords = ['tools', 'tasks', 'include', 'agents', 'like', 'roles', 'http', 'https', 'www', 'crewai', 'defined', 'agent', 'web', 'content', 'various', 'engaging', 'existing']
-stop_words = set(stopwords.words('english')) | set(additional_stopwords)
+
+
+def _nltk_models() -> Dict:
+    """NLTK stopwords/lemmatizer from the model registry (its loader downloads missing resources once)"""
+    return get_model_registry().get("nltk") or {"stopwords": set(stopwords.words('english')), "lemmatizer": lemmatizer}
+
+
+@lru_cache(maxsize=1)
+def get_stop_words() -> Set[str]:
+    """NLTK English stopwords + additional_stopwords"""
+    return _nltk_models()["stopwords"] | set(additional_stopwords)
+
 
 class Post(BaseModel):
     text: str
@@ -105,11 +114,13 @@ class ProcessedPosts(BaseModel):
     posts: List[ProcessedPost]
 
 def lemmatize_text(text: str) -> str:
+    _nltk_models()
     words = word_tokenize(text)
     lemmatized_words = [lemmatizer.lemmatize(word) for word in words]
     return ' '.join(lemmatized_words)
 
 def stem_text(text: str) -> str:
+    _nltk_models()
     words = word_tokenize(text)
     stemmed_words = [stemmer.stem(word) for word in words]
     return ' '.join(stemmed_words)
@@ -201,376 +212,30 @@ Context:
     return default_prompt
 
 def remove_stopwords(text: str) -> str:
+    stop_words = get_stop_words()
     words = word_tokenize(text)
     filtered_words = [word for word in words if word.lower() not in stop_words]
     return ' '.join(filtered_words)
 
-def extract_entities(text: str, extract_persons: bool, extract_organizations: bool, extract_locations: bool, extract_dates: bool, 
-                     extract_money: bool = False, extract_percent: bool = False, extract_time: bool = False, extract_facility: bool = False) -> Dict[str, List[str]]:
-    import re
-    entities = {
-        'persons': [],
-        'organizations': [],
-        'locations': [],
-        'dates': [],
-        'money': [],
-        'percent': [],
-        'time': [],
-        'facility': []
-    }
-    if not any([extract_persons, extract_organizations, extract_locations, extract_dates, extract_money, extract_percent, extract_time, extract_facility]):
-        return entities
-
-    # Extract NLTK entities (PERSON, ORGANIZATION, GPE, DATE)
-    try:
-        words = word_tokenize(text)
-        pos_tags = pos_tag(words)
-        # Use binary=False to get detailed entity types (PERSON, ORGANIZATION, GPE, etc.)
-        chunks = ne_chunk(pos_tags, binary=False)
-    except Exception as e:
-        logger.warning(f"NLTK entity extraction failed: {e}, using regex fallback only")
-        chunks = []
-
-    for chunk in chunks:
-        if hasattr(chunk, 'label'):
-            entity_type = chunk.label()
-            entity_text = ' '.join(c[0] for c in chunk)
-            if entity_type == 'PERSON' and extract_persons:
-                # Filter out software names, UI elements, and product names
-                entity_lower = entity_text.lower()
-                entity_words = entity_text.split()
-                
-                software_ui_indicators = [
-                    'microsoft', 'word', 'excel', 'powerpoint', 'outlook', 'windows', 'macintosh', 'apple', 'mac',
-                    'google', 'chrome', 'firefox', 'safari', 'edge', 'internet', 'explorer', 'browser',
-                    'edit', 'view', 'file', 'insert', 'format', 'tools', 'table', 'help', 'developer',
-                    'initial', 'predecessor', 'multi', 'type', 'license', 'trialware', 'website', 'tool',
-                    'share', 'print', 'save', 'open', 'close', 'new', 'copy', 'paste', 'cut',
-                    'office', 'media', 'unix', 'independent', 'wikimedia', 'foundation', 'project', 'wikipedia',
-                    'regular', 'guys', 'built', 'wordperfect', 'eclectic', 'light', 'digital', 'writing'
-                ]
-                
-                # Additional validation: Person names should be 2-4 words, both capitalized
-                # Skip single words (too ambiguous)
-                if len(entity_words) == 1:
-                    continue
-                
-                # Skip if any word is a software/UI indicator
-                if any(word.lower() in software_ui_indicators for word in entity_words):
-                    continue
-                
-                # Skip if it's clearly software/UI (contains indicators)
-                if any(indicator in entity_lower for indicator in software_ui_indicators):
-                    continue
-                
-                # Skip if it's a common phrase pattern (not a name)
-                common_phrases = [
-                    'edit view', 'tool word', 'type word', 'license trialware', 'microsoft word', 'apple macintosh',
-                    # UI instruction phrases
-                    'to how', 'duplicate pages', 'page document if', 'press ctrl', 'blank page', 'page break',
-                    'different document you', 'sub duplicate', 'enter number', 'place your cursor', 'want to duplicate',
-                    'min read', 'page you want', 'select all', 'copy paste'
-                ]
-                if entity_lower in common_phrases:
-                    continue
-                
-                # Additional check: skip if it contains instruction words that make it clearly not a name
-                instruction_words = ['to', 'how', 'duplicate', 'page', 'pages', 'document', 'if', 'press', 'ctrl', 'blank',
-                                   'break', 'different', 'you', 'sub', 'enter', 'number', 'place', 'your', 'cursor',
-                                   'want', 'min', 'read', 'select', 'copy', 'paste', 'open', 'close', 'save', 'print']
-                # If more than half the words are instruction words, it's probably not a name
-                instruction_count = sum(1 for word in entity_words if word.lower() in instruction_words)
-                if instruction_count > len(entity_words) * 0.5:
-                    continue
-                
-                entities['persons'].append(entity_text)
-            elif entity_type == 'ORGANIZATION' and extract_organizations:
-                # Filter out invalid organization entries
-                entity_lower = entity_text.lower()
-                entity_words = entity_text.split()
-                
-                # Skip if it contains person names or locations incorrectly labeled as organizations
-                invalid_org_indicators = [
-                    'louisville', 'muhammad', 'ali',  # Person name + location
-                    'regular guys built wordperfect',  # Phrase, not an organization
-                    'the eclectic light',  # Publication name, may be valid but let's be strict
-                ]
-                # Skip if it contains person names
-                if any(indicator in entity_lower for indicator in invalid_org_indicators):
-                    continue
-                
-                # Skip if it's a single generic word like "Office", "Media", "Independent" (but allow "Microsoft", "Apple", etc.)
-                if len(entity_words) == 1:
-                    generic_words = ['office', 'media', 'independent', 'digital', 'writing', 'page', 'document', 'document', 'tool', 'website']
-                    known_orgs = ['microsoft', 'apple', 'google', 'amazon', 'meta', 'facebook', 'twitter', 'linkedin', 'nvidia', 'intel', 'amd']
-                    if entity_lower in generic_words and entity_lower not in known_orgs:
-                        continue
-                
-                # Skip if it's a UI instruction phrase
-                instruction_words = ['to', 'how', 'duplicate', 'page', 'pages', 'document', 'if', 'press', 'ctrl', 'blank',
-                                   'break', 'different', 'you', 'sub', 'enter', 'number', 'place', 'your', 'cursor',
-                                   'want', 'min', 'read', 'select', 'copy', 'paste', 'open', 'close', 'save', 'print']
-                instruction_count = sum(1 for word in entity_words if word.lower() in instruction_words)
-                if instruction_count > len(entity_words) * 0.5:
-                    continue
-                
-                entities['organizations'].append(entity_text)
-            # NLTK sometimes labels organizations as GPE, so check for organization indicators
-            elif entity_type == 'GPE':
-                # Check if it's likely an organization (contains org words)
-                if extract_organizations:
-                    org_indicators = ['Corp', 'Corporation', 'Inc', 'LLC', 'Ltd', 'Company', 'University', 'College', 'School', 'Hospital', 'Foundation', 'Institute', 'Organization', 'Association']
-                    if any(indicator in entity_text for indicator in org_indicators):
-                        entities['organizations'].append(entity_text)
-                    elif extract_locations:
-                        # If not an organization, it's a location
-                        entities['locations'].append(entity_text)
-                elif extract_locations:
-                    entities['locations'].append(entity_text)
-            elif entity_type == 'DATE' and extract_dates:
-                entities['dates'].append(entity_text)
-            # NLTK sometimes labels facilities as ORGANIZATION, but we'll use regex for better coverage
-            elif entity_type == 'FACILITY' and extract_facility:
-                entities['facility'].append(entity_text)
-    
-    # Enhanced organization extraction using regex (for organizations NLTK might miss)
-    if extract_organizations:
-        org_patterns = [
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Corp|Corporation|Inc|LLC|Ltd|Company|Co|Industries|International|Group|Systems|Technologies|Solutions)\b',
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:University|College|School|Institute|Academy|Foundation|Association|Society|Organization|Agency|Department|Bureau)\b',
-            r'\b(?:The\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Hospital|Clinic|Medical Center|Bank|Trust|Fund)\b',
-        ]
-        for pattern in org_patterns:
-            org_matches = re.findall(pattern, text)
-            for match in org_matches:
-                if isinstance(match, tuple):
-                    match = match[0] if match[0] else match[1]
-                # Exclude common non-org words
-                if match and match not in {'The', 'A', 'An', 'United', 'States'} and match not in entities['organizations']:
-                    entities['organizations'].append(match)
-    
-    # Enhanced date extraction using regex (for dates NLTK might miss)
-    # Only extract complete dates: Month + Year or Month + Day + Year
-    if extract_dates:
-        # Comprehensive date patterns - only complete dates (non-capturing groups to avoid fragments)
-        date_patterns = [
-            # Month Day, Year (e.g., "January 15, 2024", "Jan 15 2024")
-            r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4}\b',
-            # Month Year (e.g., "January 2024", "Jan 2024")
-            r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b',
-            # MM/DD/YYYY or DD-MM-YYYY (e.g., "01/15/2024", "15-01-2024")
-            r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b',
-            # YYYY/MM/DD (e.g., "2024/01/15")
-            r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',
-            # Ordinal dates (e.g., "15th of January 2024", "the 15th of January 2024")
-            r'\b(?:the\s+)?\d{1,2}(?:st|nd|rd|th)\s+(?:of\s+)?(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b',
-            # Years with context (e.g., "in 2024", "2024.", "(2024)")
-            r'\b(?:in\s+|the\s+year\s+)?(19\d{2}|20\d{2})(?:\s|$|\.|,|;|\)|\])\b',
-        ]
-        
-        # Extract all date matches
-        all_date_matches = []
-        for pattern in date_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match_obj in matches:
-                full_match = match_obj.group(0).strip('.,;()[]')
-                # Validate: must be at least 7 characters (e.g., "Jan 2024") or a 4-digit year
-                if len(full_match) >= 4:
-                    # Filter out fragments: must contain either a complete month name or be a 4-digit year
-                    full_match_lower = full_match.lower()
-                    valid_months = ['january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october', 'november', 'december', 'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-                    
-                    # Check if it contains a valid month name or is a 4-digit year
-                    has_valid_month = any(month in full_match_lower for month in valid_months)
-                    is_year_only = re.match(r'^\d{4}$', full_match)
-                    
-                    if has_valid_month or is_year_only:
-                        # Exclude fragments: only reject if it's a standalone fragment (not part of a valid month)
-                        invalid_fragments = ['ober', 'uary', 'ember', 'tember', 'ruary']
-                        # Only reject if the match IS a fragment (not if it contains a valid month)
-                        if has_valid_month:
-                            # If it contains a valid month, it's not a fragment - accept it
-                            all_date_matches.append(full_match)
-                        elif is_year_only:
-                            # Standalone year - accept it
-                            all_date_matches.append(full_match)
-                        else:
-                            # Check if it's a standalone fragment (not part of a valid date)
-                            if not any(fragment == full_match_lower for fragment in invalid_fragments):
-                                all_date_matches.append(full_match)
-        
-        # Remove duplicates and add to entities
-        for date in dict.fromkeys(all_date_matches):  # Preserves order while removing duplicates
-            if date not in entities['dates']:
-                entities['dates'].append(date)
-    
-    # Pattern-based extraction for better coverage (especially for titles and short texts)
-    if extract_persons:
-        # Pattern: Capitalized word(s) that look like names (First Last, First Middle Last)
-        # Common name patterns: "John Smith", "Mary-Jane Watson", "O'Brien"
-        name_pattern = r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2}\b'
-        # Exclude common capitalized words that aren't names
-        exclude_words = {
-            'The', 'A', 'An', 'In', 'On', 'At', 'For', 'With', 'From', 'To', 'Of', 'And', 'Or', 'But', 'As', 'By',
-            'War', 'Prisoner', 'Escape', 'Camp', 'Life', 'Liberation', 'Discover', 'Earn', 'Points', 'Support',
-            'Login', 'Vietnam', 'United', 'States', 'America', 'World', 'Documentary', 'Mini', 'Series', 'Trailer',
-            'English', 'General', 'Seasons', 'Brasil', 'Crew', 'Artwork', 'Lists', 'Changed',
-            'Article', 'Talk', 'Read', 'Tools', 'Appearance', 'Text', 'Small', 'Standard', 'Large', 'Width',
-            'Wide', 'Color', 'Automatic', 'Light', 'Dark', 'From', 'Wikipedia', 'Nathu', 'La', 'Cho', 'Indochina', 'Wars',
-            # Software and product names
-            'Microsoft', 'Word', 'Excel', 'PowerPoint', 'Outlook', 'Windows', 'Macintosh', 'Apple', 'Mac', 'iOS', 'Android',
-            'Google', 'Chrome', 'Firefox', 'Safari', 'Edge', 'Internet', 'Explorer', 'Opera', 'Browser',
-            'Edit', 'View', 'File', 'Insert', 'Format', 'Tools', 'Table', 'Help', 'Developer', 'Initial', 'Predecessor',
-            'Multi', 'Type', 'License', 'Trialware', 'Website', 'Tool', 'Office', 'Media', 'Unix', 'Independent',
-            'Wikimedia', 'Foundation', 'Project', 'Wikipedia', 'Meta',
-            # UI elements and actions
-            'Share', 'Print', 'Save', 'Open', 'Close', 'New', 'Copy', 'Paste', 'Cut', 'Undo', 'Redo', 'Find', 'Replace',
-            'Select', 'All', 'None', 'Zoom', 'In', 'Out', 'Fit', 'Page', 'Width', 'Actual', 'Size',
-            'Font', 'Size', 'Bold', 'Italic', 'Underline', 'Strikethrough', 'Subscript', 'Superscript',
-            'Align', 'Left', 'Center', 'Right', 'Justify', 'Bullet', 'Number', 'List', 'Indent', 'Decrease', 'Increase',
-            # Common phrases that look like names
-            'Regular', 'Guys', 'Built', 'Wordperfect', 'Eclectic', 'Light',
-            # UI instruction words
-            'To', 'How', 'Duplicate', 'Pages', 'Page', 'Document', 'If', 'Press', 'Ctrl', 'Blank', 'Break',
-            'Different', 'You', 'Sub', 'Enter', 'Number', 'Select', 'Place', 'Your', 'Cursor', 'Want', 'Min', 'Read'
-        }
-        # Common non-name patterns (articles, titles, UI elements, software names, instructions, etc.)
-        non_name_patterns = [
-            r'\b(Discover|Support|Login|Earn|Points|The War|That|Changed|America|Brasil|General|Seasons|Crew|Artwork|Lists|Documentary|Mini|Series|United States|English Trailer)\b',
-            r'\b[A-Z][a-z]+\s+(Earn|Points|Login|Support|War|That|Changed|America)\b',
-            r'\b(The|A|An)\s+[A-Z][a-z]+\s+[A-Z][a-z]+\b',  # Articles before capitalized words
-            r'\b(Article|Talk|Read|Tools|Appearance|Text|Small|Standard|Large|Width|Wide|Color|Automatic|Light|Dark|From|Wikipedia)\s+[A-Z][a-z]+\b',  # UI elements
-            r'\b[A-Z][a-z]+\s+(Talk|Read|Tools|Appearance|Text|Small|Standard|Large|Width|Wide|Color)\b',  # UI patterns
-            r'\b(Nathu|Cho)\s+La\b',  # Geographic locations
-            r'\bIndochina\s+Wars\b',  # Historical events
-            # Software and product names
-            r'\b(Microsoft|Apple|Google|Windows|Macintosh|Mac|Word|Excel|PowerPoint|Outlook|Chrome|Firefox|Safari|Edge|Internet|Explorer)\s+[A-Z][a-z]+\b',
-            r'\b[A-Z][a-z]+\s+(Word|Excel|PowerPoint|Outlook|Windows|Macintosh|Mac|Chrome|Firefox|Safari|Edge|Explorer|Browser|Office|Media|Unix|Developer|Initial|Predecessor|Multi|Type|License|Trialware|Website|Tool)\b',
-            r'\b(Edit|View|File|Insert|Format|Tools|Table|Help|Share|Print|Save|Open|Close|New|Copy|Paste|Cut)\s+[A-Z][a-z]+\b',
-            r'\b[A-Z][a-z]+\s+(Edit|View|File|Insert|Format|Tools|Table|Help|Share|Print|Save|Open|Close|New|Copy|Paste|Cut)\b',
-            # Software-specific patterns
-            r'\b(Microsoft|Word|Microsoft Word|Edit View|Tool Word|Developer|Type Word|License Trialware|Website)\b',
-            r'\b(Apple|Macintosh|Mac|iOS|Android|Google|Chrome|Firefox|Safari|Edge|Browser)\b',
-            # Common non-name phrases
-            r'\b(Regular|Guys|Built|Wordperfect|Eclectic|Light)\s+[A-Z][a-z]+\b',
-            r'\b[A-Z][a-z]+\s+(Regular|Guys|Built|Wordperfect|Eclectic|Light)\b',
-            # UI instruction patterns (common in tutorials)
-            r'\b(To|How)\s+[A-Z][a-z]+\b',  # "To How", "To Duplicate"
-            r'\b(To|How)\s+[A-Z][a-z]+\s+[A-Z][a-z]+\b',  # "To Duplicate Pages"
-            r'\b(Duplicate|Select|Enter|Press|Place|Want)\s+(Pages?|Ctrl|Number|Cursor|Your|To)\b',  # "Duplicate Pages", "Press Ctrl", "Enter Number"
-            r'\b(Blank|Page|Document|Break|Different)\s+(Page|Document|You|If)\b',  # "Blank Page", "Page Document", "Page Break"
-            r'\b(Page|Document|Press|Ctrl|Enter|Place|Cursor|Select)\s+(Document|If|Ctrl|Number|Your|All|Text)\b',  # "Page Document", "Press Ctrl", "Place Your"
-            r'\b(Min|Read|Sub|Duplicate)\s+(Read|Duplicate|Enter)\b',  # "Min Read", "Sub Duplicate"
-            r'\b[A-Z][a-z]+\s+(Page|Document|Ctrl|Number|Cursor|Read|Duplicate)\b',  # "Want To Duplicate", "Place Your Cursor"
-            r'\b(Windows|Command)\s+(Or|Command)\b',  # "(windows) or command"
-        ]
-        
-        name_matches = re.findall(name_pattern, text)
-        for match in name_matches:
-            # Skip if it matches non-name patterns
-            if any(re.search(pattern, match, re.IGNORECASE) for pattern in non_name_patterns):
-                continue
-            # Exclude if it's a common word or if it's already found by NLTK
-            words_in_match = match.split()
-            if match not in exclude_words and match not in entities['persons']:
-                # If it's two words (First Last), it's likely a name
-                # Additional validation: both words should be proper nouns (capitalized)
-                if len(words_in_match) >= 2:
-                    # Check that both words are capitalized (proper nouns)
-                    if all(word[0].isupper() and word[1:].islower() for word in words_in_match):
-                        # Additional check: not common title/UI/software words
-                        common_non_names = {
-                            'the', 'war', 'that', 'changed', 'america', 'support', 'login', 'earn', 'points',
-                            'article', 'talk', 'read', 'tools', 'appearance', 'text', 'small', 'standard', 'large',
-                            'width', 'wide', 'color', 'automatic', 'light', 'dark', 'from', 'wikipedia', 'nathu',
-                            'cho', 'la', 'indochina', 'wars', 'vietnam', 'united', 'states', 'world', 'documentary',
-                            # Software and product names
-                            'microsoft', 'word', 'excel', 'powerpoint', 'outlook', 'windows', 'macintosh', 'apple', 'mac',
-                            'google', 'chrome', 'firefox', 'safari', 'edge', 'internet', 'explorer', 'browser',
-                            'edit', 'view', 'file', 'insert', 'format', 'table', 'help', 'developer', 'initial',
-                            'predecessor', 'multi', 'type', 'license', 'trialware', 'website', 'tool', 'office',
-                            'media', 'unix', 'independent', 'wikimedia', 'foundation', 'project', 'regular', 'guys',
-                            'built', 'wordperfect', 'eclectic', 'light',
-                            # UI instruction words
-                            'to', 'how', 'duplicate', 'page', 'pages', 'document', 'if', 'press', 'ctrl', 'blank',
-                            'break', 'different', 'you', 'sub', 'enter', 'number', 'place', 'your', 'cursor',
-                            'want', 'min', 'read', 'select', 'copy', 'paste', 'open', 'close', 'save', 'print'
-                        }
-                        if not any(word.lower() in common_non_names for word in words_in_match):
-                            entities['persons'].append(match)
-    
-    if extract_locations:
-        # DO NOT extract nationalities as locations - they are adjectives, not places
-        # Only extract actual place names (cities, countries, regions, etc.)
-        # Nationalities are filtered out because they're not actionable locations
-        
-        # Pattern for actual place names: Capitalized place names (cities, countries, regions)
-        # This should be primarily handled by NLTK's GPE (Geopolitical Entity) recognition above
-        # Additional regex patterns for place names that might be missed
-        place_patterns = [
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:City|State|Province|Country|Region|Island|Islands|Republic|Kingdom|Empire)\b',
-            r'\b(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:River|Mountain|Lake|Bay|Sea|Ocean|Gulf|Strait)\b',
-        ]
-        
-        for pattern in place_patterns:
-            place_matches = re.findall(pattern, text)
-            for match in place_matches:
-                if isinstance(match, tuple):
-                    match = match[0] if match[0] else match[1]
-                # Exclude common non-place words
-                if match not in {'The', 'A', 'An', 'United', 'States', 'America'} and match not in entities['locations']:
-                    entities['locations'].append(match)
-        
-        # Note: Nationalities like "American", "British", "Vietnamese" are NOT added as locations
-        # They are adjectives describing people, not actual places
-    
-    # Extract money values using regex
-    if extract_money:
-        money_pattern = r'\$[\d,]+(?:\.\d{2})?|[\d,]+(?:\.\d{2})?\s*(?:dollars|USD|EUR|€|£|GBP|yen|JPY)'
-        money_matches = re.findall(money_pattern, text, re.IGNORECASE)
-        entities['money'].extend(money_matches)
-    
-    # Extract percentages using regex
-    if extract_percent:
-        percent_pattern = r'\d+(?:\.\d+)?%'
-        percent_matches = re.findall(percent_pattern, text)
-        entities['percent'].extend(percent_matches)
-    
-    # Extract time expressions using regex
-    if extract_time:
-        time_pattern = r'\b(?:0?[1-9]|1[0-2]):[0-5][0-9]\s*(?:AM|PM|am|pm)|(?:0?[0-9]|1[0-9]|2[0-3]):[0-5][0-9]\b|(?:noon|midnight|midday)'
-        time_matches = re.findall(time_pattern, text, re.IGNORECASE)
-        entities['time'].extend(time_matches)
-    
-    # Extract facilities using regex (buildings, hospitals, landmarks)
-    if extract_facility:
-        # Common facility patterns
-        facility_patterns = [
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Hospital|Clinic|Medical Center|University|College|School|Building|Tower|Center|Centre|Museum|Library|Stadium|Arena|Theater|Theatre|Airport|Station)',
-            r'\b(?:The\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Building|Tower|Center|Centre)',
-        ]
-        for pattern in facility_patterns:
-            facility_matches = re.findall(pattern, text)
-            entities['facility'].extend(facility_matches)
-    
-    return entities
-
 def preprocess_text(text: str, aggressive: bool = False) -> List[str]:
+    stop_words = get_stop_words()
     words = word_tokenize(text.lower())
     filtered_words = [lemmatizer.lemmatize(word) for word in words if word.isalnum() and (not aggressive or word not in stop_words)]
     return filtered_words if filtered_words else ['empty']
 
-def extract_keywords(texts: List[str], num_keywords: int) -> List[str]:
-    all_words = []
-    for text in texts:
-        words = preprocess_text(text, aggressive=True)
-        all_words.extend(words)
-    all_words = [word for word in all_words if word != 'empty']
-    if not all_words:
+def extract_keywords(texts: List[str], num_keywords: int, campaign_id: Optional[str] = None) -> List[str]:
+    """
+    Most frequent non-stopword lemmas of a corpus
+
+    Sums the documents' stored term-count vectors (term_counts.py) instead of
+    re-tokenizing the texts; with a campaign_id the campaign's running totals are used.
+    """
+    totals = campaign_term_totals(campaign_id, texts) if campaign_id else corpus_term_totals(texts)
+    keyword_counts = totals.get("keywords")
+    if keyword_counts is None or not len(keyword_counts):
         logger.warning("No valid words for keyword extraction")
         return []
-    word_counts = Counter(all_words)
-    top_keywords = [word for word, _ in word_counts.most_common(num_keywords)]
+    top_keywords = [word for word, _ in keyword_counts.top(num_keywords)]
     logger.info(f"Extracted {len(top_keywords)} keywords: {top_keywords}")
     return top_keywords
 
@@ -599,7 +264,9 @@ def bertopic_model(texts: List[str], num_topics: int) -> List[List[str]]:
         logger.error("BERTopic is not available - cannot use bertopic_model")
         return []
     try:
-        model = BERTopic(nr_topics=num_topics, min_topic_size=1, embedding_model="all-MiniLM-L6-v2")
+        # Shared embedding model from the registry; BERTopic loads it by name if that failed
+        embedding_model = get_model_registry().get("bertopic_embeddings") or BERTOPIC_EMBEDDING_MODEL_NAME
+        model = BERTopic(nr_topics=num_topics, min_topic_size=1, embedding_model=embedding_model)
         topics, probs = model.fit_transform(texts)
         topic_info = model.get_topic_info()
         topic_info = topic_info[topic_info['Topic'] != -1].sort_values(by='Count', ascending=False)
@@ -614,10 +281,10 @@ def nmf_model(texts: List[str], num_topics: int, iterations: int) -> List[List[s
         logger.error("NMF model requires sklearn, which is not available")
         return []
     try:
-        vectorizer = TfidfVectorizer(max_df=1.0, min_df=1)
+        vectorizer = make_tfidf_vectorizer(max_df=1.0, min_df=1)
         tfidf = vectorizer.fit_transform(texts)
         num_topics = min(num_topics, tfidf.shape[0])
-        nmf = NMF(n_components=num_topics, random_state=42, max_iter=iterations)
+        nmf = make_nmf(num_topics, plan_nmf_fit(tfidf, num_topics)["backend"], random_state=42, max_iter=iterations, init=None)
         W = nmf.fit_transform(tfidf)
         topic_sums = np.sum(W, axis=0)
         top_indices = np.argsort(topic_sums)[::-1][:num_topics]
@@ -632,7 +299,7 @@ def lsa_model(texts: List[str], num_topics: int, iterations: int) -> List[List[s
         logger.error("LSA model requires sklearn, which is not available")
         return []
     try:
-        vectorizer = TfidfVectorizer(max_df=1.0, min_df=1)
+        vectorizer = make_tfidf_vectorizer(max_df=1.0, min_df=1)
         tfidf = vectorizer.fit_transform(texts)
         num_topics = min(num_topics, tfidf.shape[0])
         lsa = TruncatedSVD(n_components=num_topics, n_iter=iterations, random_state=42)
@@ -647,10 +314,378 @@ def lsa_model(texts: List[str], num_topics: int, iterations: int) -> List[List[s
 
 import re
 
-def system_model_topics(texts: List[str], num_topics: int, query: str = "", keywords: List[str] = [], urls: List[str] = []) -> List[str]:
+# spaCy tokenization for the system model: documents are streamed through nlp.pipe in
+# batches (optionally across worker processes) instead of one nlp(text) call per page
+SPACY_PIPE_BATCH_SIZE = int(os.getenv("SPACY_PIPE_BATCH_SIZE", "32"))
+# Worker processes for nlp.pipe; "auto" = up to 4 (one core left free) for corpora above SPACY_PIPE_MIN_PARALLEL_CHARS
+SPACY_PIPE_N_PROCESS = os.getenv("SPACY_PIPE_N_PROCESS", "auto")
+SPACY_PIPE_MIN_PARALLEL_CHARS = int(os.getenv("SPACY_PIPE_MIN_PARALLEL_CHARS", str(2_000_000)))  # Process start-up isn't worth it below this
+SPACY_MAX_CHUNK_CHARS = int(os.getenv("SPACY_MAX_CHUNK_CHARS", str(100_000)))  # Longer documents are split at paragraph/sentence/word breaks
+
+# Pipes the topic tokens depend on (POS tags + lemmas); everything else is skipped
+SPACY_TOPIC_PIPES = ("tok2vec", "tagger", "morphologizer", "attribute_ruler", "lemmatizer")
+SPACY_TOPIC_POS = ("NOUN", "PROPN", "VERB", "ADJ", "ADV")
+
+_CHUNK_BREAKS = ("\n\n", "\n", ". ", " ")
+
+
+def split_text_chunks(text: str, max_chars: int = SPACY_MAX_CHUNK_CHARS) -> List[str]:
+    """
+    Split a long document into pieces of at most max_chars
+
+    Cuts at the last paragraph break in the window, else line break, sentence end
+    or space (hard cut only if there is none), so words are never split. Texts
+    within the limit are returned unchanged as a single chunk.
+    """
+    if max_chars <= 0 or len(text) <= max_chars:
+        return [text]
+    chunks = []
+    start = 0
+    while len(text) - start > max_chars:
+        window_end = start + max_chars
+        cut = -1
+        for brk in _CHUNK_BREAKS:
+            pos = text.rfind(brk, start + 1, window_end)
+            if pos != -1:
+                cut = pos + len(brk)
+                break
+        if cut <= start:
+            cut = window_end
+        chunks.append(text[start:cut])
+        start = cut
+    chunks.append(text[start:])
+    return chunks
+
+
+def _topic_lemmas(doc) -> List[str]:
+    """Lemmas of the content words in a spaCy Doc (nouns/verbs/adjectives/adverbs)"""
+    toks = []
+    for tok in doc:
+        if tok.is_punct or tok.is_space or tok.like_num:
+            continue
+        lemma = tok.lemma_.lower().strip()
+        if not lemma or len(lemma) < 2:
+            continue
+        # Keep nouns/verbs/adjectives/adverbs (most meaningful for topics)
+        if tok.pos_ in SPACY_TOPIC_POS:
+            toks.append(lemma)
+    return toks
+
+
+def _spacy_n_process(total_chars: int) -> int:
+    if SPACY_PIPE_N_PROCESS != "auto":
+        try:
+            return max(1, int(SPACY_PIPE_N_PROCESS))
+        except ValueError:
+            return 1
+    if total_chars < SPACY_PIPE_MIN_PARALLEL_CHARS:
+        return 1
+    return max(1, min((os.cpu_count() or 1) - 1, 4))
+
+
+def spacy_topic_tokens(
+    nlp,
+    texts: List[str],
+    batch_size: int = SPACY_PIPE_BATCH_SIZE,
+    n_process: Optional[int] = None,
+    max_chunk_chars: int = SPACY_MAX_CHUNK_CHARS
+) -> List[List[str]]:
+    """
+    Topic tokens (content-word lemmas) for each document via batched nlp.pipe
+
+    Documents longer than max_chunk_chars are split with split_text_chunks() and
+    their chunk tokens concatenated; shorter documents give exactly the tokens of
+    nlp(text). Pipes not in SPACY_TOPIC_PIPES are disabled for the run.
+
+    Args:
+        nlp: Loaded spaCy pipeline
+        texts: Documents
+        batch_size: Documents per nlp.pipe batch
+        n_process: Worker processes (default: SPACY_PIPE_N_PROCESS / corpus size)
+        max_chunk_chars: Chunk length bound for long documents
+
+    Returns:
+        One token list per input text, in input order
+    """
+    if n_process is None:
+        n_process = _spacy_n_process(sum(len(t) for t in texts))
+    disable = [name for name in nlp.pipe_names if name not in SPACY_TOPIC_PIPES]
+
+    def chunk_stream():
+        for doc_index, text in enumerate(texts):
+            for chunk in split_text_chunks(text, max_chunk_chars):
+                yield chunk, doc_index
+
+    def run(processes: int) -> List[List[str]]:
+        tokens_list = [[] for _ in texts]
+        for doc, doc_index in nlp.pipe(
+            chunk_stream(), as_tuples=True, batch_size=batch_size, n_process=processes, disable=disable
+        ):
+            tokens_list[doc_index].extend(_topic_lemmas(doc))
+        return tokens_list
+
+    start = time.time()
+    if n_process > 1:
+        try:
+            tokens_list = run(n_process)
+        except Exception as e:
+            # e.g. no fork/spawn available in this worker - same result single-process
+            logger.warning(f"⚠️ Multi-process spaCy tokenization failed ({e}), retrying in-process")
+            n_process = 1
+            tokens_list = run(1)
+    else:
+        tokens_list = run(1)
+    logger.info(f"🔍 spaCy tokenized {len(texts)} documents in {time.time() - start:.1f}s (batch_size={batch_size}, n_process={n_process})")
+    return tokens_list
+
+
+# K sweep for the system model: NMF fits for the candidate K values run in the shared
+# worker pool (worker_pool.py), and one gensim CoherenceModel (one co-occurrence
+# accumulator) scores them all
+SYSTEM_MODEL_K_WORKERS = os.getenv("SYSTEM_MODEL_K_WORKERS", "auto")  # "auto" = one per candidate K, up to the core count
+SYSTEM_MODEL_K_EARLY_STOP_PATIENCE = int(os.getenv("SYSTEM_MODEL_K_EARLY_STOP_PATIENCE", "0"))  # 0 = sweep the whole grid
+
+
+def _k_sweep_workers(candidate_count: int) -> int:
+    if SYSTEM_MODEL_K_WORKERS != "auto":
+        try:
+            return max(1, int(SYSTEM_MODEL_K_WORKERS))
+        except ValueError:
+            return 1
+    return max(1, min(candidate_count, os.cpu_count() or 1))
+
+
+def _fit_nmf_wave(X, ks: List[int], random_state: int, max_iter: int, workers: int, backend: str = "batch") -> Dict[int, any]:
+    """
+    Fit NMF for several K values, in parallel when workers > 1 (failed fits map to the exception)
+
+    At most `workers` fits are in flight at once - the shared pool may be larger, and
+    the worker count is what plan_nmf_fit() capped to the memory budget.
+    """
+    results = {}
+    if workers > 1 and len(ks) > 1:
+        try:
+            from concurrent.futures import FIRST_COMPLETED, wait
+            from worker_pool import submit_to_workers
+            queued, running = list(ks), {}
+            while queued or running:
+                while queued and len(running) < workers:
+                    K = queued.pop(0)
+                    running[submit_to_workers(fit_nmf_candidate, X, K, random_state, max_iter, backend)] = K
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    K = running.pop(future)
+                    try:
+                        results[K] = future.result()
+                    except Exception as e:
+                        results[K] = e
+            return results
+        except Exception as e:
+            # Worker processes unavailable (e.g. inside a daemon process) - fit in-process
+            logger.warning(f"⚠️ Parallel NMF fits failed ({e}), fitting sequentially")
+            results = {}
+    for K in ks:
+        try:
+            results[K] = fit_nmf_candidate(X, K, random_state, max_iter, backend)
+        except Exception as e:
+            results[K] = e
+    return results
+
+
+def sweep_nmf_k_grid(
+    X,
+    terms,
+    tokens_phrased: List[List[str]],
+    k_grid: List[int],
+    top_words: int,
+    random_state: int = 42,
+    max_iter: int = 500,
+    workers: Optional[int] = None,
+    patience: int = SYSTEM_MODEL_K_EARLY_STOP_PATIENCE
+):
+    """
+    Fit NMF for each K in k_grid and keep the model with the best c_v coherence
+
+    Candidates are fitted in waves of `workers` processes. The sliding-window
+    co-occurrence statistics are accumulated once per wave over the union of the
+    wave's topic words and reused to score every candidate in it (a gensim
+    CoherenceModel keeps its accumulator when the new topics' words are a subset).
+    The NMF backend (full batch or MiniBatchNMF) and the number of concurrent fits
+    follow the memory estimate of topic_backend.plan_nmf_fit().
+    With patience > 0 the sweep stops once that many K values in a row (grid
+    order) failed to improve on the best coherence.
+
+    Args:
+        X: Document-term matrix (TF-IDF)
+        terms: Feature names of X
+        tokens_phrased: Tokenized documents the coherence is measured on
+        k_grid: Candidate topic counts (K above the document count is skipped)
+        top_words: Words per topic used for coherence
+        random_state: NMF random_state
+        max_iter: NMF max_iter
+        workers: Worker processes (default SYSTEM_MODEL_K_WORKERS)
+        patience: Early-stop patience (0 = sweep the whole grid)
+
+    Returns:
+        ((coherence, K, nmf, W, H), topic_terms) of the best candidate, or (None, None)
+    """
+    from gensim.corpora import Dictionary
+    from gensim.models.coherencemodel import CoherenceModel
+
+    candidates = [K for K in k_grid if K <= X.shape[0]]
+    if not candidates:
+        return None, None
+    fit_plan = plan_nmf_fit(X, max(candidates), workers or _k_sweep_workers(len(candidates)))
+    workers = fit_plan["workers"]
+    # Waves never hold more candidates than may be fitted at once (the memory-capped worker count)
+    wave_size = workers
+    dictionary = Dictionary(tokens_phrased)
+
+    best = None
+    best_topic_terms = None
+    since_improvement = 0
+    for wave_start in range(0, len(candidates), wave_size):
+        wave = candidates[wave_start:wave_start + wave_size]
+        fits = _fit_nmf_wave(X, wave, random_state, max_iter, workers, fit_plan["backend"])
+
+        topics_by_k = {}
+        for K in wave:
+            if isinstance(fits[K], Exception):
+                logger.warning(f"⚠️ Error with K={K}: {fits[K]}")
+                continue
+            H = fits[K][0].components_
+            topics_by_k[K] = [[terms[i] for i in comp.argsort()[-top_words:]] for comp in H]
+
+        # One accumulator for the whole wave; fall back to one model per K if the
+        # union can't be scored (e.g. a term missing from the dictionary)
+        shared_cm = None
+        if len(topics_by_k) > 1:
+            try:
+                shared_cm = CoherenceModel(
+                    topics=[t for topic_terms in topics_by_k.values() for t in topic_terms],
+                    texts=tokens_phrased, dictionary=dictionary, coherence="c_v"
+                )
+                shared_cm.estimate_probabilities()
+            except Exception as e:
+                logger.debug(f"Shared coherence accumulator unavailable ({e}), scoring each K separately")
+                shared_cm = None
+
+        for K in wave:
+            if K not in topics_by_k:
+                continue
+            topic_terms = topics_by_k[K]
+            try:
+                if shared_cm is not None:
+                    shared_cm.topics = topic_terms
+                    coh = shared_cm.get_coherence()
+                else:
+                    coh = CoherenceModel(topics=topic_terms, texts=tokens_phrased, dictionary=dictionary, coherence="c_v").get_coherence()
+            except Exception as e:
+                logger.warning(f"⚠️ Error with K={K}: {e}")
+                continue
+
+            logger.info(f"📊 K={K}, coherence={coh:.3f}")
+            nmf, W = fits[K]
+            if (best is None) or (coh > best[0]):
+                best = (coh, K, nmf, W, nmf.components_)
+                best_topic_terms = topic_terms
+                since_improvement = 0
+            else:
+                since_improvement += 1
+
+        if patience > 0 and best is not None and since_improvement >= patience:
+            remaining = candidates[wave_start + wave_size:]
+            if remaining:
+                logger.info(f"⏹️ K sweep stopped early: no coherence gain for {since_improvement} K values (skipped K={remaining})")
+            break
+
+    return best, best_topic_terms
+
+
+def system_model_tokenize(texts: List[str], nlp=None) -> List[List[str]]:
+    """
+    Tokens the system model mines phrases from
+
+    Args:
+        texts: Documents
+        nlp: spaCy pipeline (lemmas filtered by POS); None for simple whitespace tokenization
+
+    Returns:
+        One token list per document
+    """
+    if nlp is not None:
+        logger.info("🔍 Using spaCy tokenization (lemmatization + POS filtering)")
+        return spacy_topic_tokens(nlp, texts)
+
+    logger.info("🔍 Using simple tokenization (spaCy not available)")
+    # Simple tokenization - split on whitespace and filter
+    stopwords_set = set(_nltk_models()["stopwords"])
+    tokens_list = []
+    for text in texts:
+        words = text.lower().split()
+        tokens_list.append([w for w in words if w not in stopwords_set and len(w) > 2 and w.isalpha()])
+    return tokens_list
+
+
+def label_system_topics(H, terms, idf, top_words: int) -> List[str]:
+    """Label each NMF topic with its two best terms (weight x IDF, phrases get a bonus)"""
+    idf_lookup = {t: idf[i] for i, t in enumerate(terms)}
+    labels = []
+    for row in H:
+        idx = row.argsort()[-top_words:][::-1]
+        cand = [(terms[i], row[i]) for i in idx]
+        scored = []
+        for t, w in cand:
+            bonus = 1.3 if "_" in t else 1.0
+            scored.append((t, w * idf_lookup.get(t, 1.0) * bonus))
+        scored.sort(key=lambda x: x[1], reverse=True)
+        title = " / ".join([t.replace("_", " ") for t, _ in scored[:2]]) or (cand[0][0] if cand else "topic")
+        labels.append(title[:35])
+    return labels
+
+
+def _incremental_system_topics(campaign_id: str, texts: List[str], settings: Dict, nlp, top_words: int, random_state: int):
+    """
+    System-model topics from the campaign's stored state, updated for new pages
+
+    Returns:
+        (W, labels) for the current corpus, or (None, None) when a full refit is needed
+    """
+    state = load_topic_state(campaign_id)
+    hashes = document_hashes(texts)
+    plan = plan_topic_update(state, hashes, settings_fingerprint(settings))
+    if plan["mode"] == "full":
+        logger.info(f"🔁 Full topic refit for campaign {campaign_id}: {plan['reason']}")
+        return None, None
+    if plan["mode"] == "unchanged":
+        logger.info(f"♻️ Topic state of campaign {campaign_id} is current ({len(hashes)} documents)")
+        return state["W"], state["labels"]
+
+    start = time.perf_counter()
+    new_tokens = system_model_tokenize([texts[i] for i in plan["new_indices"]], nlp)
+    try:
+        updated = fold_in_documents(state, hashes, dict(zip(plan["new_indices"], new_tokens)), random_state=random_state)
+    except Exception as e:
+        logger.warning(f"⚠️ Incremental topic update failed for campaign {campaign_id}, refitting: {e}")
+        return None, None
+    if updated is None:
+        return None, None
+    terms = np.array(updated["terms"])
+    updated["labels"] = label_system_topics(updated["H"], terms, updated.pop("idf"), top_words)
+    save_topic_state(campaign_id, updated)
+    logger.info(
+        f"⚡ Incremental topic update for campaign {campaign_id} ({plan['reason']}) "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+    return updated["W"], updated["labels"]
+
+
+def system_model_topics(texts: List[str], num_topics: int, query: str = "", keywords: List[str] = [], urls: List[str] = [], campaign_id: Optional[str] = None) -> List[str]:
     """
     System model (LLM-free) topic extraction using NMF with Gensim Phrases and spaCy tokenization.
     Loads ALL configuration from system_settings table (fully configurable from admin panel).
+    With a campaign_id, pages added since the campaign's last fit are folded into its stored
+    model (see topic_incremental.py) instead of refitting the whole corpus.
     """
     try:
         # Import required libraries
@@ -668,7 +703,6 @@ def system_model_topics(texts: List[str], num_topics: int, query: str = "", keyw
                     return []
             
             from gensim.models import Phrases
-            from gensim.models.coherencemodel import CoherenceModel
             # Phraser was removed in gensim 4.x - Phrases can be used directly
             PHRASER_AVAILABLE = False  # Initialize to False (gensim 4.x default)
             try:
@@ -688,23 +722,14 @@ def system_model_topics(texts: List[str], num_topics: int, query: str = "", keyw
             logger.error("❌ sklearn not available - system model requires sklearn")
             return []
         
-        # Check for spaCy (optional but recommended)
-        try:
-            import spacy
-            SPACY_AVAILABLE = True
-            try:
-                nlp = spacy.load("en_core_web_sm", disable=["ner", "parser", "textcat"])
-                nlp.enable_pipe("lemmatizer")
-                logger.info("✅ Using spaCy for enhanced tokenization (lemmatization + POS filtering)")
-            except OSError:
-                logger.warning("⚠️ spaCy model 'en_core_web_sm' not found, falling back to simple tokenization")
-                logger.warning("⚠️ Install with: python -m spacy download en_core_web_sm")
-                SPACY_AVAILABLE = False
-                nlp = None
-        except ImportError:
-            logger.warning("⚠️ spaCy not available, using simple tokenization")
-            SPACY_AVAILABLE = False
-            nlp = None
+        # Check for spaCy (optional but recommended) - loaded once per process by the model registry
+        nlp = get_spacy_nlp()
+        SPACY_AVAILABLE = nlp is not None
+        if SPACY_AVAILABLE:
+            logger.info("✅ Using spaCy for enhanced tokenization (lemmatization + POS filtering)")
+        else:
+            logger.warning("⚠️ spaCy or model 'en_core_web_sm' not available, falling back to simple tokenization")
+            logger.warning("⚠️ Install with: pip install spacy && python -m spacy download en_core_web_sm")
         
         # Load ALL configuration from database (fully configurable)
         try:
@@ -813,106 +838,85 @@ def system_model_topics(texts: List[str], num_topics: int, query: str = "", keyw
             texts = filtered_texts
             urls = filtered_urls if urls else []
         
-        # Tokenize documents using spaCy (if available) or simple tokenization
-        tokens_list = []
-        if USE_SPACY and nlp:
-            logger.info("🔍 Using spaCy tokenization (lemmatization + POS filtering)")
-            for text in texts:
-                doc = nlp(text)
-                toks = []
-                for tok in doc:
-                    if tok.is_punct or tok.is_space or tok.like_num:
-                        continue
-                    lemma = tok.lemma_.lower().strip()
-                    if not lemma or len(lemma) < 2:
-                        continue
-                    # Keep nouns/verbs/adjectives/adverbs (most meaningful for topics)
-                    if tok.pos_ in ("NOUN", "PROPN", "VERB", "ADJ", "ADV"):
-                        toks.append(lemma)
-                tokens_list.append(toks)
-        else:
-            logger.info("🔍 Using simple tokenization (spaCy not available)")
-            # Simple sentence splitter (for reference, not used in simple mode)
-            sent_split = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'])")
-            
-            # Simple tokenization - split on whitespace and filter
-            stopwords_set = set(stopwords.words('english'))
-            for text in texts:
-                words = text.lower().split()
-                tokens = [w for w in words if w not in stopwords_set and len(w) > 2 and w.isalpha()]
-                tokens_list.append(tokens)
+        # Same corpus + same resolved settings = same model; reuse a fit from any endpoint
+        cache_settings = {
+            "phrases_min_count": PHRASES_MIN_COUNT,
+            "phrases_threshold": PHRASES_THRESHOLD,
+            "tfidf_min_df": TFIDF_MIN_DF,
+            "tfidf_max_df": TFIDF_MAX_DF,
+            "k_grid": K_GRID,
+            "top_words": TOP_WORDS,
+            "nmf_max_iter": NMF_MAX_ITER,
+            "nmf_random_state": NMF_RANDOM_STATE,
+            "use_spacy": bool(USE_SPACY and nlp),
+            "spacy_model": SPACY_MODEL_NAME if USE_SPACY and nlp else None,
+            "k_early_stop_patience": SYSTEM_MODEL_K_EARLY_STOP_PATIENCE,
+            "backend": backend_settings(),
+        }
+        cache_key = topic_cache_key(texts, "system", cache_settings)
+        cached = get_topic_result(cache_key)
+        W = labels = None
+        if cached is not None and cached["labels"] is not None:
+            W, labels = cached["W"], cached["labels"]
+        elif campaign_id and SYSTEM_MODEL_INCREMENTAL_ENABLED:
+            # Fold pages added since the campaign's last fit into its stored model
+            W, labels = _incremental_system_topics(
+                campaign_id, texts, cache_settings, nlp if USE_SPACY else None, TOP_WORDS, NMF_RANDOM_STATE
+            )
+        if W is None:
+            # Tokenize documents using spaCy (if available) or simple tokenization
+            tokens_list = system_model_tokenize(texts, nlp if USE_SPACY else None)
         
-        if not tokens_list or sum(len(t) for t in tokens_list) < 10:
-            logger.warning("⚠️ Insufficient tokens for system model")
-            return []
+            if not tokens_list or sum(len(t) for t in tokens_list) < 10:
+                logger.warning("⚠️ Insufficient tokens for system model")
+                return []
         
-        # Phrase mining with Gensim
-        # Use string delimiter (not bytes) since tokens_list contains strings
-        bigram = Phrases(tokens_list, min_count=PHRASES_MIN_COUNT, threshold=PHRASES_THRESHOLD, delimiter="_")
-        trigram = Phrases(bigram[tokens_list], min_count=PHRASES_MIN_COUNT, threshold=PHRASES_THRESHOLD, delimiter="_")
-        # In gensim 4.x, Phraser was removed - Phrases can be used directly
-        if PHRASER_AVAILABLE:
-            bigr = Phraser(bigram)
-            trgr = Phraser(trigram)
-            tokens_phrased = [trgr[bigr[tok]] for tok in tokens_list]
-        else:
-            # Use Phrases directly (gensim 4.x compatibility)
-            bigr = bigram
-            trgr = trigram
-            tokens_phrased = [trgr[bigr[tok]] for tok in tokens_list]
-        docs_str = [" ".join(t) for t in tokens_phrased]
+            # Phrase mining with Gensim
+            # Use string delimiter (not bytes) since tokens_list contains strings
+            bigram = Phrases(tokens_list, min_count=PHRASES_MIN_COUNT, threshold=PHRASES_THRESHOLD, delimiter="_")
+            trigram = Phrases(bigram[tokens_list], min_count=PHRASES_MIN_COUNT, threshold=PHRASES_THRESHOLD, delimiter="_")
+            # In gensim 4.x, Phraser was removed - Phrases can be used directly
+            if PHRASER_AVAILABLE:
+                bigr = Phraser(bigram)
+                trgr = Phraser(trigram)
+                tokens_phrased = [trgr[bigr[tok]] for tok in tokens_list]
+            else:
+                # Use Phrases directly (gensim 4.x compatibility)
+                bigr = bigram
+                trgr = trigram
+                tokens_phrased = [trgr[bigr[tok]] for tok in tokens_list]
+            docs_str = [" ".join(t) for t in tokens_phrased]
         
-        # Vectorize with TF-IDF
-        tfidf = TfidfVectorizer(min_df=TFIDF_MIN_DF, max_df=TFIDF_MAX_DF, strip_accents="unicode")
-        X = tfidf.fit_transform(docs_str)
-        terms = tfidf.get_feature_names_out()
-        idf = tfidf.idf_
+            # Vectorize with TF-IDF
+            tfidf = make_tfidf_vectorizer(min_df=TFIDF_MIN_DF, max_df=TFIDF_MAX_DF, strip_accents="unicode")
+            X = tfidf.fit_transform(docs_str)
+            terms = tfidf.get_feature_names_out()
+            idf = tfidf.idf_
         
-        # K sweep (pick best by coherence)
-        best = None
-        best_topic_terms = None
-        for K in K_GRID:
-            if K > len(texts):
-                continue
-            try:
-                nmf = NMF(n_components=K, init="nndsvd", random_state=NMF_RANDOM_STATE, max_iter=NMF_MAX_ITER)
-                W = nmf.fit_transform(X)
-                H = nmf.components_
-                
-                # Calculate coherence
-                topic_terms = [[terms[i] for i in comp.argsort()[-TOP_WORDS:]] for comp in H]
-                cm = CoherenceModel(topics=topic_terms, texts=tokens_phrased, coherence="c_v")
-                coh = cm.get_coherence()
-                
-                logger.info(f"📊 K={K}, coherence={coh:.3f}")
-                
-                if (best is None) or (coh > best[0]):
-                    best = (coh, K, nmf, W, H)
-                    best_topic_terms = topic_terms
-            except Exception as e:
-                logger.warning(f"⚠️ Error with K={K}: {e}")
-                continue
+            # K sweep (pick best by coherence)
+            best, best_topic_terms = sweep_nmf_k_grid(
+                X, terms, tokens_phrased, K_GRID, TOP_WORDS,
+                random_state=NMF_RANDOM_STATE, max_iter=NMF_MAX_ITER
+            )
         
-        if best is None:
-            logger.error("❌ Could not fit any NMF model")
-            return []
+            if best is None:
+                logger.error("❌ Could not fit any NMF model")
+                return []
         
-        coherence, K, nmf, W, H = best
+            coherence, K, nmf, W, H = best
         
-        # Label topics
-        vocab = terms.tolist()
-        idf_lookup = {t: idf[i] for i, t in enumerate(vocab)}
-        labels = []
-        for row in H:
-            idx = row.argsort()[-TOP_WORDS:][::-1]
-            cand = [(terms[i], row[i]) for i in idx]
-            scored = []
-            for t, w in cand:
-                bonus = 1.3 if "_" in t else 1.0
-                scored.append((t, w * idf_lookup.get(t, 1.0) * bonus))
-            scored.sort(key=lambda x: x[1], reverse=True)
-            title = " / ".join([t.replace("_", " ") for t, _ in scored[:2]]) or (cand[0][0] if cand else "topic")
-            labels.append(title[:35])
+            # Label topics
+            vocab = terms.tolist()
+            labels = label_system_topics(H, terms, idf, TOP_WORDS)
+            store_topic_result(
+                cache_key, "system", vocab, W, H, labels=labels,
+                meta={"k": int(K), "coherence": float(coherence)}
+            )
+            if campaign_id and SYSTEM_MODEL_INCREMENTAL_ENABLED:
+                save_topic_state(campaign_id, build_topic_state(
+                    settings_fingerprint(cache_settings), document_hashes(texts), bigr, trgr,
+                    docs_str, terms, X, W, H, K, coherence, labels
+                ))
         
         # Return top topics (limit to num_topics)
         topic_strength = W.sum(axis=0)
@@ -1112,7 +1116,17 @@ def llm_model(texts: List[str], num_topics: int, query: str = "", keywords: List
         logger.error(f"❌ Traceback: {traceback.format_exc()}")
         return []
 
-def extract_topics(texts: List[str], topic_tool: Optional[str], num_topics: int, iterations: int, query: str = "", keywords: List[str] = [], urls: List[str] = []) -> List[str]:
+def extract_topics(texts: List[str], topic_tool: Optional[str], num_topics: int, iterations: int, query: str = "", keywords: List[str] = [], urls: List[str] = [], campaign_id: Optional[str] = None, simhashes: Optional[List[Optional[str]]] = None) -> List[str]:
+    # Syndicated copies, AMP/print variants and paginated repeats would skew topic weights.
+    # simhashes: the rows' stored CampaignRawData.simhash, so only unfingerprinted texts are hashed
+    from near_duplicates import unique_document_indices
+    keep = unique_document_indices(texts, simhashes=simhashes)
+    if len(keep) < len(texts):
+        logger.info(f"🪞 Dropped {len(texts) - len(keep)} near-duplicate documents before topic extraction")
+        if urls and len(urls) == len(texts):
+            urls = [urls[i] for i in keep]
+        texts = [texts[i] for i in keep]
+
     total_words = sum(len(text.strip().split()) for text in texts)
     logger.info(f"Processing {len(texts)} texts with {total_words} words")
 
@@ -1124,7 +1138,7 @@ def extract_topics(texts: List[str], topic_tool: Optional[str], num_topics: int,
     if topic_tool == 'system':
         logger.info("🔍 Using system model (NMF-based with Gensim Phrases) for topic extraction")
         try:
-            topics = system_model_topics(texts, num_topics, query, keywords, urls)
+            topics = system_model_topics(texts, num_topics, query, keywords, urls, campaign_id=campaign_id)
             if topics:
                 logger.info(f"✅ System model returned {len(topics)} topics")
                 return topics
@@ -1161,7 +1175,7 @@ def extract_topics(texts: List[str], topic_tool: Optional[str], num_topics: int,
             # Fallback to phrase extraction instead of single-word keywords
             # Extract meaningful phrases from texts (same logic as non-LLM fallback)
             # Counter is already imported at the top of the file
-            stopwords_set = set(stopwords.words('english'))
+            stopwords_set = set(_nltk_models()["stopwords"])
             phrases = []
             
             for text in texts[:50]:  # Limit to first 50 texts for performance
@@ -1234,7 +1248,7 @@ def extract_topics(texts: List[str], topic_tool: Optional[str], num_topics: int,
         phrase_counts = Counter(phrases)
         
         # Get top phrases, ensuring they're meaningful (at least 2 words, not too common stopwords)
-        stopwords_set = set(stopwords.words('english'))
+        stopwords_set = set(_nltk_models()["stopwords"])
         top_phrases = []
         for phrase, count in phrase_counts.most_common(num_topics * 3):  # Get more candidates
             # Filter out phrases that are just stopwords
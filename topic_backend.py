@@ -0,0 +1,142 @@
+"""
+Memory-Lean Topic Model Backend
+Shared TF-IDF / NMF construction for the system, NMF and LSA topic models: float32
+sparse matrices, a capped vocabulary, and MiniBatchNMF (online updates over
+document batches) for corpora whose full-batch fit would not fit the memory budget.
+The peak memory of a fit is estimated and logged before it starts.
+"""
+
+import logging
+import os
+from typing import Any, Dict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOPIC_MODEL_BACKEND = os.getenv("TOPIC_MODEL_BACKEND", "auto").lower()  # "auto", "batch" or "minibatch"
+TOPIC_MAX_FEATURES = int(os.getenv("TOPIC_MAX_FEATURES", "20000"))  # Vocabulary cap (most frequent terms); 0 = uncapped
+TOPIC_MEMORY_BUDGET_MB = int(os.getenv("TOPIC_MEMORY_BUDGET_MB", "768"))  # Above this estimate "auto" switches to MiniBatchNMF
+TOPIC_MINIBATCH_MIN_DOCS = int(os.getenv("TOPIC_MINIBATCH_MIN_DOCS", "2000"))  # "auto" always uses MiniBatchNMF from here on
+TOPIC_MINIBATCH_SIZE = int(os.getenv("TOPIC_MINIBATCH_SIZE", "256"))  # Documents per MiniBatchNMF update
+
+TOPIC_DTYPE = np.float32
+_INDEX_BYTES = 4  # int32 CSR indices / indptr
+
+
+def make_tfidf_vectorizer(**kwargs):
+    """
+    TfidfVectorizer producing float32 matrices with the vocabulary capped at TOPIC_MAX_FEATURES
+
+    Args:
+        **kwargs: Other TfidfVectorizer arguments (min_df, max_df, strip_accents, ...)
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    kwargs.setdefault("max_features", TOPIC_MAX_FEATURES or None)
+    return TfidfVectorizer(dtype=TOPIC_DTYPE, **kwargs)
+
+
+def estimate_nmf_memory_mb(X, k: int, backend: str, batch_size: int = TOPIC_MINIBATCH_SIZE) -> float:
+    """
+    Approximate peak memory of one NMF fit on X, in MB
+
+    Counts the arrays the solver holds at once: full-batch coordinate descent keeps X
+    plus a transposed copy, W, X·Hᵀ and H with its gradient buffers; MiniBatchNMF
+    keeps X, W, H with its running numerator/denominator and one batch.
+
+    Args:
+        X: Sparse document-term matrix
+        k: Number of topics
+        backend: "batch" or "minibatch"
+        batch_size: Documents per MiniBatchNMF update
+
+    Returns:
+        Estimated MB (interpreter and library overhead not included)
+    """
+    n_docs, n_terms = X.shape
+    item = np.dtype(X.dtype).itemsize
+    nnz = X.nnz if hasattr(X, "nnz") else n_docs * n_terms
+    x_bytes = nnz * (item + _INDEX_BYTES) + (n_docs + 1) * _INDEX_BYTES
+    doc_topic = n_docs * k * item
+    topic_term = k * n_terms * item
+    if backend == "minibatch":
+        batch = min(batch_size, n_docs)
+        total = x_bytes + doc_topic + 4 * topic_term + x_bytes * batch / max(n_docs, 1) + 2 * batch * k * item
+    else:
+        total = 2 * x_bytes + 3 * doc_topic + 3 * topic_term
+    return total / (1024 * 1024)
+
+
+def choose_backend(X, k: int, workers: int = 1) -> str:
+    """
+    Resolve TOPIC_MODEL_BACKEND for a corpus
+
+    "auto" picks MiniBatchNMF for large corpora or when `workers` concurrent
+    full-batch fits would exceed TOPIC_MEMORY_BUDGET_MB.
+    """
+    if TOPIC_MODEL_BACKEND in ("batch", "minibatch"):
+        return TOPIC_MODEL_BACKEND
+    if X.shape[0] >= TOPIC_MINIBATCH_MIN_DOCS:
+        return "minibatch"
+    if estimate_nmf_memory_mb(X, k, "batch") * max(1, workers) > TOPIC_MEMORY_BUDGET_MB:
+        return "minibatch"
+    return "batch"
+
+
+def memory_capped_workers(X, k: int, backend: str, workers: int) -> int:
+    """Limit concurrent fits so their combined estimate stays within TOPIC_MEMORY_BUDGET_MB"""
+    per_fit = estimate_nmf_memory_mb(X, k, backend)
+    if per_fit <= 0:
+        return workers
+    return max(1, min(workers, int(TOPIC_MEMORY_BUDGET_MB // per_fit)))
+
+
+def plan_nmf_fit(X, k: int, workers: int = 1) -> Dict[str, Any]:
+    """
+    Backend, worker count and memory estimate for fitting up to k topics on X (logged)
+
+    Returns:
+        Dict with "backend", "workers" and "estimate_mb" (all concurrent fits)
+    """
+    backend = choose_backend(X, k, workers)
+    workers = memory_capped_workers(X, k, backend, workers)
+    estimate = estimate_nmf_memory_mb(X, k, backend) * workers
+    nnz = X.nnz if hasattr(X, "nnz") else X.shape[0] * X.shape[1]
+    logger.info(
+        f"📐 Topic model memory estimate: ~{estimate:.0f} MB peak "
+        f"({X.shape[0]} docs x {X.shape[1]} terms, {nnz} non-zeros, K<={k}, {backend}, {workers} worker(s))"
+    )
+    if estimate > TOPIC_MEMORY_BUDGET_MB:
+        logger.warning(f"⚠️ Estimated topic model memory exceeds TOPIC_MEMORY_BUDGET_MB ({TOPIC_MEMORY_BUDGET_MB} MB)")
+    return {"backend": backend, "workers": workers, "estimate_mb": estimate}
+
+
+def make_nmf(k: int, backend: str, random_state: int = 42, max_iter: int = 500, init: str = "nndsvd"):
+    """NMF (full batch) or MiniBatchNMF (online updates over TOPIC_MINIBATCH_SIZE documents)"""
+    if backend == "minibatch":
+        from sklearn.decomposition import MiniBatchNMF
+        return MiniBatchNMF(
+            n_components=k, init=init, batch_size=TOPIC_MINIBATCH_SIZE,
+            random_state=random_state, max_iter=max_iter
+        )
+    from sklearn.decomposition import NMF
+    return NMF(n_components=k, init=init, random_state=random_state, max_iter=max_iter)
+
+
+def fit_nmf_candidate(X, K: int, random_state: int, max_iter: int, backend: str = "batch"):
+    """Fit one NMF candidate of the K sweep (top-level in a light module so it can run in a worker process)"""
+    nmf = make_nmf(K, backend, random_state=random_state, max_iter=max_iter)
+    W = nmf.fit_transform(X)
+    return nmf, W
+
+
+def backend_settings() -> Dict[str, Any]:
+    """Settings that change fitted results (for topic cache keys)"""
+    return {
+        "backend": TOPIC_MODEL_BACKEND,
+        "max_features": TOPIC_MAX_FEATURES,
+        "dtype": np.dtype(TOPIC_DTYPE).name,
+        "memory_budget_mb": TOPIC_MEMORY_BUDGET_MB if TOPIC_MODEL_BACKEND == "auto" else None,
+        "minibatch_min_docs": TOPIC_MINIBATCH_MIN_DOCS if TOPIC_MODEL_BACKEND == "auto" else None,
+        "minibatch_size": TOPIC_MINIBATCH_SIZE,
+    }
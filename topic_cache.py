@@ -0,0 +1,212 @@
+"""
+Topic Model Result Cache
+Fitted topic models keyed by a hash of the corpus (per-document content hashes, in
+order), the modeling method and the fully resolved settings. Research, compare-topics,
+TopicWizard, gap analysis and the article-topics script all fit TF-IDF + NMF on the
+same campaign corpus; whichever runs first stores the vocabulary, W/H matrices and
+labels, and the others reuse them. A changed document or setting changes the key,
+so stale results are never served - old rows simply stop being used and age out.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from scrape_cache import compute_content_hash
+
+logger = logging.getLogger(__name__)
+
+TOPIC_CACHE_ENABLED = os.getenv("TOPIC_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+TOPIC_CACHE_MEMORY_ENTRIES = int(os.getenv("TOPIC_CACHE_MEMORY_ENTRIES", "16"))  # Per-process LRU in front of the table
+TOPIC_CACHE_MAX_AGE_DAYS = int(os.getenv("TOPIC_CACHE_MAX_AGE_DAYS", "30"))  # Rows unused this long are deleted
+# Bump when a fitting pipeline changes in a way that changes its output for the same input
+TOPIC_CACHE_VERSION = 1
+
+_memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def document_hashes(texts: Sequence[str]) -> List[str]:
+    """Content hash of each document (empty documents hash as "")"""
+    return [compute_content_hash(text) or "" for text in texts]
+
+
+def topic_cache_key(texts: Sequence[str], method: str, settings: Dict[str, Any]) -> str:
+    """
+    Cache key for fitting `method` with `settings` on `texts`
+
+    Document order is part of the key because W rows follow it.
+
+    Args:
+        texts: Documents exactly as they are passed to the vectorizer pipeline
+        method: Modeling method ("system", "topicwizard_nmf", ...)
+        settings: Every setting that influences the fit, already resolved to final values
+
+    Returns:
+        sha256 hex digest
+    """
+    payload = json.dumps({
+        "version": TOPIC_CACHE_VERSION,
+        "method": method,
+        "settings": settings,
+        "documents": document_hashes(texts),
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _session():
+    from database import SessionLocal
+    return SessionLocal()
+
+
+def _pack_matrices(W, H) -> bytes:
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, W=np.asarray(W), H=np.asarray(H))
+    return buffer.getvalue()
+
+
+def _unpack_matrices(blob: bytes):
+    with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+        return data["W"], data["H"]
+
+
+def _remember(key: str, result: Dict[str, Any]):
+    with _memory_lock:
+        _memory[key] = result
+        _memory.move_to_end(key)
+        while len(_memory) > max(0, TOPIC_CACHE_MEMORY_ENTRIES):
+            _memory.popitem(last=False)
+
+
+def get_topic_result(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a fitted topic model
+
+    Args:
+        key: Output of topic_cache_key()
+
+    Returns:
+        None on a miss, otherwise a dict with "vocabulary" (list of terms), "W"
+        (documents x topics), "H" (topics x terms), "labels" and "meta". The arrays
+        are shared with the cache and must not be modified in place.
+    """
+    if not TOPIC_CACHE_ENABLED:
+        return None
+    with _memory_lock:
+        result = _memory.get(key)
+        if result is not None:
+            _memory.move_to_end(key)
+    if result is not None:
+        logger.info(f"♻️ Topic model cache hit (memory) for {result['method']}")
+        return result
+
+    try:
+        from models import TopicModelCache
+        session = _session()
+        try:
+            entry = session.query(TopicModelCache).filter(TopicModelCache.cache_key == key).first()
+            if entry is None:
+                return None
+            W, H = _unpack_matrices(entry.matrices)
+            result = {
+                "method": entry.method,
+                "vocabulary": json.loads(entry.vocabulary),
+                "W": W,
+                "H": H,
+                "labels": json.loads(entry.labels) if entry.labels else None,
+                "meta": json.loads(entry.meta_json) if entry.meta_json else {},
+            }
+            doc_count = entry.doc_count
+            entry.last_used_at = datetime.now()
+            session.commit()
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Topic model cache lookup failed: {e}")
+        return None
+
+    _remember(key, result)
+    logger.info(f"♻️ Topic model cache hit for {result['method']} ({doc_count} docs)")
+    return result
+
+
+def store_topic_result(
+    key: str,
+    method: str,
+    vocabulary: Sequence[str],
+    W,
+    H,
+    labels: Optional[List[str]] = None,
+    meta: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Store a fitted topic model (in memory and in the topic_model_cache table)
+
+    Args:
+        key: Output of topic_cache_key()
+        method: Modeling method the key was built with
+        vocabulary: Feature names, one per H column
+        W: Document-topic matrix
+        H: Topic-term matrix
+        labels: Topic labels, one per H row
+        meta: Extra JSON-serializable details (chosen K, coherence, ...)
+
+    Returns:
+        The cached result in get_topic_result() shape
+    """
+    result = {
+        "method": method,
+        "vocabulary": [str(term) for term in vocabulary],
+        "W": np.asarray(W),
+        "H": np.asarray(H),
+        "labels": list(labels) if labels is not None else None,
+        "meta": meta or {},
+    }
+    if not TOPIC_CACHE_ENABLED:
+        return result
+    _remember(key, result)
+
+    try:
+        from models import TopicModelCache
+        session = _session()
+        try:
+            now = datetime.now()
+            entry = session.query(TopicModelCache).filter(TopicModelCache.cache_key == key).first()
+            if entry is None:
+                entry = TopicModelCache(cache_key=key, created_at=now)
+                session.add(entry)
+            entry.method = method
+            entry.doc_count = int(result["W"].shape[0])
+            entry.vocabulary = json.dumps(result["vocabulary"])
+            entry.labels = json.dumps(result["labels"]) if result["labels"] is not None else None
+            entry.matrices = _pack_matrices(result["W"], result["H"])
+            entry.meta_json = json.dumps(result["meta"], default=str)
+            entry.last_used_at = now
+            if TOPIC_CACHE_MAX_AGE_DAYS > 0:
+                session.query(TopicModelCache).filter(
+                    TopicModelCache.last_used_at < now - timedelta(days=TOPIC_CACHE_MAX_AGE_DAYS)
+                ).delete(synchronize_session=False)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    except Exception as e:
+        # Concurrent fits of the same corpus can hit the unique key - the other writer wins
+        logger.warning(f"⚠️ Could not store topic model in cache: {e}")
+    return result
+
+
+def clear_topic_cache_memory():
+    """Drop the in-process LRU (table rows are kept)"""
+    with _memory_lock:
+        _memory.clear()
@@ -0,0 +1,428 @@
+"""
+Incremental System-Model Topics per Campaign
+After a full fit the campaign keeps its phrase models, vocabulary, per-document term
+counts and the NMF factors. When pages are added later only the new pages are
+tokenized and phrased; they are folded into the stored vocabulary/IDF statistics
+and the NMF factors are refined with a few warm-started iterations instead of
+re-running phrase mining, TF-IDF fitting and the K sweep over the whole corpus.
+
+A full refit is still done when the settings changed, when too much of the corpus
+was added or removed since the last full fit, or when the new pages drift away
+from the stored model (the topics explain them much worse than the pages they
+were fitted on, or many of their terms are outside the vocabulary).
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_MODEL_INCREMENTAL_ENABLED = os.getenv("SYSTEM_MODEL_INCREMENTAL_ENABLED", "true").lower() in ("1", "true", "yes")
+# Full refit once this share of the last full fit's corpus was added or removed since
+SYSTEM_MODEL_INCREMENTAL_MAX_CHANGE_FRACTION = float(os.getenv("SYSTEM_MODEL_INCREMENTAL_MAX_CHANGE_FRACTION", "0.5"))
+# Full refit when new pages reconstruct this much worse (relative) than the fitted ones
+SYSTEM_MODEL_INCREMENTAL_DRIFT_THRESHOLD = float(os.getenv("SYSTEM_MODEL_INCREMENTAL_DRIFT_THRESHOLD", "0.25"))
+# Full refit when the out-of-vocabulary token share of new pages exceeds the fitted one by this much
+SYSTEM_MODEL_INCREMENTAL_OOV_THRESHOLD = float(os.getenv("SYSTEM_MODEL_INCREMENTAL_OOV_THRESHOLD", "0.15"))
+SYSTEM_MODEL_INCREMENTAL_NMF_ITER = int(os.getenv("SYSTEM_MODEL_INCREMENTAL_NMF_ITER", "50"))  # Warm-start refinement iterations
+
+# Bump when the stored state layout changes; older states trigger a full refit
+TOPIC_STATE_VERSION = 2
+
+# State entries stored as arrays; everything else goes into the JSON header
+_ARRAY_KEYS = ("W", "H")
+
+
+def settings_fingerprint(settings: Dict[str, Any]) -> str:
+    """sha256 of the resolved model settings (a change forces a full refit)"""
+    return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _session():
+    from database import SessionLocal
+    return SessionLocal()
+
+
+def load_topic_state(campaign_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Stored incremental topic state of a campaign
+
+    Returns:
+        State dict, or None if nothing usable is stored (or the lookup failed)
+    """
+    try:
+        from models import CampaignTopicState
+        session = _session()
+        try:
+            row = session.query(CampaignTopicState).filter(CampaignTopicState.campaign_id == campaign_id).first()
+            if row is None:
+                return None
+            state = unpack_topic_state(row.state_blob)
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not load topic state for campaign {campaign_id}: {e}")
+        return None
+    if state is None or state.get("version") != TOPIC_STATE_VERSION:
+        return None
+    return state
+
+
+def save_topic_state(campaign_id: str, state: Dict[str, Any]):
+    """Insert or replace the incremental topic state of a campaign"""
+    try:
+        from models import CampaignTopicState
+        session = _session()
+        try:
+            row = session.query(CampaignTopicState).filter(CampaignTopicState.campaign_id == campaign_id).first()
+            if row is None:
+                row = CampaignTopicState(campaign_id=campaign_id)
+                session.add(row)
+            row.settings_hash = state["settings_hash"]
+            row.doc_count = len(state["doc_hashes"])
+            row.state_blob = pack_topic_state(state)
+            if state["folded_since_full_fit"] == 0:
+                row.full_fit_at = datetime.now()
+            row.updated_at = datetime.now()
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not save topic state for campaign {campaign_id}: {e}")
+
+
+def plan_topic_update(state: Optional[Dict[str, Any]], doc_hashes: Sequence[str], settings_hash: str) -> Dict[str, Any]:
+    """
+    Decide how the current corpus can be modeled from the stored state
+
+    Args:
+        state: Output of load_topic_state() (None if there is none)
+        doc_hashes: Content hashes of the current corpus, in order
+        settings_hash: settings_fingerprint() of the current settings
+
+    Returns:
+        Dict with "mode" ("full", "incremental" or "unchanged"), "reason",
+        "new_indices" (positions in doc_hashes not in the state) and "removed" (count)
+    """
+    if state is None:
+        return {"mode": "full", "reason": "no stored topic state", "new_indices": [], "removed": 0}
+    if state["settings_hash"] != settings_hash:
+        return {"mode": "full", "reason": "topic model settings changed", "new_indices": [], "removed": 0}
+
+    stored = set(state["doc_hashes"])
+    current = set(doc_hashes)
+    new_indices, seen = [], set()
+    for i, h in enumerate(doc_hashes):
+        if h not in stored and h not in seen:
+            new_indices.append(i)
+        seen.add(h)
+    removed = len(stored - current)
+    plan = {"mode": "incremental", "reason": "", "new_indices": new_indices, "removed": removed}
+
+    if not new_indices and not removed:
+        plan.update(mode="unchanged", reason="corpus unchanged")
+        return plan
+    changed = state["folded_since_full_fit"] + len(new_indices) + removed
+    if changed > SYSTEM_MODEL_INCREMENTAL_MAX_CHANGE_FRACTION * max(state["docs_at_full_fit"], 1):
+        plan.update(mode="full", reason=f"{changed} documents changed since the last full fit of {state['docs_at_full_fit']}")
+        return plan
+    plan["reason"] = f"{len(new_indices)} new, {removed} removed documents"
+    return plan
+
+
+def smoothed_idf(counts) -> np.ndarray:
+    """IDF exactly as TfidfVectorizer(smooth_idf=True) computes it from a term count matrix"""
+    n_docs = counts.shape[0]
+    df = np.bincount(counts.indices, minlength=counts.shape[1]) if counts.nnz else np.zeros(counts.shape[1])
+    return np.log((1 + n_docs) / (1 + df)) + 1
+
+
+def tfidf_from_counts(counts, idf: np.ndarray, dtype=np.float64):
+    """Row-L2-normalized TF-IDF matrix, matching TfidfVectorizer's default output"""
+    import scipy.sparse as sp
+    X = sp.csr_matrix(counts, dtype=np.float64).multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(X.multiply(X).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sp.csr_matrix(sp.diags(1.0 / norms) @ X, dtype=dtype)
+
+
+def relative_errors(X, W: np.ndarray, H: np.ndarray) -> np.ndarray:
+    """Per-document ||x - wH|| / ||x|| (0 for empty documents)"""
+    # Expanded as ||x||^2 - 2 x.(wH) + ||wH||^2 so X never has to be densified
+    x_sq = np.asarray(X.multiply(X).sum(axis=1)).ravel() if hasattr(X, "multiply") else (np.asarray(X) ** 2).sum(axis=1)
+    cross = (np.asarray(X @ H.T) * W).sum(axis=1)
+    wh_sq = ((W @ (H @ H.T)) * W).sum(axis=1)
+    residual = np.sqrt(np.maximum(x_sq - 2 * cross + wh_sq, 0.0))
+    norms = np.sqrt(x_sq)
+    return np.divide(residual, norms, out=np.zeros_like(residual), where=norms > 0)
+
+
+def _count_vectorizer(terms: Sequence[str]):
+    from sklearn.feature_extraction.text import CountVectorizer
+    # Same tokenization as the TfidfVectorizer of the full fit
+    return CountVectorizer(vocabulary=list(terms), strip_accents="unicode")
+
+
+def _oov_share(vectorizer, docs_str: List[str]) -> float:
+    analyze = vectorizer.build_analyzer()
+    vocabulary = set(vectorizer.vocabulary)
+    total = outside = 0
+    for doc in docs_str:
+        tokens = analyze(doc)
+        total += len(tokens)
+        outside += sum(1 for t in tokens if t not in vocabulary)
+    return outside / total if total else 0.0
+
+
+class StoredPhrases:
+    """
+    Phrase detection of a fitted gensim phrase model, rebuilt from its exported phrasegrams
+
+    Joins tokens exactly like gensim's FrozenPhrases: a candidate runs from one
+    non-connector word to the next (connector words in between), and is joined when
+    its phrasegram scores above the threshold.
+    """
+
+    __slots__ = ("phrasegrams", "threshold", "delimiter", "connector_words")
+
+    def __init__(self, phrasegrams: Dict[str, float], threshold: float, delimiter: str = "_", connector_words: Sequence[str] = ()):
+        self.phrasegrams = phrasegrams
+        self.threshold = threshold
+        self.delimiter = delimiter
+        self.connector_words = frozenset(connector_words)
+
+    @classmethod
+    def from_model(cls, phrases) -> "StoredPhrases":
+        """From a gensim Phrases / FrozenPhrases model"""
+        if isinstance(phrases, cls):
+            return phrases
+        phrasegrams = phrases.phrasegrams if hasattr(phrases, "phrasegrams") else phrases.export_phrases()
+        return cls(
+            {str(phrase): float(score) for phrase, score in phrasegrams.items()},
+            float(phrases.threshold), phrases.delimiter, sorted(phrases.connector_words)
+        )
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "StoredPhrases":
+        return cls(data["phrasegrams"], data["threshold"], data["delimiter"], data["connector_words"])
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "phrasegrams": self.phrasegrams,
+            "threshold": self.threshold,
+            "delimiter": self.delimiter,
+            "connector_words": sorted(self.connector_words),
+        }
+
+    def _joined(self, start: str, in_between: List[str], end: str) -> Optional[str]:
+        phrase = self.delimiter.join([start] + in_between + [end])
+        return phrase if self.phrasegrams.get(phrase, float("-inf")) > self.threshold else None
+
+    def __getitem__(self, sentence: Sequence[str]) -> List[str]:
+        out: List[str] = []
+        start, in_between = None, []
+        for word in sentence:
+            if word in self.connector_words:
+                if start:
+                    in_between.append(word)
+                else:
+                    out.append(word)
+                continue
+            if start:
+                phrase = self._joined(start, in_between, word)
+                if phrase is not None:
+                    out.append(phrase)
+                    start, in_between = None, []
+                    continue
+                out.append(start)
+                out.extend(in_between)
+            start, in_between = word, []
+        if start:
+            out.append(start)
+            out.extend(in_between)
+        return out
+
+
+def pack_topic_state(state: Dict[str, Any]) -> bytes:
+    """
+    Storage form of a state: JSON header (scalars, hashes, vocabulary, labels, phrasegrams)
+    plus the count matrix and NMF factors as arrays (np.savez_compressed, no pickle)
+    """
+    header = {key: value for key, value in state.items() if key not in _ARRAY_KEYS + ("counts", "bigram", "trigram", "idf")}
+    header["bigram"] = StoredPhrases.from_model(state["bigram"]).to_json()
+    header["trigram"] = StoredPhrases.from_model(state["trigram"]).to_json()
+    counts = state["counts"].tocsr()
+    buffer = io.BytesIO()
+    np.savez_compressed(
+        buffer,
+        header=np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8),
+        counts_data=counts.data, counts_indices=counts.indices, counts_indptr=counts.indptr,
+        counts_shape=np.asarray(counts.shape, dtype=np.int64),
+        **{key: np.asarray(state[key]) for key in _ARRAY_KEYS}
+    )
+    return buffer.getvalue()
+
+
+def unpack_topic_state(blob: bytes) -> Optional[Dict[str, Any]]:
+    """State from pack_topic_state() output (None for anything else, e.g. a blob of an older layout)"""
+    import scipy.sparse as sp
+    try:
+        with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+            state = json.loads(data["header"].tobytes().decode("utf-8"))
+            state["counts"] = sp.csr_matrix(
+                (data["counts_data"], data["counts_indices"], data["counts_indptr"]),
+                shape=tuple(int(n) for n in data["counts_shape"])
+            )
+            for key in _ARRAY_KEYS:
+                state[key] = data[key]
+    except Exception as e:
+        logger.info(f"Stored topic state not readable ({e}) - treating as missing")
+        return None
+    state["bigram"] = StoredPhrases.from_json(state["bigram"])
+    state["trigram"] = StoredPhrases.from_json(state["trigram"])
+    return state
+
+
+def build_topic_state(
+    settings_hash: str,
+    doc_hashes: Sequence[str],
+    bigram,
+    trigram,
+    docs_str: List[str],
+    terms: Sequence[str],
+    X,
+    W: np.ndarray,
+    H: np.ndarray,
+    k: int,
+    coherence: float,
+    labels: List[str]
+) -> Dict[str, Any]:
+    """
+    State after a full fit
+
+    Args:
+        settings_hash: settings_fingerprint() of the settings used
+        doc_hashes: Content hashes of the fitted documents (W row order)
+        bigram, trigram: Fitted phrase models
+        docs_str: Phrased documents as passed to the TF-IDF vectorizer
+        terms: TF-IDF vocabulary
+        X: TF-IDF matrix of the fit
+        W, H: NMF factors of the chosen K
+        k, coherence: Chosen K and its coherence
+        labels: Topic labels (H row order)
+
+    Returns:
+        State dict for save_topic_state()
+    """
+    vectorizer = _count_vectorizer(terms)
+    errors = relative_errors(X, W, H)
+    return {
+        "version": TOPIC_STATE_VERSION,
+        "settings_hash": settings_hash,
+        "doc_hashes": list(doc_hashes),
+        "bigram": StoredPhrases.from_model(bigram),
+        "trigram": StoredPhrases.from_model(trigram),
+        "terms": [str(t) for t in terms],
+        "counts": vectorizer.transform(docs_str).tocsr(),
+        "W": np.asarray(W),
+        "H": np.asarray(H),
+        "k": int(k),
+        "coherence": float(coherence),
+        "labels": list(labels),
+        "baseline_error": float(errors.mean()) if len(errors) else 0.0,
+        "baseline_oov": _oov_share(vectorizer, docs_str),
+        "docs_at_full_fit": len(doc_hashes),
+        "folded_since_full_fit": 0,
+    }
+
+
+def fold_in_documents(
+    state: Dict[str, Any],
+    doc_hashes: Sequence[str],
+    new_tokens: Dict[int, List[str]],
+    random_state: int = 42
+) -> Optional[Dict[str, Any]]:
+    """
+    Update a stored state for the current corpus without a full refit
+
+    New documents are phrased with the stored phrase models and counted against
+    the stored vocabulary; IDF is recomputed from the updated counts, new W rows are
+    solved against the current topics and both factors are refined by a few
+    warm-started NMF iterations. Removed documents are dropped.
+
+    Args:
+        state: Output of load_topic_state()
+        doc_hashes: Content hashes of the current corpus, in order
+        new_tokens: Position in doc_hashes -> token list, for every document not in the state
+        random_state: NMF random state
+
+    Returns:
+        Updated state (with "idf" for labeling), or None when the new documents
+        drift too far from the model and a full refit is needed
+    """
+    import scipy.sparse as sp
+    from sklearn.decomposition import non_negative_factorization
+    from topic_backend import TOPIC_DTYPE, make_nmf, plan_nmf_fit
+
+    vectorizer = _count_vectorizer(state["terms"])
+    row_of = {h: i for i, h in enumerate(state["doc_hashes"])}
+    positions = sorted(new_tokens)
+    new_docs = [" ".join(state["trigram"][state["bigram"][new_tokens[i]]]) for i in positions]
+    new_counts = vectorizer.transform(new_docs).tocsr() if new_docs else None
+
+    # Current corpus order: stored rows for known documents, fresh rows for new ones
+    source_of = {h: ("old", i) for h, i in row_of.items()}
+    source_of.update({doc_hashes[pos]: ("new", j) for j, pos in enumerate(positions)})
+    count_rows, sources = [], []
+    for h in doc_hashes:
+        kind, j = source_of[h]
+        count_rows.append(new_counts[j] if kind == "new" else state["counts"][j])
+        sources.append((kind, j))
+    counts = sp.vstack(count_rows).tocsr()
+    idf = smoothed_idf(counts)
+    X = tfidf_from_counts(counts, idf, dtype=TOPIC_DTYPE)
+    H = np.asarray(state["H"], dtype=X.dtype)
+    k = H.shape[0]
+
+    W_new = np.zeros((len(positions), k), dtype=X.dtype)
+    if positions:
+        X_new = X[positions]
+        W_new, _, _ = non_negative_factorization(
+            X_new, H=H, n_components=k, init="custom", update_H=False, max_iter=500, random_state=random_state
+        )
+        drift = relative_errors(X_new, W_new, H).mean() / max(state["baseline_error"], 1e-9) - 1
+        oov_increase = _oov_share(vectorizer, new_docs) - state["baseline_oov"]
+        if drift > SYSTEM_MODEL_INCREMENTAL_DRIFT_THRESHOLD or oov_increase > SYSTEM_MODEL_INCREMENTAL_OOV_THRESHOLD:
+            logger.info(
+                f"🔁 New documents drifted from the stored topics "
+                f"(error +{drift:.0%}, out-of-vocabulary +{oov_increase:.0%}) - full refit needed"
+            )
+            return None
+
+    W0 = np.vstack([W_new[j] if kind == "new" else state["W"][j] for kind, j in sources]).astype(X.dtype)
+    nmf = make_nmf(
+        k, plan_nmf_fit(X, k)["backend"], random_state=random_state,
+        max_iter=SYSTEM_MODEL_INCREMENTAL_NMF_ITER, init="custom"
+    )
+    W = nmf.fit_transform(X, W=W0, H=H.copy())
+
+    updated = dict(state)
+    updated.update({
+        "doc_hashes": list(doc_hashes),
+        "counts": counts,
+        "W": W,
+        "H": nmf.components_,
+        "idf": idf,
+        "folded_since_full_fit": state["folded_since_full_fit"] + len(positions) + len(set(state["doc_hashes"]) - set(doc_hashes)),
+    })
+    return updated
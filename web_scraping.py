@@ -1,11 +1,19 @@
 """
 Web Scraping Module for Campaign Analysis
-Implements DuckDuckGo search and Playwright-based web scraping
+Implements DuckDuckGo search, a static-HTML fast path and Playwright-based web scraping
 """
 
+import asyncio
 import logging
+import os
+import queue
 import re
-from typing import List, Dict, Optional, Set, Callable
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Awaitable, List, Dict, Iterator, Optional, Set, Callable, Tuple
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 
@@ -35,33 +43,56 @@ except ImportError:
     DDGS = None
 
 # Dynamic import to allow reloading after installation
-sync_playwright = None
-Browser = None
-Page = None
+# Scraping uses Playwright's async API through the process-wide browser pool (browser_pool.py)
+async_playwright = None
 
 def _reload_playwright():
     """Reload Playwright imports - useful after installation"""
-    global sync_playwright, Browser, Page
+    global async_playwright
     try:
-        from playwright.sync_api import sync_playwright, Browser, Page
+        from playwright.async_api import async_playwright
         logger.info("✅ Playwright imported successfully")
         return True
     except ImportError:
         logger.warning("playwright not available - scraping will be disabled")
-        sync_playwright = None
-        Browser = None
-        Page = None
+        async_playwright = None
         return False
 
 # Try initial import
 _reload_playwright()
 
+from scrape_cache import normalize_url
+from crawl_frontier import CrawlFrontier, FrontierItem
+from page_loading import install_request_filter, wait_until_ready
+
 logger = logging.getLogger(__name__)
 
+# Scraping mode: "async" fetches pages concurrently on the browser pool's event loop,
+# "sequential" fetches one page at a time (both crawl breadth-first through a CrawlFrontier)
+SCRAPER_MODE = os.getenv("SCRAPER_MODE", "async").lower()
+SCRAPER_MAX_CONCURRENCY = int(os.getenv("SCRAPER_MAX_CONCURRENCY", "6"))  # Pages in flight overall
+SCRAPER_PER_HOST_CONCURRENCY = int(os.getenv("SCRAPER_PER_HOST_CONCURRENCY", "2"))  # Pages in flight per host
+SCRAPER_POLITENESS_DELAY_MS = int(os.getenv("SCRAPER_POLITENESS_DELAY_MS", "1000"))  # Min gap between requests to one host
+SCRAPER_STREAM_QUEUE_SIZE = int(os.getenv("SCRAPER_STREAM_QUEUE_SIZE", "8"))  # Scraped pages buffered ahead of the consumer
+
+# Search fan-out: one DuckDuckGo query per keyword plus the combined query, run in parallel
+SEARCH_MAX_WORKERS = int(os.getenv("SEARCH_MAX_WORKERS", "4"))
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", str(6 * 3600)))
+SEARCH_CACHE_MAX_ENTRIES = 500
+
+# In-memory cache of search results: (normalized query, max_results) -> (fetched_at, urls)
+_search_cache: "OrderedDict[Tuple[str, int], Tuple[float, List[str]]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
 def search_duckduckgo(keywords: List[str], query: str = "", max_results: int = 10) -> List[str]:
     """
     Search DuckDuckGo for URLs based on keywords and query
     
+    Each (expanded) keyword is searched on its own, plus all keywords combined; the
+    searches run in parallel (SEARCH_MAX_WORKERS) and their rankings are merged with
+    reciprocal rank fusion. Result lists are cached in-process for
+    SEARCH_CACHE_TTL_SECONDS, keyed by normalized query.
+    
     Args:
         keywords: List of keywords to search for
         query: Additional context query string
@@ -110,68 +141,31 @@ def search_duckduckgo(keywords: List[str], query: str = "", max_results: int = 1
         elif query:
             logger.info(f"📋 Query used as context/frame of reference (not in search): '{query[:100]}...'")
         
-        # Combine into search query - only keywords (or query if no keywords)
-        search_query = " ".join(search_terms[:10])  # Limit to 10 terms
-        
-        if not search_query.strip():
+        # One search per term (each keyword gets its own result page) plus the combined
+        # query, run concurrently and merged by reciprocal rank fusion
+        search_terms = [t for t in dict.fromkeys(" ".join(t.split()) for t in search_terms[:10]) if t]
+        if not search_terms:
             logger.warning("Empty search query, returning empty results")
             return []
+        search_queries = list(search_terms)
+        if len(search_terms) > 1:
+            search_queries.append(" ".join(search_terms))
         
         # Log original vs expanded for debugging (CRITICAL for keyword tracking)
         original_query = " ".join([query] + (keywords[:5] if keywords else []))
         logger.info(f"🔍 CRITICAL: Search input - query: '{query}', keywords: {keywords[:5] if keywords else []}")
-        if search_query != original_query:
-            logger.info(f"🔍 Expanded search query: '{original_query}' → '{search_query}'")
-        else:
-            logger.info(f"🔍 Searching DuckDuckGo for: '{search_query}' (max_results={max_results})")
+        logger.info(f"🔍 Searching DuckDuckGo for {len(search_queries)} queries: {search_queries} (max_results={max_results}, from '{original_query}')")
         
-        results = []
-        try:
-            with DDGS() as ddgs:
-                # Use text() method - returns list of result dictionaries (not generator in newer versions)
-                search_results = ddgs.text(search_query, max_results=max_results)
-                
-                # Handle both list and generator returns
-                if not isinstance(search_results, (list, tuple)):
-                    search_results = list(search_results)
-                
-                count = 0
-                for result in search_results:
-                    # ddgs.text() returns dictionaries with different key formats
-                    url = None
-                    if isinstance(result, dict):
-                        # Try multiple possible keys
-                        url = result.get('href') or result.get('url') or result.get('link') or result.get('url')
-                        
-                        # Some versions return nested structures
-                        if not url and isinstance(result.get('body'), dict):
-                            url = result['body'].get('href') or result['body'].get('url')
-                    
-                    if url and isinstance(url, str) and url.startswith(('http://', 'https://')):
-                        # Avoid duplicates
-                        if url not in results:
-                            results.append(url)
-                            count += 1
-                            logger.debug(f"Found URL: {url}")
-                            if count >= max_results:
-                                break
-                    
-                    # Safety check to avoid infinite loops
-                    if count > max_results * 2:
-                        logger.warning(f"Search returning too many results, limiting to {max_results}")
-                        break
-                
-                if count == 0:
-                    logger.warning(f"No URLs found in search results. Search query: '{search_query}'")
-                    logger.debug(f"Sample result structure: {list(search_results)[:1] if hasattr(search_results, '__iter__') else 'N/A'}")
-                        
-        except Exception as search_err:
-            logger.error(f"Error in DuckDuckGo search execution: {search_err}")
-            import traceback
-            logger.error(traceback.format_exc())
+        ranked_lists = []
+        if len(search_queries) == 1:
+            ranked_lists.append(_cached_search(search_queries[0], max_results))
+        else:
+            with ThreadPoolExecutor(max_workers=max(1, min(SEARCH_MAX_WORKERS, len(search_queries)))) as executor:
+                ranked_lists = list(executor.map(lambda q: _cached_search(q, max_results), search_queries))
         
-        logger.info(f"✅ DuckDuckGo search returned {len(results)} URLs")
-        return results[:max_results]
+        results = _fuse_ranked_urls(ranked_lists, max_results)
+        logger.info(f"✅ DuckDuckGo search returned {len(results)} URLs ({sum(len(r) for r in ranked_lists)} hits across {len(search_queries)} queries)")
+        return results
     
     except Exception as e:
         logger.error(f"❌ Error searching DuckDuckGo: {e}")
@@ -179,9 +173,112 @@ def search_duckduckgo(keywords: List[str], query: str = "", max_results: int = 1
         logger.error(traceback.format_exc())
         return []
 
-def extract_links_from_html(html: str, base_url: str, max_links: int = 10) -> List[str]:
+def _normalize_search_query(search_query: str) -> str:
+    """Cache key form of a search query: lowercase, single-spaced"""
+    return " ".join(search_query.lower().split())
+
+def _cached_search(search_query: str, max_results: int) -> List[str]:
     """
-    Extract links from HTML content
+    Ranked result URLs for one search query, served from the in-process TTL cache when possible
+
+    Failed or empty searches are not cached, so a transient rate limit doesn't stick.
+    """
+    key = (_normalize_search_query(search_query), max_results)
+    now = time.time()
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+        if cached and now - cached[0] < SEARCH_CACHE_TTL_SECONDS:
+            _search_cache.move_to_end(key)
+            logger.info(f"♻️ Search cache hit for '{search_query}' ({len(cached[1])} URLs, age {int(now - cached[0])}s)")
+            return list(cached[1])
+    
+    urls = _ddgs_text_urls(search_query, max_results)
+    if urls:
+        with _search_cache_lock:
+            _search_cache[key] = (time.time(), urls)
+            _search_cache.move_to_end(key)
+            while len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+                _search_cache.popitem(last=False)
+    return list(urls)
+
+def _ddgs_text_urls(search_query: str, max_results: int) -> List[str]:
+    """Run one DDGS text search and return result URLs in rank order"""
+    results = []
+    try:
+        with DDGS() as ddgs:
+            # Use text() method - returns list of result dictionaries (not generator in newer versions)
+            search_results = ddgs.text(search_query, max_results=max_results)
+            
+            # Handle both list and generator returns
+            if not isinstance(search_results, (list, tuple)):
+                search_results = list(search_results)
+            
+            count = 0
+            for result in search_results:
+                # ddgs.text() returns dictionaries with different key formats
+                url = None
+                if isinstance(result, dict):
+                    # Try multiple possible keys
+                    url = result.get('href') or result.get('url') or result.get('link') or result.get('url')
+                    
+                    # Some versions return nested structures
+                    if not url and isinstance(result.get('body'), dict):
+                        url = result['body'].get('href') or result['body'].get('url')
+                
+                if url and isinstance(url, str) and url.startswith(('http://', 'https://')):
+                    # Avoid duplicates
+                    if url not in results:
+                        results.append(url)
+                        count += 1
+                        logger.debug(f"Found URL: {url}")
+                        if count >= max_results:
+                            break
+                
+                # Safety check to avoid infinite loops
+                if count > max_results * 2:
+                    logger.warning(f"Search returning too many results, limiting to {max_results}")
+                    break
+            
+            if count == 0:
+                logger.warning(f"No URLs found in search results. Search query: '{search_query}'")
+                logger.debug(f"Sample result structure: {list(search_results)[:1] if hasattr(search_results, '__iter__') else 'N/A'}")
+                    
+    except Exception as search_err:
+        logger.error(f"Error in DuckDuckGo search execution for '{search_query}': {search_err}")
+        import traceback
+        logger.error(traceback.format_exc())
+    
+    return results[:max_results]
+
+def _fuse_ranked_urls(ranked_lists: List[List[str]], max_results: int, k: int = 60) -> List[str]:
+    """
+    Merge ranked URL lists with reciprocal rank fusion
+
+    Each list contributes 1 / (k + rank) per URL, so URLs found by several queries
+    rise to the top; URLs are deduplicated on their normalized form (first spelling wins).
+
+    Args:
+        ranked_lists: URL lists, each in search rank order
+        max_results: Maximum number of URLs to return
+        k: RRF damping constant
+
+    Returns:
+        Merged URL list, best first
+    """
+    scores: Dict[str, float] = {}
+    spelling: Dict[str, str] = {}
+    for urls in ranked_lists:
+        for rank, url in enumerate(urls, 1):
+            normalized = normalize_url(url)
+            spelling.setdefault(normalized, url)
+            scores[normalized] = scores.get(normalized, 0.0) + 1.0 / (k + rank)
+    # sorted() is stable: ties keep first-seen order
+    ordered = sorted(spelling, key=lambda n: scores[n], reverse=True)
+    return [spelling[n] for n in ordered[:max_results]]
+
+def extract_links_with_anchors(html: str, base_url: str, max_links: int = 50) -> List[Tuple[str, str]]:
+    """
+    Extract same-domain links with their anchor text from HTML content
     
     Args:
         html: HTML content
@@ -189,7 +286,7 @@ def extract_links_from_html(html: str, base_url: str, max_links: int = 10) -> Li
         max_links: Maximum number of links to return
         
     Returns:
-        List of absolute URLs
+        List of (absolute URL, anchor text) tuples, deduplicated on normalized URL
     """
     try:
         # Check if bs4 is available (checked at module load, but double-check here)
@@ -198,28 +295,324 @@ def extract_links_from_html(html: str, base_url: str, max_links: int = 10) -> Li
         
         from bs4 import BeautifulSoup
         soup = BeautifulSoup(html, 'html.parser')
-        links = []
-        
-        for a in soup.find_all('a', href=True):
-            href = a['href']
-            # Resolve relative URLs
-            absolute_url = urljoin(base_url, href)
-            # Only include http/https URLs
-            parsed = urlparse(absolute_url)
-            if parsed.scheme in ('http', 'https') and parsed.netloc:
-                # Same domain only (for depth control)
-                if parsed.netloc == urlparse(base_url).netloc:
-                    links.append(absolute_url)
-        
-        # Deduplicate and limit
-        unique_links = list(dict.fromkeys(links))[:max_links]
-        logger.debug(f"Extracted {len(unique_links)} links from {base_url}")
-        return unique_links
+        anchors = ((a['href'], a.get_text(" ") or a.get('title', '') or '') for a in soup.find_all('a', href=True))
+        links = _same_domain_links(anchors, base_url, max_links)
+        logger.debug(f"Extracted {len(links)} links from {base_url}")
+        return links
     
     except Exception as e:
         logger.warning(f"Error extracting links from {base_url}: {e}")
         return []
 
+def _same_domain_links(anchors, base_url: str, max_links: int = 50) -> List[Tuple[str, str]]:
+    """
+    Resolve raw (href, anchor text) pairs into same-domain links
+
+    Args:
+        anchors: Iterable of (href attribute, anchor text) pairs in document order
+        base_url: Base URL for resolving relative links
+        max_links: Maximum number of links to return
+
+    Returns:
+        List of (absolute URL, anchor text) tuples, deduplicated on normalized URL
+    """
+    base_netloc = urlparse(base_url).netloc
+    links = []
+    seen = set()
+    for href, anchor in anchors:
+        # Resolve relative URLs
+        absolute_url = urljoin(base_url, href)
+        # Only include http/https URLs
+        parsed = urlparse(absolute_url)
+        if parsed.scheme in ('http', 'https') and parsed.netloc:
+            # Same domain only (for depth control)
+            if parsed.netloc == base_netloc:
+                normalized = normalize_url(absolute_url)
+                if normalized in seen:
+                    continue
+                seen.add(normalized)
+                anchor_text = re.sub(r'\s+', ' ', anchor or '').strip()
+                links.append((absolute_url, anchor_text[:200]))
+                if len(links) >= max_links:
+                    break
+    return links
+
+def extract_links_from_html(html: str, base_url: str, max_links: int = 10) -> List[str]:
+    """
+    Extract links from HTML content
+    
+    Args:
+        html: HTML content
+        base_url: Base URL for resolving relative links
+        max_links: Maximum number of links to return
+        
+    Returns:
+        List of absolute URLs
+    """
+    return [url for url, _ in extract_links_with_anchors(html, base_url, max_links=max_links)]
+
+def _set_links(result: Dict[str, any], html: str, url: str, links: Optional[List[Tuple[str, str]]] = None):
+    """Fill result["links"] (first 20) and result["link_anchors"] (url -> anchor text) from page HTML"""
+    if links is None:
+        links = extract_links_with_anchors(html, url, max_links=50)
+    result["links"] = [link for link, _ in links[:20]]
+    result["link_anchors"] = dict(links)
+
+# Collects everything _scrape_page_async needs in one page.evaluate() round trip.
+# URL resolution, filtering and dedupe stay in Python so results match the static path.
+_EXTRACT_PAGE_JS = """
+([selectors, includeImages, includeLinks]) => {
+    let text = '';
+    for (const selector of selectors) {
+        const elements = document.querySelectorAll(selector);
+        if (elements.length) {
+            for (const element of elements) {
+                const elementText = element.innerText || '';
+                if (elementText.length > text.length) text = elementText;
+            }
+            break;
+        }
+    }
+    if (!text && document.body) text = document.body.innerText || '';
+
+    const images = includeImages
+        ? Array.from(document.querySelectorAll('img[src]'), img => img.getAttribute('src'))
+        : [];
+    const links = includeLinks
+        ? Array.from(document.querySelectorAll('a[href]'),
+              a => [a.getAttribute('href'), a.textContent || a.getAttribute('title') || ''])
+        : [];
+    const html = includeLinks ? document.documentElement.outerHTML : null;
+    return {text, images, links, html};
+}
+"""
+
+async def _scrape_page_async(
+    page,
+    url: str,
+    include_images: bool = False,
+    include_links: bool = False,
+    timeout: int = 30000
+) -> Dict[str, any]:
+    """
+    Load a URL in an already-open Playwright page and extract its content
+
+    Args:
+        page: Async Playwright page (from the browser pool)
+        url: URL to scrape
+        include_images: Whether to extract image URLs
+        include_links: Whether to extract links
+        timeout: Page load timeout in milliseconds
+
+    Returns:
+        Same dictionary shape as scrape_with_playwright()
+    """
+    result = {
+        "text": "",
+        "html": None,
+        "images": [],
+        "links": [],
+        "error": None
+    }
+
+    # Skip images/media/fonts and ad/analytics hosts (images load when the campaign wants them)
+    request_counts = await install_request_filter(page, include_images=include_images)
+
+    # Navigate to URL
+    logger.debug(f"🌐 Navigating to: {url}")
+    await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+
+    # Wait for JavaScript content: network idle or a stable DOM, capped by SCRAPER_READY_TIMEOUT_MS
+    readiness = await wait_until_ready(page)
+    result["metadata"] = {**readiness, "blocked_requests": request_counts["blocked"]}
+    logger.debug(
+        f"Page ready via {readiness['ready_signal']} after {readiness['ready_wait_ms']} ms "
+        f"({request_counts['blocked']} requests blocked): {url}"
+    )
+
+    # Extract text, image sources and links in a single round trip to the browser
+    try:
+        from static_fetch import CONTENT_SELECTORS
+
+        payload = await page.evaluate(_EXTRACT_PAGE_JS, [CONTENT_SELECTORS, include_images, include_links])
+    except Exception as e:
+        logger.warning(f"Error extracting content from {url}: {e}")
+        result["error"] = f"Text extraction error: {str(e)}"
+        return result
+
+    # Clean up text
+    result["text"] = re.sub(r'\s+', ' ', payload.get("text") or '').strip()
+
+    if include_images:
+        image_urls = []
+        for src in payload.get("images") or []:
+            if src:
+                absolute_url = urljoin(url, src)
+                if absolute_url.startswith(('http://', 'https://')):
+                    image_urls.append(absolute_url)
+        result["images"] = list(dict.fromkeys(image_urls))[:50]  # Limit to 50 images
+        logger.debug(f"Extracted {len(result['images'])} images from {url}")
+
+    if include_links:
+        result["html"] = payload.get("html")
+        _set_links(result, result["html"], url, links=_same_domain_links(payload.get("links") or [], url, max_links=50))
+        logger.debug(f"Extracted {len(result['links'])} links from {url}")
+
+    return result
+
+async def _scrape_url_async(
+    url: str,
+    include_images: bool = False,
+    include_links: bool = False,
+    timeout: int = 30000
+) -> Dict[str, any]:
+    """
+    Scrape a single URL on a pooled browser (runs on the browser pool's event loop)
+
+    Never raises - failures are reported through the result's "error" field.
+    """
+    from browser_pool import get_browser_pool, BrowserLaunchError
+
+    try:
+        async with get_browser_pool().page() as page:
+            return await _scrape_page_async(
+                page,
+                url,
+                include_images=include_images,
+                include_links=include_links,
+                timeout=timeout
+            )
+    except BrowserLaunchError as launch_err:
+        return {
+            "text": "",
+            "html": None,
+            "images": [],
+            "links": [],
+            "error": str(launch_err)
+        }
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f"❌ Error scraping {url}: {error_msg}")
+        return {
+            "text": f"Error scraping URL: {error_msg}",
+            "html": None,
+            "images": [],
+            "links": [],
+            "error": error_msg
+        }
+
+def _static_result_metadata(static_ms: int) -> Dict[str, any]:
+    from static_fetch import estimated_browser_page_ms
+    return {
+        "fetch_method": "static",
+        "escalation_reason": None,
+        "static_fetch_ms": static_ms,
+        "time_saved_ms": max(estimated_browser_page_ms() - static_ms, 0)
+    }
+
+def _browser_result_metadata(escalation_reason: Optional[str], static_ms: Optional[int], browser_ms: int) -> Dict[str, any]:
+    return {
+        "fetch_method": "browser",
+        "escalation_reason": escalation_reason,
+        "static_fetch_ms": static_ms,
+        "browser_fetch_ms": browser_ms,
+        "time_saved_ms": 0
+    }
+
+async def _fetch_page_async(
+    url: str,
+    include_images: bool = False,
+    include_links: bool = False,
+    timeout: int = 30000
+) -> Dict[str, any]:
+    """
+    Scrape a URL: shared page cache first, then the static fast path, escalating
+    to a pooled browser only when the page needs JavaScript
+
+    The fetch method, escalation reason and timings are recorded in result["metadata"].
+    """
+    import scrape_cache
+    from static_fetch import STATIC_FETCH_ENABLED, fetch_static, record_browser_page_ms, estimated_browser_page_ms
+
+    cached = await asyncio.to_thread(scrape_cache.get_cached_page, url, include_images, include_links)
+    if cached and cached["fresh"]:
+        result = cached["result"]
+        result["metadata"] = {
+            "fetch_method": "cache",
+            "escalation_reason": None,
+            "cache_age_seconds": cached["age_seconds"],
+            "time_saved_ms": estimated_browser_page_ms()
+        }
+        logger.debug(f"♻️ Scrape cache hit for {url} (age {cached['age_seconds']}s)")
+        return result
+
+    escalation_reason, static_ms = "static_fetch_disabled", None
+    if STATIC_FETCH_ENABLED:
+        static_result, escalation_reason, static_ms = await asyncio.to_thread(
+            fetch_static, url, include_images, include_links,
+            validators=cached["validators"] if cached else None
+        )
+        if escalation_reason == "not_modified" and cached:
+            await asyncio.to_thread(scrape_cache.touch_page, url)
+            result = cached["result"]
+            result["metadata"] = {
+                "fetch_method": "cache_revalidated",
+                "escalation_reason": None,
+                "static_fetch_ms": static_ms,
+                "time_saved_ms": max(estimated_browser_page_ms() - static_ms, 0)
+            }
+            logger.debug(f"♻️ {url} not modified since last fetch (304), serving cached copy")
+            return result
+        if static_result is not None:
+            http_validators = static_result.pop("http_validators", None) or {}
+            if include_links and static_result.get("html"):
+                _set_links(static_result, static_result["html"], url)
+            static_result["metadata"] = _static_result_metadata(static_ms)
+            logger.debug(f"⚡ Static fetch served {url} in {static_ms} ms")
+            await asyncio.to_thread(
+                scrape_cache.store_page, url, static_result, include_images, include_links,
+                http_validators.get("etag"), http_validators.get("last_modified")
+            )
+            return static_result
+        logger.debug(f"🌐 Escalating {url} to Playwright ({escalation_reason})")
+
+    browser_start = time.perf_counter()
+    result = await _scrape_url_async(url, include_images, include_links, timeout)
+    browser_ms = int((time.perf_counter() - browser_start) * 1000)
+    result["metadata"] = {
+        **_browser_result_metadata(escalation_reason, static_ms, browser_ms),
+        **(result.get("metadata") or {})
+    }
+    if not result.get("error"):
+        record_browser_page_ms(browser_ms)
+        await asyncio.to_thread(scrape_cache.store_page, url, result, include_images, include_links)
+    return result
+
+def _fetch_page(
+    url: str,
+    include_images: bool = False,
+    include_links: bool = False,
+    timeout: int = 30000
+) -> Dict[str, any]:
+    """Blocking version of _fetch_page_async (used by the sequential scraping mode)"""
+    from browser_pool import get_browser_pool
+
+    try:
+        return get_browser_pool().run(
+            _fetch_page_async(url, include_images, include_links, timeout),
+            timeout=timeout / 1000 + 60
+        )
+    except Exception as e:
+        error_msg = str(e) or type(e).__name__
+        logger.error(f"❌ Error scraping {url}: {error_msg}")
+        return {
+            "text": f"Error scraping URL: {error_msg}",
+            "html": None,
+            "images": [],
+            "links": [],
+            "error": error_msg
+        }
+
 def scrape_with_playwright(
     url: str,
     include_images: bool = False,
@@ -229,6 +622,9 @@ def scrape_with_playwright(
     """
     Scrape a single URL using Playwright
     
+    Pages are rendered on warm browsers from the process-wide browser pool
+    (see browser_pool.py); each page gets its own fresh browser context.
+    
     Args:
         url: URL to scrape
         include_images: Whether to extract image URLs
@@ -244,7 +640,7 @@ def scrape_with_playwright(
         - error: Error message if scraping failed
     """
     # Try to reload Playwright if not available (in case it was installed after module import)
-    if sync_playwright is None:
+    if async_playwright is None:
         logger.info("🔄 Attempting to reload Playwright...")
         if not _reload_playwright():
             return {
@@ -255,126 +651,57 @@ def scrape_with_playwright(
                 "error": "Playwright not available - install with: pip install playwright && playwright install chromium"
             }
     
-    result = {
-        "text": "",
-        "html": None,
-        "images": [],
-        "links": [],
-        "error": None
-    }
-    
     try:
-        with sync_playwright() as p:
-            # Launch browser in headless mode
-            # Note: Playwright browsers must be installed via: playwright install chromium
-            try:
-                browser = p.chromium.launch(headless=True)
-            except Exception as launch_err:
-                logger.error(f"Failed to launch Playwright browser: {launch_err}")
-                logger.error("Run 'playwright install chromium' to install browsers")
-                return {
-                    "text": "",
-                    "html": None,
-                    "images": [],
-                    "links": [],
-                    "error": f"Playwright browser not installed: {str(launch_err)}"
-                }
-            
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = context.new_page()
-            
-            # Navigate to URL
-            logger.debug(f"🌐 Navigating to: {url}")
-            page.goto(url, wait_until="domcontentloaded", timeout=timeout)
-            
-            # Wait a bit for JavaScript to load content
-            page.wait_for_timeout(2000)
-            
-            # Extract text content
-            try:
-                # Try to get main content area (common selectors)
-                content_selectors = [
-                    'article', 'main', '[role="main"]', 
-                    '.content', '#content', '.post-content',
-                    '.article-content', '.entry-content'
-                ]
-                
-                text_content = ""
-                for selector in content_selectors:
-                    elements = page.query_selector_all(selector)
-                    if elements:
-                        for element in elements:
-                            text = element.inner_text()
-                            if len(text) > len(text_content):
-                                text_content = text
-                        break
-                
-                # Fallback to body if no content found
-                if not text_content:
-                    body = page.query_selector('body')
-                    if body:
-                        text_content = body.inner_text()
-                
-                # Clean up text
-                text_content = re.sub(r'\s+', ' ', text_content).strip()
-                result["text"] = text_content
-                
-            except Exception as e:
-                logger.warning(f"Error extracting text from {url}: {e}")
-                result["error"] = f"Text extraction error: {str(e)}"
-            
-            # Extract images if requested
-            if include_images:
-                try:
-                    images = page.query_selector_all('img[src]')
-                    image_urls = []
-                    for img in images:
-                        src = img.get_attribute('src')
-                        if src:
-                            absolute_url = urljoin(url, src)
-                            if absolute_url.startswith(('http://', 'https://')):
-                                image_urls.append(absolute_url)
-                    result["images"] = list(dict.fromkeys(image_urls))[:50]  # Limit to 50 images
-                    logger.debug(f"Extracted {len(result['images'])} images from {url}")
-                except Exception as e:
-                    logger.warning(f"Error extracting images from {url}: {e}")
-            
-            # Extract links if requested
-            if include_links:
-                try:
-                    html_content = page.content()
-                    result["html"] = html_content
-                    links = extract_links_from_html(html_content, url, max_links=20)
-                    result["links"] = links
-                except Exception as e:
-                    logger.warning(f"Error extracting links from {url}: {e}")
-            
-            browser.close()
-            
+        from browser_pool import get_browser_pool
+        # Leave headroom over the page timeout for the extra JS wait and extraction
+        return get_browser_pool().run(
+            _scrape_url_async(url, include_images, include_links, timeout),
+            timeout=timeout / 1000 + 30
+        )
     except Exception as e:
-        error_msg = str(e)
+        error_msg = str(e) or type(e).__name__
         logger.error(f"❌ Error scraping {url}: {error_msg}")
-        result["error"] = error_msg
-        result["text"] = f"Error scraping URL: {error_msg}"
-    
-    return result
+        return {
+            "text": f"Error scraping URL: {error_msg}",
+            "html": None,
+            "images": [],
+            "links": [],
+            "error": error_msg
+        }
+
+def _discovered_links(scraped_data: Dict[str, any]) -> List[Tuple[str, str]]:
+    """(url, anchor text) pairs found on a scraped page, for the crawl frontier"""
+    anchors = scraped_data.get("link_anchors")
+    if anchors:
+        return list(anchors.items())
+    return [(link, "") for link in scraped_data.get("links", [])]
+
+def _finish_result(scraped_data: Dict[str, any], item: FrontierItem) -> Dict[str, any]:
+    """Add URL and crawl metadata to a scrape result"""
+    scraped_data["url"] = item.url
+    scraped_data["depth"] = item.depth
+    scraped_data["scraped_at"] = datetime.utcnow().isoformat()
+    if item.depth > 0:
+        metadata = scraped_data.setdefault("metadata", {})
+        metadata["parent_url"] = item.parent_url
+        metadata["anchor_text"] = item.anchor_text
+        metadata["frontier_score"] = round(item.score, 2)
+    return scraped_data
 
-def scrape_urls_recursive(
+def iter_urls_sequential(
     urls: List[str],
     depth: int = 1,
     max_pages: int = 10,
     include_images: bool = False,
     include_links: bool = False,
-    visited: Optional[Set[str]] = None,
-    current_depth: int = 0,
     progress_callback: Optional[Callable[[int, int, int], None]] = None,
     total_urls: int = 0,
-    scraped_count: int = 0
-) -> List[Dict[str, any]]:
+    skip_urls: Optional[Set[str]] = None,
+    keywords: Optional[List[str]] = None,
+    query: str = ""
+) -> Iterator[Dict[str, any]]:
     """
-    Recursively scrape URLs with depth control
+    Scrape URLs one at a time, breadth-first through a CrawlFrontier, yielding each page as it is scraped
     
     Args:
         urls: List of URLs to scrape
@@ -382,79 +709,258 @@ def scrape_urls_recursive(
         max_pages: Maximum total pages to scrape
         include_images: Whether to extract images
         include_links: Whether to extract links (required for depth > 1)
-        visited: Set of already visited URLs (for deduplication)
-        current_depth: Current depth level (internal use)
+        progress_callback: Called as (scraped, total, progress_pct)
+        total_urls: Total used for progress reporting
+        skip_urls: URLs that must not be fetched (already stored)
+        keywords: Campaign keywords, used to score discovered links
+        query: Campaign query (weaker link-scoring context)
         
-    Returns:
-        List of scraped data dictionaries
+    Yields:
+        Scraped data dictionaries
     """
-    if visited is None:
-        visited = set()
+    frontier = CrawlFrontier(max_pages, max_depth=depth, keywords=keywords, query=query, skip_urls=skip_urls)
+    frontier.add_seeds(urls)
+    scraped_count = 0
     
-    if current_depth >= depth or len(visited) >= max_pages:
-        return []
-    
-    results = []
+    while frontier.remaining_budget > 0:
+        batch = frontier.pop_batch(frontier.remaining_budget)
+        if not batch:
+            break
+        for item in batch:
+            if frontier.remaining_budget <= 0:
+                break
+            if not frontier.is_allowed(item.url):
+                continue
+            frontier.mark_scheduled(1)
+            
+            logger.info(f"📄 Scraping [{item.depth}/{depth}]: {item.url}")
+            
+            # Scrape the URL (static fast path first, Playwright if the page needs JS)
+            scraped_data = _finish_result(
+                _fetch_page(item.url, include_images=include_images, include_links=include_links),
+                item
+            )
+            scraped_count += 1
+            
+            # Update progress if callback provided
+            if progress_callback and total_urls > 0:
+                progress_pct = min(50 + int((scraped_count / total_urls) * 20), 70)  # 50% to 70% range
+                progress_callback(scraped_count, total_urls, progress_pct)
+            
+            frontier.mark_seen(scraped_data.get("canonical_url"))
+            if include_links:
+                frontier.add_links(item, _discovered_links(scraped_data))
+            yield scraped_data
     
-    for url in urls:
-        # Check limits
-        if len(visited) >= max_pages:
-            logger.info(f"Reached max_pages limit ({max_pages}), stopping")
+    if frontier.remaining_budget <= 0 and len(frontier):
+        logger.info(f"Reached max_pages limit ({max_pages}), stopping")
+
+def scrape_urls_sequential(*args, **kwargs) -> List[Dict[str, any]]:
+    """List version of iter_urls_sequential (same arguments)"""
+    return list(iter_urls_sequential(*args, **kwargs))
+
+class _HostLimiter:
+    """Per-host concurrency cap plus a minimum delay between request starts to the same host"""
+
+    def __init__(self, per_host: int, delay_ms: int):
+        self._per_host = max(1, per_host)
+        self._delay = max(0, delay_ms) / 1000
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        host = urlparse(url).netloc.lower()
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self._per_host))
+        async with semaphore:
+            # Reserve the next start time before sleeping so concurrent waiters are spaced out
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            start_at = max(now, self._next_start.get(host, 0.0))
+            self._next_start[host] = start_at + self._delay
+            if start_at > now:
+                await asyncio.sleep(start_at - now)
+            yield
+
+async def _scrape_urls_concurrent_async(
+    urls: List[str],
+    depth: int,
+    max_pages: int,
+    include_images: bool,
+    include_links: bool,
+    emit: Callable[[Dict[str, any]], Awaitable[None]],
+    timeout: int = 30000,
+    skip_urls: Optional[Set[str]] = None,
+    keywords: Optional[List[str]] = None,
+    query: str = ""
+) -> int:
+    """
+    Breadth-first concurrent crawl on the browser pool's event loop
+
+    The CrawlFrontier hands out the best-scoring URLs of the shallowest depth level;
+    each batch is fetched concurrently (bounded by the global and per-host limits)
+    and the links it yields are scored into the next level. Every finished page is
+    handed to `emit` right away; only its canonical URL and links are kept here.
+
+    Returns:
+        Number of pages scraped
+    """
+    global_limit = asyncio.Semaphore(max(1, SCRAPER_MAX_CONCURRENCY))
+    hosts = _HostLimiter(SCRAPER_PER_HOST_CONCURRENCY, SCRAPER_POLITENESS_DELAY_MS)
+    frontier = CrawlFrontier(max_pages, max_depth=depth, keywords=keywords, query=query, skip_urls=skip_urls)
+    frontier.add_seeds(urls)
+    scraped_count = 0
+
+    async def fetch(item: FrontierItem) -> Tuple[Optional[str], List[Tuple[str, str]]]:
+        nonlocal scraped_count
+        url = item.url
+        async with hosts.slot(url):
+            async with global_limit:
+                logger.info(f"📄 Scraping [{item.depth}/{depth}]: {url}")
+                try:
+                    scraped_data = await asyncio.wait_for(
+                        _fetch_page_async(url, include_images, include_links, timeout),
+                        timeout=timeout / 1000 + 60
+                    )
+                except asyncio.TimeoutError:
+                    error_msg = f"Timed out after {timeout / 1000 + 60:.0f}s"
+                    logger.error(f"❌ Error scraping {url}: {error_msg}")
+                    scraped_data = {
+                        "text": f"Error scraping URL: {error_msg}",
+                        "html": None,
+                        "images": [],
+                        "links": [],
+                        "error": error_msg
+                    }
+
+        scraped_count += 1
+        scraped_data = _finish_result(scraped_data, item)
+        canonical_url = scraped_data.get("canonical_url")
+        links = _discovered_links(scraped_data) if include_links else []
+        await emit(scraped_data)
+        return canonical_url, links
+
+    while frontier.remaining_budget > 0:
+        batch = frontier.pop_batch(frontier.remaining_budget)
+        if not batch:
             break
-        
-        # Skip if already visited
-        if url in visited:
+
+        # robots.txt lookups hit the network once per host - run them off the loop
+        allowed = await asyncio.gather(*(asyncio.to_thread(frontier.is_allowed, item.url) for item in batch))
+        batch = [item for item, ok in zip(batch, allowed) if ok]
+        if not batch:
             continue
+        frontier.mark_scheduled(len(batch))
+
+        batch_links = await asyncio.gather(*(fetch(item) for item in batch))
+
+        for item, (canonical_url, links) in zip(batch, batch_links):
+            frontier.mark_seen(canonical_url)
+            if include_links:
+                frontier.add_links(item, links)
+
+    if frontier.remaining_budget <= 0 and len(frontier):
+        logger.info(f"Reached max_pages limit ({max_pages}), stopping")
+    if frontier.disallowed:
+        logger.info(f"🤖 {frontier.disallowed} URLs skipped by robots.txt")
+    return scraped_count
+
+def iter_urls_concurrent(
+    urls: List[str],
+    depth: int = 1,
+    max_pages: int = 10,
+    include_images: bool = False,
+    include_links: bool = False,
+    progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    total_urls: int = 0,
+    skip_urls: Optional[Set[str]] = None,
+    keywords: Optional[List[str]] = None,
+    query: str = "",
+    queue_size: int = SCRAPER_STREAM_QUEUE_SIZE
+) -> Iterator[Dict[str, any]]:
+    """
+    Scrape URLs concurrently with depth control (asyncio on the browser pool), yielding pages as they finish
+    
+    Same arguments and result dictionaries as iter_urls_sequential. Concurrency is bounded by SCRAPER_MAX_CONCURRENCY overall and
+    SCRAPER_PER_HOST_CONCURRENCY per host, with SCRAPER_POLITENESS_DELAY_MS between
+    requests to the same host.
+    
+    Finished pages go through a bounded queue: when the consumer falls behind
+    (e.g. a slow database write) the crawl waits instead of piling pages up in memory.
+    
+    Args:
+        urls: List of URLs to scrape
+        depth: Maximum depth to follow links (1 = only initial URLs)
+        max_pages: Maximum total pages to scrape
+        include_images: Whether to extract images
+        include_links: Whether to extract links (required for depth > 1)
+        progress_callback: Called as (scraped, total, progress_pct) on the calling thread
+        total_urls: Total used for progress reporting
+        skip_urls: URLs that must not be fetched (already stored)
+        keywords: Campaign keywords, used to score discovered links
+        query: Campaign query (weaker link-scoring context)
+        queue_size: Maximum scraped pages waiting for the consumer
         
-        # Mark as visited
-        visited.add(url)
-        
-        # Update progress if callback provided
-        if progress_callback and total_urls > 0:
-            scraped_count += 1
-            progress_pct = min(50 + int((scraped_count / total_urls) * 20), 70)  # 50% to 70% range
-            progress_callback(scraped_count, total_urls, progress_pct)
-        
-        logger.info(f"📄 Scraping [{current_depth}/{depth}]: {url}")
-        
-        # Scrape the URL
-        scraped_data = scrape_with_playwright(
-            url,
-            include_images=include_images,
-            include_links=include_links
+    Yields:
+        Scraped data dictionaries, in completion order
+    """
+    from browser_pool import get_browser_pool
+
+    # Pages (and progress) are handed back to the calling thread: consumers typically
+    # touch the caller's DB session, which must not be used from the event loop thread
+    pages: "queue.Queue[Dict[str, any]]" = queue.Queue(maxsize=max(1, queue_size))
+
+    async def emit(scraped_data: Dict[str, any]):
+        # Blocking put off the loop: a full queue holds back this fetch, not the event loop
+        await asyncio.to_thread(pages.put, scraped_data)
+
+    future = get_browser_pool().submit(
+        _scrape_urls_concurrent_async(
+            urls,
+            depth,
+            max_pages,
+            include_images,
+            include_links,
+            emit=emit,
+            skip_urls=skip_urls,
+            keywords=keywords,
+            query=query
         )
-        
-        # Add URL and metadata to result
-        scraped_data["url"] = url
-        scraped_data["depth"] = current_depth
-        scraped_data["scraped_at"] = datetime.utcnow().isoformat()
-        
-        results.append(scraped_data)
-        
-        # If depth > 1 and include_links=True, recursively scrape links
-        if depth > 1 and include_links and current_depth < (depth - 1):
-            links = scraped_data.get("links", [])
-            if links:
-                # Limit links to follow
-                links_to_follow = links[:5]  # Limit to 5 links per page
-                logger.debug(f"Following {len(links_to_follow)} links from {url}")
-                recursive_results = scrape_urls_recursive(
-                    links_to_follow,
-                    depth=depth,
-                    max_pages=max_pages,
-                    include_images=include_images,
-                    include_links=include_links,
-                    visited=visited,
-                    current_depth=current_depth + 1,
-                    progress_callback=progress_callback,
-                    total_urls=total_urls,
-                    scraped_count=scraped_count
-                )
-                results.extend(recursive_results)
-    
-    return results
-
-def scrape_campaign_data(
+    )
+
+    scraped_count = 0
+    try:
+        while True:
+            try:
+                scraped_data = pages.get(timeout=0.5)
+            except queue.Empty:
+                if future.done() and pages.empty():
+                    break
+                continue
+            scraped_count += 1
+            if progress_callback and total_urls > 0:
+                progress_pct = min(50 + int((scraped_count / total_urls) * 20), 70)  # 50% to 70% range
+                try:
+                    progress_callback(scraped_count, total_urls, progress_pct)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
+            yield scraped_data
+        future.result()  # Re-raise crawl errors
+    finally:
+        if not future.done():
+            # Consumer stopped early: cancel the crawl and unblock a fetch waiting on a full queue
+            future.cancel()
+            while True:
+                try:
+                    pages.get_nowait()
+                except queue.Empty:
+                    break
+
+def scrape_urls_concurrent(*args, **kwargs) -> List[Dict[str, any]]:
+    """List version of iter_urls_concurrent (same arguments)"""
+    return list(iter_urls_concurrent(*args, **kwargs))
+
+def iter_campaign_data(
     keywords: List[str] = None,
     urls: List[str] = None,
     query: str = "",
@@ -462,16 +968,22 @@ def scrape_campaign_data(
     max_pages: int = 10,
     include_images: bool = False,
     include_links: bool = False,
-    progress_callback: Optional[callable] = None
-) -> List[Dict[str, any]]:
+    progress_callback: Optional[callable] = None,
+    skip_urls: Optional[Set[str]] = None,
+    stats: Optional[Dict[str, int]] = None
+) -> Iterator[Dict[str, any]]:
     """
-    Main function to scrape campaign data
+    Main function to scrape campaign data, streaming pages as they are scraped
     
     Combines DuckDuckGo search (for keywords) and Playwright scraping
     
     Query is used as frame of reference/context, not as search terms.
     Keywords/URLs are the actual targets, query provides the REASON/context.
     
+    In the default async mode at most SCRAPER_STREAM_QUEUE_SIZE scraped pages are
+    held in memory ahead of the consumer, so callers can persist results while the
+    crawl continues instead of waiting for the whole corpus.
+    
     Args:
         keywords: List of keywords to search for (search targets)
         urls: Direct URLs to scrape (optional)
@@ -480,26 +992,13 @@ def scrape_campaign_data(
         max_pages: Maximum pages to scrape
         include_images: Whether to extract images
         include_links: Whether to extract links
+        skip_urls: URLs already stored for the campaign - filtered out of the
+            frontier before any page is fetched (compared after normalization)
+        stats: Optional dict filled with "candidate_urls" and "skipped_known" counts
+            (available once the first page is yielded, or when the iterator is exhausted)
         
-    Returns:
-        List of scraped data dictionaries, each with query stored in metadata
-    """
-    """
-    Main function to scrape campaign data
-    
-    Combines DuckDuckGo search (for keywords) and Playwright scraping
-    
-    Args:
-        keywords: List of keywords to search for
-        urls: Direct URLs to scrape (optional)
-        query: Additional context query string
-        depth: Web scraping depth (1 = only initial URLs)
-        max_pages: Maximum pages to scrape
-        include_images: Whether to extract images
-        include_links: Whether to extract links
-        
-    Returns:
-        List of scraped data dictionaries
+    Yields:
+        Scraped data dictionaries, each with query stored in metadata
     """
     all_urls = []
     
@@ -526,8 +1025,11 @@ def scrape_campaign_data(
     else:
         logger.info(f"⚠️ No keywords or query provided for DuckDuckGo search")
     
-    # Deduplicate URLs
-    unique_urls = list(dict.fromkeys(all_urls))[:max_pages]
+    # Deduplicate URLs on their normalized form (keeping the first spelling seen)
+    deduped_urls = {}
+    for url in all_urls:
+        deduped_urls.setdefault(normalize_url(url), url)
+    unique_urls = list(deduped_urls.values())[:max_pages]
     
     # Calculate search results count safely
     search_results_count = len(search_urls) if keywords and 'search_urls' in locals() else 0
@@ -536,13 +1038,27 @@ def scrape_campaign_data(
     if not unique_urls:
         logger.error(f"❌ CRITICAL: No URLs to scrape! Keywords: {keywords}, Direct URLs: {urls}, Query: '{query}'")
         logger.error(f"❌ This means either DuckDuckGo search failed or no URLs/keywords were provided")
-        return []
+        return
+    
+    # Frontier filter: drop URLs that are already stored before fetching anything
+    known_urls = {normalize_url(u) for u in (skip_urls or []) if u}
+    candidate_count = len(unique_urls)
+    if known_urls:
+        unique_urls = [u for u in unique_urls if normalize_url(u) not in known_urls]
+        logger.info(f"♻️ Frontier filter: {candidate_count - len(unique_urls)}/{candidate_count} URLs already stored, {len(unique_urls)} left to scrape")
+    if stats is not None:
+        stats["candidate_urls"] = candidate_count
+        stats["skipped_known"] = candidate_count - len(unique_urls)
+    if not unique_urls:
+        logger.info(f"✅ Nothing new to scrape - all {candidate_count} URLs are already stored")
+        return
     
     logger.info(f"🚀 Starting scraping for {len(unique_urls)} URLs (depth={depth}, max_pages={max_pages})")
     logger.info(f"📋 URLs to scrape: {unique_urls[:10]}")  # Show first 10 URLs
     
-    # Scrape URLs recursively
-    results = scrape_urls_recursive(
+    # Scrape URLs (concurrently on the browser pool unless SCRAPER_MODE=sequential)
+    iter_urls = iter_urls_sequential if SCRAPER_MODE == "sequential" else iter_urls_concurrent
+    pages = iter_urls(
         unique_urls,
         depth=depth,
         max_pages=max_pages,
@@ -550,22 +1066,42 @@ def scrape_campaign_data(
         include_links=include_links,
         progress_callback=progress_callback,
         total_urls=len(unique_urls),
-        scraped_count=0
+        skip_urls=known_urls,
+        keywords=keywords,
+        query=query
     )
     
-    # Add query as context/frame of reference to all results
-    # This provides the REASON for scraping and can be used for filtering/ranking
-    if query:
-        for result in results:
+    scraped_count = 0
+    fetch_methods = {}
+    time_saved_ms = 0
+    for result in pages:
+        # Add query as context/frame of reference
+        # This provides the REASON for scraping and can be used for filtering/ranking
+        if query:
             if "metadata" not in result:
                 result["metadata"] = {}
             result["metadata"]["query"] = query
             result["metadata"]["query_context"] = "Frame of reference - reason for scraping"
-        logger.info(f"📋 Added query context to {len(results)} results: '{query[:50]}...'")
+        scraped_count += 1
+        method = result.get("metadata", {}).get("fetch_method", "browser")
+        fetch_methods[method] = fetch_methods.get(method, 0) + 1
+        time_saved_ms += result.get("metadata", {}).get("time_saved_ms", 0)
+        yield result
     
-    logger.info(f"✅ Scraping complete: {len(results)} pages scraped")
+    if query:
+        logger.info(f"📋 Added query context to {scraped_count} results: '{query[:50]}...'")
+    logger.info(f"✅ Scraping complete: {scraped_count} pages scraped")
+    if scraped_count:
+        browserless = scraped_count - fetch_methods.get("browser", 0)
+        logger.info(f"⚡ {browserless}/{scraped_count} pages served without a browser {fetch_methods} (~{time_saved_ms / 1000:.1f}s saved)")
     if query:
         logger.info(f"📋 Query context stored in results metadata for filtering/ranking")
-    
-    return results
 
+def scrape_campaign_data(*args, **kwargs) -> List[Dict[str, any]]:
+    """
+    Scrape campaign data and return all pages at once (list version of iter_campaign_data, same arguments)
+    
+    Returns:
+        List of scraped data dictionaries, each with query stored in metadata
+    """
+    return list(iter_campaign_data(*args, **kwargs))
@@ -0,0 +1,108 @@
+"""
+Shared Worker Process Pool
+CPU-bound per-request work (NER on uncached documents, document preprocessing, the
+system-model K sweep) runs in one process pool that lives as long as the server
+process. Starting a forkserver pool costs a process start plus the imports of every
+worker; paying that once per request made the parallel path slower than running
+in-process for small batches. The pool is started on first use and reused after.
+
+Worker entry points must live in modules that stay light to import
+(entity_cache / entity_extraction, doc_artifacts, topic_backend) - never in
+text_processing, which pulls in gensim, sklearn, LangChain and the NLTK corpora.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WORKER_POOL_SIZE = os.getenv("WORKER_POOL_SIZE", "auto")  # "auto" = one process per core
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def worker_pool_size() -> int:
+    """Processes in the shared pool"""
+    if WORKER_POOL_SIZE != "auto":
+        try:
+            return max(1, int(WORKER_POOL_SIZE))
+        except ValueError:
+            return 1
+    return max(1, os.cpu_count() or 1)
+
+
+def get_worker_pool():
+    """The shared ProcessPoolExecutor, started on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # forkserver: workers aren't forked from this (multi-threaded) server process
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+            _pool = ProcessPoolExecutor(max_workers=worker_pool_size(), mp_context=multiprocessing.get_context(start_method))
+            logger.info(f"🧵 Started shared worker pool ({worker_pool_size()} processes, {start_method or 'default'} start)")
+        return _pool
+
+
+def shutdown_worker_pool(wait: bool = True):
+    """Stop the shared pool (a later call to get_worker_pool() starts a new one)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+atexit.register(shutdown_worker_pool, False)
+
+
+def _discard(pool):
+    """Drop a pool whose workers died, so the next call starts a fresh one"""
+    global _pool
+    with _pool_lock:
+        if _pool is not pool:
+            return
+        _pool = None
+    logger.warning("⚠️ Shared worker pool broke, it will be restarted on next use")
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def map_in_workers(fn: Callable, *iterables: Iterable, workers: Optional[int] = None) -> List:
+    """
+    list(map(fn, *iterables)) on the shared pool
+
+    Args:
+        fn: Top-level function of a light module (it is pickled by reference)
+        iterables: Arguments, one iterable per parameter
+        workers: Processes the call is split across (default: the whole pool); sets the chunk size
+
+    Returns:
+        Results in input order. Raises if the pool is unavailable or a call fails.
+    """
+    columns = [list(values) for values in iterables]
+    count = len(columns[0]) if columns else 0
+    workers = min(workers or worker_pool_size(), worker_pool_size(), max(count, 1))
+    # A few chunks per worker keeps the pool busy when item sizes differ
+    chunksize = max(1, count // (workers * 4))
+    pool = get_worker_pool()
+    try:
+        return list(pool.map(fn, *columns, chunksize=chunksize))
+    except BrokenProcessPool:
+        _discard(pool)
+        raise
+
+
+def submit_to_workers(fn: Callable, *args):
+    """pool.submit(fn, *args) on the shared pool (a Future)"""
+    pool = get_worker_pool()
+    try:
+        return pool.submit(fn, *args)
+    except BrokenProcessPool:
+        _discard(pool)
+        raise